@@ -50,6 +50,7 @@ PYTHON2_DEPENDENCIES="libbde-python2
                       python2-lz4
                       python2-pefile
                       python2-psutil
+                      python2-pyarrow
                       python2-pyparsing
                       python2-pysqlite
                       python2-pytsk3
@@ -49,6 +49,7 @@ PYTHON2_DEPENDENCIES="libbde-python
                       python-lz4
                       python-pefile
                       python-psutil
+                      python-pyarrow
                       python-pyparsing
                       python-pysqlite2
                       python-pytsk3
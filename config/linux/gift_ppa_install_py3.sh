@@ -48,6 +48,7 @@ PYTHON3_DEPENDENCIES="libbde-python3
                       python3-lz4
                       python3-pefile
                       python3-psutil
+                      python3-pyarrow
                       python3-pyparsing
                       python3-pytsk3
                       python3-requests
@@ -3,6 +3,10 @@
 
 from __future__ import unicode_literals
 
+import io
+import math
+import time
+
 import yara
 
 from plaso.analyzers import interface
@@ -13,7 +17,14 @@ from plaso.lib import definitions
 
 
 class YaraAnalyzer(interface.BaseAnalyzer):
-  """Analyzer that matches Yara rules."""
+  """Analyzer that matches Yara rules.
+
+  The analyzer is incremental, data streams larger than the size of a block
+  are scanned in windows that overlap by _WINDOW_OVERLAP_SIZE bytes, so that
+  strings that cross block boundaries are still matched. Note that conditions
+  that depend on the absolute offset or the size of the data, such as
+  "$mz at 0" or "filesize", are evaluated relative to the current window.
+  """
 
   # pylint: disable=no-member
 
@@ -22,33 +33,72 @@ class YaraAnalyzer(interface.BaseAnalyzer):
 
   PROCESSING_STATUS_HINT = definitions.PROCESSING_STATUS_YARA_SCAN
 
-  INCREMENTAL_ANALYZER = False
+  INCREMENTAL_ANALYZER = True
 
   _ATTRIBUTE_NAME = 'yara_match'
-  _MATCH_TIMEOUT = 60
+
+  # The default maximum number of seconds to spend scanning a single data
+  # stream, where 0 represents no limit.
+  _DEFAULT_TIME_BUDGET = 60
+
+  _WINDOW_OVERLAP_SIZE = 1024 * 1024
 
   def __init__(self):
     """Initializes the Yara analyzer."""
     super(YaraAnalyzer, self).__init__()
-    self._matches = []
+    self._elapsed_time = 0.0
+    self._matched_rule_names = []
+    self._previous_data = b''
     self._rules = None
+    self._time_budget = self._DEFAULT_TIME_BUDGET
+    self._time_budget_exceeded = False
 
   def Analyze(self, data):
     """Analyzes a block of data, attempting to match Yara rules to it.
 
+    Matches are accumulated over successive calls until Reset is called.
+
     Args:
       data(bytes): a block of data.
     """
-    if not self._rules:
+    if not self._rules or self._time_budget_exceeded:
       return
+
+    timeout = 0
+    if self._time_budget:
+      remaining_time = self._time_budget - self._elapsed_time
+      if remaining_time <= 0:
+        self._time_budget_exceeded = True
+        logger.error(
+            'Could not process file within time budget: {0:d}'.format(
+                self._time_budget))
+        return
+
+      timeout = int(math.ceil(remaining_time))
+
+    if self._previous_data:
+      data = b''.join([self._previous_data, data])
+
+    matches = []
+    start_time = time.time()
     try:
-      self._matches = self._rules.match(data=data, timeout=self._MATCH_TIMEOUT)
-    except yara.YaraTimeoutError:
-      logger.error('Could not process file within timeout: {0:d}'.format(
-          self._MATCH_TIMEOUT))
-    except yara.YaraError as exception:
+      matches = self._rules.match(data=data, timeout=timeout)
+    except yara.TimeoutError:
+      self._time_budget_exceeded = True
+      logger.error(
+          'Could not process file within time budget: {0:d}'.format(
+              self._time_budget))
+    except yara.Error as exception:
       logger.error('Error processing file with Yara: {0!s}.'.format(
           exception))
+    finally:
+      self._elapsed_time += time.time() - start_time
+
+    for match in matches:
+      if match.rule not in self._matched_rule_names:
+        self._matched_rule_names.append(match.rule)
+
+    self._previous_data = data[-self._WINDOW_OVERLAP_SIZE:]
 
   def GetResults(self):
     """Retrieves results of the most recent analysis.
@@ -59,13 +109,28 @@ class YaraAnalyzer(interface.BaseAnalyzer):
     result = analyzer_result.AnalyzerResult()
     result.analyzer_name = self.NAME
     result.attribute_name = self._ATTRIBUTE_NAME
-    rule_names = [match.rule for match in self._matches]
-    result.attribute_value = ','.join(rule_names)
+    result.attribute_value = ','.join(self._matched_rule_names)
     return [result]
 
   def Reset(self):
     """Resets the internal state of the analyzer."""
-    self._matches = []
+    self._elapsed_time = 0.0
+    self._matched_rule_names = []
+    self._previous_data = b''
+    self._time_budget_exceeded = False
+
+  def SetCompiledRules(self, compiled_rules):
+    """Sets precompiled rules that the Yara analyzer will use.
+
+    Loading precompiled rules is considerably faster than compiling the
+    rule definitions, which matters when every worker needs its own copy.
+
+    Args:
+      compiled_rules (bytes): Yara rules compiled by yarac or saved by
+          yara.Rules.save().
+    """
+    file_object = io.BytesIO(compiled_rules)
+    self._rules = yara.load(file=file_object)
 
   def SetRules(self, rules_string):
     """Sets the rules that the Yara analyzer will use.
@@ -75,5 +140,14 @@ class YaraAnalyzer(interface.BaseAnalyzer):
     """
     self._rules = yara.compile(source=rules_string)
 
+  def SetTimeBudget(self, time_budget):
+    """Sets the maximum time to spend scanning a single data stream.
+
+    Args:
+      time_budget (int): maximum number of seconds to spend scanning
+          a single data stream, where 0 represents no limit.
+    """
+    self._time_budget = time_budget
+
 
 manager.AnalyzersManager.RegisterAnalyzer(YaraAnalyzer)
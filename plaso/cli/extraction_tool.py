@@ -48,6 +48,7 @@ class ExtractionTool(
         input_reader=input_reader, output_writer=output_writer)
     self._artifacts_registry = None
     self._buffer_size = 0
+    self._evtx_xml_templates = False
     self._mount_path = None
     self._operating_system = None
     self._preferred_year = None
@@ -57,12 +58,17 @@ class ExtractionTool(
     self._queue_size = self._DEFAULT_QUEUE_SIZE
     self._resolver_context = dfvfs_context.Context()
     self._single_process_mode = False
+    self._sqlite_cache_size = None
+    self._sqlite_journal_mode = None
+    self._sqlite_page_size = None
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._temporary_directory = None
     self._text_prepend = None
     self._use_zeromq = True
+    self._yara_compiled_rules = None
     self._yara_rules_string = None
+    self._yara_time_budget = None
 
   def _CreateProcessingConfiguration(self, knowledge_base):
     """Creates a processing configuration.
@@ -83,6 +89,8 @@ class ExtractionTool(
     configuration.artifact_filters = self._artifact_filters
     configuration.credentials = self._credential_configurations
     configuration.debug_output = self._debug_mode
+    configuration.event_extraction.evtx_xml_templates = (
+        self._evtx_xml_templates)
     configuration.event_extraction.text_prepend = self._text_prepend
     configuration.extraction.hasher_file_size_limit = (
         self._hasher_file_size_limit)
@@ -90,7 +98,9 @@ class ExtractionTool(
     configuration.extraction.process_archives = self._process_archives
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
+    configuration.extraction.yara_compiled_rules = self._yara_compiled_rules
     configuration.extraction.yara_rules_string = self._yara_rules_string
+    configuration.extraction.yara_time_budget = self._yara_time_budget
     configuration.filter_file = self._filter_file
     configuration.input_source.mount_path = self._mount_path
     configuration.log_filename = self._log_file
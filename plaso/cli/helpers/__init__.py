@@ -16,11 +16,13 @@ from plaso.cli.helpers import language
 from plaso.cli.helpers import mysql_4n6time_output
 from plaso.cli.helpers import nsrlsvr_analysis
 from plaso.cli.helpers import output_modules
+from plaso.cli.helpers import parquet_output
 from plaso.cli.helpers import parsers
 from plaso.cli.helpers import profiling
 from plaso.cli.helpers import process_resources
 from plaso.cli.helpers import sessionize_analysis
 from plaso.cli.helpers import sqlite_4n6time_output
+from plaso.cli.helpers import sqlite_storage
 from plaso.cli.helpers import status_view
 from plaso.cli.helpers import storage_file
 from plaso.cli.helpers import storage_format
@@ -31,6 +31,8 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
   _DEFAULT_INDEX_NAME = uuid4().hex
   _DEFAULT_DOCUMENT_TYPE = 'plaso_event'
   _DEFAULT_FLUSH_INTERVAL = 1000
+  _DEFAULT_CHUNK_SIZE = 5 * 1024 * 1024
+  _DEFAULT_NUMBER_OF_SENDER_THREADS = 2
   _DEFAULT_RAW_FIELDS = False
   _DEFAULT_ELASTIC_USER = None
   _DEFAULT_CA_CERTS = None
@@ -59,6 +61,18 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         '--flush_interval', dest='flush_interval', type=int,
         action='store', default=cls._DEFAULT_FLUSH_INTERVAL, help=(
             'Events to queue up before bulk insert to ElasticSearch.'))
+    argument_group.add_argument(
+        '--elastic_chunk_size', dest='elastic_chunk_size', type=int,
+        action='store', default=cls._DEFAULT_CHUNK_SIZE, metavar='BYTES',
+        help=(
+            'Maximum size, in bytes, of the events of a bulk insert to '
+            'ElasticSearch.'))
+    argument_group.add_argument(
+        '--elastic_sender_threads', dest='elastic_sender_threads', type=int,
+        action='store', default=cls._DEFAULT_NUMBER_OF_SENDER_THREADS,
+        metavar='NUMBER', help=(
+            'Number of threads that send bulk inserts to ElasticSearch '
+            'concurrently.'))
     argument_group.add_argument(
         '--raw_fields', dest='raw_fields', action='store_true',
         default=cls._DEFAULT_RAW_FIELDS, help=(
@@ -106,6 +120,20 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         options, 'document_type', default_value=cls._DEFAULT_DOCUMENT_TYPE)
     flush_interval = cls._ParseNumericOption(
         options, 'flush_interval', default_value=cls._DEFAULT_FLUSH_INTERVAL)
+    chunk_size = cls._ParseNumericOption(
+        options, 'elastic_chunk_size', default_value=cls._DEFAULT_CHUNK_SIZE)
+    if chunk_size <= 0:
+      raise errors.BadConfigOption(
+          'Invalid Elasticsearch chunk size value must be larger than 0.')
+
+    number_of_sender_threads = cls._ParseNumericOption(
+        options, 'elastic_sender_threads',
+        default_value=cls._DEFAULT_NUMBER_OF_SENDER_THREADS)
+    if number_of_sender_threads <= 0:
+      raise errors.BadConfigOption((
+          'Invalid number of Elasticsearch sender threads value must be '
+          'larger than 0.'))
+
     raw_fields = getattr(
         options, 'raw_fields', cls._DEFAULT_RAW_FIELDS)
     elastic_user = cls._ParseStringOption(
@@ -129,6 +157,8 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
     output_module.SetIndexName(index_name)
     output_module.SetDocumentType(document_type)
     output_module.SetFlushInterval(flush_interval)
+    output_module.SetChunkSize(chunk_size)
+    output_module.SetNumberOfSenderThreads(number_of_sender_threads)
     output_module.SetRawFields(raw_fields)
     output_module.SetUsername(elastic_user)
     output_module.SetPassword(elastic_password)
@@ -26,6 +26,14 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--evtx_xml_templates', '--evtx-xml-templates',
+        dest='evtx_xml_templates', action='store_true', default=False, help=(
+            'Store the XML representation of Windows XML EventLog (EVTX) '
+            'records as a template, that is stored once per distinct '
+            'template, and the values of the record. This reduces the size '
+            'of the storage file.'))
+
     argument_group.add_argument(
         '--preferred_year', '--preferred-year', dest='preferred_year',
         type=int, action='store', default=None, metavar='YEAR', help=(
@@ -63,12 +71,14 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigObject(
           'Configuration object is not an instance of CLITool')
 
+    evtx_xml_templates = getattr(options, 'evtx_xml_templates', False)
     preferred_year = cls._ParseNumericOption(options, 'preferred_year')
 
     process_archives = getattr(options, 'process_archives', False)
     process_compressed_streams = getattr(
         options, 'process_compressed_streams', True)
 
+    setattr(configuration_object, '_evtx_xml_templates', evtx_xml_templates)
     setattr(configuration_object, '_preferred_year', preferred_year)
     setattr(configuration_object, '_process_archives', process_archives)
     setattr(
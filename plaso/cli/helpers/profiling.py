@@ -23,7 +23,7 @@ class ProfilingArgumentsHelper(interface.ArgumentsHelper):
   PROFILERS_INFORMATION = {
       'memory': 'Profile memory usage over time',
       'parsers': 'Profile CPU time per parser',
-      'processing': 'Profile CPU time of processing phases',
+      'processing': 'Profile CPU time of processing phases and cache usage',
       'serializers': 'Profile CPU time of serialization',
       'storage': 'Profile storage reads and writes',
       'task_queue': 'Profile task queue status (multi-processing only)',
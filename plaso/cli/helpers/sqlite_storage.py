@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""The SQLite storage CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+from plaso.cli import tools
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+from plaso.storage.sqlite import sqlite_file
+
+
+class SQLiteStorageArgumentsHelper(interface.ArgumentsHelper):
+  """SQLite storage CLI arguments helper."""
+
+  NAME = 'sqlite_storage'
+  DESCRIPTION = 'SQLite storage command line arguments.'
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
+          argparse group.
+    """
+    journal_modes = sorted(
+        sqlite_file.SQLiteStorageFile.SUPPORTED_JOURNAL_MODES)
+
+    argument_group.add_argument(
+        '--sqlite_cache_size', '--sqlite-cache-size', dest='sqlite_cache_size',
+        type=int, action='store', default=None, metavar='SIZE', help=(
+            'SQLite page cache size of the storage file, where a positive '
+            'value represents a number of pages and a negative value a size '
+            'in KiB. By default the SQLite default is used.'))
+
+    argument_group.add_argument(
+        '--sqlite_journal_mode', '--sqlite-journal-mode',
+        dest='sqlite_journal_mode', type=str, action='store', default=None,
+        metavar='MODE', help=(
+            'SQLite journal mode used when writing the storage file. By '
+            'default the SQLite default is used. Supported options: '
+            '{0:s}').format(', '.join(journal_modes)))
+
+    argument_group.add_argument(
+        '--sqlite_page_size', '--sqlite-page-size', dest='sqlite_page_size',
+        type=int, action='store', default=None, metavar='SIZE', help=(
+            'SQLite page size, in bytes, used when the storage file is '
+            'created, which must be a power of 2 between 512 and 65536. By '
+            'default the SQLite default is used.'))
+
+  @classmethod
+  def ParseOptions(cls, options, configuration_object):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options.
+      configuration_object (CLITool): object to be configured by the argument
+          helper.
+
+    Raises:
+      BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: if the journal mode or page size is not supported.
+    """
+    if not isinstance(configuration_object, tools.CLITool):
+      raise errors.BadConfigObject(
+          'Configuration object is not an instance of CLITool')
+
+    cache_size = cls._ParseNumericOption(options, 'sqlite_cache_size')
+
+    journal_mode = cls._ParseStringOption(options, 'sqlite_journal_mode')
+    if journal_mode:
+      journal_mode = journal_mode.upper()
+      if (journal_mode not in
+          sqlite_file.SQLiteStorageFile.SUPPORTED_JOURNAL_MODES):
+        raise errors.BadConfigOption(
+            'Unsupported SQLite journal mode: {0:s}'.format(journal_mode))
+
+    page_size = cls._ParseNumericOption(options, 'sqlite_page_size')
+    if page_size is not None and (
+        page_size < 512 or page_size > 65536 or page_size & (page_size - 1)):
+      raise errors.BadConfigOption(
+          'Unsupported SQLite page size: {0:d}'.format(page_size))
+
+    setattr(configuration_object, '_sqlite_cache_size', cache_size)
+    setattr(configuration_object, '_sqlite_journal_mode', journal_mode)
+    setattr(configuration_object, '_sqlite_page_size', page_size)
+
+
+manager.ArgumentHelperManager.RegisterHelper(SQLiteStorageArgumentsHelper)
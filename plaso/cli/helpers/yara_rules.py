@@ -19,6 +19,11 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
   NAME = 'yara_rules'
   DESCRIPTION = 'YARA rules command line arguments.'
 
+  _DEFAULT_TIME_BUDGET = 60
+
+  # Signature of rules compiled by yarac.
+  _COMPILED_RULES_SIGNATURE = b'YARA'
+
   @classmethod
   def AddArguments(cls, argument_group):
     """Adds command line arguments to an argument group.
@@ -33,7 +38,15 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
     argument_group.add_argument(
         '--yara_rules', '--yara-rules', dest='yara_rules_path',
         type=str, metavar='PATH', action='store', help=(
-            'Path to a file containing Yara rules definitions.'))
+            'Path to a file containing Yara rules definitions or rules '
+            'compiled with yarac.'))
+
+    argument_group.add_argument(
+        '--yara_time_budget', '--yara-time-budget', dest='yara_time_budget',
+        type=int, action='store', default=cls._DEFAULT_TIME_BUDGET,
+        metavar='SECONDS', help=(
+            'Define the maximum number of seconds Yara rules matching should '
+            'spend on a single file. A value of 0 represents no limit.'))
 
   @classmethod
   def ParseOptions(cls, options, configuration_object):
@@ -46,18 +59,20 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: when a configuration parameter fails validation.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
           'Configuration object is not an instance of CLITool')
 
+    yara_compiled_rules = None
     yara_rules_string = None
 
     path = getattr(options, 'yara_rules_path', None)
     if path:
       try:
-        with io.open(path, 'rt', encoding='utf-8') as rules_file:
-          yara_rules_string = rules_file.read()
+        with open(path, 'rb') as rules_file:
+          rules_data = rules_file.read()
 
       except IOError as exception:
         raise errors.BadConfigObject(
@@ -65,17 +80,36 @@ class YaraRulesArgumentsHelper(interface.ArgumentsHelper):
                 path, exception))
 
       try:
-        # We try to parse the rules here, to check that the definitions are
-        # valid. We then pass the string definitions along to the workers, so
-        # that they don't need read access to the rules file.
-        yara.compile(source=yara_rules_string)
-
-      except yara.Error as exception:
+        # The rules are compiled only once here, both to check that the
+        # definitions are valid and to pass the compiled rules along to
+        # the workers, which is faster than having every worker compile
+        # the definitions and does not require read access to the rules
+        # file.
+        if rules_data.startswith(cls._COMPILED_RULES_SIGNATURE):
+          rules = yara.load(file=io.BytesIO(rules_data))
+        else:
+          yara_rules_string = rules_data.decode('utf-8')
+          rules = yara.compile(source=yara_rules_string)
+
+        file_object = io.BytesIO()
+        rules.save(file=file_object)
+        yara_compiled_rules = file_object.getvalue()
+
+      except (UnicodeDecodeError, yara.Error) as exception:
         raise errors.BadConfigObject(
             'Unable to parse Yara rules in: {0:s} with error: {1!s}'.format(
                 path, exception))
 
+    yara_time_budget = cls._ParseNumericOption(
+        options, 'yara_time_budget', default_value=cls._DEFAULT_TIME_BUDGET)
+
+    if yara_time_budget < 0:
+      raise errors.BadConfigOption(
+          'Invalid Yara time budget value cannot be negative.')
+
+    setattr(configuration_object, '_yara_compiled_rules', yara_compiled_rules)
     setattr(configuration_object, '_yara_rules_string', yara_rules_string)
+    setattr(configuration_object, '_yara_time_budget', yara_time_budget)
 
 
 manager.ArgumentHelperManager.RegisterHelper(YaraRulesArgumentsHelper)
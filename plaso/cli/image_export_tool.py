@@ -6,10 +6,14 @@ from __future__ import unicode_literals
 import argparse
 import codecs
 import io
+import multiprocessing
 import os
+import shutil
+import sqlite3
 import textwrap
 
 from dfvfs.helpers import file_system_searcher
+from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
@@ -30,6 +34,251 @@ from plaso.lib import specification
 from plaso.preprocessors import manager as preprocess_manager
 
 
+# Resolver context of the current export worker process.
+_worker_resolver_context = None
+
+
+def _InitializeExportWorker():
+  """Initializes an export worker process.
+
+  Every worker process uses its own resolver context, since file objects
+  inherited from the parent process share their file offsets with it.
+  """
+  global _worker_resolver_context  # pylint: disable=global-statement
+  _worker_resolver_context = context.Context()
+
+
+def _ExportDataStream(
+    path_spec, data_stream_name, destination_file, calculate_digest):
+  """Exports a data stream in an export worker process.
+
+  Args:
+    path_spec (dfvfs.PathSpec): path specification of the source file.
+    data_stream_name (str): name of the data stream to export.
+    destination_file (str): path of the destination file.
+    calculate_digest (bool): True if the SHA-256 digest of the data stream
+        should be calculated.
+
+  Returns:
+    tuple: containing:
+
+      str: hexadecimal representation of the SHA-256 digest or None if
+          not calculated.
+      str: error message or None if the data stream was exported.
+  """
+  try:
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=_worker_resolver_context)
+    if not file_entry:
+      return None, 'unable to open file entry'
+
+    # pylint: disable=protected-access
+    digest = ImageExportTool._WriteFileEntry(
+        file_entry, data_stream_name, destination_file,
+        calculate_digest=calculate_digest)
+
+  except (IOError, dfvfs_errors.BackEndError) as exception:
+    return None, '{0!s}'.format(exception)
+
+  return digest, None
+
+
+class ImageExportDigestIndex(object):
+  """Index of the digests of exported data streams.
+
+  The index is stored in a SQLite database so that it does not need to be
+  kept in memory and so that an interrupted export can be resumed without
+  reading the data streams that were already processed.
+  """
+
+  _COMMIT_INTERVAL = 1000
+
+  _CREATE_TABLE_QUERIES = [
+      ('CREATE TABLE IF NOT EXISTS digests ('
+       'digest TEXT PRIMARY KEY, display_name TEXT)'),
+      ('CREATE TABLE IF NOT EXISTS targets ('
+       'target_path TEXT PRIMARY KEY, digest TEXT, is_duplicate INTEGER)')]
+
+  def __init__(self):
+    """Initializes a digest index."""
+    super(ImageExportDigestIndex, self).__init__()
+    self._connection = None
+    self._cursor = None
+    self._number_of_changes = 0
+
+  def _Change(self, query, values):
+    """Executes a query that changes the index.
+
+    Args:
+      query (str): SQL query.
+      values (tuple[str, ...]): values of the query.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._cursor.execute(query, values)
+
+    self._number_of_changes += 1
+    if self._number_of_changes >= self._COMMIT_INTERVAL:
+      self._connection.commit()
+      self._number_of_changes = 0
+
+  def _GetValue(self, query, values):
+    """Retrieves a single value from the index.
+
+    Args:
+      query (str): SQL query.
+      values (tuple[str, ...]): values of the query.
+
+    Returns:
+      str: value or None if not available.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    if not self._connection:
+      raise IOError('Digest index not opened.')
+
+    self._cursor.execute(query, values)
+    row = self._cursor.fetchone()
+    if not row:
+      return None
+
+    return row[0]
+
+  def AddDigest(self, digest, display_name):
+    """Adds the digest of an exported data stream.
+
+    Args:
+      digest (str): hexadecimal representation of the SHA-256 digest.
+      display_name (str): display name of the exported data stream.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    self._Change(
+        'INSERT OR IGNORE INTO digests VALUES (?, ?)', (digest, display_name))
+
+  def AddTarget(self, target_path, digest, is_duplicate=False):
+    """Adds a processed target path.
+
+    Args:
+      target_path (str): path of the target relative to the destination.
+      digest (str): hexadecimal representation of the SHA-256 digest of the
+          data stream of the target.
+      is_duplicate (Optional[bool]): True if the data stream was skipped as
+          duplicate instead of exported to the target.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    self._Change(
+        'INSERT OR REPLACE INTO targets VALUES (?, ?, ?)',
+        (target_path, digest, int(is_duplicate)))
+
+  def Close(self):
+    """Closes the index."""
+    if self._connection:
+      self._connection.commit()
+      self._connection.close()
+
+    self._connection = None
+    self._cursor = None
+    self._number_of_changes = 0
+
+  def GetDigestByTarget(self, target_path):
+    """Retrieves the digest of a processed target path.
+
+    Args:
+      target_path (str): path of the target relative to the destination.
+
+    Returns:
+      str: hexadecimal representation of the SHA-256 digest or None if
+          the target path was not processed.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    return self._GetValue(
+        'SELECT digest FROM targets WHERE target_path = ?', (target_path, ))
+
+  def IsDuplicateTarget(self, target_path):
+    """Determines if a target path was skipped as duplicate.
+
+    Args:
+      target_path (str): path of the target relative to the destination.
+
+    Returns:
+      bool: True if the data stream of the target path was skipped as
+          duplicate.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    return bool(self._GetValue(
+        'SELECT is_duplicate FROM targets WHERE target_path = ?',
+        (target_path, )))
+
+  def RemoveDigest(self, digest):
+    """Removes the digest of an exported data stream.
+
+    Args:
+      digest (str): hexadecimal representation of the SHA-256 digest.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    self._Change('DELETE FROM digests WHERE digest = ?', (digest, ))
+
+  def GetDisplayNameByDigest(self, digest):
+    """Retrieves the display name of the data stream exported with a digest.
+
+    Args:
+      digest (str): hexadecimal representation of the SHA-256 digest.
+
+    Returns:
+      str: display name or None if no data stream was exported with the digest.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    return self._GetValue(
+        'SELECT display_name FROM digests WHERE digest = ?', (digest, ))
+
+  def Open(self, path=None):
+    """Opens the index.
+
+    Args:
+      path (Optional[str]): path of the index file, where None represents
+          an in-memory index.
+
+    Raises:
+      IOError: if the index is already opened.
+      OSError: if the index is already opened.
+    """
+    if self._connection:
+      raise IOError('Digest index already opened.')
+
+    self._connection = sqlite3.connect(path or ':memory:')
+    self._cursor = self._connection.cursor()
+
+    for query in self._CREATE_TABLE_QUERIES:
+      self._cursor.execute(query)
+
+    self._connection.commit()
+
+
 class ImageExportTool(storage_media_tool.StorageMediaTool):
   """Class that implements the image export CLI tool.
 
@@ -58,6 +307,13 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
   _COPY_BUFFER_SIZE = 32768
 
+  # Maximum number of data streams queued per export worker process.
+  _MAXIMUM_NUMBER_OF_PENDING_EXPORTS_PER_WORKER = 4
+
+  # Number of seconds to wait for a pending export before checking the
+  # other pending exports.
+  _PENDING_EXPORT_WAIT_TIME = 0.1
+
   _READ_BUFFER_SIZE = 4096
 
   # TODO: remove this redirect.
@@ -65,6 +321,8 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
   _SPECIFICATION_FILE_ENCODING = 'utf-8'
 
+  _TEMPORARY_DIRECTORY_NAME = 'image_export_partial'
+
   def __init__(self, input_reader=None, output_writer=None):
     """Initializes the CLI tool object.
 
@@ -82,14 +340,19 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     self._artifacts_registry = None
     self._custom_artifacts_path = None
     self._destination_path = None
-    self._digests = {}
+    self._digest_index = None
+    self._digest_index_path = None
     self._filter_collection = file_entry_filters.FileEntryFilterCollection()
     self._filter_file = None
     self._knowledge_base = knowledge_base.KnowledgeBase()
+    self._number_of_exports = 0
+    self._number_of_workers = 0
     self._path_spec_extractor = extractors.PathSpecExtractor()
+    self._pending_exports = []
     self._process_memory_limit = None
     self._resolver_context = context.Context()
     self._skip_duplicates = True
+    self._worker_pool = None
 
     self.has_filters = False
     self.list_signature_identifiers = False
@@ -181,6 +444,10 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       skip_duplicates=True):
     """Extracts a data stream.
 
+    The data stream is copied to a temporary file, while its digest is
+    calculated, by an export worker process or, if there are no worker
+    processes, directly. Duplicates are resolved once the copy completes.
+
     Args:
       file_entry (dfvfs.FileEntry): file entry containing the data stream.
       data_stream_name (str): name of the data stream.
@@ -195,31 +462,6 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
         file_entry.path_spec)
 
-    if skip_duplicates:
-      try:
-        digest = self._CalculateDigestHash(file_entry, data_stream_name)
-      except (IOError, dfvfs_errors.BackEndError) as exception:
-        output_writer.Write((
-            '[skipping] unable to read content of file entry: {0:s} '
-            'with error: {1!s}\n').format(display_name, exception))
-        return
-
-      if not digest:
-        output_writer.Write(
-            '[skipping] unable to read content of file entry: {0:s}\n'.format(
-                display_name))
-        return
-
-      duplicate_display_name = self._digests.get(digest, None)
-      if duplicate_display_name:
-        output_writer.Write((
-            '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
-            'digest: {2:s}\n').format(
-                display_name, duplicate_display_name, digest))
-        return
-
-      self._digests[digest] = display_name
-
     target_directory, target_filename = self._CreateSanitizedDestination(
         file_entry, file_entry.path_spec, destination_path)
 
@@ -240,6 +482,32 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       os.makedirs(target_directory)
 
     target_path = os.path.join(target_directory, target_filename)
+    relative_target_path = os.path.relpath(target_path, destination_path)
+
+    if skip_duplicates:
+      if not self._digest_index:
+        self._digest_index = ImageExportDigestIndex()
+        self._digest_index.Open()
+
+      digest = self._digest_index.GetDigestByTarget(relative_target_path)
+      if digest and self._digest_index.IsDuplicateTarget(relative_target_path):
+        # The target was skipped as duplicate by a previous export.
+        duplicate_display_name = self._digest_index.GetDisplayNameByDigest(
+            digest)
+        output_writer.Write((
+            '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
+            'digest: {2:s}\n').format(
+                display_name, duplicate_display_name, digest))
+        return
+
+      if os.path.exists(target_path):
+        if not digest:
+          self._IndexExportedFile(target_path, relative_target_path)
+
+      elif digest:
+        # The target was exported by a previous export but has been removed
+        # since, hence it is exported again.
+        self._digest_index.RemoveDigest(digest)
 
     if os.path.exists(target_path):
       output_writer.Write((
@@ -248,17 +516,46 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
               display_name, target_path))
       return
 
-    try:
-      self._WriteFileEntry(file_entry, data_stream_name, target_path)
-    except (IOError, dfvfs_errors.BackEndError) as exception:
-      output_writer.Write((
-          '[skipping] unable to export contents of file entry: {0:s} '
-          'with error: {1!s}\n').format(display_name, exception))
+    temporary_directory = os.path.join(
+        destination_path, self._TEMPORARY_DIRECTORY_NAME)
+    if not os.path.isdir(temporary_directory):
+      os.makedirs(temporary_directory)
 
+    temporary_path = os.path.join(
+        temporary_directory, '{0:d}'.format(self._number_of_exports))
+    self._number_of_exports += 1
+
+    if not self._worker_pool:
       try:
-        os.remove(target_path)
-      except (IOError, OSError):
-        pass
+        digest = self._WriteFileEntry(
+            file_entry, data_stream_name, temporary_path,
+            calculate_digest=skip_duplicates)
+        error = None
+
+      except (IOError, dfvfs_errors.BackEndError) as exception:
+        digest = None
+        error = '{0!s}'.format(exception)
+
+      self._FinalizeExport(
+          display_name, target_path, relative_target_path, temporary_path,
+          digest, error, output_writer, skip_duplicates=skip_duplicates)
+      return
+
+    async_result = self._worker_pool.apply_async(
+        _ExportDataStream, (
+            file_entry.path_spec, data_stream_name, temporary_path,
+            skip_duplicates))
+
+    self._pending_exports.append((
+        async_result, display_name, target_path, relative_target_path,
+        temporary_path, skip_duplicates))
+
+    maximum_number_of_pending_exports = (
+        self._number_of_workers *
+        self._MAXIMUM_NUMBER_OF_PENDING_EXPORTS_PER_WORKER)
+    self._ProcessPendingExports(
+        output_writer,
+        maximum_number_of_pending_exports=maximum_number_of_pending_exports)
 
   def _ExtractFileEntry(
       self, path_spec, destination_path, output_writer, skip_duplicates=True):
@@ -339,6 +636,72 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
       file_system.Close()
 
+  def _FinalizeExport(
+      self, display_name, target_path, relative_target_path, temporary_path,
+      digest, error, output_writer, skip_duplicates=True):
+    """Finalizes the export of a data stream.
+
+    Moves the temporary copy of the data stream to the target path, unless
+    the export failed or the content is a duplicate.
+
+    Args:
+      display_name (str): display name of the data stream.
+      target_path (str): path of the target.
+      relative_target_path (str): path of the target relative to the
+          destination.
+      temporary_path (str): path of the temporary copy of the data stream.
+      digest (str): hexadecimal representation of the SHA-256 digest of the
+          data stream or None if not calculated.
+      error (str): error message or None if the data stream was copied.
+      output_writer (CLIOutputWriter): output writer.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    is_exported = False
+
+    if error:
+      output_writer.Write((
+          '[skipping] unable to export contents of file entry: {0:s} '
+          'with error: {1:s}\n').format(display_name, error))
+
+    elif (skip_duplicates and
+          self._digest_index.GetDisplayNameByDigest(digest)):
+      duplicate_display_name = self._digest_index.GetDisplayNameByDigest(
+          digest)
+      output_writer.Write((
+          '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
+          'digest: {2:s}\n').format(
+              display_name, duplicate_display_name, digest))
+
+      self._digest_index.AddTarget(
+          relative_target_path, digest, is_duplicate=True)
+
+    elif os.path.exists(target_path):
+      output_writer.Write((
+          '[skipping] unable to export contents of file entry: {0:s} '
+          'because exported file: {1:s} already exists.\n').format(
+              display_name, target_path))
+
+    else:
+      try:
+        os.rename(temporary_path, target_path)
+        is_exported = True
+
+      except (IOError, OSError) as exception:
+        output_writer.Write((
+            '[skipping] unable to export contents of file entry: {0:s} '
+            'with error: {1!s}\n').format(display_name, exception))
+
+    if not is_exported:
+      try:
+        os.remove(temporary_path)
+      except (IOError, OSError):
+        pass
+
+    elif skip_duplicates:
+      self._digest_index.AddDigest(digest, display_name)
+      self._digest_index.AddTarget(relative_target_path, digest)
+
   # TODO: refactor, this is a duplicate of the function in engine.
   def _GetSourceFileSystem(self, source_path_spec, resolver_context=None):
     """Retrieves the file system of the source.
@@ -372,6 +735,36 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     return file_system, mount_point
 
+  def _IndexExportedFile(self, target_path, relative_target_path):
+    """Adds a file exported by a previous export to the digest index.
+
+    This is needed when a previous export was interrupted before its digest
+    index was updated.
+
+    Args:
+      target_path (str): path of the target.
+      relative_target_path (str): path of the target relative to the
+          destination.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=target_path)
+
+    try:
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+          path_spec, resolver_context=self._resolver_context)
+      digest = self._CalculateDigestHash(file_entry, '')
+    except (IOError, dfvfs_errors.BackEndError) as exception:
+      logger.warning((
+          'Unable to determine digest of exported file: {0:s} with error: '
+          '{1!s}').format(target_path, exception))
+      return
+
+    if digest:
+      # The display name of the source is not known, hence the target path
+      # is used instead.
+      self._digest_index.AddDigest(digest, target_path)
+      self._digest_index.AddTarget(relative_target_path, digest)
+
   def _ParseExtensionsString(self, extensions_string):
     """Parses the extensions string.
 
@@ -492,6 +885,37 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     logger.debug('Preprocessing done.')
 
+  def _ProcessPendingExports(
+      self, output_writer, maximum_number_of_pending_exports=0):
+    """Processes data streams exported by the export worker processes.
+
+    Args:
+      output_writer (CLIOutputWriter): output writer.
+      maximum_number_of_pending_exports (Optional[int]): maximum number of
+          exports that can remain pending, where 0 represents to wait for all
+          pending exports.
+    """
+    while len(self._pending_exports) > maximum_number_of_pending_exports:
+      completed_exports = [
+          pending_export for pending_export in self._pending_exports
+          if pending_export[0].ready()]
+
+      if not completed_exports:
+        self._pending_exports[0][0].wait(self._PENDING_EXPORT_WAIT_TIME)
+        continue
+
+      for pending_export in completed_exports:
+        self._pending_exports.remove(pending_export)
+
+        (async_result, display_name, target_path, relative_target_path,
+         temporary_path, skip_duplicates) = pending_export
+
+        digest, error = async_result.get()
+
+        self._FinalizeExport(
+            display_name, target_path, relative_target_path, temporary_path,
+            digest, error, output_writer, skip_duplicates=skip_duplicates)
+
   def _ReadSpecificationFile(self, path):
     """Reads the format specification file.
 
@@ -538,34 +962,60 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     return specification_store
 
-  def _WriteFileEntry(self, file_entry, data_stream_name, destination_file):
+  @classmethod
+  def _WriteFileEntry(
+      cls, file_entry, data_stream_name, destination_file,
+      calculate_digest=False):
     """Writes the contents of the source file entry to a destination file.
 
-    Note that this function will overwrite an existing file.
+    Note that this function will overwrite an existing file. This is a class
+    method so that it can be called by the export worker processes, which do
+    not have an image export tool.
 
     Args:
       file_entry (dfvfs.FileEntry): file entry whose content is to be written.
       data_stream_name (str): name of the data stream whose content is to be
           written.
       destination_file (str): path of the destination file.
+      calculate_digest (Optional[bool]): True if the SHA-256 digest of the
+          content should be calculated while it is written.
+
+    Returns:
+      str: hexadecimal representation of the SHA-256 digest or None if
+          not calculated.
+
+    Raises:
+      IOError: if the data stream cannot be opened.
+      OSError: if the data stream cannot be opened.
     """
     source_file_object = file_entry.GetFileObject(
         data_stream_name=data_stream_name)
     if not source_file_object:
-      return
+      raise IOError('Unable to open data stream.')
+
+    hasher_object = None
+    if calculate_digest:
+      hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
 
     try:
       with open(destination_file, 'wb') as destination_file_object:
         source_file_object.seek(0, os.SEEK_SET)
 
-        data = source_file_object.read(self._COPY_BUFFER_SIZE)
+        data = source_file_object.read(cls._COPY_BUFFER_SIZE)
         while data:
+          if hasher_object:
+            hasher_object.Update(data)
           destination_file_object.write(data)
-          data = source_file_object.read(self._COPY_BUFFER_SIZE)
+          data = source_file_object.read(cls._COPY_BUFFER_SIZE)
 
     finally:
       source_file_object.close()
 
+    if not hasher_object:
+      return None
+
+    return hasher_object.GetStringDigest()
+
   def AddFilterOptions(self, argument_group):
     """Adds the filter options to the argument group.
 
@@ -668,6 +1118,21 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
             'previously exported files and duplicates are skipped. Use '
             'this option to include duplicate files in the export.'))
 
+    argument_parser.add_argument(
+        '--resume', dest='resume', action='store', type=str, default=None,
+        metavar='PATH', help=(
+            'Path of a file in which the digests of the exported files are '
+            'stored, so that an interrupted export can be resumed without '
+            'exporting duplicate files. The file should not be stored in the '
+            'export directory and is reused by every export that is resumed. '
+            'By default the digests are only kept during the export.'))
+
+    argument_parser.add_argument(
+        '--workers', dest='workers', action='store', type=int, default=0,
+        metavar='NUMBER', help=(
+            'Number of worker processes that export file content concurrently. '
+            'By default file content is exported by the main process.'))
+
     argument_parser.add_argument(
         self._SOURCE_OPTION, nargs='?', action='store', metavar='IMAGE',
         default=None, type=str, help=(
@@ -741,6 +1206,16 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         getattr(options, 'include_duplicates', False)):
       self._skip_duplicates = False
 
+    self._digest_index_path = self.ParseStringOption(options, 'resume')
+    if self._digest_index_path and not self._skip_duplicates:
+      raise errors.BadConfigOption(
+          'Resuming an export is not supported when duplicates are included.')
+
+    self._number_of_workers = getattr(options, 'workers', None) or 0
+    if self._number_of_workers < 0:
+      raise errors.BadConfigOption(
+          'Invalid number of workers value cannot be negative.')
+
     self._EnforceProcessMemoryLimit(self._process_memory_limit)
 
   def PrintFilterCollection(self):
@@ -762,16 +1237,49 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     if not os.path.isdir(self._destination_path):
       os.makedirs(self._destination_path)
 
-    if self._artifact_filters or self._filter_file:
-      self._ExtractWithFilter(
-          self._source_path_specs, self._destination_path, self._output_writer,
-          self._artifact_filters, self._filter_file,
-          self._artifact_definitions_path, self._custom_artifacts_path,
-          skip_duplicates=self._skip_duplicates)
-    else:
-      self._Extract(
-          self._source_path_specs, self._destination_path, self._output_writer,
-          skip_duplicates=self._skip_duplicates)
+    # Remove partial copies left behind by an interrupted export.
+    temporary_directory = os.path.join(
+        self._destination_path, self._TEMPORARY_DIRECTORY_NAME)
+    if os.path.isdir(temporary_directory):
+      shutil.rmtree(temporary_directory)
+
+    if self._skip_duplicates:
+      self._digest_index = ImageExportDigestIndex()
+      self._digest_index.Open(path=self._digest_index_path)
+
+    if self._number_of_workers:
+      self._worker_pool = multiprocessing.Pool(
+          processes=self._number_of_workers,
+          initializer=_InitializeExportWorker)
+
+    try:
+      if self._artifact_filters or self._filter_file:
+        self._ExtractWithFilter(
+            self._source_path_specs, self._destination_path,
+            self._output_writer, self._artifact_filters, self._filter_file,
+            self._artifact_definitions_path, self._custom_artifacts_path,
+            skip_duplicates=self._skip_duplicates)
+      else:
+        self._Extract(
+            self._source_path_specs, self._destination_path,
+            self._output_writer, skip_duplicates=self._skip_duplicates)
+
+      self._ProcessPendingExports(self._output_writer)
+
+    finally:
+      if self._worker_pool:
+        self._worker_pool.terminate()
+        self._worker_pool.join()
+        self._worker_pool = None
+
+      self._pending_exports = []
+
+      if self._digest_index:
+        self._digest_index.Close()
+        self._digest_index = None
+
+    if os.path.isdir(temporary_directory):
+      shutil.rmtree(temporary_directory)
 
     self._output_writer.Write('Export completed.\n')
     self._output_writer.Write('\n')
@@ -222,7 +222,19 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     storage_group = argument_parser.add_argument_group('storage arguments')
 
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
-        storage_group, names=['storage_format'])
+        storage_group, names=['sqlite_storage', 'storage_format'])
+
+    serializer_formats = sorted(definitions.SERIALIZER_FORMATS)
+
+    storage_group.add_argument(
+        '--serializer_format', '--serializer-format', action='store',
+        choices=serializer_formats, dest='serializer_format', type=str,
+        metavar='FORMAT', default=definitions.SERIALIZER_FORMAT_JSON, help=(
+            'Format used to serialize the attribute containers in the '
+            'storage file, the default is: {0:s}. Supported options: '
+            '{1:s}').format(
+                definitions.SERIALIZER_FORMAT_JSON,
+                ', '.join(serializer_formats)))
 
     argument_parser.add_argument(
         self._SOURCE_OPTION, action='store', metavar='SOURCE', nargs='?',
@@ -320,8 +332,8 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
 
     argument_helper_names = [
         'artifact_definitions', 'artifact_filters', 'extraction',
-        'filter_file', 'status_view', 'storage_file', 'storage_format',
-        'text_prepend', 'yara_rules']
+        'filter_file', 'sqlite_storage', 'status_view', 'storage_file',
+        'storage_format', 'text_prepend', 'yara_rules']
     helpers_manager.ArgumentHelperManager.ParseOptions(
         options, self, names=argument_helper_names)
 
@@ -394,7 +406,11 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
         preferred_year=self._preferred_year)
 
     storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
-        self._storage_format, session, self._storage_file_path)
+        self._storage_format, session, self._storage_file_path,
+        cache_size=self._sqlite_cache_size,
+        journal_mode=self._sqlite_journal_mode,
+        page_size=self._sqlite_page_size,
+        serialization_format=self._storage_serializer_format)
     if not storage_writer:
       raise errors.BadConfigOption(
           'Unsupported storage format: {0:s}'.format(self._storage_format))
@@ -54,6 +54,7 @@ class PinfoTool(
 
     self._verbose = False
     self.compare_storage_information = False
+    self.create_event_timestamp_index = False
 
   def _CalculateStorageCounters(self, storage):
     """Calculates the counters of the entire storage.
@@ -426,6 +427,10 @@ class PinfoTool(
     table_view.AddRow(['Filename', os.path.basename(self._storage_file_path)])
     table_view.AddRow(['Format version', storage.format_version])
     table_view.AddRow(['Serialization format', storage.serialization_format])
+    if storage.HasEventTimestampIndex():
+      table_view.AddRow(['Event timestamp index', 'Yes'])
+    else:
+      table_view.AddRow(['Event timestamp index', 'No'])
     table_view.Write(self._output_writer)
 
     if storage.storage_type == definitions.STORAGE_TYPE_SESSION:
@@ -466,10 +471,15 @@ class PinfoTool(
     """
     serializer = json_serializer.JSONAttributeContainerSerializer
     self._output_writer.Write('{')
-    for index, session in enumerate(storage.GetSessions()):
+
+    if storage.HasEventTimestampIndex():
+      self._output_writer.Write('"event_timestamp_index": true')
+    else:
+      self._output_writer.Write('"event_timestamp_index": false')
+
+    for session in storage.GetSessions():
       json_string = serializer.WriteSerialized(session)
-      if index != 0:
-        self._output_writer.Write(',\n')
+      self._output_writer.Write(',\n')
       self._output_writer.Write('"session_{0:s}": {1:s} '.format(
           session.identifier, json_string))
     self._output_writer.Write('}')
@@ -547,6 +557,50 @@ class PinfoTool(
 
     return result
 
+  def CreateEventTimestampIndex(self):
+    """Creates the event timestamp index in the storage file.
+
+    This upgrades a storage file, created by an older version of plaso, in
+    place so that psort can read events in chronological order without
+    sorting the entire event table.
+
+    Returns:
+      bool: True if the event timestamp index was created or already existed.
+    """
+    storage_file = storage_factory.StorageFactory.CreateStorageFileForFile(
+        self._storage_file_path)
+    if not storage_file:
+      logger.error(
+          'Format of storage file: {0:s} not supported'.format(
+              self._storage_file_path))
+      return False
+
+    try:
+      storage_file.Open(path=self._storage_file_path, read_only=False)
+    except IOError as exception:
+      logger.error(
+          'Unable to open storage file: {0:s} with error: {1!s}'.format(
+              self._storage_file_path, exception))
+      return False
+
+    try:
+      if storage_file.HasEventTimestampIndex():
+        self._output_writer.Write('Event timestamp index already exists.\n')
+      else:
+        storage_file.CreateEventTimestampIndex()
+        self._output_writer.Write('Event timestamp index created.\n')
+
+    except IOError as exception:
+      logger.error(
+          'Unable to create event timestamp index with error: {0!s}'.format(
+              exception))
+      return False
+
+    finally:
+      storage_file.Close()
+
+    return True
+
   def ParseArguments(self):
     """Parses the command line arguments.
 
@@ -572,6 +626,13 @@ class PinfoTool(
         action='store', default='', metavar='STORAGE_FILE', help=(
             'The path of the storage file to compare against.'))
 
+    argument_parser.add_argument(
+        '--create_index', '--create-index', dest='create_index',
+        action='store_true', default=False, help=(
+            'Create the event timestamp index if the storage file does not '
+            'contain it. This upgrades a storage file created by an older '
+            'version of plaso in place.'))
+
     argument_parser.add_argument(
         '--output_format', '--output-format', dest='output_format', type=str,
         choices=['text', 'json'], action='store', default='text',
@@ -647,6 +708,8 @@ class PinfoTool(
       self._compare_storage_file_path = compare_storage_file_path
       self.compare_storage_information = True
 
+    self.create_event_timestamp_index = getattr(options, 'create_index', False)
+
     self._output_format = self.ParseStringOption(options, 'output_format')
 
     if self._output_filename:
@@ -81,8 +81,12 @@ class PsortTool(
     self._event_filter = None
     self._knowledge_base = knowledge_base.KnowledgeBase()
     self._number_of_analysis_reports = 0
+    self._number_of_export_workers = 0
     self._preferred_language = 'en-US'
     self._process_memory_limit = None
+    self._sqlite_cache_size = None
+    self._sqlite_journal_mode = None
+    self._sqlite_page_size = None
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._stdout_output_writer = isinstance(
@@ -263,6 +267,14 @@ class PsortTool(
 
     self._worker_memory_limit = worker_memory_limit
 
+    number_of_export_workers = getattr(options, 'export_workers', 0) or 0
+
+    if number_of_export_workers < 0:
+      raise errors.BadConfigOption(
+          'Invalid number of export workers value cannot be negative.')
+
+    self._number_of_export_workers = number_of_export_workers
+
   def _PrintAnalysisReportsDetails(self, storage_reader):
     """Prints the details of the analysis reports.
 
@@ -304,6 +316,15 @@ class PsortTool(
             'If a worker process exceeds this limit is is killed by the main '
             '(foreman) process.'))
 
+    argument_group.add_argument(
+        '--export-workers', '--export_workers', dest='export_workers',
+        action='store', type=int, default=0, metavar='NUMBER', help=(
+            'Number of worker processes used to export the events, where 0 '
+            'or 1 represents the events are exported by the main process. '
+            'Multiple export workers require a storage file with an event '
+            'timestamp index, see pinfo --create-index, and an output format '
+            'that supports partitioned output.'))
+
   def ParseArguments(self):
     """Parses the command line arguments.
 
@@ -330,6 +351,9 @@ class PsortTool(
     processing_group = argument_parser.add_argument_group('Processing')
     self.AddProcessingOptions(processing_group)
 
+    helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
+        processing_group, names=['sqlite_storage'])
+
     info_group = argument_parser.add_argument_group('Informational Arguments')
 
     self.AddLogFileOptions(info_group)
@@ -467,7 +491,7 @@ class PsortTool(
     self._command_line_arguments = self.GetCommandLineArguments()
 
     helpers_manager.ArgumentHelperManager.ParseOptions(
-        options, self, names=['storage_file'])
+        options, self, names=['sqlite_storage', 'storage_file'])
 
     # TODO: move check into _CheckStorageFile.
     if not self._storage_file_path:
@@ -522,7 +546,9 @@ class PsortTool(
     if self._analysis_plugins:
       storage_writer = (
           storage_factory.StorageFactory.CreateStorageWriterForFile(
-              session, self._storage_file_path))
+              session, self._storage_file_path,
+              cache_size=self._sqlite_cache_size,
+              journal_mode=self._sqlite_journal_mode))
 
       # TODO: add single processing support.
       analysis_engine = psort.PsortMultiProcessEngine(
@@ -544,7 +570,7 @@ class PsortTool(
     if self._output_format != 'null':
       storage_reader = (
           storage_factory.StorageFactory.CreateStorageReaderForFile(
-              self._storage_file_path))
+              self._storage_file_path, cache_size=self._sqlite_cache_size))
 
       # TODO: add single processing support.
       analysis_engine = psort.PsortMultiProcessEngine(
@@ -554,7 +580,10 @@ class PsortTool(
           self._knowledge_base, storage_reader, self._output_module,
           configuration, deduplicate_events=self._deduplicate_events,
           event_filter=self._event_filter,
+          number_of_worker_processes=self._number_of_export_workers,
           status_update_callback=status_update_callback,
+          storage_file_path=self._storage_file_path,
+          temporary_directory=self._temporary_directory,
           time_slice=self._time_slice, use_time_slicer=self._use_time_slicer)
 
     if self._quiet_mode:
@@ -347,6 +347,13 @@ class StatusView(object):
       self._output_writer.Write('\n')
       table_view.Write(self._output_writer)
 
+      if tasks_status.number_of_merged_attribute_containers:
+        self._output_writer.Write((
+            'Merged\t\t\t: {0:d} attribute containers '
+            '({1:.1f} per second)\n').format(
+                tasks_status.number_of_merged_attribute_containers,
+                tasks_status.merge_rate))
+
   def GetAnalysisStatusUpdateCallback(self):
     """Retrieves the analysis status update callback function.
 
@@ -11,6 +11,7 @@ from plaso.cli import tools
 from plaso.cli import views
 from plaso.cli.helpers import manager as helpers_manager
 from plaso.cli.helpers import profiling
+from plaso.formatters import manager as formatters_manager
 from plaso.formatters import mediator as formatters_mediator
 from plaso.analyzers.hashers import manager as hashers_manager
 from plaso.lib import errors
@@ -128,6 +129,11 @@ class OutputModuleOptions(object):
     except (KeyError, TypeError) as exception:
       raise RuntimeError(exception)
 
+    # The formatted strings cache is shared by the event filter and the output
+    # module and is disabled when the events have been exported.
+    formatters_manager.FormattersManager.EnableFormattedStringsCache(
+        formatter_mediator)
+
     mediator = output_mediator.OutputMediator(
         self._knowledge_base, formatter_mediator,
         preferred_encoding=self.preferred_encoding)
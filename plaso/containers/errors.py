@@ -18,6 +18,9 @@ class ExtractionError(interface.AttributeContainer):
     parser_chain (str): parser chain to which the error applies.
     path_spec (dfvfs.PathSpec):
         path specification of the file entry to which the error applies.
+    path_spec_row_identifier (int): row identifier of the path specification
+        in the storage file or None if not stored separately. Only set while
+        the error is written to storage.
   """
   CONTAINER_TYPE = 'extraction_error'
 
@@ -34,6 +37,7 @@ class ExtractionError(interface.AttributeContainer):
     self.message = message
     self.parser_chain = parser_chain
     self.path_spec = path_spec
+    self.path_spec_row_identifier = None
 
 
 manager.AttributeContainersManager.RegisterAttributeContainer(ExtractionError)
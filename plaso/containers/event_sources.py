@@ -18,6 +18,11 @@ class EventSource(interface.AttributeContainer):
     data_type (str): attribute container type indicator.
     file_entry_type (str): dfVFS file entry type.
     path_spec (dfvfs.PathSpec): path specification.
+    path_spec_row_identifier (int): row identifier of the path specification
+        in the storage file or None if not stored separately. Only set while
+        the event source is written to storage.
+    size (int): size of the data of the event source in bytes or None
+        if not available.
   """
   CONTAINER_TYPE = 'event_source'
   DATA_TYPE = None
@@ -32,6 +37,8 @@ class EventSource(interface.AttributeContainer):
     self.data_type = self.DATA_TYPE
     self.file_entry_type = None
     self.path_spec = path_spec
+    self.path_spec_row_identifier = None
+    self.size = None
 
   # This method is necessary for heap sort.
   def __lt__(self, other):
@@ -76,14 +76,10 @@ class AttributeContainer(object):
     Returns:
       list[str]: attribute names.
     """
-    attribute_names = []
-    for attribute_name in iter(self.__dict__.keys()):
-      # Not using startswith to improve performance.
-      if attribute_name[0] == '_':
-        continue
-      attribute_names.append(attribute_name)
-
-    return attribute_names
+    # Not using startswith to improve performance.
+    return [
+        attribute_name for attribute_name in self.__dict__
+        if attribute_name[0] != '_']
 
   def GetAttributes(self):
     """Retrieves the attribute names and values.
@@ -30,4 +30,27 @@ class MountPoint(interface.AttributeContainer):
     self.path_specification = path_specification
 
 
-manager.AttributeContainersManager.RegisterAttributeContainer(MountPoint)
+class PathSpecification(interface.AttributeContainer):
+  """Path specification attribute container.
+
+  The path specification attribute container is used by stores to keep
+  a single copy of a path specification that is shared by multiple other
+  attribute containers, such as event data or event sources.
+
+  Attributes:
+    path_spec (dfvfs.PathSpec): path specification.
+  """
+  CONTAINER_TYPE = 'path_spec'
+
+  def __init__(self, path_spec=None):
+    """Initializes a path specification attribute container.
+
+    Args:
+      path_spec (Optional[dfvfs.PathSpec]): path specification.
+    """
+    super(PathSpecification, self).__init__()
+    self.path_spec = path_spec
+
+
+manager.AttributeContainersManager.RegisterAttributeContainers([
+    MountPoint, PathSpecification])
@@ -31,6 +31,9 @@ class Task(interface.AttributeContainer):
     merge_priority (int): priority used for the task storage file merge, where
         a lower value indicates a higher priority to merge.
     path_spec (dfvfs.PathSpec): path specification.
+    path_specs (list[dfvfs.PathSpec]): path specifications of a task that
+        processes multiple path specifications, in which case path_spec
+        is not set.
     session_identifier (str): the identifier of the session the task is part of.
     start_time (int): time that the task was started. Contains the number
         of micro seconds since January 1, 1970, 00:00:00 UTC.
@@ -54,6 +57,7 @@ class Task(interface.AttributeContainer):
     self.last_processing_time = None
     self.merge_priority = None
     self.path_spec = None
+    self.path_specs = None
     self.session_identifier = session_identifier
     self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
     self.storage_file_size = None
@@ -83,12 +87,41 @@ class Task(interface.AttributeContainer):
     retry_task.file_entry_type = self.file_entry_type
     retry_task.merge_priority = self.merge_priority
     retry_task.path_spec = self.path_spec
+    retry_task.path_specs = self.path_specs
     retry_task.storage_file_size = self.storage_file_size
 
     self.has_retry = True
 
     return retry_task
 
+  def CreateRetryTasks(self):
+    """Creates new tasks to retry a previously abandoned task.
+
+    A task with multiple path specifications is retried as a task per path
+    specification, so that a path specification that causes a worker to fail
+    does not prevent the other path specifications from being processed.
+    The storage file size of the abandoned task is not copied, since it
+    represents all path specifications and would otherwise be accounted for
+    once per retry task.
+
+    Returns:
+      list[Task]: tasks to retry a previously abandoned task.
+    """
+    if not self.path_specs:
+      return [self.CreateRetryTask()]
+
+    retry_tasks = []
+    for path_spec in self.path_specs:
+      retry_task = Task(session_identifier=self.session_identifier)
+      retry_task.file_entry_type = self.file_entry_type
+      retry_task.merge_priority = self.merge_priority
+      retry_task.path_spec = path_spec
+      retry_tasks.append(retry_task)
+
+    self.has_retry = True
+
+    return retry_tasks
+
   def CreateTaskCompletion(self):
     """Creates a task completion.
 
@@ -117,6 +150,20 @@ class Task(interface.AttributeContainer):
     task_start.timestamp = self.start_time
     return task_start
 
+  def GetPathSpecs(self):
+    """Retrieves the path specifications to process.
+
+    Returns:
+      list[dfvfs.PathSpec]: path specifications.
+    """
+    if self.path_specs:
+      return list(self.path_specs)
+
+    if self.path_spec:
+      return [self.path_spec]
+
+    return []
+
   def UpdateProcessingTime(self):
     """Updates the processing time to now."""
     self.last_processing_time = int(
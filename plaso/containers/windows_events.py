@@ -3,7 +3,11 @@
 
 from __future__ import unicode_literals
 
+import re
+
 from plaso.containers import events
+from plaso.containers import interface
+from plaso.containers import manager
 
 
 class WindowsDistributedLinkTrackingEventData(events.EventData):
@@ -46,6 +50,106 @@ class WindowsDistributedLinkTrackingEventData(events.EventData):
     self.uuid = '{0!s}'.format(uuid)
 
 
+class WindowsEventLogXMLTemplate(interface.AttributeContainer):
+  """Windows XML EventLog (EVTX) XML template attribute container.
+
+  The XML template is the XML representation of an event record where
+  the values, such as the element text and most attribute values, are
+  replaced by placeholders. Event records with the same structure share
+  the same XML template, hence stores keep a single copy of an XML template
+  that is referenced by the event data of multiple event records.
+
+  Attributes:
+    template (str): XML template.
+  """
+  CONTAINER_TYPE = 'evtx_xml_template'
+
+  _PLACEHOLDER = '\x00'
+
+  # Attribute values that are typically the same for every event record of
+  # an event provider are kept in the XML template.
+  _TEMPLATE_ATTRIBUTES = frozenset(['Guid="', 'Name="'])
+
+  # Regular expression that matches attribute values and element text that
+  # does not only consist of whitespace.
+  _VALUES_RE = re.compile(
+      r'((?<==")[^"]*(?=")|(?<=>)[^<]*[^<\s][^<]*(?=<))')
+
+  def __init__(self, template=None):
+    """Initializes a Windows XML EventLog (EVTX) XML template.
+
+    Args:
+      template (Optional[str]): XML template.
+    """
+    super(WindowsEventLogXMLTemplate, self).__init__()
+    self._template_parts = None
+    self.template = template
+
+  @classmethod
+  def SplitXMLString(cls, xml_string):
+    """Splits a XML string into a XML template and values.
+
+    Args:
+      xml_string (str): XML representation of an event record.
+
+    Returns:
+      tuple: containing:
+
+        str: XML template or None if the XML string cannot be split.
+        list[str]: values or None if the XML string cannot be split.
+    """
+    if not xml_string or cls._PLACEHOLDER in xml_string:
+      return None, None
+
+    # Since the regular expression has a single group the parts alternate
+    # between markup and values.
+    parts = cls._VALUES_RE.split(xml_string)
+
+    template_parts = [parts[0]]
+    values = []
+    for part_index in range(1, len(parts), 2):
+      value = parts[part_index]
+      markup = parts[part_index + 1]
+
+      last_template_part = template_parts[-1]
+      attribute = last_template_part[last_template_part.rfind(' ') + 1:]
+      if (attribute in cls._TEMPLATE_ATTRIBUTES or
+          attribute.startswith('xmlns')):
+        template_parts[-1] = ''.join([last_template_part, value, markup])
+      else:
+        template_parts.append(markup)
+        values.append(value)
+
+    return cls._PLACEHOLDER.join(template_parts), values
+
+  def Render(self, values):
+    """Renders the XML string of an event record.
+
+    Args:
+      values (list[str]): values of the event record.
+
+    Returns:
+      str: XML representation of the event record.
+
+    Raises:
+      ValueError: if the number of values does not match the XML template.
+    """
+    if self._template_parts is None:
+      self._template_parts = self.template.split(self._PLACEHOLDER)
+
+    if len(values) != len(self._template_parts) - 1:
+      raise ValueError((
+          'Number of values: {0:d} does not match XML template with: {1:d} '
+          'placeholders.').format(len(values), len(self._template_parts) - 1))
+
+    string_parts = [self._template_parts[0]]
+    for value, template_part in zip(values, self._template_parts[1:]):
+      string_parts.append(value)
+      string_parts.append(template_part)
+
+    return ''.join(string_parts)
+
+
 class WindowsRegistryInstallationEventData(events.EventData):
   """Windows installation event data attribute container.
 
@@ -161,3 +265,7 @@ class WindowsVolumeEventData(events.EventData):
     # TODO: replace origin with something machine readable.
     self.origin = None
     self.serial_number = None
+
+
+manager.AttributeContainersManager.RegisterAttributeContainer(
+    WindowsEventLogXMLTemplate)
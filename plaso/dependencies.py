@@ -37,6 +37,7 @@ PYTHON_DEPENDENCIES = {
     'lzma': ('__version__', '', None, False),
     'pefile': ('__version__', '2018.8.8', None, True),
     'psutil': ('__version__', '5.4.3', None, True),
+    'pyarrow': ('__version__', '0.11.0', None, False),
     'pybde': ('get_version()', '20140531', None, True),
     'pyesedb': ('get_version()', '20150409', None, True),
     'pyevt': ('get_version()', '20120410', None, True),
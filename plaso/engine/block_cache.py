@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""Read-through block cache for file-like objects."""
+
+from __future__ import unicode_literals
+
+import os
+
+from plaso.lib import cachelib
+
+
+class BlockCacheFileObject(object):
+  """File-like object that caches the blocks read from another file-like object.
+
+  The block cache is used to share the data of a data stream between
+  the analyzers, the signature scanner and the parsers, so that the data is
+  only read once from the underlying, and possibly compressed or encrypted,
+  storage media image.
+
+  The cache is scan-resistant: while sequential read is enabled, for example
+  when the analyzers hash or Yara scan the entire data stream, blocks that
+  are not cached are only added to the cache while it is not full. This
+  prevents a full pass over a large data stream from evicting the blocks
+  the signature scanner and parsers read, such as those of the file header.
+
+  Attributes:
+    number_of_hits (int): number of blocks read from the cache.
+    number_of_misses (int): number of blocks read from the underlying
+        file-like object.
+  """
+
+  _DEFAULT_BLOCK_SIZE = 64 * 1024
+
+  _DEFAULT_MAXIMUM_CACHE_SIZE = 32 * 1024 * 1024
+
+  def __init__(
+      self, file_object, block_size=None, maximum_cache_size=None):
+    """Initializes a block cache file-like object.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object to read from.
+      block_size (Optional[int]): size of a cached block in bytes.
+      maximum_cache_size (Optional[int]): maximum size of the cached blocks in
+          bytes.
+
+    Raises:
+      ValueError: if the block size or maximum cache size is out of bounds.
+    """
+    block_size = block_size or self._DEFAULT_BLOCK_SIZE
+    if block_size <= 0:
+      raise ValueError('Block size out of bounds.')
+
+    if maximum_cache_size is None:
+      maximum_cache_size = self._DEFAULT_MAXIMUM_CACHE_SIZE
+    if maximum_cache_size < 0:
+      raise ValueError('Maximum cache size out of bounds.')
+
+    super(BlockCacheFileObject, self).__init__()
+    self._block_cache = cachelib.LeastRecentlyUsedCache(
+        maximum_cache_size // block_size)
+    self._block_size = block_size
+    self._current_offset = 0
+    self._file_object = file_object
+    self._sequential_read = False
+    self._size = file_object.get_size()
+
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+  def _ReadBlocks(self, first_block_number, last_block_number):
+    """Reads consecutive blocks from the underlying file-like object.
+
+    Args:
+      first_block_number (int): number of the first block to read.
+      last_block_number (int): number of the last block to read.
+
+    Returns:
+      bytes: data of the blocks.
+    """
+    read_offset = first_block_number * self._block_size
+    read_size = min(
+        (last_block_number + 1) * self._block_size, self._size) - read_offset
+
+    self._file_object.seek(read_offset, os.SEEK_SET)
+    data = self._file_object.read(read_size)
+
+    self.number_of_misses += last_block_number - first_block_number + 1
+
+    block_number = first_block_number
+    for data_offset in range(0, len(data), self._block_size):
+      block_data = data[data_offset:data_offset + self._block_size]
+
+      if self._sequential_read and (
+          len(self._block_cache) >= self._block_cache.maximum_number_of_values):
+        # Sequential reads do not evict cached blocks.
+        break
+
+      # Only cache complete blocks or the last block of the data.
+      block_end_offset = read_offset + data_offset + len(block_data)
+      if (len(block_data) == self._block_size or
+          block_end_offset == self._size):
+        self._block_cache.SetValue(block_number, block_data)
+
+      block_number += 1
+
+    return data
+
+  def SetSequentialRead(self, sequential_read):
+    """Sets whether the data stream is read sequentially.
+
+    Args:
+      sequential_read (bool): True if the data stream is read sequentially
+          in its entirety, in which case reads do not evict cached blocks.
+    """
+    self._sequential_read = sequential_read
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def close(self):
+    """Closes the file-like object and empties the block cache."""
+    self._block_cache.Empty()
+    self._file_object.close()
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+    """
+    return self._size
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    if size is None or size < 0:
+      size = self._size - self._current_offset
+
+    if size == 0 or self._current_offset >= self._size:
+      return b''
+
+    end_offset = min(self._current_offset + size, self._size)
+
+    first_block_number = self._current_offset // self._block_size
+    last_block_number = (end_offset - 1) // self._block_size
+
+    data_segments = []
+    block_number = first_block_number
+    while block_number <= last_block_number:
+      block_data = self._block_cache.GetValue(block_number)
+      if block_data is not None:
+        self.number_of_hits += 1
+        data_segments.append(block_data)
+        block_number += 1
+        continue
+
+      # Read consecutive blocks that are not cached with a single read.
+      last_uncached_block_number = block_number
+      while (last_uncached_block_number < last_block_number and
+             last_uncached_block_number + 1 not in self._block_cache):
+        last_uncached_block_number += 1
+
+      data_segments.append(
+          self._ReadBlocks(block_number, last_uncached_block_number))
+      block_number = last_uncached_block_number + 1
+
+    if len(data_segments) == 1:
+      data = data_segments[0]
+    else:
+      data = b''.join(data_segments)
+
+    data_offset = self._current_offset - (
+        first_block_number * self._block_size)
+    data_size = end_offset - self._current_offset
+    if data_offset > 0 or len(data) > data_size:
+      data = data[data_offset:data_offset + data_size]
+
+    self._current_offset += len(data)
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def seekable(self):
+    """Determines if a file-like object is seekable.
+
+    Returns:
+      bool: True since a block cache file-like object is seekable.
+    """
+    return True
+
+  def tell(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
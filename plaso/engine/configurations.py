@@ -37,6 +37,9 @@ class EventExtractionConfiguration(interface.AttributeContainer):
   These settings are primarily used by the parser mediator.
 
   Attributes:
+    evtx_xml_templates (bool): True if the XML representation of Windows
+        XML EventLog (EVTX) records should be stored as XML template and
+        values.
     filter_object (objectfilter.Filter): filter that specifies which
         events to include.
     text_prepend (str): text to prepend to every event.
@@ -46,6 +49,7 @@ class EventExtractionConfiguration(interface.AttributeContainer):
   def __init__(self):
     """Initializes an event extraction configuration object."""
     super(EventExtractionConfiguration, self).__init__()
+    self.evtx_xml_templates = False
     self.filter_object = None
     self.text_prepend = None
 
@@ -64,7 +68,12 @@ class ExtractionConfiguration(interface.AttributeContainer):
         scanned for file entries.
     process_compressed_streams (bool): True if file content in
         compressed streams should be processed.
+    yara_compiled_rules (bytes): compiled Yara rules, which are used
+        instead of yara_rules_string when set.
     yara_rules_string (str): Yara rule definitions.
+    yara_time_budget (int): maximum number of seconds the Yara analyzer
+        should spend on a single file, where 0 represents unlimited and
+        None the analyzer default.
   """
   CONTAINER_TYPE = 'extraction_configuration'
 
@@ -75,7 +84,9 @@ class ExtractionConfiguration(interface.AttributeContainer):
     self.hasher_names_string = None
     self.process_archives = False
     self.process_compressed_streams = True
+    self.yara_compiled_rules = None
     self.yara_rules_string = None
+    self.yara_time_budget = None
 
 
 class InputSourceConfiguration(interface.AttributeContainer):
@@ -105,7 +116,7 @@ class ProfilingConfiguration(interface.AttributeContainer):
         * 'memory', which profiles memory usage;
         * 'parsers', which profiles CPU time consumed by individual parsers;
         * 'processing', which profiles CPU time consumed by different parts of
-          processing;
+          processing and the usage of caches used during processing;
         * 'serializers', which profiles CPU time consumed by individual
           serializers.
         * 'storage', which profiles storage reads and writes.
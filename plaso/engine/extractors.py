@@ -8,6 +8,7 @@ from __future__ import unicode_literals
 
 import copy
 import hashlib
+import os
 
 import pysigscan
 
@@ -290,21 +291,31 @@ class EventExtractor(object):
 
     return parse_results
 
-  def ParseDataStream(self, parser_mediator, file_entry, data_stream_name):
+  def ParseDataStream(
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
     """Parses a data stream of a file entry with the enabled parsers.
 
     Args:
       parser_mediator (ParserMediator): parser mediator.
       file_entry (dfvfs.FileEntry): file entry.
       data_stream_name (str): data stream name.
+      file_object (Optional[file]): file-like object of the data stream.
+          If not set the data stream of the file entry is opened and closed
+          after parsing. A file-like object that is set is not closed.
 
     Raises:
       RuntimeError: if the file-like object or the parser object is missing.
     """
-    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
-    if not file_object:
-      raise RuntimeError(
-          'Unable to retrieve file-like object from file entry.')
+    close_file_object = not file_object
+    if close_file_object:
+      file_object = file_entry.GetFileObject(
+          data_stream_name=data_stream_name)
+      if not file_object:
+        raise RuntimeError(
+            'Unable to retrieve file-like object from file entry.')
+
+    else:
+      file_object.seek(0, os.SEEK_SET)
 
     try:
       parser_names = self._GetSignatureMatchParserNames(file_object)
@@ -323,7 +334,8 @@ class EventExtractor(object):
             file_object=file_object)
 
     finally:
-      file_object.close()
+      if close_file_object:
+        file_object.close()
 
   def ParseFileEntryMetadata(self, parser_mediator, file_entry):
     """Parses the file entry metadata e.g. file system data.
@@ -512,7 +512,11 @@ class TasksStatus(object):
   """The status of the tasks.
 
   Attributes:
+    merge_rate (float): number of attribute containers merged per second
+        since the previous status update.
     number_of_abandoned_tasks (int): number of abandoned tasks.
+    number_of_merged_attribute_containers (int): number of attribute
+        containers merged from task storage into the session storage.
     number_of_queued_tasks (int): number of active tasks.
     number_of_tasks_pending_merge (int): number of tasks pending merge.
     number_of_tasks_processing (int): number of tasks processing.
@@ -522,7 +526,9 @@ class TasksStatus(object):
   def __init__(self):
     """Initializes a tasks status."""
     super(TasksStatus, self).__init__()
+    self.merge_rate = 0.0
     self.number_of_abandoned_tasks = 0
+    self.number_of_merged_attribute_containers = 0
     self.number_of_queued_tasks = 0
     self.number_of_tasks_pending_merge = 0
     self.number_of_tasks_processing = 0
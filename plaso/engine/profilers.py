@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 import codecs
 import gzip
 import os
+import threading
 import time
 
 try:
@@ -42,8 +43,12 @@ class CPUTimeMeasurement(object):
 
 
 class SampleFileProfiler(object):
-  """Shared functionality for sample file-based profilers."""
+  """Shared functionality for sample file-based profilers.
 
+  A profiler can be shared by multiple threads of a process, such as the
+  main, merge and status update threads of the task engine, hence access to
+  the measurements and the sample file is serialized with a lock.
+  """
 
   # This constant must be overridden by subclasses.
   _FILENAME_PREFIX = None
@@ -63,6 +68,7 @@ class SampleFileProfiler(object):
     """
     super(SampleFileProfiler, self).__init__()
     self._identifier = identifier
+    self._lock = threading.Lock()
     self._path = configuration.directory
     self._profile_measurements = {}
     self._sample_file = None
@@ -75,7 +81,8 @@ class SampleFileProfiler(object):
       content (str): content to write to the sample file.
     """
     content_bytes = codecs.encode(content, 'utf-8')
-    self._sample_file.write(content_bytes)
+    with self._lock:
+      self._sample_file.write(content_bytes)
 
   @classmethod
   def IsSupported(cls):
@@ -100,8 +107,31 @@ class SampleFileProfiler(object):
 
   def Stop(self):
     """Stops the profiler."""
-    self._sample_file.close()
-    self._sample_file = None
+    with self._lock:
+      self._sample_file.close()
+      self._sample_file = None
+
+
+class CacheProfiler(SampleFileProfiler):
+  """The cache profiler."""
+
+  _FILENAME_PREFIX = 'cache'
+
+  _FILE_HEADER = 'Time\tName\tHits\tMisses\n'
+
+  def Sample(self, profile_name, number_of_hits, number_of_misses):
+    """Takes a sample of the usage of a cache for profiling.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+      number_of_hits (int): number of lookups that found a cached value.
+      number_of_misses (int): number of lookups that did not find a cached
+          value.
+    """
+    sample_time = time.time()
+    sample = '{0:f}\t{1:s}\t{2:d}\t{3:d}\n'.format(
+        sample_time, profile_name, number_of_hits, number_of_misses)
+    self._WritesString(sample)
 
 
 class CPUTimeProfiler(SampleFileProfiler):
@@ -117,10 +147,11 @@ class CPUTimeProfiler(SampleFileProfiler):
     Args:
       profile_name (str): name of the profile to sample.
     """
-    if profile_name not in self._profile_measurements:
-      self._profile_measurements[profile_name] = CPUTimeMeasurement()
+    with self._lock:
+      if profile_name not in self._profile_measurements:
+        self._profile_measurements[profile_name] = CPUTimeMeasurement()
 
-    self._profile_measurements[profile_name].SampleStart()
+      self._profile_measurements[profile_name].SampleStart()
 
   def StopTiming(self, profile_name):
     """Stops timing CPU time.
@@ -128,14 +159,18 @@ class CPUTimeProfiler(SampleFileProfiler):
     Args:
       profile_name (str): name of the profile to sample.
     """
-    measurements = self._profile_measurements.get(profile_name)
-    if measurements:
+    with self._lock:
+      measurements = self._profile_measurements.get(profile_name)
+      if not measurements:
+        return
+
       measurements.SampleStop()
 
       sample = '{0:f}\t{1:s}\t{2:f}\n'.format(
           measurements.start_sample_time, profile_name,
           measurements.total_cpu_time)
-      self._WritesString(sample)
+
+    self._WritesString(sample)
 
 
 class GuppyMemoryProfiler(object):
@@ -218,10 +253,46 @@ class MemoryProfiler(SampleFileProfiler):
 
 
 class ProcessingProfiler(CPUTimeProfiler):
-  """The processing profiler."""
+  """The processing profiler.
+
+  Besides the CPU time of processing phases the processing profiler samples
+  the usage of caches used during processing in a separate sample file.
+  """
 
   _FILENAME_PREFIX = 'processing'
 
+  def __init__(self, identifier, configuration):
+    """Initializes a processing profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(ProcessingProfiler, self).__init__(identifier, configuration)
+    self._cache_profiler = CacheProfiler(identifier, configuration)
+
+  def SampleCacheUsage(self, profile_name, number_of_hits, number_of_misses):
+    """Takes a sample of the usage of a cache for profiling.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+      number_of_hits (int): number of lookups that found a cached value.
+      number_of_misses (int): number of lookups that did not find a cached
+          value.
+    """
+    self._cache_profiler.Sample(profile_name, number_of_hits, number_of_misses)
+
+  def Start(self):
+    """Starts the profiler."""
+    super(ProcessingProfiler, self).Start()
+    self._cache_profiler.Start()
+
+  def Stop(self):
+    """Stops the profiler."""
+    self._cache_profiler.Stop()
+    super(ProcessingProfiler, self).Stop()
+
 
 class SerializersProfiler(CPUTimeProfiler):
   """The serializers profiler."""
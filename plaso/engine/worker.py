@@ -17,6 +17,7 @@ from dfvfs.resolver import resolver as path_spec_resolver
 from plaso.analyzers import hashing_analyzer
 from plaso.analyzers import manager as analyzers_manager
 from plaso.containers import event_sources
+from plaso.engine import block_cache
 from plaso.engine import extractors
 from plaso.engine import logger
 from plaso.lib import definitions
@@ -104,7 +105,8 @@ class EventExtractionWorker(object):
     self.last_activity_timestamp = 0.0
     self.processing_status = definitions.PROCESSING_STATUS_IDLE
 
-  def _AnalyzeDataStream(self, mediator, file_entry, data_stream_name):
+  def _AnalyzeDataStream(
+      self, mediator, file_entry, data_stream_name, file_object=None):
     """Analyzes the contents of a specific data stream of a file entry.
 
     The results of the analyzers are set in the parser mediator as attributes
@@ -117,6 +119,10 @@ class EventExtractionWorker(object):
       file_entry (dfvfs.FileEntry): file entry whose data stream is to be
           analyzed.
       data_stream_name (str): name of the data stream.
+      file_object (Optional[BlockCacheFileObject]): block cache file-like
+          object of the data stream. If not set the data stream of the file
+          entry is opened and closed after analysis. A file-like object that
+          is set is not closed.
 
     Raises:
       RuntimeError: if the file-like object cannot be retrieved from
@@ -130,16 +136,27 @@ class EventExtractionWorker(object):
       self._processing_profiler.StartTiming('analyzing')
 
     try:
-      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
-      if not file_object:
-        raise RuntimeError((
-            'Unable to retrieve file-like object for file entry: '
-            '{0:s}.').format(display_name))
+      close_file_object = not file_object
+      if close_file_object:
+        file_object = file_entry.GetFileObject(
+            data_stream_name=data_stream_name)
+        if not file_object:
+          raise RuntimeError((
+              'Unable to retrieve file-like object for file entry: '
+              '{0:s}.').format(display_name))
+
+      else:
+        # The analyzers read the entire data stream, which should not evict
+        # the blocks that the signature scanner and parsers read.
+        file_object.SetSequentialRead(True)
 
       try:
         self._AnalyzeFileObject(mediator, file_object)
       finally:
-        file_object.close()
+        if close_file_object:
+          file_object.close()
+        else:
+          file_object.SetSequentialRead(False)
 
     finally:
       if self._processing_profiler:
@@ -310,7 +327,7 @@ class EventExtractionWorker(object):
     return False
 
   def _ExtractContentFromDataStream(
-      self, mediator, file_entry, data_stream_name):
+      self, mediator, file_entry, data_stream_name, file_object=None):
     """Extracts content from a data stream.
 
     Args:
@@ -319,6 +336,9 @@ class EventExtractionWorker(object):
       file_entry (dfvfs.FileEntry): file entry to extract its content.
       data_stream_name (str): name of the data stream whose content is to be
           extracted.
+      file_object (Optional[file]): file-like object of the data stream.
+          If not set the data stream of the file entry is opened and closed
+          after extraction. A file-like object that is set is not closed.
     """
     self.processing_status = definitions.PROCESSING_STATUS_EXTRACTING
 
@@ -326,7 +346,7 @@ class EventExtractionWorker(object):
       self._processing_profiler.StartTiming('extracting')
 
     self._event_extractor.ParseDataStream(
-        mediator, file_entry, data_stream_name)
+        mediator, file_entry, data_stream_name, file_object=file_object)
 
     if self._processing_profiler:
       self._processing_profiler.StopTiming('extracting')
@@ -373,6 +393,35 @@ class EventExtractionWorker(object):
 
     self.processing_status = definitions.PROCESSING_STATUS_RUNNING
 
+  def _GetBlockCacheFileObject(self, mediator, file_entry, data_stream_name):
+    """Opens a data stream of a file entry with a read-through block cache.
+
+    The block cache file-like object is shared by the analyzers, signature
+    scanner and parsers so that the data of the data stream is only read
+    once from the underlying storage media image.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      file_entry (dfvfs.FileEntry): file entry.
+      data_stream_name (str): name of the data stream.
+
+    Returns:
+      BlockCacheFileObject: block cache file-like object.
+
+    Raises:
+      RuntimeError: if the file-like object cannot be retrieved from
+          the file entry.
+    """
+    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      display_name = mediator.GetDisplayName()
+      raise RuntimeError((
+          'Unable to retrieve file-like object for file entry: '
+          '{0:s}.').format(display_name))
+
+    return block_cache.BlockCacheFileObject(file_object)
+
   def _GetArchiveTypes(self, mediator, path_spec):
     """Determines if a data stream contains an archive such as: TAR or ZIP.
 
@@ -596,6 +645,7 @@ class EventExtractionWorker(object):
       stat_object = sub_file_entry.GetStat()
       if stat_object:
         event_source.file_entry_type = stat_object.type
+        event_source.size = getattr(stat_object, 'size', None)
 
       mediator.ProduceEventSource(event_source)
 
@@ -680,57 +730,75 @@ class EventExtractionWorker(object):
 
     mediator.ClearEventAttributes()
 
-    if data_stream and self._analyzers:
-      # Since AnalyzeDataStream generates event attributes it needs to be
-      # called before producing events.
-      self._AnalyzeDataStream(mediator, file_entry, data_stream.name)
+    file_object = None
+    try:
+      # The block cache is only used when the data stream is read by
+      # the analyzers, in which case it is shared with the signature scanner
+      # and parsers. Otherwise the parsers read the data stream directly.
+      if data_stream and self._analyzers:
+        file_object = self._GetBlockCacheFileObject(
+            mediator, file_entry, data_stream.name)
 
-    self._ExtractMetadataFromFileEntry(mediator, file_entry, data_stream)
+        # Since AnalyzeDataStream generates event attributes it needs to be
+        # called before producing events.
+        self._AnalyzeDataStream(
+            mediator, file_entry, data_stream.name, file_object=file_object)
 
-    # Not every file entry has a data stream. In such cases we want to
-    # extract the metadata only.
-    if not data_stream:
-      return
+      self._ExtractMetadataFromFileEntry(mediator, file_entry, data_stream)
 
-    # Determine if the content of the file entry should not be extracted.
-    skip_content_extraction = self._CanSkipContentExtraction(file_entry)
-    if skip_content_extraction:
-      display_name = mediator.GetDisplayName()
-      logger.debug(
-          'Skipping content extraction of: {0:s}'.format(display_name))
-      self.processing_status = definitions.PROCESSING_STATUS_IDLE
-      return
+      # Not every file entry has a data stream. In such cases we want to
+      # extract the metadata only.
+      if not data_stream:
+        return
 
-    path_spec = copy.deepcopy(file_entry.path_spec)
-    if data_stream and not data_stream.IsDefault():
-      path_spec.data_stream = data_stream.name
+      # Determine if the content of the file entry should not be extracted.
+      skip_content_extraction = self._CanSkipContentExtraction(file_entry)
+      if skip_content_extraction:
+        display_name = mediator.GetDisplayName()
+        logger.debug(
+            'Skipping content extraction of: {0:s}'.format(display_name))
+        self.processing_status = definitions.PROCESSING_STATUS_IDLE
+        return
+
+      path_spec = copy.deepcopy(file_entry.path_spec)
+      if data_stream and not data_stream.IsDefault():
+        path_spec.data_stream = data_stream.name
+
+      archive_types = []
+      compressed_stream_types = []
+
+      if self._process_compressed_streams:
+        compressed_stream_types = self._GetCompressedStreamTypes(
+            mediator, path_spec)
 
-    archive_types = []
-    compressed_stream_types = []
+      if not compressed_stream_types:
+        archive_types = self._GetArchiveTypes(mediator, path_spec)
 
-    if self._process_compressed_streams:
-      compressed_stream_types = self._GetCompressedStreamTypes(
-          mediator, path_spec)
+      if archive_types:
+        if self._process_archives:
+          self._ProcessArchiveTypes(mediator, path_spec, archive_types)
 
-    if not compressed_stream_types:
-      archive_types = self._GetArchiveTypes(mediator, path_spec)
+        if dfvfs_definitions.TYPE_INDICATOR_ZIP in archive_types:
+          # ZIP files are the base of certain file formats like docx.
+          self._ExtractContentFromDataStream(
+              mediator, file_entry, data_stream.name, file_object=file_object)
 
-    if archive_types:
-      if self._process_archives:
-        self._ProcessArchiveTypes(mediator, path_spec, archive_types)
+      elif compressed_stream_types:
+        self._ProcessCompressedStreamTypes(
+            mediator, path_spec, compressed_stream_types)
 
-      if dfvfs_definitions.TYPE_INDICATOR_ZIP in archive_types:
-        # ZIP files are the base of certain file formats like docx.
+      else:
         self._ExtractContentFromDataStream(
-            mediator, file_entry, data_stream.name)
+            mediator, file_entry, data_stream.name, file_object=file_object)
 
-    elif compressed_stream_types:
-      self._ProcessCompressedStreamTypes(
-          mediator, path_spec, compressed_stream_types)
+    finally:
+      if file_object:
+        if self._processing_profiler:
+          self._processing_profiler.SampleCacheUsage(
+              'data_stream_block_cache', file_object.number_of_hits,
+              file_object.number_of_misses)
 
-    else:
-      self._ExtractContentFromDataStream(
-          mediator, file_entry, data_stream.name)
+        file_object.close()
 
   def _ProcessMetadataFile(self, mediator, file_entry):
     """Processes a metadata file.
@@ -766,18 +834,31 @@ class EventExtractionWorker(object):
     analyzer_object.SetHasherNames(hasher_names_string)
     self._analyzers.append(analyzer_object)
 
-  def _SetYaraRules(self, yara_rules_string):
+  def _SetYaraRules(
+      self, yara_rules_string, yara_compiled_rules=None, yara_time_budget=None):
     """Sets the Yara rules.
 
     Args:
       yara_rules_string (str): unparsed Yara rule definitions.
+      yara_compiled_rules (Optional[bytes]): compiled Yara rules, which
+          are used instead of the unparsed rule definitions when set.
+      yara_time_budget (Optional[int]): maximum number of seconds to spend
+          scanning a single data stream, where 0 represents no limit and
+          None the analyzer default.
     """
-    if not yara_rules_string:
+    if not yara_rules_string and not yara_compiled_rules:
       return
 
     analyzer_object = analyzers_manager.AnalyzersManager.GetAnalyzerInstance(
         'yara')
-    analyzer_object.SetRules(yara_rules_string)
+    if yara_compiled_rules:
+      analyzer_object.SetCompiledRules(yara_compiled_rules)
+    else:
+      analyzer_object.SetRules(yara_rules_string)
+
+    if yara_time_budget is not None:
+      analyzer_object.SetTimeBudget(yara_time_budget)
+
     self._analyzers.append(analyzer_object)
 
   def GetAnalyzerNames(self):
@@ -834,7 +915,10 @@ class EventExtractionWorker(object):
     self._SetHashers(configuration.hasher_names_string)
     self._process_archives = configuration.process_archives
     self._process_compressed_streams = configuration.process_compressed_streams
-    self._SetYaraRules(configuration.yara_rules_string)
+    self._SetYaraRules(
+        configuration.yara_rules_string,
+        yara_compiled_rules=configuration.yara_compiled_rules,
+        yara_time_budget=configuration.yara_time_budget)
 
   def SetProcessingProfiler(self, processing_profiler):
     """Sets the parsers profiler.
@@ -14,6 +14,7 @@ to the description_long and description_short field.
 from __future__ import unicode_literals
 
 import re
+import string
 
 from plaso.formatters import logger
 from plaso.lib import errors
@@ -49,9 +50,68 @@ class EventFormatter(object):
       '{([a-z][a-zA-Z0-9_]*)[!]?[^:}]*[:]?[^}]*}')
 
   def __init__(self):
-    """Initializes an event formatter object."""
+    """Initializes an event formatter object.
+
+    The names of the event attributes used by the format strings are
+    determined once, so that only these attributes need to be copied from
+    an event, instead of all its attributes, when it is formatted.
+    """
     super(EventFormatter, self).__init__()
     self._format_string_attribute_names = None
+    self._format_strings_attribute_names = self._GetFieldNames([
+        self.FORMAT_STRING, self.FORMAT_STRING_SHORT])
+
+  def _CopyEventValues(self, event, attribute_names):
+    """Copies specific attribute values of an event to a dictionary.
+
+    Args:
+      event (EventObject): event.
+      attribute_names (list[str]): names of the attributes to copy.
+
+    Returns:
+      dict[str, object]: attribute values per name, where attributes that
+          are not set or are set to None are ignored, similar to
+          EventObject.CopyToDict().
+    """
+    event_values = {}
+    for attribute_name in attribute_names:
+      attribute_value = getattr(event, attribute_name, None)
+      if attribute_value is not None:
+        event_values[attribute_name] = attribute_value
+
+    return event_values
+
+  def _GetFieldNames(self, format_strings):
+    """Retrieves the names of the fields in format strings.
+
+    Args:
+      format_strings (list[str]): format strings.
+
+    Returns:
+      list[str]: names of the fields, without attribute access or element
+          index, or None if the names cannot be determined, such as when
+          a format string contains a positional field.
+    """
+    field_names = set()
+    for format_string in format_strings:
+      if not format_string:
+        continue
+
+      try:
+        for _, field_name, _, _ in string.Formatter().parse(format_string):
+          if field_name is None:
+            continue
+
+          field_name = re.split(r'[.\[]', field_name, maxsplit=1)[0]
+          if not field_name or field_name.isdigit():
+            return None
+
+          field_names.add(field_name)
+
+      except (TypeError, ValueError):
+        return None
+
+    return sorted(field_names)
 
   def _FormatMessage(self, format_string, event_values):
     """Determines the formatted message string.
@@ -175,7 +235,19 @@ class EventFormatter(object):
       raise errors.WrongFormatter('Unsupported data type: {0:s}.'.format(
           event.data_type))
 
-    event_values = event.CopyToDict()
+    event_values = None
+    if self._format_strings_attribute_names is not None:
+      event_values = self._CopyEventValues(
+          event, self._format_strings_attribute_names)
+
+      # All attribute values are copied if one is missing so that the error
+      # message of _FormatMessage contains all the event values.
+      if len(event_values) != len(self._format_strings_attribute_names):
+        event_values = None
+
+    if event_values is None:
+      event_values = event.CopyToDict()
+
     return self._FormatMessages(
         self.FORMAT_STRING, self.FORMAT_STRING_SHORT, event_values)
 
@@ -269,6 +341,12 @@ class ConditionalEventFormatter(EventFormatter):
             'Invalid short format string piece: [{0:s}] contains more '
             'than 1 attribute name.').format(format_string_piece))
 
+    # Only the attributes used by the format string pieces are copied from
+    # an event when it is formatted.
+    self._format_strings_attribute_names = self._GetFieldNames(
+        list(self.FORMAT_STRING_PIECES) +
+        list(self.FORMAT_STRING_SHORT_PIECES))
+
   def _ConditionalFormatMessages(self, event_values):
     """Determines the conditional formatted message strings.
 
@@ -345,5 +423,10 @@ class ConditionalEventFormatter(EventFormatter):
       raise errors.WrongFormatter('Unsupported data type: {0:s}.'.format(
           event.data_type))
 
-    event_values = event.CopyToDict()
+    if self._format_strings_attribute_names is None:
+      event_values = event.CopyToDict()
+    else:
+      event_values = self._CopyEventValues(
+          event, self._format_strings_attribute_names)
+
     return self._ConditionalFormatMessages(event_values)
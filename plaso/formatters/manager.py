@@ -5,14 +5,47 @@ from __future__ import unicode_literals
 
 from plaso.formatters import default
 from plaso.formatters import logger
+from plaso.formatters import mediator as formatters_mediator
+from plaso.lib import cachelib
 
 
 class FormattersManager(object):
   """Class that implements the formatters manager."""
 
+  # The default maximum number of events of which the formatted strings are
+  # cached.
+  _MAXIMUM_NUMBER_OF_CACHED_EVENTS = 16 * 1024
+
   _formatter_classes = {}
   _formatter_objects = {}
 
+  # The formatted message and source strings are cached, when enabled, for
+  # events that refer to event data, such as the MACB events of a file that
+  # share the same event data, and that are formatted multiple times, by both
+  # event filters and output modules.
+  _formatted_messages_cache = None
+  _formatted_sources_cache = None
+  _formatted_strings_cache_formatter_mediator = None
+
+  @classmethod
+  def _GetFormattedStringsCacheKey(cls, event):
+    """Retrieves the key of an event in the formatted strings caches.
+
+    Args:
+      event (EventObject): event.
+
+    Returns:
+      tuple[str, str]: event data identifier and timestamp description of
+          the event or None if the event does not refer to event data.
+    """
+    event_data_identifier = event.GetEventDataIdentifier()
+    if not event_data_identifier:
+      return None
+
+    return (
+        event_data_identifier.CopyToString(),
+        getattr(event, 'timestamp_desc', None))
+
   @classmethod
   def DeregisterFormatter(cls, formatter_class):
     """Deregisters a formatter class.
@@ -33,6 +66,58 @@ class FormattersManager(object):
 
     del cls._formatter_classes[formatter_data_type]
 
+  @classmethod
+  def DisableFormattedStringsCache(cls):
+    """Disables the cache of formatted message and source strings."""
+    cls._formatted_messages_cache = None
+    cls._formatted_sources_cache = None
+    cls._formatted_strings_cache_formatter_mediator = None
+
+  @classmethod
+  def EnableFormattedStringsCache(
+      cls, formatter_mediator, maximum_number_of_cached_events=None):
+    """Enables the cache of formatted message and source strings.
+
+    The cache should only be enabled for the events of a single storage,
+    such as during an export run, since the events are identified by their
+    event data identifiers. Enabling the cache empties it.
+
+    Args:
+      formatter_mediator (FormatterMediator): mediates the interactions between
+          formatters and other components, such as storage and Windows EventLog
+          resources. Only the message strings formatted with this formatter
+          mediator are cached.
+      maximum_number_of_cached_events (Optional[int]): maximum number of events
+          of which the formatted strings are cached.
+    """
+    if maximum_number_of_cached_events is None:
+      maximum_number_of_cached_events = cls._MAXIMUM_NUMBER_OF_CACHED_EVENTS
+
+    cls._formatted_messages_cache = cachelib.LeastRecentlyUsedCache(
+        maximum_number_of_cached_events)
+    cls._formatted_sources_cache = cachelib.LeastRecentlyUsedCache(
+        maximum_number_of_cached_events)
+    cls._formatted_strings_cache_formatter_mediator = formatter_mediator
+
+  @classmethod
+  def GetFormattedStringsCacheStatistics(cls):
+    """Retrieves the statistics of the formatted strings cache.
+
+    Returns:
+      tuple: containing:
+
+        int: number of formatted strings retrieved from the cache.
+        int: number of formatted strings not in the cache.
+    """
+    number_of_hits = 0
+    number_of_misses = 0
+    for cache in (cls._formatted_messages_cache, cls._formatted_sources_cache):
+      if cache is not None:
+        number_of_hits += cache.number_of_hits
+        number_of_misses += cache.number_of_misses
+
+    return number_of_hits, number_of_misses
+
   @classmethod
   def GetFormatterObject(cls, data_type):
     """Retrieves the formatter object for a specific data type.
@@ -44,24 +129,32 @@ class FormattersManager(object):
       EventFormatter: corresponding formatter or the default formatter if
           not available.
     """
-    data_type = data_type.lower()
-    if data_type not in cls._formatter_objects:
-      formatter_object = None
-
-      if data_type in cls._formatter_classes:
-        formatter_class = cls._formatter_classes[data_type]
+    # The formatter objects are stored both by the data type as used by
+    # the events and by its lower case variant, so that the formatter object
+    # of an event can be looked up without normalizing its data type.
+    formatter_object = cls._formatter_objects.get(data_type, None)
+    if formatter_object:
+      return formatter_object
+
+    lower_case_data_type = data_type.lower()
+    formatter_object = cls._formatter_objects.get(lower_case_data_type, None)
+    if not formatter_object:
+      if lower_case_data_type in cls._formatter_classes:
+        formatter_class = cls._formatter_classes[lower_case_data_type]
         # TODO: remove the need to instantiate the Formatter classes
         # and use class methods only.
         formatter_object = formatter_class()
 
       if not formatter_object:
         logger.warning(
-            'Using default formatter for data type: {0:s}'.format(data_type))
+            'Using default formatter for data type: {0:s}'.format(
+                lower_case_data_type))
         formatter_object = default.DefaultFormatter()
 
-      cls._formatter_objects[data_type] = formatter_object
+      cls._formatter_objects[lower_case_data_type] = formatter_object
 
-    return cls._formatter_objects[data_type]
+    cls._formatter_objects[data_type] = formatter_object
+    return formatter_object
 
   @classmethod
   def GetMessageStrings(cls, formatter_mediator, event):
@@ -70,14 +163,36 @@ class FormattersManager(object):
     Args:
       formatter_mediator (FormatterMediator): mediates the interactions between
           formatters and other components, such as storage and Windows EventLog
-          resources.
+          resources, where None represents the formatter mediator of
+          the formatted strings cache, if enabled, or a default formatter
+          mediator otherwise.
       event (EventObject): event.
 
     Returns:
       list[str, str]: long and short version of the message string.
     """
+    if not formatter_mediator:
+      formatter_mediator = (
+          cls._formatted_strings_cache_formatter_mediator or
+          formatters_mediator.FormatterMediator())
+
+    lookup_key = None
+    if (cls._formatted_messages_cache is not None and formatter_mediator is
+        cls._formatted_strings_cache_formatter_mediator):
+      lookup_key = cls._GetFormattedStringsCacheKey(event)
+
+    if lookup_key:
+      messages = cls._formatted_messages_cache.GetValue(lookup_key)
+      if messages:
+        return messages
+
     formatter_object = cls.GetFormatterObject(event.data_type)
-    return formatter_object.GetMessages(formatter_mediator, event)
+    messages = formatter_object.GetMessages(formatter_mediator, event)
+
+    if lookup_key:
+      cls._formatted_messages_cache.SetValue(lookup_key, messages)
+
+    return messages
 
   @classmethod
   def GetSourceStrings(cls, event):
@@ -89,10 +204,24 @@ class FormattersManager(object):
     Returns:
       list[str, str]: short and long version of the source of the event.
     """
+    lookup_key = None
+    if cls._formatted_sources_cache is not None:
+      lookup_key = cls._GetFormattedStringsCacheKey(event)
+
+    if lookup_key:
+      sources = cls._formatted_sources_cache.GetValue(lookup_key)
+      if sources:
+        return sources
+
     # TODO: change this to return the long variant first so it is consistent
     # with GetMessageStrings.
     formatter_object = cls.GetFormatterObject(event.data_type)
-    return formatter_object.GetSources(event)
+    sources = formatter_object.GetSources(event)
+
+    if lookup_key:
+      cls._formatted_sources_cache.SetValue(lookup_key, sources)
+
+    return sources
 
   @classmethod
   def RegisterFormatter(cls, formatter_class):
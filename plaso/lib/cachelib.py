@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Least recently used (LRU) cache for storing deserialized values."""
+
+from __future__ import unicode_literals
+
+import collections
+
+
+class LeastRecentlyUsedCache(object):
+  """Class that defines a bounded least recently used (LRU) cache.
+
+  When the cache is full the least recently used value is evicted to make
+  room for a new value.
+
+  Attributes:
+    number_of_hits (int): number of lookups that found a cached value.
+    number_of_misses (int): number of lookups that did not find a cached
+        value.
+  """
+
+  def __init__(self, maximum_number_of_values):
+    """Initializes a least recently used cache.
+
+    Args:
+      maximum_number_of_values (int): maximum number of values in the cache,
+          where 0 represents a disabled cache.
+
+    Raises:
+      ValueError: if the maximum number of values is out of bounds.
+    """
+    if maximum_number_of_values < 0:
+      raise ValueError('Maximum number of values out of bounds.')
+
+    super(LeastRecentlyUsedCache, self).__init__()
+    self._maximum_number_of_values = maximum_number_of_values
+    self._values = collections.OrderedDict()
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+  def __contains__(self, key):
+    """Determines if a key is in the cache without changing its usage.
+
+    Args:
+      key (object): key.
+
+    Returns:
+      bool: True if the key is in the cache.
+    """
+    return key in self._values
+
+  def __len__(self):
+    """Return the number of cached values."""
+    return len(self._values)
+
+  @property
+  def maximum_number_of_values(self):
+    """int: maximum number of values in the cache."""
+    return self._maximum_number_of_values
+
+  def Empty(self):
+    """Empties the cache."""
+    self._values = collections.OrderedDict()
+
+  def GetValue(self, key):
+    """Retrieves a value from the cache.
+
+    Args:
+      key (object): key.
+
+    Returns:
+      object: cached value or None if not available.
+    """
+    value = self._values.pop(key, None)
+    if value is None:
+      self.number_of_misses += 1
+      return None
+
+    # Re-insert the value to mark it as the most recently used.
+    self._values[key] = value
+    self.number_of_hits += 1
+    return value
+
+  def SetValue(self, key, value):
+    """Sets a value in the cache.
+
+    Args:
+      key (object): key.
+      value (object): value, where None values are not cached.
+    """
+    if not self._maximum_number_of_values or value is None:
+      return
+
+    self._values.pop(key, None)
+
+    while len(self._values) >= self._maximum_number_of_values:
+      self._values.popitem(last=False)
+
+    self._values[key] = value
@@ -82,9 +82,12 @@ RESERVED_VARIABLE_NAMES = frozenset([
     'timezone',
     'username'])
 
+SERIALIZER_FORMAT_BINARY = 'binary'
 SERIALIZER_FORMAT_JSON = 'json'
 
-SERIALIZER_FORMATS = frozenset([SERIALIZER_FORMAT_JSON])
+SERIALIZER_FORMATS = frozenset([
+    SERIALIZER_FORMAT_BINARY,
+    SERIALIZER_FORMAT_JSON])
 
 STORAGE_FORMAT_SQLITE = 'sqlite'
 
@@ -9,7 +9,6 @@ import logging
 import re
 
 from plaso.formatters import manager as formatters_manager
-from plaso.formatters import mediator as formatters_mediator
 
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -95,13 +94,12 @@ class PlasoValueExpander(objectfilter.AttributeValueExpander):
     Returns:
       A formatted message string.
     """
-    # TODO: move this somewhere where the mediator can be instantiated once.
-    formatter_mediator = formatters_mediator.FormatterMediator()
-
     result = ''
     try:
+      # The formatter mediator of the formatted strings cache is used when
+      # enabled, so that the message strings are shared with the output.
       result, _ = formatters_manager.FormattersManager.GetMessageStrings(
-          formatter_mediator, event_object)
+          None, event_object)
     except KeyError as exception:
       logging.warning(
           'Unable to correctly assemble event with error: {0!s}'.format(
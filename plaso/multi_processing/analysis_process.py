@@ -5,6 +5,12 @@ from __future__ import unicode_literals
 
 import threading
 
+# The 'cPickle' module was renamed to 'pickle' in Python 3
+try:
+  import cPickle as pickle
+except ImportError:
+  import pickle  # pylint: disable=import-error
+
 from plaso.analysis import mediator as analysis_mediator
 from plaso.containers import tasks
 from plaso.engine import plaso_queue
@@ -14,6 +20,50 @@ from plaso.multi_processing import base_process
 from plaso.multi_processing import logger
 
 
+class SerializedEventBatch(object):
+  """Batch of events serialized once for all analysis processes.
+
+  Attributes:
+    data (bytes): serialized events.
+    number_of_events (int): number of events in the batch.
+  """
+
+  def __init__(self, data=None, number_of_events=0):
+    """Initializes a serialized event batch.
+
+    Args:
+      data (Optional[bytes]): serialized events.
+      number_of_events (Optional[int]): number of events in the batch.
+    """
+    super(SerializedEventBatch, self).__init__()
+    self.data = data
+    self.number_of_events = number_of_events
+
+  @classmethod
+  def FromEvents(cls, events):
+    """Serializes events into a batch.
+
+    Args:
+      events (list[EventObject]): events.
+
+    Returns:
+      SerializedEventBatch: serialized event batch.
+    """
+    data = pickle.dumps(events, pickle.HIGHEST_PROTOCOL)
+    return cls(data=data, number_of_events=len(events))
+
+  def GetEvents(self):
+    """Deserializes the events in the batch.
+
+    Returns:
+      list[EventObject]: events.
+    """
+    if not self.data:
+      return []
+
+    return pickle.loads(self.data)
+
+
 class AnalysisProcess(base_process.MultiProcessBaseProcess):
   """Multi-processing analysis process."""
 
@@ -163,9 +213,19 @@ class AnalysisProcess(base_process.MultiProcessBaseProcess):
           logger.debug('ConsumeItems exiting, dequeued QueueAbort object.')
           break
 
-        self._ProcessEvent(self._analysis_mediator, event)
+        if isinstance(event, SerializedEventBatch):
+          for batch_event in event.GetEvents():
+            if self._abort:
+              break
+
+            self._ProcessEvent(self._analysis_mediator, batch_event)
+
+            self._number_of_consumed_events += 1
+
+        else:
+          self._ProcessEvent(self._analysis_mediator, event)
 
-        self._number_of_consumed_events += 1
+          self._number_of_consumed_events += 1
 
         if self._guppy_memory_profiler:
           self._guppy_memory_profiler.Sample()
@@ -4,21 +4,38 @@
 from __future__ import unicode_literals
 
 import collections
+import hashlib
 import heapq
+import io
+import multiprocessing
 import os
+import shutil
+import sys
+import tempfile
 import time
 
+# The 'Queue' module was renamed to 'queue' in Python 3
+try:
+  import Queue
+except ImportError:
+  import queue as Queue  # pylint: disable=import-error
+
 from plaso.engine import plaso_queue
 from plaso.engine import zeromq_queue
 from plaso.containers import tasks
+from plaso.containers import windows_events
+from plaso.formatters import manager as formatters_manager
 from plaso.lib import bufferlib
+from plaso.lib import cachelib
 from plaso.lib import definitions
 from plaso.lib import py2to3
 from plaso.multi_processing import analysis_process
+from plaso.multi_processing import base_process
 from plaso.multi_processing import engine as multi_process_engine
 from plaso.multi_processing import logger
 from plaso.multi_processing import multi_process_queue
 from plaso.storage import event_tag_index
+from plaso.storage import factory as storage_factory
 from plaso.storage import time_range as storage_time_range
 
 
@@ -35,9 +52,28 @@ class PsortEventHeap(object):
       'timestamp',
       'timestamp_desc'])
 
+  _MACB_TIMESTAMP_DESCRIPTIONS = frozenset([
+      'atime', 'ctime', 'crtime', 'mtime',
+      definitions.TIME_DESCRIPTION_LAST_ACCESS,
+      definitions.TIME_DESCRIPTION_CHANGE,
+      definitions.TIME_DESCRIPTION_CREATION,
+      definitions.TIME_DESCRIPTION_MODIFICATION])
+
+  # The events are ordered by the strings that represent their attributes
+  # and values, but deduplication and MACB grouping compare fixed-size
+  # digests of these strings. Since the same event data is typically
+  # referenced by multiple events, such as the MACB events of a file, the
+  # string and digest of the event data are only determined once per event
+  # data and combined with the timestamp description per event.
+
+  # The maximum number of event data identifier values that are cached.
+  _MAXIMUM_CACHED_EVENT_DATA = 16 * 1024
+
   def __init__(self):
     """Initializes a psort events heap."""
     super(PsortEventHeap, self).__init__()
+    self._event_data_identifier_values_cache = (
+        cachelib.LeastRecentlyUsedCache(self._MAXIMUM_CACHED_EVENT_DATA))
     self._heap = []
 
   @property
@@ -45,41 +81,19 @@ class PsortEventHeap(object):
     """int: number of events on the heap."""
     return len(self._heap)
 
-  def _GetEventIdentifiers(self, event):
-    """Retrieves different identifiers of the event.
-
-    Every event contains event data, which consists of attributes and values.
-    These attributes and values can be represented as a string and used for
-    sorting and uniquely identifying events. This function determines multiple
-    identifiers:
-    * an identifier of the attributes and values without the timestamp
-      description (or usage). This is referred to as the MACB group
-      identifier.
-    * an identifier of the attributes and values including the timestamp
-      description (or usage). This is referred to as the event content
-      identifier.
-
-    The identifier without the timestamp description can be used to group
-    events that have the same MACB (modification, access, change, birth)
-    timestamps. The PsortEventHeap will store these events individually and
-    relies on PsortMultiProcessEngine to do the actual grouping of events.
+  def _GetAttributeStrings(self, attributes):
+    """Retrieves the strings that represent attributes and values.
 
     Args:
-      event (EventObject): event.
+      attributes (iterable[tuple[str, object]]): attribute names and values.
 
     Returns:
-      tuple: containing:
-
-        str: identifier of the event MACB group or None if the event cannot
-            be grouped.
-        str: identifier of the event content.
+      list[tuple[str, str]]: attribute names and the strings that represent
+          the attributes and values, sorted by attribute name.
     """
-    attributes = []
+    attribute_strings = []
 
-    attribute_string = 'data_type: {0:s}'.format(event.data_type)
-    attributes.append(attribute_string)
-
-    for attribute_name, attribute_value in sorted(event.GetAttributes()):
+    for attribute_name, attribute_value in sorted(attributes):
       if attribute_name in self._IDENTIFIER_EXCLUDED_ATTRIBUTES:
         continue
 
@@ -104,24 +118,185 @@ class PsortEventHeap(object):
       except UnicodeDecodeError:
         logger.error('Failed to decode attribute {0:s}'.format(
             attribute_name))
-      attributes.append(attribute_string)
+        continue
+
+      attribute_strings.append((attribute_name, attribute_string))
+
+    return attribute_strings
+
+  def _GetEventDataIdentifierValues(self, event_data):
+    """Retrieves the values to determine identifiers from the event data.
+
+    The values are cached per event data, since the same event data is
+    typically referenced by multiple events, such as the MACB events of
+    a file.
+
+    Args:
+      event_data (EventData): event data.
+
+    Returns:
+      tuple: containing:
+
+        frozenset[str]: names of the event data attributes.
+        list[tuple[str, str]]: attribute names and the strings that represent
+            the attributes and values, sorted by attribute name.
+        str: string that represents the data type and the event data
+            attributes and values.
+        bytes: digest of the string that represents the data type and
+            the event data attributes and values.
+    """
+    lookup_key = None
+    event_data_identifier = event_data.GetIdentifier()
+    if event_data_identifier:
+      lookup_key = event_data_identifier.CopyToString()
+
+    cached_value = None
+    if lookup_key:
+      cached_value = self._event_data_identifier_values_cache.GetValue(
+          lookup_key)
+
+    if not cached_value:
+      attributes = list(event_data.GetAttributes())
+      attribute_names = frozenset([
+          attribute_name for attribute_name, _ in attributes])
+      attribute_strings = self._GetAttributeStrings(attributes)
+      identifier_string = self._GetIdentifierString(
+          event_data.data_type, attribute_strings)
+      identifier_digest = self._GetIdentifierDigest(identifier_string)
+
+      cached_value = (
+          attribute_names, attribute_strings, identifier_string,
+          identifier_digest)
+      if lookup_key:
+        self._event_data_identifier_values_cache.SetValue(
+            lookup_key, cached_value)
+
+    return cached_value
+
+  def _GetEventIdentifiers(self, event, event_data=None):
+    """Retrieves different identifiers of the event.
+
+    Every event contains event data, which consists of attributes and values.
+    These attributes and values can be represented as a string and used for
+    sorting and uniquely identifying events. This function determines multiple
+    identifiers:
+    * an identifier of the attributes and values without the timestamp
+      description (or usage). This is referred to as the MACB group
+      identifier.
+    * an identifier of the attributes and values including the timestamp
+      description (or usage). This is referred to as the event content
+      identifier.
+
+    The identifier without the timestamp description can be used to group
+    events that have the same MACB (modification, access, change, birth)
+    timestamps. The PsortEventHeap will store these events individually and
+    relies on PsortMultiProcessEngine to do the actual grouping of events.
+
+    The identifiers are digests of the strings that represent the attributes
+    and values, where the strings themselves are used for sorting.
+
+    Args:
+      event (EventObject): event, which contains the attributes of the event
+          data.
+      event_data (Optional[EventData]): event data of the event. If provided,
+          the string and digest of the event data attributes are only
+          determined once per event data.
+
+    Returns:
+      tuple: containing:
+
+        bytes: identifier of the event MACB group or None if the event cannot
+            be grouped.
+        bytes: identifier of the event content.
+        str: string that represents the event MACB group or an empty string
+            if the event cannot be grouped.
+        str: string that represents the event content.
+    """
+    identifier_string = None
+    identifier_digest = None
+    if not event_data:
+      attribute_strings = self._GetAttributeStrings(event.GetAttributes())
+
+    else:
+      (event_data_attribute_names, attribute_strings, identifier_string,
+       identifier_digest) = self._GetEventDataIdentifierValues(event_data)
+
+      # Attributes of the event that are not overwritten by the event data,
+      # which is uncommon, are interleaved in attribute name order.
+      event_attribute_names = set(event.GetAttributeNames())
+      event_attribute_names.difference_update(event_data_attribute_names)
+      event_attribute_names.difference_update(
+          self._IDENTIFIER_EXCLUDED_ATTRIBUTES)
+
+      if event_attribute_names:
+        event_attribute_strings = self._GetAttributeStrings([
+            (attribute_name, getattr(event, attribute_name))
+            for attribute_name in event_attribute_names])
+        attribute_strings = sorted(attribute_strings + event_attribute_strings)
+        identifier_string = None
+
+      elif event.data_type != event_data.data_type:
+        identifier_string = None
+
+    if identifier_string is None:
+      identifier_string = self._GetIdentifierString(
+          event.data_type, attribute_strings)
+      identifier_digest = self._GetIdentifierDigest(identifier_string)
 
     # The 'atime', 'ctime', 'crtime', 'mtime' are included for backwards
     # compatibility with the filestat parser.
-    if event.timestamp_desc in (
-        'atime', 'ctime', 'crtime', 'mtime',
-        definitions.TIME_DESCRIPTION_LAST_ACCESS,
-        definitions.TIME_DESCRIPTION_CHANGE,
-        definitions.TIME_DESCRIPTION_CREATION,
-        definitions.TIME_DESCRIPTION_MODIFICATION):
-      macb_group_identifier = ', '.join(attributes)
+    if event.timestamp_desc in self._MACB_TIMESTAMP_DESCRIPTIONS:
+      macb_group_identifier = identifier_digest
+      macb_group_string = identifier_string
     else:
       macb_group_identifier = None
+      macb_group_string = ''
+
+    content_string = ', '.join([event.timestamp_desc, identifier_string])
+
+    # The digest of the data type and attributes has a fixed size, hence it
+    # can be combined with the timestamp description without a separator.
+    timestamp_description = event.timestamp_desc.encode(
+        'utf-8', 'backslashreplace')
+    content_identifier = hashlib.md5(
+        identifier_digest + timestamp_description).digest()
+
+    return (
+        macb_group_identifier, content_identifier, macb_group_string,
+        content_string)
+
+  def _GetIdentifierDigest(self, identifier_string):
+    """Retrieves the digest of the string that represents an event.
+
+    Args:
+      identifier_string (str): string that represents the data type and
+          attributes and values of an event.
+
+    Returns:
+      bytes: digest of the string.
+    """
+    identifier_string = identifier_string.encode('utf-8', 'backslashreplace')
+    return hashlib.md5(identifier_string).digest()
 
-    attributes.insert(0, event.timestamp_desc)
-    content_identifier = ', '.join(attributes)
+  def _GetIdentifierString(self, data_type, attribute_strings):
+    """Retrieves the string that represents the data type and attributes.
 
-    return macb_group_identifier, content_identifier
+    Args:
+      data_type (str): data type of the event.
+      attribute_strings (list[tuple[str, str]]): attribute names and the
+          strings that represent the attributes and values, sorted by
+          attribute name.
+
+    Returns:
+      str: string that represents the data type and attributes and values.
+    """
+    identifier_string = 'data_type: {0:s}'.format(data_type)
+    if attribute_strings:
+      attributes_string = ', '.join([
+          attribute_string for _, attribute_string in attribute_strings])
+      identifier_string = ', '.join([identifier_string, attributes_string])
+
+    return identifier_string
 
   def PopEvent(self):
     """Pops an event from the heap.
@@ -129,16 +304,14 @@ class PsortEventHeap(object):
     Returns:
       tuple: containing:
 
-        str: identifier of the event MACB group or None if the event cannot
+        bytes: identifier of the event MACB group or None if the event cannot
             be grouped.
-        str: identifier of the event content.
+        bytes: identifier of the event content.
         EventObject: event.
     """
     try:
-      macb_group_identifier, content_identifier, event = heapq.heappop(
+      _, _, macb_group_identifier, content_identifier, event = heapq.heappop(
           self._heap)
-      if macb_group_identifier == '':
-        macb_group_identifier = None
       return macb_group_identifier, content_identifier, event
 
     except IndexError:
@@ -155,26 +328,195 @@ class PsortEventHeap(object):
       yield event
       event = self.PopEvent()
 
-  def PushEvent(self, event):
+  def PushEvent(self, event, event_data=None):
     """Pushes an event onto the heap.
 
     Args:
-      event (EventObject): event.
+      event (EventObject): event, which contains the attributes of the event
+          data.
+      event_data (Optional[EventData]): event data of the event.
     """
-    macb_group_identifier, content_identifier = self._GetEventIdentifiers(event)
+    (macb_group_identifier, content_identifier, macb_group_string,
+     content_string) = self._GetEventIdentifiers(event, event_data=event_data)
 
     # We can ignore the timestamp here because the psort engine only stores
     # events with the same timestamp in the event heap.
-    heap_values = (macb_group_identifier or '', content_identifier, event)
+    heap_values = (
+        macb_group_string, content_string, macb_group_identifier,
+        content_identifier, event)
     heapq.heappush(self._heap, heap_values)
 
 
+class PsortExportOutputWriter(object):
+  """Output writer that writes the output of an export process to a file."""
+
+  def __init__(self, file_object):
+    """Initializes an export process output writer.
+
+    Args:
+      file_object (file): text file-like object to write to.
+    """
+    super(PsortExportOutputWriter, self).__init__()
+    self._file_object = file_object
+
+  def Write(self, string):
+    """Writes a string to the output.
+
+    Args:
+      string (str): output.
+    """
+    self._file_object.write(string)
+
+
+class PsortExportProcess(base_process.MultiProcessBaseProcess):
+  """Multi-processing process that exports the events in a time range.
+
+  The events are written by the output module to a partition file, which
+  is concatenated with the partition files of other export processes by
+  the psort multi-processing engine. The output module is inherited from
+  the main process, hence the process must be started by forking.
+  """
+
+  def __init__(
+      self, storage_file_path, output_module, time_range, partition_path,
+      result_queue, processing_configuration, deduplicate_events=True,
+      event_filter=None, partition_index=0, **kwargs):
+    """Initializes an export process.
+
+    Non-specified keyword arguments (kwargs) are directly passed to
+    multiprocessing.Process.
+
+    Args:
+      storage_file_path (str): path of the storage file.
+      output_module (LinearOutputModule): output module.
+      time_range (TimeRange): time range of the events to export.
+      partition_path (str): path of the partition file to write the output to.
+      result_queue (multiprocessing.Queue): queue used to return the events
+          counter of the partition.
+      processing_configuration (ProcessingConfiguration): processing
+          configuration.
+      deduplicate_events (Optional[bool]): True if events should be
+          deduplicated.
+      event_filter (Optional[FilterObject]): event filter.
+      partition_index (Optional[int]): index of the partition.
+    """
+    super(PsortExportProcess, self).__init__(
+        processing_configuration, **kwargs)
+    self._abort = False
+    self._deduplicate_events = deduplicate_events
+    self._event_filter = event_filter
+    self._output_module = output_module
+    self._partition_index = partition_index
+    self._partition_path = partition_path
+    self._result_queue = result_queue
+    self._status = definitions.PROCESSING_STATUS_INITIALIZED
+    self._storage_file_path = storage_file_path
+    self._time_range = time_range
+
+  def _GetStatus(self):
+    """Retrieves status information.
+
+    Returns:
+      dict[str, object]: status attributes, indexed by name.
+    """
+    if self._process_information:
+      used_memory = self._process_information.GetUsedMemory() or 0
+    else:
+      used_memory = 0
+
+    return {
+        'display_name': '',
+        'identifier': self._name,
+        'number_of_consumed_errors': None,
+        'number_of_consumed_event_tags': None,
+        'number_of_consumed_events': None,
+        'number_of_consumed_reports': None,
+        'number_of_consumed_sources': None,
+        'number_of_produced_errors': None,
+        'number_of_produced_event_tags': None,
+        'number_of_produced_events': None,
+        'number_of_produced_reports': None,
+        'number_of_produced_sources': None,
+        'processing_status': self._status,
+        'task_identifier': None,
+        'used_memory': used_memory}
+
+  def _Main(self):
+    """The main loop."""
+    logger.debug('Export process: {0!s} (PID: {1:d}) started'.format(
+        self._name, self._pid))
+
+    self._status = definitions.PROCESSING_STATUS_EXPORTING
+
+    events_counter = None
+    storage_reader = None
+    try:
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              self._storage_file_path))
+
+      # Surrogates are passed to allow the output writer of the main process
+      # to handle them the same as if the events were exported by a single
+      # process.
+      with io.open(
+          self._partition_path, 'w', encoding='utf-8',
+          errors='surrogatepass', newline='') as file_object:
+        self._output_module.SetOutputWriter(
+            PsortExportOutputWriter(file_object))
+
+        engine = PsortMultiProcessEngine(use_zeromq=False)
+        # pylint: disable=protected-access
+        events_counter = engine._ExportEvents(
+            storage_reader, self._output_module,
+            deduplicate_events=self._deduplicate_events,
+            event_filter=self._event_filter, time_range=self._time_range)
+
+      self._status = definitions.PROCESSING_STATUS_COMPLETED
+
+    except Exception as exception:  # pylint: disable=broad-except
+      logger.warning(
+          'Unhandled exception in export process: {0!s} (PID: {1:d}) with '
+          'error: {2!s}'.format(self._name, self._pid, exception))
+      logger.exception(exception)
+
+      self._status = definitions.PROCESSING_STATUS_ERROR
+
+    finally:
+      if storage_reader:
+        storage_reader.Close()
+
+    if events_counter is not None:
+      events_counter = dict(events_counter)
+
+    self._result_queue.put((self._partition_index, events_counter))
+
+    logger.debug('Export process: {0!s} (PID: {1:d}) stopped'.format(
+        self._name, self._pid))
+
+  def SignalAbort(self):
+    """Signals the process to abort."""
+    self._abort = True
+
+
 class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
   """Psort multi-processing engine."""
 
+  _PARTITION_READ_SIZE = 1024 * 1024
+
+  # Number of seconds to wait for the result of an export process before
+  # checking if the export processes are still alive.
+  _PARTITION_RESULT_TIMEOUT = 1.0
+
   _PROCESS_JOIN_TIMEOUT = 5.0
   _PROCESS_WORKER_TIMEOUT = 15.0 * 60.0
 
+  # Number of events that are serialized once and pushed as a single item
+  # on the event queue of every analysis process.
+  _EVENT_BATCH_SIZE = 128
+
+  # Maximum number of event batches to queue on a ZeroMQ socket.
+  _MAXIMUM_NUMBER_OF_QUEUED_EVENT_BATCHES = 64
+
   _QUEUE_TIMEOUT = 10 * 60
 
   def __init__(self, use_zeromq=True):
@@ -251,6 +593,7 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     filter_limit = getattr(event_filter, 'limit', None)
 
+    event_batch = []
     for event in storage_writer.GetSortedEvents():
       event_data_identifier = event.GetEventDataIdentifier()
       if event_data_identifier:
@@ -260,6 +603,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
           for attribute_name, attribute_value in event_data.GetAttributes():
             setattr(event, attribute_name, attribute_value)
 
+          self._RenderEVTXXMLString(storage_writer, event)
+
       event_identifier = event.GetIdentifier()
       event.tag = self._event_tag_index.GetEventTagByIdentifier(
           storage_writer, event_identifier)
@@ -274,9 +619,10 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
         number_of_filtered_events += 1
         continue
 
-      for event_queue in self._event_queues.values():
-        # TODO: Check for premature exit of analysis plugins.
-        event_queue.PushItem(event)
+      event_batch.append(event)
+      if len(event_batch) >= self._EVENT_BATCH_SIZE:
+        self._PushEventBatch(event_batch)
+        event_batch = []
 
       self._number_of_consumed_events += 1
 
@@ -284,6 +630,9 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
           filter_limit == self._number_of_consumed_events):
         break
 
+    if event_batch:
+      self._PushEventBatch(event_batch)
+
     logger.debug('Finished pushing events to analysis plugins.')
     # Signal that we have finished adding events.
     for event_queue in self._event_queues.values():
@@ -421,25 +770,31 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
       self._TerminateProcessByPid(pid)
 
-  def _ExportEvent(self, output_module, event, deduplicate_events=True):
+  def _ExportEvent(
+      self, storage_reader, output_module, event, deduplicate_events=True,
+      event_data=None):
     """Exports an event using an output module.
 
     Args:
+      storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
       event (EventObject): event.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
+      event_data (Optional[EventData]): event data of the event.
     """
     if event.timestamp != self._export_event_timestamp:
       self._FlushExportBuffer(
-          output_module, deduplicate_events=deduplicate_events)
+          storage_reader, output_module,
+          deduplicate_events=deduplicate_events)
       self._export_event_timestamp = event.timestamp
 
-    self._export_event_heap.PushEvent(event)
+    self._export_event_heap.PushEvent(event, event_data=event_data)
 
   def _ExportEvents(
       self, storage_reader, output_module, deduplicate_events=True,
-      event_filter=None, time_slice=None, use_time_slicer=False):
+      event_filter=None, time_range=None, time_slice=None,
+      use_time_slicer=False):
     """Exports events using an output module.
 
     Args:
@@ -448,6 +803,9 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
       event_filter (Optional[FilterObject]): event filter.
+      time_range (Optional[TimeRange]): time range of the events to export,
+          where None represents all events. The time range is ignored if a
+          time slice with an event timestamp is defined.
       time_slice (Optional[TimeRange]): time range that defines a time slice
           to filter events.
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
@@ -477,7 +835,9 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     number_of_filtered_events = 0
     number_of_events_from_time_slice = 0
 
-    for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
+    for event in storage_reader.GetSortedEvents(
+        time_range=time_slice_range or time_range):
+      event_data = None
       event_data_identifier = event.GetEventDataIdentifier()
       if event_data_identifier:
         event_data = storage_reader.GetEventDataByIdentifier(
@@ -494,6 +854,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
         number_of_events_from_time_slice += 1
 
       if event_filter:
+        # The XML string is needed to match filters on it.
+        self._RenderEVTXXMLString(storage_reader, event)
         filter_match = event_filter.Match(event)
       else:
         filter_match = None
@@ -509,7 +871,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
         elif forward_entries <= time_slice_buffer.size:
           self._ExportEvent(
-              output_module, event, deduplicate_events=deduplicate_events)
+              storage_reader, output_module, event,
+              deduplicate_events=deduplicate_events, event_data=event_data)
           self._number_of_consumed_events += 1
           number_of_events_from_time_slice += 1
           forward_entries += 1
@@ -526,7 +889,7 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
           # Empty the time slice buffer.
           for event_in_buffer in time_slice_buffer.Flush():
             self._ExportEvent(
-                output_module, event_in_buffer,
+                storage_reader, output_module, event_in_buffer,
                 deduplicate_events=deduplicate_events)
             self._number_of_consumed_events += 1
             number_of_filtered_events += 1
@@ -535,7 +898,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
           forward_entries = 1
 
         self._ExportEvent(
-            output_module, event, deduplicate_events=deduplicate_events)
+            storage_reader, output_module, event,
+            deduplicate_events=deduplicate_events, event_data=event_data)
         self._number_of_consumed_events += 1
 
         # pylint: disable=singleton-comparison
@@ -543,7 +907,7 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
             filter_limit == self._number_of_consumed_events):
           break
 
-    self._FlushExportBuffer(output_module)
+    self._FlushExportBuffer(storage_reader, output_module)
 
     events_counter = collections.Counter()
     events_counter['Events filtered'] = number_of_filtered_events
@@ -561,12 +925,134 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     if filter_limit:
       events_counter['Limited By'] = filter_limit
 
+    number_of_hits, number_of_misses = (
+        formatters_manager.FormattersManager.
+        GetFormattedStringsCacheStatistics())
+    if number_of_hits or number_of_misses:
+      events_counter['Formatted strings cache hits'] = number_of_hits
+      events_counter['Formatted strings cache misses'] = number_of_misses
+
     return events_counter
 
-  def _FlushExportBuffer(self, output_module, deduplicate_events=True):
+  def _ExportEventsInPartitions(
+      self, storage_file_path, output_module, time_ranges,
+      deduplicate_events=True, event_filter=None, temporary_directory=None):
+    """Exports events in partitions using export processes.
+
+    Every time range is exported by a separate export process into
+    a partition file. The partition files are written to the output in
+    chronological order afterwards.
+
+    Args:
+      storage_file_path (str): path of the storage file.
+      output_module (LinearOutputModule): output module.
+      time_ranges (list[TimeRange]): time ranges of the partitions, in
+          increasing chronological order.
+      deduplicate_events (Optional[bool]): True if events should be
+          deduplicated.
+      event_filter (Optional[FilterObject]): event filter.
+      temporary_directory (Optional[str]): path of the directory in which
+          the partition files are written, where None represents the default
+          temporary directory.
+
+    Returns:
+      collections.Counter: counter that tracks the number of unique events
+          read from storage.
+
+    Raises:
+      RuntimeError: if the export of a partition failed.
+    """
+    self._status = definitions.PROCESSING_STATUS_EXPORTING
+
+    partitions_directory = tempfile.mkdtemp(
+        prefix='psort-', dir=temporary_directory)
+
+    result_queue = multiprocessing.Queue()
+
+    events_counters = {}
+    partition_paths = []
+    processes = []
+
+    try:
+      for partition_index, time_range in enumerate(time_ranges):
+        partition_path = os.path.join(
+            partitions_directory, 'partition{0:d}'.format(partition_index))
+        partition_paths.append(partition_path)
+
+        process = PsortExportProcess(
+            storage_file_path, output_module, time_range, partition_path,
+            result_queue, self._processing_configuration,
+            deduplicate_events=deduplicate_events, event_filter=event_filter,
+            partition_index=partition_index,
+            name='Export{0:d}'.format(partition_index))
+        process.start()
+        processes.append(process)
+
+        logger.info('Started export process: {0:s} (PID: {1:d}).'.format(
+            process.name, process.pid))
+
+      # The results are read before the processes are joined otherwise
+      # a process can block on exit until its queued result is read.
+      processes_alive = True
+      while len(events_counters) < len(time_ranges):
+        try:
+          partition_index, events_counter = result_queue.get(
+              timeout=self._PARTITION_RESULT_TIMEOUT)
+        except Queue.Empty:
+          if not processes_alive:
+            break
+
+          # Check for pending results once more after the last process
+          # stopped.
+          processes_alive = any(process.is_alive() for process in processes)
+          continue
+
+        events_counters[partition_index] = events_counter
+
+      for process in processes:
+        process.join(timeout=self._PROCESS_JOIN_TIMEOUT)
+
+      for partition_index, partition_path in enumerate(partition_paths):
+        events_counter = events_counters.get(partition_index, None)
+        if events_counter is None:
+          raise RuntimeError(
+              'Unable to export events of partition: {0:d}.'.format(
+                  partition_index))
+
+        with io.open(
+            partition_path, 'r', encoding='utf-8', errors='surrogatepass',
+            newline='') as file_object:
+          output = file_object.read(self._PARTITION_READ_SIZE)
+          while output:
+            output_module.WriteFormattedOutput(output)
+            output = file_object.read(self._PARTITION_READ_SIZE)
+
+    finally:
+      for process in processes:
+        if process.is_alive():
+          logger.warning(
+              'Terminating export process: {0:s} (PID: {1:d})'.format(
+                  process.name, process.pid))
+          process.terminate()
+          process.join(timeout=self._PROCESS_JOIN_TIMEOUT)
+
+      result_queue.close()
+      shutil.rmtree(partitions_directory, True)
+
+    events_counter = collections.Counter()
+    for partition_index in range(len(time_ranges)):
+      events_counter.update(events_counters[partition_index])
+
+    self._number_of_consumed_events = events_counter['Events processed']
+
+    return events_counter
+
+  def _FlushExportBuffer(
+      self, storage_reader, output_module, deduplicate_events=True):
     """Flushes buffered events and writes them to the output module.
 
     Args:
+      storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
@@ -582,6 +1068,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
         self._number_of_duplicate_events += 1
         continue
 
+      self._RenderEVTXXMLString(storage_reader, event)
+
       if macb_group_identifier is None:
         if macb_group:
           output_module.WriteEventMACBGroup(macb_group)
@@ -606,6 +1094,23 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     if macb_group:
       output_module.WriteEventMACBGroup(macb_group)
 
+  def _HasForkStartMethod(self):
+    """Determines if processes are started by forking the main process.
+
+    The export processes inherit the output module, including its output
+    writer, of the main process, which requires the processes to be started
+    by forking.
+
+    Returns:
+      bool: True if processes are started by forking the main process.
+    """
+    # Python 2 does not support start methods and forks on POSIX platforms.
+    get_start_method = getattr(multiprocessing, 'get_start_method', None)
+    if not get_start_method:
+      return sys.platform != 'win32'
+
+    return get_start_method() == 'fork'
+
   def _MergeEventTag(self, storage_writer, attribute_container):
     """Merges an event tag with the last stored event tag.
 
@@ -634,6 +1139,62 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     self._event_tag_index.SetEventTag(attribute_container)
 
+  def _PushEventBatch(self, events):
+    """Pushes a batch of events on the event queues of the analysis processes.
+
+    The events are serialized once and the same serialized batch is pushed
+    on every event queue, rather than serializing every event once per
+    analysis process.
+
+    Args:
+      events (list[EventObject]): events.
+    """
+    event_batch = analysis_process.SerializedEventBatch.FromEvents(events)
+
+    for event_queue in self._event_queues.values():
+      # TODO: Check for premature exit of analysis plugins.
+      event_queue.PushItem(event_batch)
+
+  def _RenderEVTXXMLString(self, storage, event):
+    """Renders the EVTX XML string of an event from its XML template.
+
+    EVTX event data can store their XML string as a reference to a XML
+    template and the values of the event record, which are only rendered
+    into the XML string when needed.
+
+    Args:
+      storage (StorageReader|StorageWriter): storage of the event.
+      event (EventObject): event.
+    """
+    xml_values = getattr(event, 'xml_values', None)
+    if xml_values is None:
+      return
+
+    row_identifier = getattr(event, 'xml_template_row_identifier', None)
+    template = getattr(event, 'xml_template', None)
+
+    try:
+      if row_identifier is not None:
+        xml_template = storage.GetEVTXXMLTemplateByRowIdentifier(
+            row_identifier)
+      else:
+        xml_template = windows_events.WindowsEventLogXMLTemplate(
+            template=template)
+
+      event.xml_string = xml_template.Render(xml_values)
+
+    except (IOError, TypeError, ValueError) as exception:
+      logger.warning(
+          'Unable to render EVTX XML string with error: {0!s}'.format(
+              exception))
+      return
+
+    del event.xml_values
+    if row_identifier is not None:
+      del event.xml_template_row_identifier
+    if template is not None:
+      del event.xml_template
+
   def _StartAnalysisProcesses(self, storage_writer, analysis_plugins):
     """Starts the analysis processes.
 
@@ -813,6 +1374,7 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     if self._use_zeromq:
       queue_name = '{0:s} output event queue'.format(process_name)
       output_event_queue = zeromq_queue.ZeroMQPushBindQueue(
+          maximum_items=self._MAXIMUM_NUMBER_OF_QUEUED_EVENT_BATCHES,
           name=queue_name, timeout_seconds=self._QUEUE_TIMEOUT)
       # Open the queue so it can bind to a random port, and we can get the
       # port number to use in the input queue.
@@ -827,6 +1389,7 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     if self._use_zeromq:
       queue_name = '{0:s} input event queue'.format(process_name)
       input_event_queue = zeromq_queue.ZeroMQPullConnectQueue(
+          maximum_items=self._MAXIMUM_NUMBER_OF_QUEUED_EVENT_BATCHES,
           name=queue_name, delay_open=True, port=output_event_queue.port,
           timeout_seconds=self._QUEUE_TIMEOUT)
 
@@ -978,9 +1541,18 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
   def ExportEvents(
       self, knowledge_base_object, storage_reader, output_module,
       processing_configuration, deduplicate_events=True, event_filter=None,
-      status_update_callback=None, time_slice=None, use_time_slicer=False):
+      number_of_worker_processes=0, status_update_callback=None,
+      storage_file_path=None, temporary_directory=None, time_slice=None,
+      use_time_slicer=False):
     """Exports events using an output module.
 
+    If multiple worker processes are requested the events are partitioned by
+    time range and exported by separate export processes. This requires an
+    output module that supports partitioned output, a storage file with an
+    event timestamp index and processes that are started by forking. It is
+    not used in combination with a time slice or an event filter with
+    a limit.
+
     Args:
       knowledge_base_object (KnowledgeBase): contains information from
           the source data needed for processing.
@@ -991,8 +1563,15 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
       event_filter (Optional[FilterObject]): event filter.
+      number_of_worker_processes (Optional[int]): number of export processes,
+          where 0 or 1 represents the events are exported by the main process.
       status_update_callback (Optional[function]): callback function for status
           updates.
+      storage_file_path (Optional[str]): path of the storage file, which is
+          required to export the events with multiple worker processes.
+      temporary_directory (Optional[str]): path of the directory in which
+          the output of the export processes is written, where None
+          represents the default temporary directory.
       time_slice (Optional[TimeSlice]): slice of time to output.
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
           used. The 'time slicer' will provide a context of events around
@@ -1001,12 +1580,32 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     Returns:
       collections.Counter: counter that tracks the number of events extracted
           from storage.
+
+    Raises:
+      RuntimeError: if the export of a partition failed.
     """
     self._processing_configuration = processing_configuration
     self._status_update_callback = status_update_callback
 
     storage_reader.ReadPreprocessingInformation(knowledge_base_object)
 
+    time_ranges = None
+    if (number_of_worker_processes > 1 and storage_file_path and
+        output_module.SUPPORTS_PARTITIONED_OUTPUT and not time_slice and
+        not getattr(event_filter, 'limit', None)):
+      if not self._HasForkStartMethod():
+        logger.warning((
+            'Unable to partition events without forking export processes, '
+            'exporting events with a single process.'))
+
+      else:
+        time_ranges = storage_reader.GetEventTimeRanges(
+            number_of_worker_processes)
+        if time_ranges is None:
+          logger.warning((
+              'Unable to partition events without an event timestamp index, '
+              'exporting events with a single process.'))
+
     output_module.Open()
     output_module.WriteHeader()
 
@@ -1015,16 +1614,27 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     self._StartProfiling(self._processing_configuration.profiling)
 
     try:
-      events_counter = self._ExportEvents(
-          storage_reader, output_module, deduplicate_events=deduplicate_events,
-          event_filter=event_filter, time_slice=time_slice,
-          use_time_slicer=use_time_slicer)
+      if time_ranges and len(time_ranges) > 1:
+        events_counter = self._ExportEventsInPartitions(
+            storage_file_path, output_module, time_ranges,
+            deduplicate_events=deduplicate_events, event_filter=event_filter,
+            temporary_directory=temporary_directory)
+
+      else:
+        events_counter = self._ExportEvents(
+            storage_reader, output_module,
+            deduplicate_events=deduplicate_events, event_filter=event_filter,
+            time_slice=time_slice, use_time_slicer=use_time_slicer)
 
     finally:
       # Stop the status update thread after close of the storage writer
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
 
+      # The formatted strings cache is only valid for the events of
+      # the storage that was exported.
+      formatters_manager.FormattersManager.DisableFormattedStringsCache()
+
     output_module.WriteFooter()
     output_module.Close()
 
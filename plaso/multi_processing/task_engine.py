@@ -7,6 +7,7 @@ import heapq
 import logging
 import multiprocessing
 import os
+import threading
 import time
 
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -49,6 +50,20 @@ class _EventSourceHeap(object):
     """
     return len(self._heap) >= self._maximum_number_of_items
 
+  def PeekEventSource(self):
+    """Retrieves the first event source from the heap without removing it.
+
+    Returns:
+      EventSource: an event source or None on if no event source is available.
+    """
+    try:
+      _, _, event_source = self._heap[0]
+
+    except IndexError:
+      return None
+
+    return event_source
+
   def PopEventSource(self):
     """Pops an event source from the heap.
 
@@ -87,44 +102,78 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
   * merge results returned by extraction workers.
   """
 
-  # Maximum number of attribute containers to merge per loop.
-  _MAXIMUM_NUMBER_OF_CONTAINERS = 50
+  # Maximum number of attribute containers to merge per merge step.
+  _MAXIMUM_NUMBER_OF_CONTAINERS = 1000
+
+  # Maximum number of path specifications of files per task.
+  _MAXIMUM_NUMBER_OF_PATH_SPECS_PER_TASK = 64
 
   # Maximum number of concurrent tasks.
   _MAXIMUM_NUMBER_OF_TASKS = 10000
 
+  # Maximum number of tasks that are pending merge or being merged before
+  # the scheduler stops creating new tasks.
+  _MAXIMUM_NUMBER_OF_TASKS_PENDING_MERGE = 128
+
+  # Maximum total size of the files of a task with multiple path
+  # specifications. A file that exceeds the size is processed by a task
+  # of its own.
+  _MAXIMUM_TASK_DATA_SIZE = 64 * 1024 * 1024
+
+  # Number of seconds the merge thread waits when there is nothing to merge.
+  _MERGE_THREAD_IDLE_INTERVAL = 0.1
+
   # Consider a worker inactive after 15 minutes of no activity.
   _PROCESS_WORKER_TIMEOUT = 15.0 * 60.0
 
   _WORKER_PROCESSES_MINIMUM = 2
   _WORKER_PROCESSES_MAXIMUM = 15
 
+  # Number of seconds the scheduler waits when no task could be scheduled.
+  _SCHEDULER_IDLE_INTERVAL = 0.05
+
   _TASK_QUEUE_TIMEOUT_SECONDS = 2
 
   _ZEROMQ_NO_WORKER_REQUEST_TIME_SECONDS = 10 * 60
 
   def __init__(
-      self, maximum_number_of_tasks=_MAXIMUM_NUMBER_OF_TASKS, use_zeromq=True):
+      self, maximum_number_of_path_specs_per_task=(
+          _MAXIMUM_NUMBER_OF_PATH_SPECS_PER_TASK),
+      maximum_number_of_tasks=_MAXIMUM_NUMBER_OF_TASKS,
+      maximum_task_data_size=_MAXIMUM_TASK_DATA_SIZE, use_zeromq=True):
     """Initializes an engine.
 
     Args:
+      maximum_number_of_path_specs_per_task (Optional[int]): maximum number
+          of path specifications of files that are processed by a single task,
+          where 1 represents a task per path specification.
       maximum_number_of_tasks (Optional[int]): maximum number of concurrent
           tasks, where 0 represents no limit.
+      maximum_task_data_size (Optional[int]): maximum total size in bytes of
+          the files that are processed by a single task.
       use_zeromq (Optional[bool]): True if ZeroMQ should be used for queuing
           instead of Python's multiprocessing queue.
     """
     super(TaskMultiProcessEngine, self).__init__()
     self._enable_sigsegv_handler = False
     self._filter_find_specs = None
+    self._last_merge_rate_time = None
+    self._last_number_of_merged_attribute_containers = 0
     self._last_worker_number = 0
+    self._maximum_number_of_path_specs_per_task = (
+        maximum_number_of_path_specs_per_task)
     self._maximum_number_of_tasks = maximum_number_of_tasks
+    self._maximum_task_data_size = maximum_task_data_size
     self._merge_task = None
     self._merge_task_on_hold = None
+    self._merge_thread = None
+    self._merge_thread_active = False
     self._number_of_consumed_errors = 0
     self._number_of_consumed_event_tags = 0
     self._number_of_consumed_events = 0
     self._number_of_consumed_reports = 0
     self._number_of_consumed_sources = 0
+    self._number_of_merged_attribute_containers = 0
     self._number_of_produced_errors = 0
     self._number_of_produced_event_tags = 0
     self._number_of_produced_events = 0
@@ -138,11 +187,65 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._status = definitions.PROCESSING_STATUS_IDLE
     self._storage_merge_reader = None
     self._storage_merge_reader_on_hold = None
+    self._storage_writer_lock = threading.Lock()
     self._task_queue = None
     self._task_queue_port = None
     self._task_manager = task_manager.TaskManager()
     self._use_zeromq = use_zeromq
 
+  def _CreateTask(self, event_source, event_source_heap):
+    """Creates a task for an event source.
+
+    Files are batched into a single task, together with other files from
+    the event source heap, to reduce the overhead of creating, finalizing and
+    merging a task storage per file. Directories are processed by a task of
+    their own since they produce new event sources.
+
+    Args:
+      event_source (EventSource): event source.
+      event_source_heap (_EventSourceHeap): event source heap.
+
+    Returns:
+      Task: task.
+    """
+    task = self._task_manager.CreateTask(self._session_identifier)
+    task.file_entry_type = event_source.file_entry_type
+    task.path_spec = event_source.path_spec
+
+    self._number_of_consumed_sources += 1
+
+    if event_source.file_entry_type == (
+        dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY):
+      return task
+
+    path_specs = [event_source.path_spec]
+    task_data_size = event_source.size or 0
+
+    while (len(path_specs) < self._maximum_number_of_path_specs_per_task and
+           task_data_size < self._maximum_task_data_size):
+      next_event_source = event_source_heap.PeekEventSource()
+      if not next_event_source or next_event_source.file_entry_type == (
+          dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY):
+        break
+
+      next_event_source_size = next_event_source.size or 0
+      if (task_data_size + next_event_source_size >
+          self._maximum_task_data_size):
+        break
+
+      event_source_heap.PopEventSource()
+
+      path_specs.append(next_event_source.path_spec)
+      task_data_size += next_event_source_size
+
+      self._number_of_consumed_sources += 1
+
+    if len(path_specs) > 1:
+      task.path_spec = None
+      task.path_specs = path_specs
+
+    return task
+
   def _FillEventSourceHeap(
       self, storage_writer, event_source_heap, start_with_first=False):
     """Fills the event source heap with the available written event sources.
@@ -183,16 +286,32 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     if self._processing_profiler:
       self._processing_profiler.StopTiming('fill_event_source_heap')
 
+  def _CountMergedAttributeContainer(
+      self, unused_storage_writer, unused_attribute_container):
+    """Counts an attribute container merged into the session storage.
+
+    Args:
+      unused_storage_writer (StorageWriter): storage writer for a session
+          storage.
+      unused_attribute_container (AttributeContainer): attribute container
+          that was merged.
+    """
+    self._number_of_merged_attribute_containers += 1
+
   def _MergeTaskStorage(self, storage_writer):
     """Merges a task storage with the session storage.
 
     This function checks all task stores that are ready to merge and updates
     the scheduled tasks. Note that to prevent this function holding up
-    the task scheduling loop only the first available task storage is merged.
+    other users of the session storage only part of the first available task
+    storage is merged.
 
     Args:
       storage_writer (StorageWriter): storage writer for a session storage used
           to merge task storage.
+
+    Returns:
+      bool: True if a task storage was being merged.
     """
     if self._processing_profiler:
       self._processing_profiler.StartTiming('merge_check')
@@ -228,8 +347,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       task = self._task_manager.GetTaskPendingMerge(self._merge_task)
 
     # Limit the number of attribute containers from a single task-based
-    # storage file that are merged per loop to keep tasks flowing.
-    if task or self._storage_merge_reader:
+    # storage file that are merged per step to keep tasks flowing.
+    is_merging = bool(task or self._storage_merge_reader)
+    if is_merging:
       self._status = definitions.PROCESSING_STATUS_MERGING
 
       if self._processing_profiler:
@@ -258,6 +378,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
       if self._storage_merge_reader:
         fully_merged = self._storage_merge_reader.MergeAttributeContainers(
+            callback=self._CountMergedAttributeContainer,
             maximum_number_of_containers=self._MAXIMUM_NUMBER_OF_CONTAINERS)
       else:
         # TODO: Do something more sensible when this happens, perhaps
@@ -295,6 +416,33 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       self._number_of_produced_events = storage_writer.number_of_events
       self._number_of_produced_sources = storage_writer.number_of_event_sources
 
+    return is_merging
+
+  def _MergeThreadMain(self, storage_writer):
+    """Main function of the merge thread.
+
+    The merge thread merges task storage with the session storage so that
+    the scheduler can continue to create and schedule tasks while a merge
+    is in progress.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage used
+          to merge task storage.
+    """
+    while self._merge_thread_active:
+      try:
+        with self._storage_writer_lock:
+          is_merging = self._MergeTaskStorage(storage_writer)
+
+      except Exception as exception:  # pylint: disable=broad-except
+        logger.error(
+            'Unable to merge task storage with error: {0!s}'.format(exception))
+        self._abort = True
+        break
+
+      if not is_merging:
+        time.sleep(self._MERGE_THREAD_IDLE_INTERVAL)
+
   def _ProcessSources(
       self, source_path_specs, storage_writer, filter_find_specs=None):
     """Processes the sources.
@@ -316,11 +464,14 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._number_of_consumed_events = 0
     self._number_of_consumed_reports = 0
     self._number_of_consumed_sources = 0
+    self._number_of_merged_attribute_containers = 0
     self._number_of_produced_errors = 0
     self._number_of_produced_event_tags = 0
     self._number_of_produced_events = 0
     self._number_of_produced_reports = 0
     self._number_of_produced_sources = 0
+    self._last_merge_rate_time = None
+    self._last_number_of_merged_attribute_containers = 0
 
     path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
         source_path_specs, find_specs=filter_find_specs,
@@ -362,6 +513,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._UpdateForemanProcessStatus()
 
     tasks_status = self._task_manager.GetStatusInformation()
+    self._UpdateMergeStatus(tasks_status)
+
     if self._task_queue_profiler:
       self._task_queue_profiler.Sample(tasks_status)
 
@@ -416,60 +569,79 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     event_source = event_source_heap.PopEventSource()
 
-    task = None
-    while event_source or self._task_manager.HasPendingTasks():
-      if self._abort:
-        break
-
-      try:
-        if not task:
-          task = self._task_manager.CreateRetryTask()
-
-        if not task and event_source:
-          task = self._task_manager.CreateTask(self._session_identifier)
-          task.file_entry_type = event_source.file_entry_type
-          task.path_spec = event_source.path_spec
-          event_source = None
-
-          self._number_of_consumed_sources += 1
-
-          if self._guppy_memory_profiler:
-            self._guppy_memory_profiler.Sample()
-
-        if task:
-          if self._ScheduleTask(task):
-            logger.debug(
-                'Scheduled task {0:s} for path specification {1:s}'.format(
-                    task.identifier, task.path_spec.comparable))
+    # Task storage is merged by a separate thread so that the scheduler can
+    # continue to create and schedule tasks while a merge is in progress.
+    self._StartMergeThread(storage_writer)
 
-            self._task_manager.SampleTaskStatus(task, 'scheduled')
-
-            task = None
-
-          else:
-            self._task_manager.SampleTaskStatus(task, 'schedule_attempted')
-
-        self._MergeTaskStorage(storage_writer)
-
-        if not event_source_heap.IsFull():
-          self._FillEventSourceHeap(storage_writer, event_source_heap)
-
-        if not task and not event_source:
-          event_source = event_source_heap.PopEventSource()
+    task = None
+    try:
+      while event_source or self._task_manager.HasPendingTasks():
+        if self._abort:
+          break
 
-      except KeyboardInterrupt:
-        self._abort = True
+        try:
+          if not task:
+            task = self._task_manager.CreateRetryTask()
+
+          # Stop creating new tasks when the merge thread cannot keep up with
+          # the task storage produced by the worker processes.
+          if (not task and event_source and
+              self._task_manager.GetNumberOfTasksPendingMerge() <
+              self._MAXIMUM_NUMBER_OF_TASKS_PENDING_MERGE):
+            task = self._CreateTask(event_source, event_source_heap)
+            event_source = None
+
+            if self._guppy_memory_profiler:
+              self._guppy_memory_profiler.Sample()
+
+          is_scheduled = False
+          if task:
+            is_scheduled = self._ScheduleTask(task)
+            if is_scheduled:
+              path_specs = task.GetPathSpecs()
+              if len(path_specs) == 1:
+                logger.debug(
+                    'Scheduled task {0:s} for path specification {1:s}'.format(
+                        task.identifier, path_specs[0].comparable))
+              else:
+                logger.debug(
+                    'Scheduled task {0:s} for {1:d} path specifications'.format(
+                        task.identifier, len(path_specs)))
+
+              self._task_manager.SampleTaskStatus(task, 'scheduled')
+
+              task = None
+
+            else:
+              self._task_manager.SampleTaskStatus(task, 'schedule_attempted')
+
+          if not event_source_heap.IsFull():
+            with self._storage_writer_lock:
+              self._FillEventSourceHeap(storage_writer, event_source_heap)
+
+          if not task and not event_source:
+            event_source = event_source_heap.PopEventSource()
+
+          if not is_scheduled:
+            time.sleep(self._SCHEDULER_IDLE_INTERVAL)
+
+        except KeyboardInterrupt:
+          self._abort = True
+
+          self._processing_status.aborted = True
+          if self._status_update_callback:
+            self._status_update_callback(self._processing_status)
 
-        self._processing_status.aborted = True
-        if self._status_update_callback:
-          self._status_update_callback(self._processing_status)
+    finally:
+      self._StopMergeThread()
 
     for task in self._task_manager.GetFailedTasks():
-      error = error_containers.ExtractionError(
-          message='Worker failed to process path specification',
-          path_spec=task.path_spec)
-      self._storage_writer.AddError(error)
-      self._processing_status.error_path_specs.append(task.path_spec)
+      for path_spec in task.GetPathSpecs():
+        error = error_containers.ExtractionError(
+            message='Worker failed to process path specification',
+            path_spec=path_spec)
+        self._storage_writer.AddError(error)
+        self._processing_status.error_path_specs.append(path_spec)
 
     self._status = definitions.PROCESSING_STATUS_IDLE
 
@@ -478,6 +650,18 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     else:
       logger.debug('Task scheduler stopped')
 
+  def _StartMergeThread(self, storage_writer):
+    """Starts the merge thread.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage used
+          to merge task storage.
+    """
+    self._merge_thread_active = True
+    self._merge_thread = threading.Thread(
+        name='Merge', target=self._MergeThreadMain, args=(storage_writer, ))
+    self._merge_thread.start()
+
   def _StartWorkerProcess(self, process_name, storage_writer):
     """Creates, starts, monitors and registers a worker process.
 
@@ -550,6 +734,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       self._UpdateForemanProcessStatus()
 
       tasks_status = self._task_manager.GetStatusInformation()
+      self._UpdateMergeStatus(tasks_status)
+
       if self._task_queue_profiler:
         self._task_queue_profiler.Sample(tasks_status)
 
@@ -601,6 +787,13 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # Kill any lingering processes.
     self._AbortKill()
 
+  def _StopMergeThread(self):
+    """Stops the merge thread."""
+    self._merge_thread_active = False
+    if self._merge_thread and self._merge_thread.is_alive():
+      self._merge_thread.join()
+    self._merge_thread = None
+
   def _UpdateForemanProcessStatus(self):
     """Update the foreman process status."""
     used_memory = self._process_information.GetUsedMemory() or 0
@@ -619,6 +812,30 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         self._number_of_consumed_errors, self._number_of_produced_errors,
         self._number_of_consumed_reports, self._number_of_produced_reports)
 
+  def _UpdateMergeStatus(self, tasks_status):
+    """Updates the merge throughput of the tasks status.
+
+    Args:
+      tasks_status (TasksStatus): tasks status information.
+    """
+    current_time = time.time()
+    number_of_merged_attribute_containers = (
+        self._number_of_merged_attribute_containers)
+
+    tasks_status.number_of_merged_attribute_containers = (
+        number_of_merged_attribute_containers)
+
+    if self._last_merge_rate_time is not None:
+      elapsed_time = current_time - self._last_merge_rate_time
+      if elapsed_time > 0:
+        tasks_status.merge_rate = float(
+            number_of_merged_attribute_containers -
+            self._last_number_of_merged_attribute_containers) / elapsed_time
+
+    self._last_merge_rate_time = current_time
+    self._last_number_of_merged_attribute_containers = (
+        number_of_merged_attribute_containers)
+
   def _UpdateProcessingStatus(self, pid, process_status, used_memory):
     """Updates the processing status.
 
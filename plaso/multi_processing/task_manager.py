@@ -166,6 +166,10 @@ class TaskManager(object):
 
     self._tasks_profiler = None
 
+    # Retry tasks, created from an abandoned task with multiple path
+    # specifications, that have not been handed out to be scheduled yet.
+    self._tasks_retry_pending = collections.deque()
+
     # TODO: implement a limit on the number of tasks.
     self._total_number_of_tasks = 0
 
@@ -247,7 +251,7 @@ class TaskManager(object):
     Returns:
       bool: True if there are abandoned tasks that need to be retried.
     """
-    return bool(self._GetTaskPendingRetry())
+    return bool(self._tasks_retry_pending or self._GetTaskPendingRetry())
 
   def _UpdateLatestProcessingTime(self, task):
     """Updates the latest processing time of the task manager from the task.
@@ -287,21 +291,30 @@ class TaskManager(object):
   def CreateRetryTask(self):
     """Creates a task that to retry a previously abandoned task.
 
+    An abandoned task with multiple path specifications is retried as a task
+    per path specification, which are returned by consecutive calls.
+
     Returns:
       Task: a task that was abandoned but should be retried or None if there are
           no abandoned tasks that should be retried.
     """
     with self._lock:
-      abandoned_task = self._GetTaskPendingRetry()
-      if not abandoned_task:
-        return None
+      if not self._tasks_retry_pending:
+        abandoned_task = self._GetTaskPendingRetry()
+        if not abandoned_task:
+          return None
+
+        # The abandoned task is kept in _tasks_abandoned so it can be still
+        # identified in CheckTaskToMerge and UpdateTaskAsPendingMerge.
 
-      # The abandoned task is kept in _tasks_abandoned so it can be still
-      # identified in CheckTaskToMerge and UpdateTaskAsPendingMerge.
+        retry_tasks = abandoned_task.CreateRetryTasks()
+        for retry_task in retry_tasks:
+          logger.debug('Retrying task {0:s} as {1:s}.'.format(
+              abandoned_task.identifier, retry_task.identifier))
 
-      retry_task = abandoned_task.CreateRetryTask()
-      logger.debug('Retrying task {0:s} as {1:s}.'.format(
-          abandoned_task.identifier, retry_task.identifier))
+        self._tasks_retry_pending.extend(retry_tasks)
+
+      retry_task = self._tasks_retry_pending.popleft()
 
       self._tasks_queued[retry_task.identifier] = retry_task
       self._total_number_of_tasks += 1
@@ -424,19 +437,32 @@ class TaskManager(object):
       Task: the next task to merge or None if there is no task pending merge or
           with a higher priority.
     """
-    next_task = self._tasks_pending_merge.PeekTask()
-    if not next_task:
-      return None
+    # The tasks are merged by a separate thread, hence the task is moved
+    # from pending merge to merging while holding the lock, otherwise
+    # HasPendingTasks could consider the task as neither.
+    with self._lock:
+      next_task = self._tasks_pending_merge.PeekTask()
+      if not next_task:
+        return None
 
-    if current_task and next_task.merge_priority > current_task.merge_priority:
-      return None
+      if (current_task and
+          next_task.merge_priority > current_task.merge_priority):
+        return None
 
-    with self._lock:
       next_task = self._tasks_pending_merge.PopTask()
+      self._tasks_merging[next_task.identifier] = next_task
 
-    self._tasks_merging[next_task.identifier] = next_task
     return next_task
 
+  def GetNumberOfTasksPendingMerge(self):
+    """Retrieves the number of tasks that are pending merge or being merged.
+
+    Returns:
+      int: number of tasks that are pending merge or being merged.
+    """
+    with self._lock:
+      return len(self._tasks_pending_merge) + len(self._tasks_merging)
+
   def HasPendingTasks(self):
     """Determines if there are tasks running or in need of retrying.
 
@@ -282,12 +282,18 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
     try:
       # TODO: add support for more task types.
-      self._ProcessPathSpec(
-          self._extraction_worker, self._parser_mediator, task.path_spec)
-      self._number_of_consumed_sources += 1
+      # Note that _ProcessPathSpec handles errors per path specification
+      # so that the other path specifications of the task are processed.
+      for path_spec in task.GetPathSpecs():
+        if self._abort:
+          break
+
+        self._ProcessPathSpec(
+            self._extraction_worker, self._parser_mediator, path_spec)
+        self._number_of_consumed_sources += 1
 
-      if self._guppy_memory_profiler:
-        self._guppy_memory_profiler.Sample()
+        if self._guppy_memory_profiler:
+          self._guppy_memory_profiler.Sample()
 
     finally:
       storage_writer.WriteTaskCompletion(aborted=self._abort)
@@ -9,6 +9,7 @@ from plaso.output import kml
 from plaso.output import l2t_csv
 from plaso.output import mysql_4n6time
 from plaso.output import null
+from plaso.output import parquet_out
 from plaso.output import rawpy
 from plaso.output import sqlite_4n6time
 from plaso.output import timesketch_out
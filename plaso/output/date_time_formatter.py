@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Date and time formatter for output modules."""
+
+from __future__ import unicode_literals
+
+import datetime
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+
+import pytz
+
+from plaso.lib import definitions
+from plaso.lib import py2to3
+from plaso.lib import timelib
+
+
+class DateTimeFormatter(object):
+  """Formats timestamps into date and time values for output modules.
+
+  Events in a timeline are typically sorted by timestamp, so that consecutive
+  events mostly share the same second and day. The formatter therefore
+  caches the formatted date and time of the last second and the date of
+  the last day, so that formatting a timestamp within the same second only
+  requires the microseconds to be formatted.
+
+  The date and time of a second are determined using the timezone, including
+  daylight saving time transitions, and since the offset of a timezone only
+  changes on a second boundary, it is the same for all the timestamps within
+  that second.
+  """
+
+  # Ordinal of January 1, 1970 in the proleptic Gregorian calendar.
+  _EPOCH_ORDINAL = 719163
+
+  _EPOCH_UTC = datetime.datetime(1970, 1, 1, 0, 0, 0, 0, tzinfo=pytz.UTC)
+
+  _SECONDS_PER_DAY = 24 * 60 * 60
+
+  def __init__(self, timezone=pytz.UTC):
+    """Initializes a date and time formatter.
+
+    Args:
+      timezone (Optional[datetime.tzinfo]): timezone of the ISO 8601 formatted
+          date and time strings.
+    """
+    super(DateTimeFormatter, self).__init__()
+    self._date_values = None
+    self._day_number = None
+    self._iso_format_prefix = None
+    self._iso_format_suffix = None
+    self._iso_format_seconds = None
+    self._timezone = timezone
+
+  def _GetDateValues(self, number_of_days):
+    """Retrieves the date values of a number of days since January 1, 1970.
+
+    Args:
+      number_of_days (int): number of days since January 1, 1970.
+
+    Returns:
+      tuple[int, int, int]: year, month, day of month.
+
+    Raises:
+      OverflowError: if the number of days is out of bounds.
+      ValueError: if the number of days is out of bounds.
+    """
+    if number_of_days != self._day_number:
+      date_object = datetime.date.fromordinal(
+          self._EPOCH_ORDINAL + number_of_days)
+
+      self._date_values = (date_object.year, date_object.month, date_object.day)
+      self._day_number = number_of_days
+
+    return self._date_values
+
+  def CopyToIsoFormat(self, timestamp, raise_error=False):
+    """Copies a timestamp to an ISO 8601 formatted string.
+
+    The string is the same as that of timelib.Timestamp.CopyToIsoFormat().
+
+    Args:
+      timestamp (int): number of microseconds since January 1, 1970,
+          00:00:00 UTC.
+      raise_error (Optional[bool]): True if an error should be raised if
+          the timestamp is missing or out of bounds.
+
+    Returns:
+      str: ISO 8601 formatted date and time in the timezone of the formatter.
+
+    Raises:
+      OverflowError: if raise_error is set and the timestamp is out of bounds.
+      ValueError: if raise_error is set and the timestamp is missing.
+    """
+    if not timestamp or not isinstance(timestamp, py2to3.INTEGER_TYPES):
+      return timelib.Timestamp.CopyToIsoFormat(
+          timestamp, timezone=self._timezone, raise_error=raise_error)
+
+    seconds, microseconds = divmod(
+        timestamp, definitions.MICROSECONDS_PER_SECOND)
+
+    if seconds != self._iso_format_seconds:
+      try:
+        datetime_object = self._EPOCH_UTC + datetime.timedelta(seconds=seconds)
+        datetime_object = datetime_object.astimezone(self._timezone)
+      except OverflowError:
+        # Fallback to timelib for its error handling.
+        return timelib.Timestamp.CopyToIsoFormat(
+            timestamp, timezone=self._timezone, raise_error=raise_error)
+
+      # Since the microseconds are 0 the ISO 8601 formatted string is:
+      # YYYY-MM-DDThh:mm:ss followed by the UTC offset of the timezone.
+      iso_format_string = datetime_object.isoformat()
+
+      self._iso_format_prefix = iso_format_string[:19]
+      self._iso_format_suffix = iso_format_string[19:]
+      self._iso_format_seconds = seconds
+
+    if not microseconds:
+      return ''.join([self._iso_format_prefix, self._iso_format_suffix])
+
+    return '{0:s}.{1:06d}{2:s}'.format(
+        self._iso_format_prefix, microseconds, self._iso_format_suffix)
+
+  def GetDateAndTimeOfDay(self, timestamp):
+    """Retrieves the date and time of day of a timestamp in UTC.
+
+    The values are the same as those of the dfdatetime
+    PosixTimeInMicroseconds GetDate() and GetTimeOfDay() methods.
+
+    Args:
+      timestamp (int): number of microseconds since January 1, 1970,
+          00:00:00 UTC.
+
+    Returns:
+      tuple[int, int, int, int, int, int]: year, month, day of month, hours,
+          minutes and seconds, where the date values are None if the date
+          cannot be determined.
+    """
+    # Negative timestamps and timestamps outside the range supported by
+    # the datetime module are rare, hence these are handled by dfdatetime.
+    if isinstance(timestamp, py2to3.INTEGER_TYPES) and timestamp >= 0:
+      number_of_days, seconds = divmod(
+          timestamp // definitions.MICROSECONDS_PER_SECOND,
+          self._SECONDS_PER_DAY)
+
+      try:
+        year, month, day_of_month = self._GetDateValues(number_of_days)
+      except (OverflowError, ValueError):
+        year = None
+
+      if year is not None:
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return year, month, day_of_month, hours, minutes, seconds
+
+    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+        timestamp=timestamp)
+
+    year, month, day_of_month = date_time.GetDate()
+    hours, minutes, seconds = date_time.GetTimeOfDay()
+    return year, month, day_of_month, hours, minutes, seconds
@@ -3,11 +3,8 @@
 
 from __future__ import unicode_literals
 
-from dfdatetime import posix_time as dfdatetime_posix_time
-
 from plaso.lib import errors
 from plaso.lib import py2to3
-from plaso.lib import timelib
 from plaso.output import interface
 from plaso.output import logger
 from plaso.output import manager
@@ -59,12 +56,9 @@ class DynamicFieldsHelper(object):
     Returns:
       str: date field.
     """
-    # TODO: preserve dfdatetime as an object.
     # TODO: add support for self._output_mediator.timezone
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
-
-    year, month, day_of_month = date_time.GetDate()
+    year, month, day_of_month, _, _, _ = (
+        self._output_mediator.GetDateAndTimeOfDay(event.timestamp))
     return '{0:04d}-{1:02d}-{2:02d}'.format(year, month, day_of_month)
 
   def _FormatDateTime(self, event):
@@ -77,9 +71,8 @@ class DynamicFieldsHelper(object):
       str: date and time field.
     """
     try:
-      return timelib.Timestamp.CopyToIsoFormat(
-          event.timestamp, timezone=self._output_mediator.timezone,
-          raise_error=True)
+      return self._output_mediator.GetDateTimeString(
+          event.timestamp, raise_error=True)
 
     except (OverflowError, ValueError) as exception:
       self._ReportEventError(event, (
@@ -238,12 +231,9 @@ class DynamicFieldsHelper(object):
     Returns:
       str: time field.
     """
-    # TODO: preserve dfdatetime as an object.
     # TODO: add support for self._output_mediator.timezone
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
-
-    hours, minutes, seconds = date_time.GetTimeOfDay()
+    _, _, _, hours, minutes, seconds = (
+        self._output_mediator.GetDateAndTimeOfDay(event.timestamp))
     return '{0:02d}:{1:02d}:{2:02d}'.format(hours, minutes, seconds)
 
   def _FormatTimestampDescription(self, event):
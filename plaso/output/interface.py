@@ -10,11 +10,18 @@ from plaso.output import logger
 
 
 class OutputModule(object):
-  """Output module interface."""
+  """Output module interface.
+
+  Attributes:
+    SUPPORTS_PARTITIONED_OUTPUT (bool): True if the output of the events can
+        be written per partition of the events and concatenated afterwards.
+  """
 
   NAME = ''
   DESCRIPTION = ''
 
+  SUPPORTS_PARTITIONED_OUTPUT = False
+
   def __init__(self, output_mediator):
     """Initializes an output module.
 
@@ -150,6 +157,8 @@ class LinearOutputModule(OutputModule):
   # classes need to implement that function.
   # pylint: disable=abstract-method
 
+  SUPPORTS_PARTITIONED_OUTPUT = True
+
   def __init__(self, output_mediator):
     """Initializes a linear output module.
 
@@ -174,3 +183,14 @@ class LinearOutputModule(OutputModule):
   def Close(self):
     """Closes the output."""
     self._output_writer = None
+
+  def WriteFormattedOutput(self, output):
+    """Writes output that was already formatted by the output module.
+
+    This is used to write the output of a partition of the events that was
+    formatted by another process.
+
+    Args:
+      output (str): formatted output.
+    """
+    self._output_writer.Write(output)
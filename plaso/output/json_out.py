@@ -16,6 +16,10 @@ class JSONOutputModule(interface.LinearOutputModule):
   NAME = 'json'
   DESCRIPTION = 'Saves the events into a JSON format.'
 
+  # The events are numbered and separated by commas, which requires state
+  # that is shared by all events.
+  SUPPORTS_PARTITIONED_OUTPUT = False
+
   _JSON_SERIALIZER = json_serializer.JSONAttributeContainerSerializer
 
   def __init__(self, output_mediator):
@@ -7,8 +7,6 @@ http://forensicswiki.org/wiki/L2T_CSV
 
 from __future__ import unicode_literals
 
-from dfdatetime import posix_time as dfdatetime_posix_time
-
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.lib import py2to3
@@ -111,10 +109,9 @@ class L2TCSVOutputModule(interface.LinearOutputModule):
       raise errors.NoFormatterFound(
           'Unable to find event formatter for: {0:s}.'.format(data_type))
 
-    # TODO: preserve dfdatetime as an object.
     # TODO: add support for self._output_mediator.timezone
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
+    year, month, day_of_month, hours, minutes, seconds = (
+        self._output_mediator.GetDateAndTimeOfDay(event.timestamp))
 
     format_variables = self._output_mediator.GetFormatStringAttributeNames(
         event)
@@ -161,10 +158,7 @@ class L2TCSVOutputModule(interface.LinearOutputModule):
     if not notes:
       notes.append('-')
 
-    year, month, day_of_month = date_time.GetDate()
     date_string = '{0:02d}/{1:02d}/{2:04d}'.format(month, day_of_month, year)
-
-    hours, minutes, seconds = date_time.GetTimeOfDay()
     time_string = '{0:02d}:{1:02d}:{2:02d}'.format(hours, minutes, seconds)
 
     output_values = [
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 from plaso.formatters import manager as formatters_manager
 from plaso.lib import definitions
+from plaso.output import date_time_formatter
 
 import pytz  # pylint: disable=wrong-import-order
 
@@ -30,6 +31,8 @@ class OutputMediator(object):
       preferred_encoding (Optional[str]): preferred encoding to output.
     """
     super(OutputMediator, self).__init__()
+    self._date_time_formatter = date_time_formatter.DateTimeFormatter(
+        timezone=pytz.UTC)
     self._formatter_mediator = formatter_mediator
     self._knowledge_base = knowledge_base
     self._preferred_encoding = preferred_encoding
@@ -55,6 +58,39 @@ class OutputMediator(object):
     """The timezone."""
     return self._timezone
 
+  def GetDateAndTimeOfDay(self, timestamp):
+    """Retrieves the date and time of day of a timestamp in UTC.
+
+    Args:
+      timestamp (int): number of microseconds since January 1, 1970,
+          00:00:00 UTC.
+
+    Returns:
+      tuple[int, int, int, int, int, int]: year, month, day of month, hours,
+          minutes and seconds, where the date values are None if the date
+          cannot be determined.
+    """
+    return self._date_time_formatter.GetDateAndTimeOfDay(timestamp)
+
+  def GetDateTimeString(self, timestamp, raise_error=False):
+    """Retrieves the ISO 8601 formatted date and time of a timestamp.
+
+    Args:
+      timestamp (int): number of microseconds since January 1, 1970,
+          00:00:00 UTC.
+      raise_error (Optional[bool]): True if an error should be raised if
+          the timestamp is missing or out of bounds.
+
+    Returns:
+      str: ISO 8601 formatted date and time in the timezone of the mediator.
+
+    Raises:
+      OverflowError: if raise_error is set and the timestamp is out of bounds.
+      ValueError: if raise_error is set and the timestamp is missing.
+    """
+    return self._date_time_formatter.CopyToIsoFormat(
+        timestamp, raise_error=raise_error)
+
   def GetEventFormatter(self, event):
     """Retrieves the event formatter for a specific event type.
 
@@ -87,7 +123,8 @@ class OutputMediator(object):
     if not event_formatter:
       return None, None
 
-    return event_formatter.GetMessages(self._formatter_mediator, event)
+    return formatters_manager.FormattersManager.GetMessageStrings(
+        self._formatter_mediator, event)
 
   def GetFormattedSources(self, event):
     """Retrieves the formatted sources related to the event.
@@ -105,7 +142,7 @@ class OutputMediator(object):
     if not event_formatter:
       return None, None
 
-    return event_formatter.GetSources(event)
+    return formatters_manager.FormattersManager.GetSourceStrings(event)
 
   def GetFormatStringAttributeNames(self, event):
     """Retrieves the attribute names in the format string.
@@ -309,3 +346,6 @@ class OutputMediator(object):
       self._timezone = pytz.timezone(timezone)
     except pytz.UnknownTimeZoneError:
       raise ValueError('Unsupported timezone: {0:s}'.format(timezone))
+
+    self._date_time_formatter = date_time_formatter.DateTimeFormatter(
+        timezone=self._timezone)
@@ -19,10 +19,6 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
   NAME = '4n6time_mysql'
   DESCRIPTION = 'MySQL database output for the 4n6time tool.'
 
-  _META_FIELDS = frozenset([
-      'sourcetype', 'source', 'user', 'host', 'MACB', 'type',
-      'record_number'])
-
   _CREATE_TABLE_QUERY = (
       'CREATE TABLE IF NOT EXISTS log2timeline ('
       'rowid INT NOT NULL AUTO_INCREMENT, timezone VARCHAR(256), '
@@ -38,6 +34,8 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
       'computer_name VARCHAR(256), evidence VARCHAR(256), '
       'PRIMARY KEY (rowid)) ENGINE=InnoDB ROW_FORMAT=COMPRESSED')
 
+  # Note that MySQLdb uses the "pyformat" parameter style and combines
+  # the rows passed to executemany into a single multi-row INSERT statement.
   _INSERT_QUERY = (
       'INSERT INTO log2timeline(timezone, MACB, source, '
       'sourcetype, type, user, host, description, filename, '
@@ -45,11 +43,13 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
       'tag, offset, vss_store_number, URL, record_number, '
       'event_identifier, event_type, source_name, user_sid, computer_name, '
       'evidence) '
-      'VALUES (:timezone, :MACB, :source, :sourcetype, :type, :user, :host, '
-      ':description, :filename, :inode, :notes, :format, :extra, :datetime, '
-      ':reportnotes, :inreport, :tag, :offset, :vss_store_number, :URL, '
-      ':record_number, :event_identifier, :event_type, :source_name, '
-      ':user_sid, :computer_name, :evidence)')
+      'VALUES (%(timezone)s, %(MACB)s, %(source)s, %(sourcetype)s, '
+      '%(type)s, %(user)s, %(host)s, %(description)s, %(filename)s, '
+      '%(inode)s, %(notes)s, %(format)s, %(extra)s, %(datetime)s, '
+      '%(reportnotes)s, %(inreport)s, %(tag)s, %(offset)s, '
+      '%(vss_store_number)s, %(URL)s, %(record_number)s, '
+      '%(event_identifier)s, %(event_type)s, %(source_name)s, '
+      '%(user_sid)s, %(computer_name)s, %(evidence)s)')
 
   def __init__(self, output_mediator):
     """Initializes the output module object.
@@ -114,13 +114,43 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
 
     return result
 
+  def _InsertEventValues(self, event_values_list):
+    """Inserts event values into the database.
+
+    If the batch of event values cannot be inserted, the event values are
+    inserted one by one, so that only the offending events are skipped.
+
+    Args:
+      event_values_list (list[dict[str, object]]): sanitized event values.
+    """
+    try:
+      self._cursor.executemany(self._INSERT_QUERY, event_values_list)
+      return
+
+    except MySQLdb.Error as exception:
+      logger.debug(
+          'Unable to insert batch into database with error: {0!s}.'.format(
+              exception))
+
+    for event_values in event_values_list:
+      try:
+        self._cursor.execute(self._INSERT_QUERY, event_values)
+      except MySQLdb.Error as exception:
+        logger.warning(
+            'Unable to insert into database with error: {0!s}.'.format(
+                exception))
+
   def Close(self):
     """Disconnects from the database.
 
     This method will create the necessary indices and commit outstanding
     transactions before disconnecting.
     """
-    # Build up indices for the fields specified in the args.
+    self._FlushEventValues()
+
+    # Build up indices for the fields specified in the args, after all
+    # events have been inserted, since maintaining the indices while
+    # inserting is considerably slower.
     # It will commit the inserts automatically before creating index.
     if not self._append:
       for field_name in self._fields:
@@ -134,18 +164,27 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     if self._set_status:
       self._set_status('Creating metadata...')
 
+    # The values of a newly created database are counted while inserting,
+    # the values of an appended database include those of previous exports.
     for field in self._META_FIELDS:
-      values = self._GetUniqueValues(field)
+      if self._append:
+        values = self._GetUniqueValues(field)
+      else:
+        values = self._GetCountedMetaFieldValues(field)
+
       self._cursor.execute('DELETE FROM l2t_{0:s}s'.format(field))
-      for name, frequency in iter(values.items()):
-        self._cursor.execute((
-            'INSERT INTO l2t_{0:s}s ({0:s}s, frequency) '
-            'VALUES("{1:s}", {2:d}) ').format(field, name, frequency))
+      self._cursor.executemany(
+          'INSERT INTO l2t_{0:s}s ({0:s}s, frequency) VALUES (%s, %s)'.format(
+              field), sorted(values.items()))
+
+    if self._append:
+      tags = self._GetTags()
+    else:
+      tags = self._tags
 
     self._cursor.execute('DELETE FROM l2t_tags')
-    for tag in self._GetTags():
-      self._cursor.execute(
-          'INSERT INTO l2t_tags (tag) VALUES ("{0:s}")'.format(tag))
+    self._cursor.executemany(
+        'INSERT INTO l2t_tags (tag) VALUES (%s)', [[tag] for tag in tags])
 
     if self._set_status:
       self._set_status('Database created.')
@@ -157,6 +196,8 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     self._cursor = None
     self._connection = None
 
+    self._ResetMetaFieldValues()
+
   def Open(self):
     """Connects to the database and creates the required tables.
 
@@ -230,6 +271,7 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
           exception))
 
     self._count = 0
+    self._ResetMetaFieldValues()
 
   def SetCredentials(self, password=None, username=None):
     """Sets the database credentials.
@@ -271,18 +313,20 @@ class MySQL4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
       return
 
     row = self._GetSanitizedEventValues(event)
-    try:
-      self._cursor.execute(self._INSERT_QUERY, row)
-    except MySQLdb.Error as exception:
-      logger.warning(
-          'Unable to insert into database with error: {0!s}.'.format(
-              exception))
+
+    if not self._append:
+      self._CountMetaFieldValues(row)
+
+    self._event_values_buffer.append(row)
+    if len(self._event_values_buffer) >= self._INSERT_BATCH_SIZE:
+      self._FlushEventValues()
 
     self._count += 1
 
     # TODO: Experiment if committing the current transaction
     # every 10000 inserts is the optimal approach.
-    if self._count % 10000 == 0:
+    if self._count % self._COMMIT_INTERVAL == 0:
+      self._FlushEventValues()
       self._connection.commit()
       if self._set_status:
         self._set_status('Inserting event: {0:d}'.format(self._count))
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""Output module for the Apache Parquet columnar format.
+
+The events are written in row groups of typed columns, where columns with
+few distinct values, such as the data type and parser, are dictionary
+encoded. Analytics tooling can read only the columns it needs and skip row
+groups based on the column statistics, such as the minimum and maximum
+timestamp.
+"""
+
+from __future__ import unicode_literals
+
+import os
+
+try:
+  import pyarrow
+  from pyarrow import parquet
+except ImportError:
+  pyarrow = None
+  parquet = None
+
+from plaso.lib import errors
+from plaso.lib import py2to3
+from plaso.output import interface
+from plaso.output import manager
+
+
+class ParquetOutputModule(interface.OutputModule):
+  """Output module for the Apache Parquet columnar format."""
+
+  NAME = 'parquet'
+  DESCRIPTION = 'Saves the events into a columnar Apache Parquet file.'
+
+  # Column names and types, where "dictionary" indicates a dictionary
+  # encoded string column.
+  _COLUMNS = [
+      ('timestamp', 'int64'),
+      ('timestamp_desc', 'dictionary'),
+      ('data_type', 'dictionary'),
+      ('parser', 'dictionary'),
+      ('source_short', 'dictionary'),
+      ('source_long', 'dictionary'),
+      ('hostname', 'dictionary'),
+      ('username', 'dictionary'),
+      ('display_name', 'string'),
+      ('message', 'string')]
+
+  _DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+  def __init__(self, output_mediator):
+    """Initializes an Apache Parquet output module.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfvfs.
+    """
+    super(ParquetOutputModule, self).__init__(output_mediator)
+    self._column_values = {column_name: [] for column_name, _ in self._COLUMNS}
+    self._filename = None
+    self._number_of_buffered_events = 0
+    self._row_group_size = self._DEFAULT_ROW_GROUP_SIZE
+    self._schema = None
+    self._writer = None
+
+  def _FlushRowGroup(self):
+    """Writes the buffered events as a row group."""
+    if not self._number_of_buffered_events:
+      return
+
+    arrays = []
+    for column_name, column_type in self._COLUMNS:
+      column_values = self._column_values[column_name]
+      if column_type == 'int64':
+        array = pyarrow.array(column_values, type=pyarrow.int64())
+      else:
+        array = pyarrow.array(column_values, type=pyarrow.string())
+        if column_type == 'dictionary':
+          array = array.dictionary_encode()
+
+      arrays.append(array)
+      self._column_values[column_name] = []
+
+    table = pyarrow.Table.from_arrays(arrays, schema=self._schema)
+    self._writer.write_table(table, row_group_size=self._row_group_size)
+
+    self._number_of_buffered_events = 0
+
+  def _GetSchema(self):
+    """Retrieves the Apache Arrow schema of the columns.
+
+    Returns:
+      pyarrow.Schema: schema of the columns.
+    """
+    fields = []
+    for column_name, column_type in self._COLUMNS:
+      if column_type == 'int64':
+        field_type = pyarrow.int64()
+      elif column_type == 'dictionary':
+        field_type = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+      else:
+        field_type = pyarrow.string()
+
+      fields.append(pyarrow.field(column_name, field_type))
+
+    return pyarrow.schema(fields)
+
+  def _GetStringValue(self, value):
+    """Retrieves the string representation of a column value.
+
+    Args:
+      value (object): column value.
+
+    Returns:
+      str: string representation of the value or None if not set.
+    """
+    if value is None or isinstance(value, py2to3.UNICODE_TYPE):
+      return value
+
+    return '{0!s}'.format(value)
+
+  def Close(self):
+    """Closes the output."""
+    if self._writer:
+      self._FlushRowGroup()
+      self._writer.close()
+      self._writer = None
+
+  def Open(self):
+    """Opens the output.
+
+    Raises:
+      IOError: if the specified output file already exists.
+      OSError: if the specified output file already exists.
+      ValueError: if the filename is not set.
+    """
+    if not self._filename:
+      raise ValueError('Missing filename.')
+
+    if os.path.isfile(self._filename):
+      raise IOError((
+          'Unable to use an already existing file for output '
+          '[{0:s}]').format(self._filename))
+
+    dictionary_column_names = [
+        column_name for column_name, column_type in self._COLUMNS
+        if column_type == 'dictionary']
+
+    self._schema = self._GetSchema()
+    self._writer = parquet.ParquetWriter(
+        self._filename, self._schema, use_dictionary=dictionary_column_names)
+
+  def SetFilename(self, filename):
+    """Sets the filename.
+
+    Args:
+      filename (str): filename.
+    """
+    self._filename = filename
+
+  def SetRowGroupSize(self, row_group_size):
+    """Sets the row group size.
+
+    The row group size determines the number of events that are buffered
+    in memory before they are written.
+
+    Args:
+      row_group_size (int): maximum number of events per row group.
+    """
+    self._row_group_size = row_group_size
+
+  def WriteEventBody(self, event):
+    """Writes event values to the output.
+
+    Args:
+      event (EventObject): event that contains the event values.
+
+    Raises:
+      NoFormatterFound: If no event formatter can be found to match the data
+          type in the event.
+    """
+    data_type = getattr(event, 'data_type', 'UNKNOWN')
+
+    message, _ = self._output_mediator.GetFormattedMessages(event)
+    if message is None:
+      raise errors.NoFormatterFound(
+          'Unable to find event formatter for: {0:s}.'.format(data_type))
+
+    source_short, source_long = self._output_mediator.GetFormattedSources(
+        event)
+    if source_short is None or source_long is None:
+      raise errors.NoFormatterFound(
+          'Unable to find event formatter for: {0:s}.'.format(data_type))
+
+    column_values = self._column_values
+    column_values['timestamp'].append(getattr(event, 'timestamp', None))
+    column_values['timestamp_desc'].append(self._GetStringValue(
+        getattr(event, 'timestamp_desc', None)))
+    column_values['data_type'].append(data_type)
+    column_values['parser'].append(self._GetStringValue(
+        getattr(event, 'parser', None)))
+    column_values['source_short'].append(source_short)
+    column_values['source_long'].append(source_long)
+    column_values['hostname'].append(self._GetStringValue(
+        self._output_mediator.GetHostname(event)))
+    column_values['username'].append(self._GetStringValue(
+        self._output_mediator.GetUsername(event)))
+    column_values['display_name'].append(self._GetStringValue(
+        getattr(event, 'display_name', None)))
+    column_values['message'].append(message)
+
+    self._number_of_buffered_events += 1
+    if self._number_of_buffered_events >= self._row_group_size:
+      self._FlushRowGroup()
+
+
+manager.OutputManager.RegisterOutput(
+    ParquetOutputModule, disabled=pyarrow is None)
@@ -3,10 +3,13 @@
 
 from __future__ import unicode_literals
 
-from dfdatetime import posix_time as dfdatetime_posix_time
+import abc
+import collections
+import operator
 
 from plaso.lib import definitions
 from plaso.lib import errors
+from plaso.lib import py2to3
 from plaso.output import interface
 
 
@@ -20,6 +23,19 @@ class Shared4n6TimeOutputModule(interface.OutputModule):
   _DEFAULT_FIELDS = [
       'datetime', 'host', 'source', 'sourcetype', 'user', 'type']
 
+  # Fields of which the frequency of the values is stored in the l2t_*
+  # metadata tables.
+  _META_FIELDS = frozenset([
+      'sourcetype', 'source', 'user', 'host', 'MACB', 'type',
+      'record_number'])
+
+  # Number of events that are inserted into the database at once.
+  _INSERT_BATCH_SIZE = 1000
+
+  # Number of events after which the current transaction is committed,
+  # which should be a multiple of the insert batch size.
+  _COMMIT_INTERVAL = 10000
+
   def __init__(self, output_mediator):
     """Initializes the output module object.
 
@@ -32,9 +48,50 @@ class Shared4n6TimeOutputModule(interface.OutputModule):
     """
     super(Shared4n6TimeOutputModule, self).__init__(output_mediator)
     self._append = False
+    self._event_values_buffer = []
     self._evidence = '-'
     self._fields = self._DEFAULT_FIELDS
+    self._meta_field_names = sorted(self._META_FIELDS)
+    self._meta_field_values = collections.Counter()
+    self._meta_field_values_getter = operator.itemgetter(
+        *self._meta_field_names)
     self._set_status = None
+    self._tags = []
+    self._tags_set = set()
+
+  def _CountMetaFieldValues(self, event_values):
+    """Counts the values of the metadata fields and the tags of an event.
+
+    The combinations of metadata field values are counted, since these are
+    typically shared by many events, and only split into the frequencies of
+    the values per field when they are written to the database.
+
+    Args:
+      event_values (dict[str, object]): sanitized event values.
+    """
+    meta_field_values = self._meta_field_values_getter(event_values)
+    try:
+      self._meta_field_values[meta_field_values] += 1
+    except TypeError:
+      # Unhashable values are counted as they are stored by the database,
+      # that is as strings.
+      meta_field_values = tuple([
+          value if value is None else '{0!s}'.format(value)
+          for value in meta_field_values])
+      self._meta_field_values[meta_field_values] += 1
+
+    tag_string = event_values.get('tag', None)
+    if tag_string:
+      for tag in tag_string.split(','):
+        if tag not in self._tags_set:
+          self._tags.append(tag)
+          self._tags_set.add(tag)
+
+  def _FlushEventValues(self):
+    """Inserts the buffered event values into the database."""
+    if self._event_values_buffer:
+      self._InsertEventValues(self._event_values_buffer)
+      self._event_values_buffer = []
 
   def _FormatDateTime(self, event):
     """Formats the date and time.
@@ -48,17 +105,41 @@ class Shared4n6TimeOutputModule(interface.OutputModule):
     if not event.timestamp:
       return 'N/A'
 
-    # TODO: preserve dfdatetime as an object.
     # TODO: add support for self._output_mediator.timezone
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
-
-    year, month, day_of_month = date_time.GetDate()
-    hours, minutes, seconds = date_time.GetTimeOfDay()
+    year, month, day_of_month, hours, minutes, seconds = (
+        self._output_mediator.GetDateAndTimeOfDay(event.timestamp))
 
     return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}'.format(
         year, month, day_of_month, hours, minutes, seconds)
 
+  def _GetCountedMetaFieldValues(self, field_name):
+    """Retrieves the frequencies of the counted values of a metadata field.
+
+    The values are those stored by the database, that is strings, where
+    empty values are ignored.
+
+    Args:
+      field_name (str): name of the metadata field.
+
+    Returns:
+      dict[str, int]: number of instances of the field value per field value.
+    """
+    field_index = self._meta_field_names.index(field_name)
+
+    frequencies = collections.Counter()
+    for meta_field_values, frequency in iter(self._meta_field_values.items()):
+      value = meta_field_values[field_index]
+      if value is None:
+        continue
+
+      if not isinstance(value, py2to3.UNICODE_TYPE):
+        value = '{0!s}'.format(value)
+
+      if value:
+        frequencies[value] += frequency
+
+    return dict(frequencies)
+
   def _GetSanitizedEventValues(self, event):
     """Sanitizes the event for use in 4n6time.
 
@@ -170,6 +251,21 @@ class Shared4n6TimeOutputModule(interface.OutputModule):
 
     return getattr(event.pathspec, 'vss_store_number', -1)
 
+  @abc.abstractmethod
+  def _InsertEventValues(self, event_values_list):
+    """Inserts event values into the database.
+
+    Args:
+      event_values_list (list[dict[str, object]]): sanitized event values.
+    """
+
+  def _ResetMetaFieldValues(self):
+    """Resets the buffered event values and the counted metadata values."""
+    self._event_values_buffer = []
+    self._meta_field_values = collections.Counter()
+    self._tags = []
+    self._tags_set = set()
+
   def SetAppendMode(self, append):
     """Set the append status.
 
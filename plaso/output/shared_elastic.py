@@ -5,15 +5,27 @@ from __future__ import unicode_literals
 
 import os
 import logging
+import threading
+import time
+import uuid
+
+# The 'Queue' module was renamed to 'queue' in Python 3
+try:
+  import Queue
+except ImportError:
+  import queue as Queue  # pylint: disable=import-error
 
 from dfvfs.serializer.json_serializer import JsonPathSpecSerializer
 
 try:
   import elasticsearch
+  from elasticsearch import serializer as elasticsearch_serializer
 except ImportError:
   elasticsearch = None
+  elasticsearch_serializer = None
 
 from plaso.lib import errors
+from plaso.lib import py2to3
 from plaso.lib import timelib
 from plaso.output import interface
 from plaso.output import logger
@@ -24,6 +36,247 @@ if elasticsearch:
   elastic_logger.setLevel(logging.WARNING)
 
 
+class ElasticsearchBulkIndexer(object):
+  """Pipelined Elasticsearch bulk indexer.
+
+  Chunks of serialized bulk actions are queued and sent by multiple sender
+  threads, so that the caller can continue to produce events while chunks
+  are being indexed. The queue is bounded, hence the caller is blocked when
+  the sender threads cannot keep up.
+
+  Chunks, or individual actions in a chunk, that are rejected by
+  Elasticsearch, for example because its bulk queue is full, are retried
+  with an exponential backoff.
+
+  Attributes:
+    number_of_bytes (int): number of bytes of the bulk actions that were
+        indexed.
+    number_of_chunks (int): number of chunks that were indexed.
+    number_of_dropped_events (int): number of events that could not be
+        indexed.
+    number_of_events (int): number of events that were indexed.
+    number_of_retries (int): number of times a chunk was retried.
+  """
+
+  # HTTP status codes of bulk requests and actions that should be retried.
+  _RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+
+  def __init__(
+      self, bulk_function, initial_backoff=1.0, maximum_number_of_retries=5,
+      maximum_queue_size=4, number_of_threads=2):
+    """Initializes an Elasticsearch bulk indexer.
+
+    Args:
+      bulk_function (function): function that sends a bulk request, which
+          takes the newline delimited JSON body of the request as argument
+          and returns the response of Elasticsearch as a dictionary.
+      initial_backoff (Optional[float]): number of seconds to wait before
+          the first retry of a rejected chunk, which is doubled for every
+          subsequent retry.
+      maximum_number_of_retries (Optional[int]): maximum number of times
+          a rejected chunk is retried.
+      maximum_queue_size (Optional[int]): maximum number of chunks that are
+          queued.
+      number_of_threads (Optional[int]): number of sender threads.
+    """
+    super(ElasticsearchBulkIndexer, self).__init__()
+    self._bulk_function = bulk_function
+    self._initial_backoff = initial_backoff
+    self._lock = threading.Lock()
+    self._maximum_number_of_retries = maximum_number_of_retries
+    self._number_of_threads = number_of_threads
+    self._queue = Queue.Queue(maxsize=maximum_queue_size)
+    self._start_time = None
+    self._stop_time = None
+    self._threads = []
+
+    self.number_of_bytes = 0
+    self.number_of_chunks = 0
+    self.number_of_dropped_events = 0
+    self.number_of_events = 0
+    self.number_of_retries = 0
+
+  def _GetRetryLines(self, lines, response):
+    """Determines the actions of a chunk that should be retried.
+
+    Args:
+      lines (list[str]): serialized actions and documents of the chunk, where
+          every action is followed by its document.
+      response (dict[str, object]): response of the bulk request.
+
+    Returns:
+      tuple: containing:
+
+        list[str]: serialized actions and documents that should be retried.
+        int: number of actions that failed and should not be retried.
+    """
+    if not isinstance(response, dict) or not response.get('errors', False):
+      return [], 0
+
+    retry_lines = []
+    number_of_failed_actions = 0
+    for index, item in enumerate(response.get('items', [])):
+      result = item.get('index', None) or {}
+      status = result.get('status', 200)
+      if status < 300:
+        continue
+
+      line_index = index * 2
+      if status in self._RETRY_STATUS_CODES and line_index < len(lines):
+        retry_lines.extend(lines[line_index:line_index + 2])
+      else:
+        number_of_failed_actions += 1
+        logger.warning('Unable to index event with error: {0!s}'.format(
+            result.get('error', status)))
+
+    return retry_lines, number_of_failed_actions
+
+  def _IsRetryableException(self, exception):
+    """Determines if a bulk request that raised an exception can be retried.
+
+    Args:
+      exception (Exception): exception raised by the bulk request.
+
+    Returns:
+      bool: True if the bulk request can be retried.
+    """
+    if isinstance(exception, (IOError, OSError)):
+      return True
+
+    if elasticsearch and isinstance(exception, elasticsearch.ConnectionError):
+      return True
+
+    status_code = getattr(exception, 'status_code', None)
+    return status_code in self._RETRY_STATUS_CODES
+
+  def _SendChunk(self, lines):
+    """Sends a chunk of actions to Elasticsearch.
+
+    Args:
+      lines (list[str]): serialized actions and documents, where every action
+          is followed by its document.
+    """
+    backoff = self._initial_backoff
+    number_of_actions = len(lines) // 2
+    number_of_bytes = 0
+    number_of_failed_actions = 0
+    number_of_retries = 0
+
+    while lines:
+      # The bulk request body must be terminated by a newline.
+      body = '{0:s}\n'.format('\n'.join(lines))
+
+      try:
+        response = self._bulk_function(body)
+        retry_lines, number_of_failed = self._GetRetryLines(lines, response)
+
+        number_of_bytes += len(body)
+        number_of_failed_actions += number_of_failed
+
+      except Exception as exception:  # pylint: disable=broad-except
+        if not self._IsRetryableException(exception):
+          logger.error('Unable to bulk insert with error: {0!s}'.format(
+              exception))
+          number_of_failed_actions += len(lines) // 2
+          break
+
+        retry_lines = lines
+
+      if not retry_lines:
+        break
+
+      if number_of_retries >= self._maximum_number_of_retries:
+        logger.error((
+            'Unable to bulk insert {0:d} events after {1:d} retries.').format(
+                len(retry_lines) // 2, number_of_retries))
+        number_of_failed_actions += len(retry_lines) // 2
+        break
+
+      logger.debug((
+          'Retrying bulk insert of {0:d} events in {1:.1f} seconds.').format(
+              len(retry_lines) // 2, backoff))
+
+      time.sleep(backoff)
+      backoff *= 2
+      number_of_retries += 1
+      lines = retry_lines
+
+    with self._lock:
+      self.number_of_bytes += number_of_bytes
+      self.number_of_chunks += 1
+      self.number_of_dropped_events += number_of_failed_actions
+      self.number_of_events += number_of_actions - number_of_failed_actions
+      self.number_of_retries += number_of_retries
+
+  def _SenderThreadMain(self):
+    """Main function of a sender thread."""
+    while True:
+      lines = self._queue.get()
+      try:
+        if lines is None:
+          break
+
+        self._SendChunk(lines)
+
+      finally:
+        self._queue.task_done()
+
+  def GetThroughput(self):
+    """Retrieves the indexing throughput.
+
+    Returns:
+      tuple: containing:
+
+        float: number of events indexed per second.
+        float: number of bytes indexed per second.
+    """
+    if self._start_time is None:
+      return 0.0, 0.0
+
+    duration = (self._stop_time or time.time()) - self._start_time
+    if duration <= 0.0:
+      return 0.0, 0.0
+
+    return self.number_of_events / duration, self.number_of_bytes / duration
+
+  def QueueChunk(self, lines):
+    """Queues a chunk of actions to be sent to Elasticsearch.
+
+    Blocks if the queue is full.
+
+    Args:
+      lines (list[str]): serialized actions and documents, where every action
+          is followed by its document.
+    """
+    if lines:
+      self._queue.put(lines)
+
+  def Start(self):
+    """Starts the sender threads."""
+    self._start_time = time.time()
+    self._stop_time = None
+
+    for thread_number in range(self._number_of_threads):
+      thread = threading.Thread(
+          name='ElasticsearchBulkIndexer{0:d}'.format(thread_number),
+          target=self._SenderThreadMain)
+      thread.daemon = True
+      thread.start()
+
+      self._threads.append(thread)
+
+  def Stop(self):
+    """Stops the sender threads after the queued chunks have been sent."""
+    for _ in self._threads:
+      self._queue.put(None)
+
+    for thread in self._threads:
+      thread.join()
+
+    self._threads = []
+    self._stop_time = time.time()
+
+
 class SharedElasticsearchOutputModule(interface.OutputModule):
   """Shared functionality for an Elasticsearch output module."""
 
@@ -31,10 +284,15 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
 
   NAME = 'elastic_shared'
 
+  # Maximum size of the serialized event documents of a bulk request.
+  _DEFAULT_CHUNK_SIZE = 5 * 1024 * 1024
+
   _DEFAULT_DOCUMENT_TYPE = 'plaso_event'
 
   _DEFAULT_FLUSH_INTERVAL = 1000
 
+  _DEFAULT_NUMBER_OF_SENDER_THREADS = 2
+
   # Number of seconds to wait before a request to Elasticsearch is timed out.
   _DEFAULT_REQUEST_TIMEOUT = 300
 
@@ -46,15 +304,20 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
           modules and other components, such as storage and dfvfs.
     """
     super(SharedElasticsearchOutputModule, self).__init__(output_mediator)
+    self._bulk_indexer = None
+    self._chunk_size = self._DEFAULT_CHUNK_SIZE
     self._client = None
     self._document_type = self._DEFAULT_DOCUMENT_TYPE
     self._event_documents = []
+    self._event_documents_size = 0
     self._flush_interval = self._DEFAULT_FLUSH_INTERVAL
     self._host = None
     self._index_name = None
     self._number_of_buffered_events = 0
+    self._number_of_sender_threads = self._DEFAULT_NUMBER_OF_SENDER_THREADS
     self._password = None
     self._port = None
+    self._serializer = None
     self._username = None
     self._use_ssl = None
     self._ca_certs = None
@@ -102,26 +365,43 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
           'Unable to create Elasticsearch index with error: {0!s}'.format(
               exception))
 
+  def _BulkInsert(self, body):
+    """Sends a bulk request to Elasticsearch.
+
+    Args:
+      body (str): newline delimited JSON body of the bulk request.
+
+    Returns:
+      dict[str, object]: response of the bulk request.
+    """
+    # pylint: disable=unexpected-keyword-arg
+    # pylint does not recognizes request_timeout as a valid kwarg. According
+    # to http://elasticsearch-py.readthedocs.io/en/master/api.html#timeout
+    # it should be supported.
+    return self._client.bulk(
+        body=body, doc_type=self._document_type, index=self._index_name,
+        request_timeout=self._DEFAULT_REQUEST_TIMEOUT)
+
   def _FlushEvents(self):
-    """Inserts the buffered event documents into Elasticsearch."""
-    try:
-      # pylint: disable=unexpected-keyword-arg
-      # pylint does not recognizes request_timeout as a valid kwarg. According
-      # to http://elasticsearch-py.readthedocs.io/en/master/api.html#timeout
-      # it should be supported.
-      self._client.bulk(
-          body=self._event_documents, doc_type=self._document_type,
-          index=self._index_name, request_timeout=self._DEFAULT_REQUEST_TIMEOUT)
-
-    except ValueError as exception:
-      # Ignore problematic events
-      logger.warning('Unable to bulk insert with error: {0!s}'.format(
-          exception))
-
-    logger.debug('Inserted {0:d} events into Elasticsearch'.format(
-        self._number_of_buffered_events))
+    """Queues the buffered event documents to be inserted into Elasticsearch.
+
+    The bulk indexer is started when the first event documents are flushed.
+    """
+    if self._event_documents:
+      if not self._bulk_indexer:
+        self._bulk_indexer = ElasticsearchBulkIndexer(
+            self._BulkInsert,
+            number_of_threads=self._number_of_sender_threads)
+        self._bulk_indexer.Start()
+
+      self._bulk_indexer.QueueChunk(self._event_documents)
+
+      logger.debug((
+          'Queued {0:d} events for insertion into Elasticsearch').format(
+              self._number_of_buffered_events))
 
     self._event_documents = []
+    self._event_documents_size = 0
     self._number_of_buffered_events = 0
 
   def _GetSanitizedEventValues(self, event):
@@ -165,8 +445,7 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
           'Defaulting to 0').format(event.timestamp, exception))
       attribute_value = 0
 
-    attribute_value = timelib.Timestamp.CopyToIsoFormat(
-        attribute_value, timezone=self._output_mediator.timezone)
+    attribute_value = self._output_mediator.GetDateTimeString(attribute_value)
     event_values['datetime'] = attribute_value
 
     message, _ = self._output_mediator.GetFormattedMessages(event)
@@ -198,9 +477,10 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
   def _InsertEvent(self, event, force_flush=False):
     """Inserts an event.
 
-    Events are buffered in the form of documents and inserted to Elasticsearch
-    when either forced to flush or when the flush interval (threshold) has been
-    reached.
+    Events are buffered in the form of serialized documents and inserted to
+    Elasticsearch when either forced to flush, when the size of the buffered
+    documents exceeds the chunk size or when the flush interval (threshold)
+    has been reached.
 
     Args:
       event (EventObject): event.
@@ -208,17 +488,61 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
           into Elasticsearch.
     """
     if event:
-      event_document = {'index': {
-          '_index': self._index_name, '_type': self._document_type}}
       event_values = self._GetSanitizedEventValues(event)
 
-      self._event_documents.append(event_document)
-      self._event_documents.append(event_values)
-      self._number_of_buffered_events += 1
-
-    if force_flush or self._number_of_buffered_events > self._flush_interval:
+      try:
+        serialized_event_values = self._SerializeDocument(event_values)
+
+        # The document identifier is assigned when the document is buffered
+        # so that a chunk that is sent again, for example after a connection
+        # error, replaces the documents that were already indexed instead of
+        # duplicating them. Distinct events with the same values are indexed
+        # as distinct documents.
+        document_identifier = uuid.uuid4().hex
+
+        event_document = {'index': {
+            '_id': document_identifier, '_index': self._index_name,
+            '_type': self._document_type}}
+        serialized_event_document = self._SerializeDocument(event_document)
+
+      except (TypeError, ValueError) as exception:
+        # Ignore problematic events
+        logger.warning('Unable to serialize event with error: {0!s}'.format(
+            exception))
+
+      else:
+        self._event_documents.append(serialized_event_document)
+        self._event_documents.append(serialized_event_values)
+        self._event_documents_size += (
+            len(serialized_event_document) + len(serialized_event_values) + 2)
+        self._number_of_buffered_events += 1
+
+    if (force_flush or self._event_documents_size >= self._chunk_size or
+        self._number_of_buffered_events > self._flush_interval):
       self._FlushEvents()
 
+  def _SerializeDocument(self, document):
+    """Serializes a document as JSON for a bulk request.
+
+    Args:
+      document (dict[str, object]): document.
+
+    Returns:
+      str: JSON serialized document.
+
+    Raises:
+      TypeError: if the document cannot be serialized.
+      ValueError: if the document cannot be serialized.
+    """
+    if not self._serializer:
+      self._serializer = elasticsearch_serializer.JSONSerializer()
+
+    serialized_document = self._serializer.dumps(document)
+    if isinstance(serialized_document, py2to3.BYTES_TYPE):
+      serialized_document = serialized_document.decode('utf-8')
+
+    return serialized_document
+
   def Close(self):
     """Closes connection to Elasticsearch.
 
@@ -226,8 +550,35 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
     """
     self._InsertEvent(None, force_flush=True)
 
+    if self._bulk_indexer:
+      self._bulk_indexer.Stop()
+
+      events_per_second, bytes_per_second = (
+          self._bulk_indexer.GetThroughput())
+      logger.info((
+          'Inserted {0:d} events ({1:d} bytes) into Elasticsearch in {2:d} '
+          'chunks at {3:.1f} events/second ({4:.1f} bytes/second), with '
+          '{5:d} retries and {6:d} events not inserted.').format(
+              self._bulk_indexer.number_of_events,
+              self._bulk_indexer.number_of_bytes,
+              self._bulk_indexer.number_of_chunks, events_per_second,
+              bytes_per_second, self._bulk_indexer.number_of_retries,
+              self._bulk_indexer.number_of_dropped_events))
+
+      self._bulk_indexer = None
+
     self._client = None
 
+  def SetChunkSize(self, chunk_size):
+    """Sets the chunk size.
+
+    Args:
+      chunk_size (int): maximum size, in bytes, of the serialized event
+          documents of a bulk request.
+    """
+    self._chunk_size = chunk_size
+    logger.debug('Elasticsearch chunk size: {0:d}'.format(chunk_size))
+
   def SetDocumentType(self, document_type):
     """Sets the document type.
 
@@ -256,6 +607,17 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
     self._index_name = index_name
     logger.debug('Elasticsearch index name: {0:s}'.format(index_name))
 
+  def SetNumberOfSenderThreads(self, number_of_sender_threads):
+    """Sets the number of sender threads.
+
+    Args:
+      number_of_sender_threads (int): number of threads that send bulk
+          requests to Elasticsearch concurrently.
+    """
+    self._number_of_sender_threads = number_of_sender_threads
+    logger.debug('Elasticsearch number of sender threads: {0:d}'.format(
+        number_of_sender_threads))
+
   def SetPassword(self, password):
     """Set the password.
 
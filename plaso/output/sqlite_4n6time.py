@@ -21,10 +21,6 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
   DESCRIPTION = (
       'Saves the data in a SQLite database, used by the tool 4n6time.')
 
-  _META_FIELDS = frozenset([
-      'sourcetype', 'source', 'user', 'host', 'MACB', 'type',
-      'record_number'])
-
   _CREATE_TABLE_QUERY = (
       'CREATE TABLE log2timeline (timezone TEXT, '
       'MACB TEXT, source TEXT, sourcetype TEXT, type TEXT, '
@@ -85,6 +81,14 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
       row = self._cursor.fetchone()
     return result
 
+  def _InsertEventValues(self, event_values_list):
+    """Inserts event values into the database.
+
+    Args:
+      event_values_list (list[dict[str, object]]): sanitized event values.
+    """
+    self._cursor.executemany(self._INSERT_QUERY, event_values_list)
+
   def _ListTags(self):
     """Query database for unique tag types."""
     all_tags = []
@@ -109,7 +113,11 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     This method will create the necessary indices and commit outstanding
     transactions before disconnecting.
     """
-    # Build up indices for the fields specified in the args.
+    self._FlushEventValues()
+
+    # Build up indices for the fields specified in the args, after all
+    # events have been inserted, since maintaining the indices while
+    # inserting is considerably slower.
     # It will commit the inserts automatically before creating index.
     if not self._append:
       for field_name in self._fields:
@@ -123,16 +131,27 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     if self._set_status:
       self._set_status('Creating metadata...')
 
+    # The values of a newly created database are counted while inserting,
+    # the values of an appended database include those of previous exports.
     for field in self._META_FIELDS:
-      values = self._GetDistinctValues(field)
+      if self._append:
+        values = self._GetDistinctValues(field)
+      else:
+        values = self._GetCountedMetaFieldValues(field)
+
       self._cursor.execute('DELETE FROM l2t_{0:s}s'.format(field))
-      for name, frequency in iter(values.items()):
-        self._cursor.execute((
-            'INSERT INTO l2t_{0:s}s ({0:s}s, frequency) '
-            'VALUES("{1:s}", {2:d}) ').format(field, name, frequency))
+      self._cursor.executemany(
+          'INSERT INTO l2t_{0:s}s ({0:s}s, frequency) VALUES (?, ?)'.format(
+              field), sorted(values.items()))
+
+    if self._append:
+      tags = self._ListTags()
+    else:
+      tags = self._tags
+
     self._cursor.execute('DELETE FROM l2t_tags')
-    for tag in self._ListTags():
-      self._cursor.execute('INSERT INTO l2t_tags (tag) VALUES (?)', [tag])
+    self._cursor.executemany(
+        'INSERT INTO l2t_tags (tag) VALUES (?)', [[tag] for tag in tags])
 
     if self._set_status:
       self._set_status('Database created.')
@@ -144,6 +163,8 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     self._cursor = None
     self._connection = None
 
+    self._ResetMetaFieldValues()
+
   def Open(self):
     """Connects to the database and creates the required tables.
 
@@ -165,6 +186,10 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
 
     # Create table in database.
     if not self._append:
+      # A newly created database is of no use if the export fails, hence
+      # it does not need to be synchronized to disk after every transaction.
+      self._cursor.execute('PRAGMA synchronous = OFF')
+
       self._cursor.execute(self._CREATE_TABLE_QUERY)
 
       for field in self._META_FIELDS:
@@ -196,6 +221,7 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
         self._set_status('Created table: l2t_disk')
 
     self._count = 0
+    self._ResetMetaFieldValues()
 
   def SetFilename(self, filename):
     """Sets the filename.
@@ -215,10 +241,17 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Shared4n6TimeOutputModule):
     # not to be used by 4n6time
     row = self._GetSanitizedEventValues(event)
 
-    self._cursor.execute(self._INSERT_QUERY, row)
+    if not self._append:
+      self._CountMetaFieldValues(row)
+
+    self._event_values_buffer.append(row)
+    if len(self._event_values_buffer) >= self._INSERT_BATCH_SIZE:
+      self._FlushEventValues()
+
     self._count += 1
-    # Commit the current transaction every 10000 inserts.
-    if self._count % 10000 == 0:
+    # Commit the current transaction every commit interval inserts.
+    if self._count % self._COMMIT_INTERVAL == 0:
+      self._FlushEventValues()
       self._connection.commit()
       if self._set_status:
         self._set_status('Inserting event: {0:d}'.format(self._count))
@@ -10,7 +10,6 @@ from dfdatetime import posix_time as dfdatetime_posix_time
 
 from plaso.lib import errors
 from plaso.lib import py2to3
-from plaso.lib import timelib
 from plaso.output import interface
 from plaso.output import manager
 
@@ -34,8 +33,8 @@ class TLNBaseOutputModule(interface.LinearOutputModule):
     Returns:
       str: formatted description field.
     """
-    date_time_string = timelib.Timestamp.CopyToIsoFormat(
-        event.timestamp, timezone=self._output_mediator.timezone)
+    date_time_string = self._output_mediator.GetDateTimeString(
+        event.timestamp)
     timestamp_description = event.timestamp_desc or 'UNKNOWN'
 
     message, _ = self._output_mediator.GetFormattedMessages(event)
@@ -7,6 +7,8 @@ defined in https://httpd.apache.org/docs/2.4/logs.html
 
 from __future__ import unicode_literals
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -121,6 +123,72 @@ class ApacheAccessParser(text_parser.PyparsingSingleLineTextParser):
 
   _SUPPORTED_KEYS = frozenset([key for key, _ in LINE_STRUCTURES])
 
+  _IPV4_ADDRESS_OCTET_PATTERN = r'(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})'
+
+  _COMMON_LOG_FORMAT_PATTERN = (
+      r'(?P<ip_address>{0:s}(?:\.{0:s}){{3}}) '
+      r'(?P<remote_name>[0-9A-Za-z]+|-) '
+      r'(?P<user_name>[0-9A-Za-z]+|-) '
+      r'\[(?P<day>[0-9]{{2}})/(?P<month>[A-Za-z]{{3}})/(?P<year>[0-9]{{4}}):'
+      r'(?P<hours>[0-9]{{2}}):(?P<minutes>[0-9]{{2}}):(?P<seconds>[0-9]{{2}}) '
+      r'(?P<time_offset>[+-][0-9]{{4}})\] '
+      r'"(?P<http_request>(?:[^" \t][^"]*)?)" '
+      r'(?P<response_code>[0-9]+) (?P<response_bytes>[0-9]+)').format(
+          _IPV4_ADDRESS_OCTET_PATTERN)
+
+  # Regular expressions to match the lines of the common and combined log
+  # formats with IPv4 addresses and single space separators, which are
+  # considerably faster than the corresponding pyparsing structures.
+  LINE_REGULAR_EXPRESSIONS = {
+      'combined_log_format': re.compile(
+          r'^{0:s} "(?P<referer>(?:[^" \t][^"]*)?)" '
+          r'"(?P<user_agent>(?:[^" \t][^"]*)?)"$'.format(
+              _COMMON_LOG_FORMAT_PATTERN)),
+      'common_log_format': re.compile(
+          r'^{0:s}$'.format(_COMMON_LOG_FORMAT_PATTERN))}
+
+  _DATE_TIME_INTEGER_VALUES = frozenset([
+      'day', 'year', 'hours', 'minutes', 'seconds'])
+
+  _DATE_TIME_VALUE_NAMES = [
+      'day', 'month', 'year', 'hours', 'minutes', 'seconds', 'time_offset']
+
+  def _GetRegularExpressionStructure(self, key, match):
+    """Retrieves the structure of a line matched by a regular expression.
+
+    Args:
+      key (str): name of the line structure.
+      match (_sre.SRE_Match): regular expression match of the line.
+
+    Returns:
+      RegularExpressionStructure: structure of the line, with the date and
+          time values in a date_time structure like the pyparsing structure.
+    """
+    date_time_values = []
+    for name in self._DATE_TIME_VALUE_NAMES:
+      value = match.group(name)
+      if name in self._DATE_TIME_INTEGER_VALUES:
+        value = int(value, 10)
+      date_time_values.append((name, value))
+
+    date_time = text_parser.RegularExpressionStructure(date_time_values)
+
+    values = [
+        ('ip_address', match.group('ip_address')),
+        ('remote_name', match.group('remote_name')),
+        ('user_name', match.group('user_name')),
+        ('date_time', date_time),
+        ('http_request', match.group('http_request')),
+        ('response_code', int(match.group('response_code'), 10)),
+        ('response_bytes', int(match.group('response_bytes'), 10))]
+
+    if key == 'combined_log_format':
+      values.extend([
+          ('referer', match.group('referer')),
+          ('user_agent', match.group('user_agent'))])
+
+    return text_parser.RegularExpressionStructure(values)
+
   # TODO: migrate function after dfdatetime issue #47 is fixed.
   def _GetISO8601String(self, structure):
     """Normalize date time parsed format to an ISO 8601 date time string.
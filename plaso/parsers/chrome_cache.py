@@ -373,7 +373,9 @@ class ChromeCacheParser(interface.FileEntryParser):
             timestamp=cache_entry.creation_time)
         event = time_events.DateTimeValuesEvent(
             date_time, definitions.TIME_DESCRIPTION_LAST_VISITED)
-        parser_mediator.ProduceEventWithEventData(event, event_data)
+        event_data_identifier = parser_mediator.ProduceEventData(event_data)
+        parser_mediator.ProduceEventWithEventDataIdentifier(
+            event, event_data_identifier)
 
         cache_address = cache_entry.next
         cache_address_chain_length += 1
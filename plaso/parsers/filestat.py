@@ -91,26 +91,28 @@ class FileStatParser(interface.FileEntryParser):
     event_data.file_system_type = file_system_type
     event_data.is_allocated = file_entry.IsAllocated()
 
+    file_entry_events = []
+
     if file_entry.access_time:
       event = time_events.DateTimeValuesEvent(
           file_entry.access_time, definitions.TIME_DESCRIPTION_LAST_ACCESS)
-      parser_mediator.ProduceEventWithEventData(event, event_data)
+      file_entry_events.append(event)
 
     if file_entry.creation_time:
       event = time_events.DateTimeValuesEvent(
           file_entry.creation_time, definitions.TIME_DESCRIPTION_CREATION)
-      parser_mediator.ProduceEventWithEventData(event, event_data)
+      file_entry_events.append(event)
 
     if file_entry.change_time:
       event = time_events.DateTimeValuesEvent(
           file_entry.change_time, definitions.TIME_DESCRIPTION_CHANGE)
-      parser_mediator.ProduceEventWithEventData(event, event_data)
+      file_entry_events.append(event)
 
     if file_entry.modification_time:
       event = time_events.DateTimeValuesEvent(
           file_entry.modification_time,
           definitions.TIME_DESCRIPTION_MODIFICATION)
-      parser_mediator.ProduceEventWithEventData(event, event_data)
+      file_entry_events.append(event)
 
     for time_attribute, usage in self._TIMESTAMP_DESCRIPTIONS.items():
       posix_time = getattr(stat_object, time_attribute, None)
@@ -134,7 +136,14 @@ class FileStatParser(interface.FileEntryParser):
       date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
           timestamp=timestamp)
       event = time_events.DateTimeValuesEvent(date_time, usage)
-      parser_mediator.ProduceEventWithEventData(event, event_data)
+      file_entry_events.append(event)
+
+    # The event data is produced once for all the events of the file entry.
+    if file_entry_events:
+      event_data_identifier = parser_mediator.ProduceEventData(event_data)
+      for event in file_entry_events:
+        parser_mediator.ProduceEventWithEventDataIdentifier(
+            event, event_data_identifier)
 
 
 manager.ParsersManager.RegisterParser(FileStatParser)
@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -88,6 +90,11 @@ class GoogleDriveSyncLogParser(text_parser.PyparsingMultiLineTextParser):
       ('logline', _GDS_LINE),
   ]
 
+  # A line that starts with a date and time, such as:
+  # "2018-01-24 18:25:08,454 -0800 ", starts a new log entry.
+  RECORD_START_REGULAR_EXPRESSION = re.compile(
+      r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} [+-]\d{4} ')
+
   def _GetISO8601String(self, structure):
     """Retrieves an ISO 8601 date time string from the structure.
 
@@ -50,6 +50,7 @@ class ParserMediator(object):
     super(ParserMediator, self).__init__()
     self._abort = False
     self._cpu_time_profiler = None
+    self._evtx_xml_templates = False
     self._extra_event_attributes = {}
     self._file_entry = None
     self._knowledge_base = knowledge_base
@@ -59,6 +60,8 @@ class ParserMediator(object):
     self._mount_path = None
     self._number_of_errors = 0
     self._number_of_event_sources = 0
+    self._pending_event_data = {}
+    self._produced_event_data_identifiers = {}
     self._number_of_events = 0
     self._parser_chain_components = []
     self._preferred_year = preferred_year
@@ -80,6 +83,12 @@ class ParserMediator(object):
     """str: codepage."""
     return self._knowledge_base.codepage
 
+  @property
+  def evtx_xml_templates(self):
+    """bool: True if Windows XML EventLog (EVTX) XML should be stored as
+        XML template and values."""
+    return self._evtx_xml_templates
+
   @property
   def hostname(self):
     """str: hostname."""
@@ -130,6 +139,41 @@ class ParserMediator(object):
     """int: year."""
     return self._knowledge_base.year
 
+  def _AddEvent(self, event, event_data_identifier):
+    """Adds an event to the storage.
+
+    Args:
+      event (EventObject): event.
+      event_data_identifier (AttributeContainerIdentifier): identifier of
+          the event data of the event.
+    """
+    if event_data_identifier:
+      event.SetEventDataIdentifier(event_data_identifier)
+
+    # TODO: remove this after structural fix is in place
+    # https://github.com/log2timeline/plaso/issues/1691
+    event.parser = self.GetParserChain()
+
+    self._storage_writer.AddEvent(event)
+    self._number_of_events += 1
+
+    self.last_activity_timestamp = time.time()
+
+  def _CheckEventTimestamp(self, event):
+    """Checks the timestamp of an event.
+
+    Args:
+      event (EventObject): event.
+
+    Raises:
+      InvalidEvent: if the event timestamp value is not set or out of bounds.
+    """
+    if event.timestamp is None:
+      raise errors_lib.InvalidEvent('Event timestamp value not set.')
+
+    if event.timestamp < self._INT64_MIN or event.timestamp > self._INT64_MAX:
+      raise errors_lib.InvalidEvent('Event timestamp value out of bounds.')
+
   def _GetEarliestYearFromFileEntry(self):
     """Retrieves the year from the file entry date and time values.
 
@@ -473,9 +517,50 @@ class ParserMediator(object):
 
     self.last_activity_timestamp = time.time()
 
+  def ProduceEventData(self, event_data):
+    """Produces event data.
+
+    Unlike ProduceEventWithEventData, the event data is neither hashed nor
+    copied, hence the event data must not be changed after it was produced.
+    The returned identifier can be passed to
+    ProduceEventWithEventDataIdentifier to produce one or more events of
+    the event data.
+
+    The event data is only stored when the first event with a valid
+    timestamp is produced, so that no event data is stored without events.
+
+    Args:
+      event_data (EventData): event data.
+
+    Returns:
+      AttributeContainerIdentifier: identifier of the event data.
+    """
+    # TODO: refactor to ProcessEventData.
+    self.ProcessEvent(
+        event_data, parser_chain=self.GetParserChain(),
+        file_entry=self._file_entry)
+
+    event_data_identifier = event_data.GetIdentifier()
+    self._pending_event_data[event_data_identifier] = event_data
+
+    # Make sure event data produced by ProduceEventWithEventData is stored
+    # again after event data was produced by this method.
+    self._last_event_data_hash = None
+    self._last_event_data_identifier = None
+
+    self.last_activity_timestamp = time.time()
+
+    return event_data_identifier
+
   def ProduceEventWithEventData(self, event, event_data):
     """Produces an event.
 
+    The event data is hashed to determine if it differs from the last
+    event data that was produced and, if so, a copy of the event data is
+    stored. Parsers that produce event data once for one or more events
+    should use ProduceEventData and ProduceEventWithEventDataIdentifier
+    instead.
+
     Args:
       event (EventObject): event.
       event_data (EventData): event data.
@@ -483,11 +568,7 @@ class ParserMediator(object):
     Raises:
       InvalidEvent: if the event timestamp value is not set or out of bounds.
     """
-    if event.timestamp is None:
-      raise errors_lib.InvalidEvent('Event timestamp value not set.')
-
-    if event.timestamp < self._INT64_MIN or event.timestamp > self._INT64_MAX:
-      raise errors_lib.InvalidEvent('Event timestamp value out of bounds.')
+    self._CheckEventTimestamp(event)
 
     event_data_hash = event_data.GetAttributeValuesHash()
     if event_data_hash != self._last_event_data_hash:
@@ -504,17 +585,34 @@ class ParserMediator(object):
       self._last_event_data_hash = event_data_hash
       self._last_event_data_identifier = event_data.GetIdentifier()
 
-    if self._last_event_data_identifier:
-      event.SetEventDataIdentifier(self._last_event_data_identifier)
+    self._AddEvent(event, self._last_event_data_identifier)
 
-    # TODO: remove this after structural fix is in place
-    # https://github.com/log2timeline/plaso/issues/1691
-    event.parser = self.GetParserChain()
+  def ProduceEventWithEventDataIdentifier(self, event, event_data_identifier):
+    """Produces an event of event data produced by ProduceEventData.
 
-    self._storage_writer.AddEvent(event)
-    self._number_of_events += 1
+    Args:
+      event (EventObject): event.
+      event_data_identifier (AttributeContainerIdentifier): identifier of
+          the event data, as returned by ProduceEventData.
 
-    self.last_activity_timestamp = time.time()
+    Raises:
+      InvalidEvent: if the event timestamp value is not set or out of bounds.
+    """
+    self._CheckEventTimestamp(event)
+
+    pending_event_data = self._pending_event_data.pop(
+        event_data_identifier, None)
+    if pending_event_data is not None:
+      self._storage_writer.AddEventData(pending_event_data)
+
+      # The storage writer assigns the event data a new identifier.
+      self._produced_event_data_identifiers[event_data_identifier] = (
+          pending_event_data.GetIdentifier())
+
+    event_data_identifier = self._produced_event_data_identifiers.get(
+        event_data_identifier, event_data_identifier)
+
+    self._AddEvent(event, event_data_identifier)
 
   def ProduceExtractionError(self, message, path_spec=None):
     """Produces an extraction error.
@@ -557,8 +655,14 @@ class ParserMediator(object):
     del self._extra_event_attributes[attribute_name]
 
   def ResetFileEntry(self):
-    """Resets the active file entry."""
+    """Resets the active file entry.
+
+    Event data produced by ProduceEventData for the file entry, that has no
+    events, is discarded.
+    """
     self._file_entry = None
+    self._pending_event_data = {}
+    self._produced_event_data_identifiers = {}
 
   def SampleMemoryUsage(self, parser_name):
     """Takes a sample of the memory usage for profiling.
@@ -595,6 +699,7 @@ class ParserMediator(object):
       configuration (EventExtractionConfiguration): event extraction
           configuration.
     """
+    self._evtx_xml_templates = configuration.evtx_xml_templates
     self._text_prepend = configuration.text_prepend
 
   def SetInputSourceConfiguration(self, configuration):
@@ -632,6 +737,9 @@ class ParserMediator(object):
     # contain event data for their events.
     self._last_event_data_hash = None
     self._last_event_data_identifier = None
+    self._pending_event_data = None
+    self._pending_event_data_identifier = None
+    self._produced_event_data_identifiers = None
 
   def SignalAbort(self):
     """Signals the parsers to abort."""
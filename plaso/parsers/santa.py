@@ -296,6 +296,74 @@ class SantaParser(text_parser.PyparsingSingleLineTextParser):
 
   _SUPPORTED_KEYS = frozenset([key for key, _ in LINE_STRUCTURES])
 
+  _DATE_PATTERN = (
+      r'\[(?P<date>[0-9]{4}-[0-9]{2}-[0-9]{2}T'
+      r'[0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{3}Z)\]')
+
+  # Value of a field, which like the pyparsing structures does not start with
+  # white space. A value that ends at the end of the line can contain "|".
+  _VALUE_PATTERN = r'(?:[^| \t][^|]*)?'
+  _LAST_VALUE_PATTERN = r'(?:[^ \t].*)?'
+
+  # Regular expressions to match the lines with single space separators,
+  # which are considerably faster than the corresponding pyparsing structures.
+  LINE_REGULAR_EXPRESSIONS = {
+      'execution_line': re.compile((
+          r'^{date:s} I santad: action=(?P<action>EXEC)\|'
+          r'decision=(?P<decision>{value:s})\|'
+          r'reason=(?P<reason>{value:s})\|'
+          r'sha256=(?P<sha256>{value:s})\|'
+          r'(?:cert_sha256=(?P<cert_sha256>{value:s})\|)?'
+          r'(?:cert_cn=(?P<cert_cn>{value:s})\|)?'
+          r'(?:quarantine_url=(?P<quarantine_url>{value:s})\|)?'
+          r'pid=(?P<pid>{value:s})\|'
+          r'ppid=(?P<ppid>{value:s})\|'
+          r'uid=(?P<uid>{value:s})\|'
+          r'user=(?P<user>{value:s})\|'
+          r'gid=(?P<gid>{value:s})\|'
+          r'group=(?P<group>{value:s})\|'
+          r'mode=(?P<mode>{value:s})\|'
+          r'path=(?P<path>{value:s})(?:\||$)'
+          r'(?:args=(?P<args>{last_value:s}))?$').format(
+              date=_DATE_PATTERN, last_value=_LAST_VALUE_PATTERN,
+              value=_VALUE_PATTERN)),
+      'file_system_event_line': re.compile((
+          r'^{date:s} I santad: action=(?P<action>WRITE|RENAME|DELETE)\|'
+          r'path=(?P<path>{value:s})(?:\||$)'
+          r'(?:newpath=(?P<newpath>{value:s})\|)?'
+          r'pid=(?P<pid>{value:s})\|'
+          r'ppid=(?P<ppid>{value:s})\|'
+          r'process=(?P<process>{value:s})\|'
+          r'processpath=(?P<processpath>{value:s})\|'
+          r'uid=(?P<uid>{value:s})\|'
+          r'user=(?P<user>{value:s})\|'
+          r'gid=(?P<gid>{value:s})\|'
+          r'group=(?P<group>{value:s})\|?$').format(
+              date=_DATE_PATTERN, value=_VALUE_PATTERN)),
+      'mount_line': re.compile((
+          r'^{date:s} I santad: action=(?P<action>DISKAPPEAR)\|'
+          r'mount=(?P<mount>{value:s})\|'
+          r'volume=(?P<volume>{value:s})\|'
+          r'bsdname=(?P<bsd_name>{value:s})(?:\||$)'
+          r'fs=(?P<fs>{value:s})\|'
+          r'model=(?P<model>{value:s})\|'
+          r'serial=(?P<serial>{value:s})\|'
+          r'bus=(?P<bus>{value:s})\|'
+          r'dmgpath=(?P<dmg_path>{value:s})\|'
+          r'appearance=(?P<appearance>{last_value:s})$').format(
+              date=_DATE_PATTERN, last_value=_LAST_VALUE_PATTERN,
+              value=_VALUE_PATTERN)),
+      'umount_line': re.compile((
+          r'^{date:s} I santad: action=(?P<action>DISKDISAPPEAR)\|'
+          r'mount=(?P<mount>{value:s})\|'
+          r'volume=(?P<volume>{value:s})\|'
+          r'bsdname=(?P<bsd_name>{value:s})\|?$').format(
+              date=_DATE_PATTERN, value=_VALUE_PATTERN)),
+      'quota_exceeded_line': re.compile((
+          r'^{date:s} \*\*\* LOG MESSAGE QUOTA EXCEEDED - SOME MESSAGES FROM '
+          r'THIS PROCESS HAVE BEEN DISCARDED \*\*\*$').format(
+              date=_DATE_PATTERN))}
+
   def ParseRecord(self, parser_mediator, key, structure):
     """Parses a matching entry.
 
@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 
 import os
+import struct
 import tempfile
 
 # pylint: disable=wrong-import-order
@@ -27,6 +28,7 @@ class SQLiteCache(plugins.BasePluginCache):
   def __init__(self):
     """Initializes a SQLite cache."""
     super(SQLiteCache, self).__init__()
+    self._changed_table_names = frozenset()
     self._row_caches = {}
 
   def CacheQueryResults(
@@ -110,6 +112,30 @@ class SQLiteCache(plugins.BasePluginCache):
       self._row_caches[query_hash] = set()
     return self._row_caches[query_hash]
 
+  def HasChangedTables(self, table_names):
+    """Determines if any of the tables was changed by a WAL file.
+
+    Only the rows of tables changed by a WAL file can differ between
+    a database and the database with its WAL file committed.
+
+    Args:
+      table_names (frozenset[str]): lower case names of the tables.
+
+    Returns:
+      bool: True if any of the tables was changed by a WAL file.
+    """
+    return not self._changed_table_names.isdisjoint(table_names)
+
+  def SetChangedTableNames(self, table_names):
+    """Sets the names of the tables changed by a WAL file.
+
+    Args:
+      table_names (Iterable[str]): names of the tables and views, of which
+          the rows can be changed by a WAL file.
+    """
+    self._changed_table_names = frozenset([
+        table_name.lower() for table_name in table_names])
+
 
 class SQLiteDatabase(object):
   """SQLite database.
@@ -119,7 +145,26 @@ class SQLiteDatabase(object):
         example {'Users': 'CREATE TABLE Users ("id" INTEGER PRIMARY KEY, ...)'}.
   """
 
-  _READ_BUFFER_SIZE = 65536
+  _READ_BUFFER_SIZE = 1024 * 1024
+
+  # B-tree page types of interior and leaf pages of index and table b-trees.
+  _BTREE_INTERIOR_PAGE_TYPES = frozenset([0x02, 0x05])
+  _BTREE_LEAF_PAGE_TYPES = frozenset([0x0a, 0x0d])
+
+  # The first page contains the 100 byte database file header.
+  _DATABASE_FILE_HEADER_SIZE = 100
+
+  _ROOT_PAGE_QUERY = (
+      'SELECT name, type, rootpage '
+      'FROM sqlite_master '
+      'WHERE type = "table" OR type = "view"')
+
+  # Signatures of a WAL file with little-endian and big-endian checksums.
+  _WAL_FILE_SIGNATURES = frozenset([0x377f0682, 0x377f0683])
+
+  _WAL_FILE_HEADER = struct.Struct('>8I')
+
+  _WAL_FRAME_HEADER = struct.Struct('>6I')
 
   SCHEMA_QUERY = (
       'SELECT tbl_name, sql '
@@ -141,6 +186,8 @@ class SQLiteDatabase(object):
     self._temp_db_file_path = ''
     self._temporary_directory = temporary_directory
     self._temp_wal_file_path = ''
+    self._wal_page_data_offsets = {}
+    self._wal_page_size = None
 
     self.schema = {}
 
@@ -165,6 +212,236 @@ class SQLiteDatabase(object):
       temporary_file.write(data)
       data = file_object.read(self._READ_BUFFER_SIZE)
 
+  def _GetBTreePageNumbers(
+      self, database_file_object, wal_file_object, root_page_number,
+      page_numbers_of_interest=None):
+    """Retrieves the page numbers of a b-tree.
+
+    Only the interior and leaf pages of the b-tree are determined, overflow
+    pages are not, since a change of a row always changes the leaf page that
+    contains the cell of the row.
+
+    Args:
+      database_file_object (file): file-like object of the database.
+      wal_file_object (file): file-like object of the WAL file.
+      root_page_number (int): page number of the root page of the b-tree.
+      page_numbers_of_interest (Optional[set[int]]): page numbers, where
+          the b-tree is no longer traversed once one of these pages is found.
+
+    Returns:
+      set[int]: page numbers of the interior and leaf pages of the b-tree.
+
+    Raises:
+      IOError: if a page cannot be read.
+      OSError: if a page cannot be read.
+    """
+    page_numbers = set()
+    page_numbers_to_read = [root_page_number]
+    while page_numbers_to_read:
+      page_number = page_numbers_to_read.pop()
+      if page_number in page_numbers:
+        continue
+
+      page_numbers.add(page_number)
+      if page_numbers_of_interest and page_number in page_numbers_of_interest:
+        break
+
+      page_data = self._ReadPage(
+          database_file_object, wal_file_object, page_number)
+
+      header_offset = 0
+      if page_number == 1:
+        header_offset = self._DATABASE_FILE_HEADER_SIZE
+
+      if (len(page_data) < header_offset + 12 or
+          ord(page_data[header_offset:header_offset + 1]) not in
+          self._BTREE_INTERIOR_PAGE_TYPES):
+        continue
+
+      number_of_cells, = struct.unpack(
+          '>H', page_data[header_offset + 3:header_offset + 5])
+      right_most_page_number, = struct.unpack(
+          '>I', page_data[header_offset + 8:header_offset + 12])
+
+      child_page_numbers = [right_most_page_number]
+
+      cell_pointers_offset = header_offset + 12
+      for cell_index in range(number_of_cells):
+        cell_pointer_offset = cell_pointers_offset + (cell_index * 2)
+        cell_offset, = struct.unpack(
+            '>H', page_data[cell_pointer_offset:cell_pointer_offset + 2])
+
+        # The cell of an interior page starts with the child page number.
+        child_page_number_data = page_data[cell_offset:cell_offset + 4]
+        if len(child_page_number_data) == 4:
+          child_page_number, = struct.unpack('>I', child_page_number_data)
+          child_page_numbers.append(child_page_number)
+
+      # All the leaf pages of a b-tree are at the same depth, so if the first
+      # child page is a leaf page the other child pages are as well and these
+      # do not need to be read.
+      page_data = self._ReadPage(
+          database_file_object, wal_file_object, child_page_numbers[0])
+      if page_data[:1] and ord(page_data[:1]) in self._BTREE_LEAF_PAGE_TYPES:
+        page_numbers.update(child_page_numbers)
+        if page_numbers_of_interest and not page_numbers_of_interest.isdisjoint(
+            child_page_numbers):
+          break
+
+      else:
+        page_numbers_to_read.extend(child_page_numbers)
+
+    return page_numbers
+
+  def _ReadPage(self, database_file_object, wal_file_object, page_number):
+    """Reads a page of the database with its WAL file committed.
+
+    Args:
+      database_file_object (file): file-like object of the database.
+      wal_file_object (file): file-like object of the WAL file.
+      page_number (int): page number, where 1 represents the first page.
+
+    Returns:
+      bytes: page data, which is empty if the page does not exist.
+
+    Raises:
+      IOError: if the page cannot be read.
+      OSError: if the page cannot be read.
+    """
+    page_data_offset = self._wal_page_data_offsets.get(page_number, None)
+    if page_data_offset is not None:
+      file_object = wal_file_object
+    else:
+      file_object = database_file_object
+      page_data_offset = (page_number - 1) * self._wal_page_size
+
+    file_object.seek(page_data_offset, os.SEEK_SET)
+    return file_object.read(self._wal_page_size)
+
+  def _ReadWALFrameHeaders(self, file_object):
+    """Reads the frame headers of a WAL file.
+
+    The pages of the frames of committed transactions are the pages that
+    are changed when the WAL file is committed. Frames that do not belong
+    to the current checkpoint, which have different salt values, and frames
+    of transactions that were not committed are ignored. Note that the frame
+    checksums are not verified, which can only lead to more pages being
+    considered changed.
+
+    Args:
+      file_object (file): file-like object of the WAL file.
+
+    Raises:
+      IOError: if the WAL file cannot be read.
+      OSError: if the WAL file cannot be read.
+    """
+    self._wal_page_data_offsets = {}
+    self._wal_page_size = None
+
+    file_object.seek(0, os.SEEK_SET)
+    file_header_data = file_object.read(self._WAL_FILE_HEADER.size)
+    if len(file_header_data) != self._WAL_FILE_HEADER.size:
+      return
+
+    file_header = self._WAL_FILE_HEADER.unpack(file_header_data)
+    signature, _, page_size, _, salt1, salt2, _, _ = file_header
+
+    if signature not in self._WAL_FILE_SIGNATURES or page_size < 512:
+      return
+
+    uncommitted_page_data_offsets = {}
+
+    frame_offset = self._WAL_FILE_HEADER.size
+    while True:
+      file_object.seek(frame_offset, os.SEEK_SET)
+      frame_header_data = file_object.read(self._WAL_FRAME_HEADER.size)
+      if len(frame_header_data) != self._WAL_FRAME_HEADER.size:
+        break
+
+      frame_header = self._WAL_FRAME_HEADER.unpack(frame_header_data)
+      page_number, database_size, frame_salt1, frame_salt2, _, _ = frame_header
+
+      if page_number == 0 or (frame_salt1, frame_salt2) != (salt1, salt2):
+        break
+
+      page_data_offset = frame_offset + self._WAL_FRAME_HEADER.size
+      uncommitted_page_data_offsets[page_number] = page_data_offset
+
+      # A frame with a database size marks the end of a transaction.
+      if database_size:
+        self._wal_page_data_offsets.update(uncommitted_page_data_offsets)
+        uncommitted_page_data_offsets = {}
+
+      frame_offset = page_data_offset + page_size
+
+    self._wal_page_size = page_size
+
+  def GetChangedTableNames(self):
+    """Retrieves the names of the tables changed by the WAL file.
+
+    The pages changed by the WAL file are mapped onto the b-trees of the
+    tables. Since the rows of views and virtual tables cannot be mapped
+    onto pages, these are always considered changed.
+
+    Returns:
+      set[str]: names of the tables and views changed by the WAL file,
+          which is empty if the database was opened without a WAL file.
+
+    Raises:
+      IOError: if the database or WAL file cannot be read.
+      OSError: if the database or WAL file cannot be read.
+      sqlite3.DatabaseError: if the schema cannot be queried.
+    """
+    if not self._is_open or not self._temp_wal_file_path:
+      return set()
+
+    changed_page_numbers = set(self._wal_page_data_offsets.keys())
+
+    sql_results = self.Query(self._ROOT_PAGE_QUERY)
+    root_page_numbers = [
+        (name, object_type, root_page_number)
+        for name, object_type, root_page_number in sql_results.fetchall()]
+
+    if not self._wal_page_size:
+      return set([name for name, _, _ in root_page_numbers])
+
+    changed_table_names = set()
+    with open(self._temp_db_file_path, 'rb') as database_file_object:
+      with open(self._temp_wal_file_path, 'rb') as wal_file_object:
+        for name, object_type, root_page_number in root_page_numbers:
+          if object_type != 'table' or not root_page_number:
+            changed_table_names.add(name)
+            continue
+
+          page_numbers = self._GetBTreePageNumbers(
+              database_file_object, wal_file_object, root_page_number,
+              page_numbers_of_interest=changed_page_numbers)
+
+          if not page_numbers.isdisjoint(changed_page_numbers):
+            changed_table_names.add(name)
+
+    return changed_table_names
+
+  def GetTemporaryCopyFileObject(self):
+    """Retrieves a file-like object of the temporary copy of the database.
+
+    The temporary copy can be used to create another copy of the database,
+    for example to commit a Write-Ahead Log (WAL), without reading the data
+    from the storage media image again.
+
+    Returns:
+      file: file-like object of the temporary copy of the database or None
+          if the database is not open.
+
+    Raises:
+      IOError: if the temporary copy cannot be opened.
+      OSError: if the temporary copy cannot be opened.
+    """
+    if not self._is_open or not self._temp_db_file_path:
+      return None
+
+    return open(self._temp_db_file_path, 'rb')
+
   def Close(self):
     """Closes the database connection and cleans up the temporary file."""
     self.schema = {}
@@ -194,6 +471,8 @@ class SQLiteDatabase(object):
                 self._temp_wal_file_path, self._filename, exception))
 
     self._temp_wal_file_path = ''
+    self._wal_page_data_offsets = {}
+    self._wal_page_size = None
 
     self._is_open = False
 
@@ -219,12 +498,9 @@ class SQLiteDatabase(object):
     if not file_object:
       raise ValueError('Missing file object.')
 
-    # TODO: Current design copies the entire file into a buffer
-    # that is parsed by each SQLite parser. This is not very efficient,
-    # especially when many SQLite parsers are ran against a relatively
-    # large SQLite database. This temporary file that is created should
-    # be usable by all SQLite parsers so the file should only be read
-    # once in memory and then deleted when all SQLite parsers have completed.
+    # Note that the temporary copy is shared by all SQLite plugins and can
+    # be reused to create a copy of the database with its WAL committed,
+    # see GetTemporaryCopyFileObject.
 
     # TODO: Change this into a proper implementation using APSW
     # and virtual filesystems when that will be available.
@@ -255,6 +531,8 @@ class SQLiteDatabase(object):
         self._CopyFileObjectToTemporaryFile(wal_file_object, temporary_file)
         self._temp_wal_file_path = temporary_filename
 
+        self._ReadWALFrameHeaders(wal_file_object)
+
       except IOError:
         os.remove(temporary_filename)
         raise
@@ -316,14 +594,17 @@ class SQLiteParser(interface.FileEntryParser):
   _plugin_classes = {}
 
   def _OpenDatabaseWithWAL(
-      self, parser_mediator, database_file_entry, database_file_object,
-      filename):
+      self, parser_mediator, database_file_entry, database, filename):
     """Opens a database with its Write-Ahead Log (WAL) committed.
 
+    The copy of the database with the WAL is made from the temporary copy
+    of the database, so that the database is only read once from the storage
+    media image.
+
     Args:
       parser_mediator (ParserMediator): parser mediator.
       database_file_entry (dfvfs.FileEntry): file entry of the database.
-      database_file_object (dfvfs.FileIO): file-like object of the database.
+      database (SQLiteDatabase): database without WAL committed.
       filename (str): name of the database file entry.
 
     Returns:
@@ -354,10 +635,12 @@ class SQLiteParser(interface.FileEntryParser):
     database_wal = SQLiteDatabase(
         filename, temporary_directory=parser_mediator.temporary_directory)
 
+    database_file_object = None
     try:
+      database_file_object = database.GetTemporaryCopyFileObject()
       database_wal.Open(database_file_object, wal_file_object=wal_file_object)
 
-    except (IOError, ValueError, sqlite3.DatabaseError) as exception:
+    except (IOError, OSError, ValueError, sqlite3.DatabaseError) as exception:
       parser_mediator.ProduceExtractionError((
           'unable to open SQLite database and WAL with error: '
           '{0!s}').format(exception))
@@ -365,6 +648,8 @@ class SQLiteParser(interface.FileEntryParser):
       return None, None
 
     finally:
+      if database_file_object:
+        database_file_object.close()
       wal_file_object.close()
 
     return database_wal, wal_file_entry
@@ -405,7 +690,7 @@ class SQLiteParser(interface.FileEntryParser):
       return
 
     database_wal, wal_file_entry = self._OpenDatabaseWithWAL(
-        parser_mediator, file_entry, file_object, filename)
+        parser_mediator, file_entry, database, filename)
 
     file_object.close()
 
@@ -414,6 +699,23 @@ class SQLiteParser(interface.FileEntryParser):
     try:
       table_names = frozenset(database.tables)
 
+      if database_wal:
+        # Only the rows of tables changed by the WAL file need to be parsed
+        # again, hence these are the only rows that need to be cached.
+        try:
+          changed_table_names = database_wal.GetChangedTableNames()
+        except (IOError, OSError, sqlite3.DatabaseError) as exception:
+          parser_mediator.ProduceExtractionError((
+              'unable to determine tables changed by WAL with error: '
+              '{0!s}').format(exception))
+          changed_table_names = set(database_wal.tables)
+
+        for table_name, query in database_wal.schema.items():
+          if database.schema.get(table_name, None) != query:
+            changed_table_names.add(table_name)
+
+        cache.SetChangedTableNames(changed_table_names)
+
       for plugin in self._plugins:
         if not plugin.REQUIRED_TABLES.issubset(table_names):
           continue
@@ -444,14 +746,14 @@ class SQLiteParser(interface.FileEntryParser):
         if not database_wal:
           continue
 
-        schema_match = plugin.CheckSchema(database)
+        schema_match = plugin.CheckSchema(database_wal)
 
         parser_mediator.SetFileEntry(wal_file_entry)
         parser_mediator.AddEventAttribute('schema_match', schema_match)
 
         try:
           plugin.UpdateChainAndProcess(
-              parser_mediator, cache=cache, database=database,
+              parser_mediator, cache=cache, database=database_wal,
               database_wal=database_wal, wal_file_entry=wal_file_entry)
 
         except Exception as exception:  # pylint: disable=broad-except
@@ -463,6 +765,8 @@ class SQLiteParser(interface.FileEntryParser):
           parser_mediator.RemoveEventAttribute('schema_match')
 
     finally:
+      if database_wal:
+        database_wal.Close()
       database.Close()
 
 
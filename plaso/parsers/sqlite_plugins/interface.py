@@ -3,12 +3,16 @@
 
 from __future__ import unicode_literals
 
+import hashlib
+import struct
+
 # pylint: disable=wrong-import-order
 try:
   from pysqlite2 import dbapi2 as sqlite3
 except ImportError:
   import sqlite3
 
+from plaso.lib import py2to3
 from plaso.parsers import logger
 from plaso.parsers import plugins
 
@@ -39,6 +43,7 @@ class SQLitePlugin(plugins.BasePlugin):
     """Initializes a SQLite parser plugin."""
     super(SQLitePlugin, self).__init__()
     self._keys_per_query = {}
+    self._table_names = self._GetTableNames()
 
   def _GetRowValue(self, query_hash, row, value_name):
     """Retrieves a value from the row.
@@ -64,34 +69,76 @@ class SQLitePlugin(plugins.BasePlugin):
     # will raise "IndexError: Index must be int or string".
     return row[value_index]
 
+  def _GetTableNames(self):
+    """Retrieves the names of the tables the queries of the plugin read.
+
+    The tables are those defined by REQUIRED_TABLES and SCHEMAS. Views are
+    not included since their rows are read from the tables in SCHEMAS.
+
+    Returns:
+      frozenset[str]: lower case names of the tables.
+    """
+    table_names = set(self.REQUIRED_TABLES)
+    for schema in self.SCHEMAS:
+      table_names.update(schema.keys())
+
+    return frozenset([table_name.lower() for table_name in table_names])
+
   @classmethod
   def _HashRow(cls, row):
     """Hashes the given row.
 
+    The values of the row are hashed into a fixed-width digest, together with
+    an indicator of their type, so that the integer 1 and the string "1" do
+    not hash the same.
+
     Args:
       row (sqlite3.Row): row.
 
     Returns:
-      int: hash value of the given row.
+      int: 64-bit hash value of the given row.
     """
-    values = []
+    md5_context = hashlib.md5()
     for value in row:
-      try:
-        value = '{0!s}'.format(value)
-      except UnicodeDecodeError:
-        # In Python 2, blobs are "read-write buffer" and will cause a
-        # UnicodeDecodeError exception if we try format it as a string.
-        # Since Python 3 does not support the buffer type we cannot check
-        # the type of value.
-        value = repr(value)
-
-      values.append(value)
-
-    return hash(' '.join(values))
+      if value is None:
+        value_type = b'n'
+        value_data = b''
+
+      elif isinstance(value, py2to3.UNICODE_TYPE):
+        value_type = b't'
+        value_data = value.encode('utf-8')
+
+      elif isinstance(value, py2to3.BYTES_TYPE):
+        value_type = b'b'
+        value_data = bytes(value)
+
+      elif isinstance(value, py2to3.INTEGER_TYPES + (float, )):
+        value_type = b'i'
+        value_data = '{0!s}'.format(value).encode('utf-8')
+
+      else:
+        # In Python 2, blobs are "read-write buffer".
+        try:
+          value_data = memoryview(value).tobytes()
+          value_type = b'b'
+        except TypeError:
+          value_data = '{0!s}'.format(value).encode('utf-8')
+          value_type = b'v'
+
+      md5_context.update(value_type)
+      md5_context.update(struct.pack('>Q', len(value_data)))
+      md5_context.update(value_data)
+
+    hash_value, = struct.unpack('>Q', md5_context.digest()[:8])
+    return hash_value
 
   def _ParseQuery(self, parser_mediator, database, query, callback, cache):
     """Queries a database and parses the results.
 
+    The hashes of the parsed rows are cached, so that duplicate rows, such
+    as the rows that are the same in the database with the WAL file
+    committed, are not parsed again.
+
     Args:
       parser_mediator (ParserMediator): parser mediator.
       database (SQLiteDatabase): database.
@@ -152,7 +199,8 @@ class SQLitePlugin(plugins.BasePlugin):
 
   # pylint: disable=arguments-differ
   def Process(
-      self, parser_mediator, cache=None, database=None, **unused_kwargs):
+      self, parser_mediator, cache=None, database=None, database_wal=None,
+      **unused_kwargs):
     """Determine if this is the right plugin for this database.
 
     This function takes a SQLiteDatabase object and compares the list
@@ -166,6 +214,9 @@ class SQLitePlugin(plugins.BasePlugin):
       parser_mediator (ParserMediator): parser mediator.
       cache (Optional[SQLiteCache]): cache.
       database (Optional[SQLiteDatabase]): database.
+      database_wal (Optional[SQLiteDatabase]): database with its WAL file
+          committed, where if this is the same as database, only the rows
+          changed by the WAL file are parsed.
 
     Raises:
       ValueError: If the database or cache value are missing.
@@ -179,6 +230,12 @@ class SQLitePlugin(plugins.BasePlugin):
     # This will raise if unhandled keyword arguments are passed.
     super(SQLitePlugin, self).Process(parser_mediator)
 
+    # The rows of tables that were not changed by the WAL file are the same
+    # as those parsed before.
+    if (database_wal is not None and database is database_wal and
+        not cache.HasChangedTables(self._table_names)):
+      return
+
     for query, callback_method in self.QUERIES:
       if parser_mediator.abort:
         break
@@ -97,6 +97,12 @@ class SyslogParser(text_parser.PyparsingMultiLineTextParser):
   _VERIFICATION_REGEX = re.compile(
       r'^\w{3}\s+\d{1,2}\s\d{2}:\d{2}:\d{2}\s' + _BODY_CONTENT)
 
+  # A line that starts a record, which also ends the body of the previous
+  # record.
+  RECORD_START_REGULAR_EXPRESSION = re.compile(
+      r'\w{3}\s+\d{1,2}\s\d{2}:\d{2}:\d{2}|'
+      r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}[\+|-]\d{2}:\d{2}\s')
+
   # The Chrome OS syslog messages are of a format beginning with an
   # ISO 8601 combined date and time expression with timezone designator:
   #   2016-10-25T12:37:23.297265-07:00
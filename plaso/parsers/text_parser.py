@@ -9,11 +9,10 @@ parser.
 from __future__ import unicode_literals
 
 import abc
+import os
 
 import pyparsing
 
-from dfvfs.helpers import text_file
-
 from plaso.lib import errors
 from plaso.lib import py2to3
 from plaso.parsers import interface
@@ -210,6 +209,212 @@ class PyparsingConstants(object):
       pyparsing.nums, min=1, max=5).setParseAction(PyParseIntCast)
 
 
+class BufferedTextFile(object):
+  """Text file interface that reads lines from a buffer of the file data.
+
+  The dfVFS text file reads at most the maximum line length from the
+  file-like object for every line, which means that a file with short lines
+  is read with a seek and read per line. Instead the buffered text file reads
+  the data of the file-like object in large blocks and splits lines from
+  the buffered data.
+  """
+
+  _READ_BUFFER_SIZE = 1024 * 1024
+
+  def __init__(self, file_object, encoding='utf-8', end_of_line='\n'):
+    """Initializes a buffered text file.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object to read from.
+      encoding (Optional[str]): text encoding.
+      end_of_line (Optional[str]): end of line indicator.
+    """
+    super(BufferedTextFile, self).__init__()
+    self._buffer = b''
+    self._buffer_offset = 0
+    self._current_offset = 0
+    self._encoding = encoding
+    self._end_of_line = end_of_line.encode(encoding)
+    self._end_of_line_length = len(self._end_of_line)
+    self._file_object = file_object
+    self._file_object_offset = 0
+    self._file_object_size = file_object.get_size()
+
+  def _ReadBuffer(self):
+    """Reads the next block of data from the file-like object into the buffer.
+
+    Returns:
+      bool: True if data was read, False if the end of the file-like object
+          was reached.
+    """
+    if self._file_object_offset >= self._file_object_size:
+      return False
+
+    self._file_object.seek(self._file_object_offset, os.SEEK_SET)
+    data = self._file_object.read(self._READ_BUFFER_SIZE)
+    if not data:
+      return False
+
+    self._file_object_offset += len(data)
+    self._buffer = b''.join([self._buffer[self._buffer_offset:], data])
+    self._buffer_offset = 0
+    return True
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the readline file-like object interface.
+  # pylint: disable=invalid-name
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: offset of the start of the next line in the file-like object.
+    """
+    return self._current_offset
+
+  def readline(self, size=None):
+    """Reads a single line of text.
+
+    A trailing end-of-line indicator is kept in the line, but may be absent
+    when the file ends with an incomplete line or when the line is longer
+    than the maximum size. In the latter case the rest of the line is returned
+    by the next read. An empty string is returned only at the end of the file.
+
+    Args:
+      size (Optional[int]): maximum number of bytes of the line, including
+          the end-of-line indicator, where None represents no maximum.
+
+    Returns:
+      str: line of text.
+
+    Raises:
+      UnicodeDecodeError: if the line cannot be decoded.
+    """
+    search_offset = self._buffer_offset
+    while True:
+      end_of_line_offset = self._buffer.find(self._end_of_line, search_offset)
+      if end_of_line_offset != -1:
+        line_end_offset = end_of_line_offset + self._end_of_line_length
+        break
+
+      buffered_size = len(self._buffer) - self._buffer_offset
+      if size and buffered_size >= size:
+        line_end_offset = self._buffer_offset + size
+        break
+
+      if not self._ReadBuffer():
+        line_end_offset = len(self._buffer)
+        break
+
+      # Continue the search for the end-of-line indicator at the data that
+      # was added to the buffer, including the end of the previously buffered
+      # data that can contain part of the indicator.
+      search_offset = max(0, buffered_size - self._end_of_line_length + 1)
+
+    if size and line_end_offset - self._buffer_offset > size:
+      line_end_offset = self._buffer_offset + size
+
+    line = self._buffer[self._buffer_offset:line_end_offset]
+    self._buffer_offset = line_end_offset
+
+    last_offset = self._current_offset
+    self._current_offset += len(line)
+
+    decoded_line = line.decode(self._encoding)
+
+    # Remove a byte-order mark at the start of the file.
+    if last_offset == 0 and decoded_line[:1] == '\ufeff':
+      decoded_line = decoded_line[1:]
+
+    return decoded_line
+
+
+class RegularExpressionStructure(object):
+  """Values of a line matched by a regular expression.
+
+  The regular expression structure provides the part of the interface of
+  pyparsing.ParseResults that is used by the text parsers, so that a line
+  matched by a regular expression can be passed to ParseRecord() instead
+  of the tokens parsed by pyparsing.
+  """
+
+  def __init__(self, values):
+    """Initializes a regular expression structure.
+
+    Args:
+      values (list[tuple[str, object]]): names and values of the structure,
+          in the order of the line, where a value of None represents a value
+          that is not present in the line.
+    """
+    super(RegularExpressionStructure, self).__init__()
+    self._names = [name for name, _ in values]
+    self._values = dict(values)
+
+  def __getattr__(self, name):
+    """Retrieves a value.
+
+    Args:
+      name (str): name of the value.
+
+    Returns:
+      object: value or an empty string if not present, like
+          pyparsing.ParseResults.
+
+    Raises:
+      AttributeError: if the name refers to an internal attribute.
+    """
+    if name.startswith('_'):
+      raise AttributeError(name)
+
+    value = self._values.get(name, None)
+    if value is None:
+      return ''
+
+    return value
+
+  def __str__(self):
+    """Retrieves a string representation of the values.
+
+    Returns:
+      str: string representation of the values, like pyparsing.ParseResults.
+    """
+    values = [
+        repr(self._values[name]) for name in self._names
+        if self._values[name] is not None]
+    return '[{0:s}]'.format(', '.join(values))
+
+  @classmethod
+  def FromMatch(cls, match):
+    """Creates a regular expression structure from a match.
+
+    Args:
+      match (_sre.SRE_Match): regular expression match.
+
+    Returns:
+      RegularExpressionStructure: structure with the values of the named
+          groups of the match.
+    """
+    group_indexes = sorted(
+        match.re.groupindex.items(), key=lambda item: item[1])
+    return cls([(name, match.group(name)) for name, _ in group_indexes])
+
+  def get(self, name, default_value=None):
+    """Retrieves a value.
+
+    Args:
+      name (str): name of the value.
+      default_value (Optional[object]): default value.
+
+    Returns:
+      object: value or the default value if not present.
+    """
+    value = self._values.get(name, None)
+    if value is None:
+      return default_value
+
+    return value
+
+
 class PyparsingSingleLineTextParser(interface.FileObjectParser):
   """Single line text parser interface based on pyparsing."""
 
@@ -225,6 +430,13 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
   # The value is the actual pyparsing structure.
   LINE_STRUCTURES = []
 
+  # Optional precompiled regular expressions per key of the line structures.
+  # A line is first matched against the regular expression of a line structure
+  # and only parsed with the pyparsing structure if the regular expression does
+  # not match. The regular expression therefore must not match a line that the
+  # pyparsing structure does not parse into the same named values.
+  LINE_REGULAR_EXPRESSIONS = {}
+
   # In order for the tool to not read too much data into a buffer to evaluate
   # whether or not the parser is the right one for this file or not we
   # specifically define a maximum amount of bytes a single line can occupy. This
@@ -251,6 +463,21 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     # a structural fix.
     self._line_structures = list(self.LINE_STRUCTURES)
 
+  def _GetRegularExpressionStructure(self, key, match):
+    """Retrieves the structure of a line matched by a regular expression.
+
+    Parsers that expect other than string values in the structure, such as
+    integers or groups, should override this method.
+
+    Args:
+      key (str): name of the line structure.
+      match (_sre.SRE_Match): regular expression match of the line.
+
+    Returns:
+      RegularExpressionStructure: structure of the line.
+    """
+    return RegularExpressionStructure.FromMatch(match)
+
   # Pylint is confused by the formatting of the bytes_in argument.
   # pylint: disable=missing-param-doc,missing-type-doc
   def _IsText(self, bytes_in, encoding=None):
@@ -316,7 +543,7 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     """Reads a line from a text file.
 
     Args:
-      text_file_object (dfvfs.TextFile): text file.
+      text_file_object (BufferedTextFile): text file.
       max_len (Optional[int]): maximum number of bytes a single line can take,
           where None means all remaining bytes should be read.
       depth (Optional[int]): number of new lines the parser encountered.
@@ -360,7 +587,7 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
           'Line structure undeclared, unable to proceed.')
 
     encoding = self._ENCODING or parser_mediator.codepage
-    text_file_object = text_file.TextFile(file_object, encoding=encoding)
+    text_file_object = BufferedTextFile(file_object, encoding=encoding)
 
     try:
       line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
@@ -397,10 +624,17 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
       use_key = None
       # Try to parse the line using all the line structures.
       for index, (key, structure) in enumerate(self._line_structures):
-        try:
-          parsed_structure = structure.parseString(line)
-        except pyparsing.ParseException:
-          pass
+        regular_expression = self.LINE_REGULAR_EXPRESSIONS.get(key, None)
+        if regular_expression:
+          match = regular_expression.match(line)
+          if match:
+            parsed_structure = self._GetRegularExpressionStructure(key, match)
+
+        if not parsed_structure:
+          try:
+            parsed_structure = structure.parseString(line)
+          except pyparsing.ParseException:
+            pass
         if parsed_structure:
           use_key = key
           break
@@ -579,11 +813,141 @@ class PyparsingMultiLineTextParser(PyparsingSingleLineTextParser):
 
   BUFFER_SIZE = 2048
 
+  # Optional precompiled regular expression that matches the start of a record,
+  # such as the date and time at the start of a log line. If defined the text
+  # is split into records, where a record consists of a line that matches
+  # the regular expression and the lines that follow up to the next matching
+  # line, and the line structures are only applied to a single record at
+  # a time instead of to the buffered text. A record is limited to
+  # the buffer size, except for a single line that is larger.
+  RECORD_START_REGULAR_EXPRESSION = None
+
   def __init__(self):
     """Initializes a parser object."""
     super(PyparsingMultiLineTextParser, self).__init__()
     self._buffer_size = self.BUFFER_SIZE
 
+  def _ParseRecords(self, parser_mediator, file_object, encoding):
+    """Parses the records of a text file-like object.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      file_object (dfvfs.FileIO): file-like object.
+      encoding (str): encoding of the text.
+
+    Raises:
+      UnableToParseFile: when the file cannot be parsed.
+    """
+    # The line structures are anchored at the start of the record text, so
+    # that a record that does not match fails without scanning the record.
+    record_structures = []
+    for key, structure in self._line_structures:
+      record_structure = pyparsing.StringStart() + structure
+      record_structure.parseWithTabs()
+      record_structures.append((key, record_structure))
+
+    text_file_object = BufferedTextFile(file_object, encoding=encoding)
+
+    consecutive_line_failures = 0
+    for text in self._ReadRecords(parser_mediator, text_file_object):
+      if parser_mediator.abort:
+        break
+
+      while text:
+        tokens = None
+        start = 0
+        end = 0
+
+        key = None
+
+        for index, (key, structure) in enumerate(record_structures):
+          parsed_structure = next(
+              structure.scanString(text, maxMatches=1), None)
+          if not parsed_structure:
+            continue
+
+          tokens, start, end = parsed_structure
+          if start == 0:
+            break
+
+        if tokens and start == 0:
+          # Move matching key, structure pair to the front of the list, so
+          # that structures that are more likely to match are tried first.
+          if index != 0:
+            key_structure = record_structures.pop(index)
+            record_structures.insert(0, key_structure)
+
+          try:
+            self.ParseRecord(parser_mediator, key, tokens)
+            consecutive_line_failures = 0
+          except (errors.ParseError, errors.TimestampError) as exception:
+            parser_mediator.ProduceExtractionError(
+                'unable to parse record: {0:s} with error: {1!s}'.format(
+                    key, exception))
+
+          text = text[end:]
+          continue
+
+        odd_line, _, text = text.partition('\n')
+        if odd_line:
+          if len(odd_line) > 80:
+            odd_line = '{0:s}...'.format(odd_line[:77])
+          parser_mediator.ProduceExtractionError(
+              'unable to parse log line: {0:s}'.format(repr(odd_line)))
+          consecutive_line_failures += 1
+          if (consecutive_line_failures >
+              self.MAXIMUM_CONSECUTIVE_LINE_FAILURES):
+            raise errors.UnableToParseFile(
+                'more than {0:d} consecutive failures to parse lines.'.format(
+                    self.MAXIMUM_CONSECUTIVE_LINE_FAILURES))
+
+  def _ReadRecords(self, parser_mediator, text_file_object):
+    """Reads records from a text file.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      text_file_object (BufferedTextFile): text file.
+
+    Yields:
+      str: text of a record.
+    """
+    record_lines = []
+    record_size = 0
+
+    while True:
+      offset = text_file_object.get_offset()
+      try:
+        line = text_file_object.readline()
+      except UnicodeDecodeError:
+        parser_mediator.ProduceExtractionError(
+            'unable to read and decode log line at offset {0:d}'.format(
+                offset))
+        break
+
+      if not line:
+        break
+
+      # Strip carriage returns from the text.
+      if line.endswith('\r\n'):
+        line = ''.join([line[:-2], '\n'])
+      elif line.endswith('\r'):
+        line = line[:-1]
+
+      if record_lines and (
+          record_size + len(line) > self._buffer_size or
+          self.RECORD_START_REGULAR_EXPRESSION.match(line)):
+        yield ''.join(record_lines)
+        record_lines = []
+        record_size = 0
+
+      record_lines.append(line)
+      record_size += len(line)
+
+    if record_lines:
+      yield ''.join(record_lines)
+
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a text file-like object using a pyparsing definition.
 
@@ -618,6 +982,9 @@ class PyparsingMultiLineTextParser(PyparsingSingleLineTextParser):
     for key, structure in self.LINE_STRUCTURES:
       structure.parseWithTabs()
 
+    if self.RECORD_START_REGULAR_EXPRESSION:
+      self._ParseRecords(parser_mediator, file_object, encoding)
+      return
 
     consecutive_line_failures = 0
     # Read every line in the text file.
@@ -12,6 +12,7 @@ from dfdatetime import semantic_time as dfdatetime_semantic_time
 
 from plaso.containers import events
 from plaso.containers import time_events
+from plaso.containers import windows_events
 from plaso.lib import definitions
 from plaso.lib import specification
 from plaso.parsers import interface
@@ -33,6 +34,10 @@ class WinEvtxRecordEventData(events.EventData):
     strings_parsed ([dict]): parsed information from event strings.
     user_sid (str): user security identifier (SID) stored in the event record.
     xml_string (str): XML representation of the event.
+    xml_template (str): XML template of the XML representation of the event,
+        which is set instead of xml_string if XML templates are enabled.
+    xml_values (list[str]): values of the XML representation of the event,
+        which are set instead of xml_string if XML templates are enabled.
   """
 
   DATA_TYPE = 'windows:evtx:record'
@@ -51,6 +56,8 @@ class WinEvtxRecordEventData(events.EventData):
     self.strings_parsed = None
     self.user_sid = None
     self.xml_string = None
+    self.xml_template = None
+    self.xml_values = None
 
 
 class WinEvtxParser(interface.FileObjectParser):
@@ -169,7 +176,21 @@ class WinEvtxParser(interface.FileObjectParser):
 
         event_data.strings_parsed[rule.name] = evtx_record.strings[rule.index]
 
-    event_data.xml_string = evtx_record.xml_string
+    xml_string = evtx_record.xml_string
+
+    xml_template = None
+    if parser_mediator.evtx_xml_templates:
+      # The XML template is stored once by the storage and the XML string
+      # is rendered from the XML template and values when read.
+      xml_template, xml_values = (
+          windows_events.WindowsEventLogXMLTemplate.SplitXMLString(
+              xml_string))
+
+    if xml_template is None:
+      event_data.xml_string = xml_string
+    else:
+      event_data.xml_template = xml_template
+      event_data.xml_values = xml_values
 
     return event_data
 
@@ -203,7 +224,9 @@ class WinEvtxParser(interface.FileObjectParser):
 
     event = time_events.DateTimeValuesEvent(
         date_time, definitions.TIME_DESCRIPTION_WRITTEN)
-    parser_mediator.ProduceEventWithEventData(event, event_data)
+    event_data_identifier = parser_mediator.ProduceEventData(event_data)
+    parser_mediator.ProduceEventWithEventDataIdentifier(
+        event, event_data_identifier)
 
   def _ParseRecords(self, parser_mediator, evtx_file):
     """Parses Windows XML EventLog (EVTX) records.
@@ -74,7 +74,9 @@ class DefaultPlugin(interface.WindowsRegistryPlugin):
 
     event = time_events.DateTimeValuesEvent(
         registry_key.last_written_time, definitions.TIME_DESCRIPTION_WRITTEN)
-    parser_mediator.ProduceEventWithEventData(event, event_data)
+    event_data_identifier = parser_mediator.ProduceEventData(event_data)
+    parser_mediator.ProduceEventWithEventDataIdentifier(
+        event, event_data_identifier)
 
 
 winreg.WinRegistryParser.RegisterPlugin(DefaultPlugin)
@@ -54,6 +54,8 @@ http://xchat.org
 
 from __future__ import unicode_literals
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -145,6 +147,16 @@ class XChatLogParser(text_parser.PyparsingSingleLineTextParser):
       ('header_signature', _HEADER_SIGNATURE),
   ]
 
+  # Regular expression to match the body lines, which is considerably faster
+  # than the corresponding pyparsing structure. A text that starts with "<"
+  # is only matched after a nickname, since pyparsing would parse it as
+  # a nickname. The white space in the text is normalized when parsed.
+  LINE_REGULAR_EXPRESSIONS = {
+      'logline': re.compile(
+          r'^(?P<month>[A-Za-z]{3}) (?P<day>[0-9]{1,2}) '
+          r'(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):(?P<seconds>[0-9]{2}) +'
+          r'(?:<(?P<nickname>[^<>\s]+)>(?: +|$))?(?P<text>[^<\s].*)?$')}
+
   def __init__(self):
     """Initializes a parser object."""
     super(XChatLogParser, self).__init__()
@@ -152,6 +164,27 @@ class XChatLogParser(text_parser.PyparsingSingleLineTextParser):
     self._xchat_year = None
     self.offset = 0
 
+  def _GetRegularExpressionStructure(self, key, match):
+    """Retrieves the structure of a line matched by a regular expression.
+
+    Args:
+      key (str): name of the line structure.
+      match (_sre.SRE_Match): regular expression match of the line.
+
+    Returns:
+      RegularExpressionStructure: structure of the line, with the date and
+          time values in a date_time list like the pyparsing structure.
+    """
+    date_time = [
+        match.group('month'), int(match.group('day'), 10),
+        int(match.group('hours'), 10), int(match.group('minutes'), 10),
+        int(match.group('seconds'), 10)]
+
+    return text_parser.RegularExpressionStructure([
+        ('date_time', date_time),
+        ('nickname', match.group('nickname')),
+        ('text', match.group('text'))])
+
   def _GetTimeElementsTuple(self, structure):
     """Retrieves a time elements tuple from the structure.
 
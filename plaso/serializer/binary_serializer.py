@@ -0,0 +1,793 @@
+# -*- coding: utf-8 -*-
+"""The binary serializer object implementation.
+
+The binary serialization format is a compact alternative to JSON. Attribute
+names of known container types and path specification properties are stored
+as an index into a schema instead of as a string.
+
+A serialized attribute container consists of:
+* format version (1 byte);
+* container type (name);
+* number of attributes (2 bytes);
+* per attribute the name (name) and the value (value).
+
+A name is stored as a 16-bit value, where a value smaller than 0x8000
+contains the index of the name in the schema and otherwise the lower 15 bits
+contain the size of the UTF-8 encoded name that follows.
+
+A value is stored as a 1 byte value type followed by type specific data.
+"""
+
+from __future__ import unicode_literals
+
+import collections
+import struct
+
+from dfvfs.path import factory as dfvfs_path_spec_factory
+from dfvfs.path import path_spec as dfvfs_path_spec
+
+from plaso.containers import interface as containers_interface
+from plaso.containers import manager as containers_manager
+from plaso.lib import cachelib
+from plaso.lib import py2to3
+from plaso.serializer import interface
+from plaso.serializer import logger
+
+
+class BinaryAttributeContainerSerializer(
+    interface.AttributeContainerSerializer):
+  """Class that implements the binary attribute container serializer.
+
+  Unlike the JSON serializer the binary serializer is used as an object,
+  since it keeps a cache of deserialized path specifications. Identical path
+  specifications are deserialized once and the resulting object is shared.
+  """
+
+  _FORMAT_VERSION = 1
+
+  # The schemas are used to store the index of a name instead of the name
+  # itself. Names can only be appended to the schemas, otherwise previously
+  # serialized attribute containers can no longer be read.
+
+  _CONTAINER_TYPES = (
+      'analysis_report', 'analyzer_result', 'environment_variable', 'event',
+      'event_data', 'event_source', 'event_tag', 'extraction_error',
+      'hostname', 'mount_point', 'session', 'session_completion',
+      'session_start', 'system_configuration', 'task', 'task_completion',
+      'task_start', 'user_account', 'path_spec', 'evtx_xml_template')
+
+  _EVENT_ATTRIBUTE_NAMES = (
+      'data_type', 'display_name', 'event_data_row_identifier', 'filename',
+      'hostname', 'inode', 'offset', 'parser', 'pathspec', 'query', 'tag',
+      'timestamp', 'timestamp_desc', 'username', 'path_spec_row_identifier',
+      'xml_template_row_identifier', 'xml_values')
+
+  _ATTRIBUTE_NAMES_PER_CONTAINER_TYPE = {
+      'analysis_report': (
+          'filter_string', 'plugin_name', 'report_array', 'report_dict',
+          'text', 'time_compiled'),
+      'analyzer_result': (
+          'analyzer_name', 'attribute_name', 'attribute_value'),
+      'environment_variable': (
+          'case_sensitive', 'name', 'value'),
+      'event': _EVENT_ATTRIBUTE_NAMES,
+      'event_data': _EVENT_ATTRIBUTE_NAMES,
+      'event_source': (
+          'data_type', 'file_entry_type', 'path_spec', 'size',
+          'path_spec_row_identifier'),
+      'event_tag': (
+          'comment', 'event_entry_index', 'event_row_identifier',
+          'event_stream_number', 'labels'),
+      'evtx_xml_template': ('template',),
+      'extraction_error': (
+          'message', 'parser_chain', 'path_spec', 'path_spec_row_identifier'),
+      'hostname': (
+          'name', 'schema'),
+      'mount_point': (
+          'mount_path', 'path_specification'),
+      'path_spec': ('path_spec',),
+      'session': (
+          'aborted', 'analysis_reports_counter', 'artifact_filters',
+          'command_line_arguments', 'completion_time', 'debug_mode',
+          'enabled_parser_names', 'event_labels_counter', 'filter_file',
+          'identifier', 'parser_filter_expression', 'parsers_counter',
+          'preferred_encoding', 'preferred_time_zone', 'preferred_year',
+          'product_name', 'product_version', 'start_time'),
+      'session_completion': (
+          'aborted', 'analysis_reports_counter', 'event_labels_counter',
+          'identifier', 'parsers_counter', 'timestamp'),
+      'session_start': (
+          'artifact_filters', 'command_line_arguments', 'debug_mode',
+          'enabled_parser_names', 'filter_file', 'identifier',
+          'parser_filter_expression', 'preferred_encoding',
+          'preferred_time_zone', 'preferred_year', 'product_name',
+          'product_version', 'timestamp'),
+      'system_configuration': (
+          'code_page', 'hostname', 'keyboard_layout', 'operating_system',
+          'operating_system_product', 'operating_system_version', 'time_zone',
+          'user_accounts'),
+      'task': (
+          'aborted', 'completion_time', 'file_entry_type', 'has_retry',
+          'identifier', 'last_processing_time', 'merge_priority', 'path_spec',
+          'path_specs', 'session_identifier', 'start_time',
+          'storage_file_size'),
+      'task_completion': (
+          'aborted', 'identifier', 'session_identifier', 'timestamp'),
+      'task_start': (
+          'identifier', 'session_identifier', 'timestamp'),
+      'user_account': (
+          'full_name', 'group_identifier', 'identifier', 'user_directory',
+          'username'),
+  }
+
+  _PATH_SPEC_PROPERTY_NAMES = (
+      'cipher_mode', 'column_name', 'compression_method', 'data_stream',
+      'encoding_method', 'encryption_method', 'identifier',
+      'initialization_vector', 'inode', 'key', 'location', 'mft_attribute',
+      'mft_entry', 'part_index', 'password', 'range_offset', 'range_size',
+      'recovery_password', 'row_condition', 'row_index', 'start_offset',
+      'startup_key', 'store_index', 'table_name', 'volume_index')
+
+  _PATH_SPEC_TYPE_INDICATORS = (
+      'APFS', 'APFS_CONTAINER', 'BDE', 'COMPRESSED_STREAM', 'CPIO',
+      'DATA_RANGE', 'ENCODED_STREAM', 'ENCRYPTED_STREAM', 'EWF', 'FAKE',
+      'FVDE', 'GZIP', 'LVM', 'MOUNT', 'NTFS', 'OS', 'QCOW', 'RAW',
+      'SQLITE_BLOB', 'TAR', 'TSK', 'TSK_PARTITION', 'VHDI', 'VMDK', 'VSHADOW',
+      'ZIP')
+
+  # The maximum number of deserialized path specifications that are cached.
+  _PATH_SPEC_CACHE_SIZE = 4096
+
+  _VALUE_TYPE_NONE = 0
+  _VALUE_TYPE_FALSE = 1
+  _VALUE_TYPE_TRUE = 2
+  _VALUE_TYPE_INTEGER = 3
+  _VALUE_TYPE_LARGE_INTEGER = 4
+  _VALUE_TYPE_FLOAT = 5
+  _VALUE_TYPE_STRING = 6
+  _VALUE_TYPE_BYTES = 7
+  _VALUE_TYPE_LIST = 8
+  _VALUE_TYPE_TUPLE = 9
+  _VALUE_TYPE_DICT = 10
+  _VALUE_TYPE_COUNTER = 11
+  _VALUE_TYPE_PATH_SPEC = 12
+  _VALUE_TYPE_ATTRIBUTE_CONTAINER = 13
+
+  _MAXIMUM_INLINE_NAME_SIZE = 0x7fff
+
+  _MAXIMUM_INTEGER = (1 << 63) - 1
+  _MINIMUM_INTEGER = -(1 << 63)
+
+  _DOUBLE = struct.Struct('<d')
+  _INT64 = struct.Struct('<q')
+  _UINT8 = struct.Struct('<B')
+  _UINT16 = struct.Struct('<H')
+  _UINT32 = struct.Struct('<I')
+
+  def __init__(self):
+    """Initializes a binary attribute container serializer."""
+    super(BinaryAttributeContainerSerializer, self).__init__()
+    self._attribute_name_indexes_per_container_type = {
+        container_type: self._GetNameIndexes(attribute_names)
+        for container_type, attribute_names in iter(
+            self._ATTRIBUTE_NAMES_PER_CONTAINER_TYPE.items())}
+    self._container_type_indexes = self._GetNameIndexes(self._CONTAINER_TYPES)
+    self._path_spec_cache = cachelib.LeastRecentlyUsedCache(
+        self._PATH_SPEC_CACHE_SIZE)
+    self._path_spec_data_cache = cachelib.LeastRecentlyUsedCache(
+        self._PATH_SPEC_CACHE_SIZE)
+    self._path_spec_property_name_indexes = self._GetNameIndexes(
+        self._PATH_SPEC_PROPERTY_NAMES)
+    self._path_spec_type_indicator_indexes = self._GetNameIndexes(
+        self._PATH_SPEC_TYPE_INDICATORS)
+
+    self._read_value_methods = {
+        self._VALUE_TYPE_NONE: self._ReadNone,
+        self._VALUE_TYPE_FALSE: self._ReadFalse,
+        self._VALUE_TYPE_TRUE: self._ReadTrue,
+        self._VALUE_TYPE_INTEGER: self._ReadInteger,
+        self._VALUE_TYPE_LARGE_INTEGER: self._ReadLargeInteger,
+        self._VALUE_TYPE_FLOAT: self._ReadFloat,
+        self._VALUE_TYPE_STRING: self._ReadString,
+        self._VALUE_TYPE_BYTES: self._ReadBytes,
+        self._VALUE_TYPE_LIST: self._ReadList,
+        self._VALUE_TYPE_TUPLE: self._ReadTuple,
+        self._VALUE_TYPE_DICT: self._ReadDict,
+        self._VALUE_TYPE_COUNTER: self._ReadCounter,
+        self._VALUE_TYPE_PATH_SPEC: self._ReadPathSpecValue,
+        self._VALUE_TYPE_ATTRIBUTE_CONTAINER: self._ReadAttributeContainer}
+
+  def _GetNameIndexes(self, names):
+    """Retrieves a lookup table of names in a schema.
+
+    Args:
+      names (tuple[str]): names in the schema.
+
+    Returns:
+      dict[str, int]: index of the name in the schema per name.
+    """
+    return {name: index for index, name in enumerate(names)}
+
+  def _ReadAttributeContainer(self, data, offset):
+    """Reads an attribute container.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the attribute container in the data.
+
+    Returns:
+      tuple[AttributeContainer, int]: attribute container and offset of
+          the data following the attribute container.
+
+    Raises:
+      ValueError: if the container type is not supported.
+    """
+    container_type, offset = self._ReadName(
+        data, offset, self._CONTAINER_TYPES)
+
+    container_class = (
+        containers_manager.AttributeContainersManager.GetAttributeContainer(
+            container_type))
+    if not container_class:
+      raise ValueError('Unsupported container type: {0:s}'.format(
+          container_type))
+
+    attribute_names = self._ATTRIBUTE_NAMES_PER_CONTAINER_TYPE.get(
+        container_type, ())
+
+    container_object = container_class()
+
+    # Be strict about which attributes to set in non event values.
+    supported_attribute_names = None
+    if container_type not in ('event', 'event_data'):
+      supported_attribute_names = container_object.GetAttributeNames()
+
+    number_of_attributes = self._UINT16.unpack_from(data, offset)[0]
+    offset += 2
+
+    for _ in range(number_of_attributes):
+      attribute_name, offset = self._ReadName(data, offset, attribute_names)
+      attribute_value, offset = self._ReadValue(data, offset)
+
+      if (supported_attribute_names is not None and
+          attribute_name not in supported_attribute_names):
+        logger.debug((
+            '[ReadAttributeContainer] unsupported attribute name: '
+            '{0:s}.{1:s}').format(container_type, attribute_name))
+        continue
+
+      setattr(container_object, attribute_name, attribute_value)
+
+    return container_object, offset
+
+  def _ReadBytes(self, data, offset):
+    """Reads a bytes value.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[bytes, int]: value and offset of the data following the value.
+    """
+    data_size = self._UINT32.unpack_from(data, offset)[0]
+    offset += 4
+    return data[offset:offset + data_size], offset + data_size
+
+  def _ReadCounter(self, data, offset):
+    """Reads a collections.Counter value.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[collections.Counter, int]: value and offset of the data following
+          the value.
+    """
+    dict_value, offset = self._ReadDict(data, offset)
+    return collections.Counter(dict_value), offset
+
+  def _ReadDict(self, data, offset):
+    """Reads a dict value.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[dict, int]: value and offset of the data following the value.
+    """
+    number_of_items = self._UINT32.unpack_from(data, offset)[0]
+    offset += 4
+
+    dict_value = {}
+    for _ in range(number_of_items):
+      key, offset = self._ReadValue(data, offset)
+      dict_value[key], offset = self._ReadValue(data, offset)
+
+    return dict_value, offset
+
+  def _ReadFalse(self, unused_data, offset):
+    """Reads a False value.
+
+    Args:
+      unused_data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[bool, int]: value and offset of the data following the value.
+    """
+    return False, offset
+
+  def _ReadFloat(self, data, offset):
+    """Reads a floating-point value.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[float, int]: value and offset of the data following the value.
+    """
+    return self._DOUBLE.unpack_from(data, offset)[0], offset + 8
+
+  def _ReadInteger(self, data, offset):
+    """Reads a 64-bit integer value.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[int, int]: value and offset of the data following the value.
+    """
+    return self._INT64.unpack_from(data, offset)[0], offset + 8
+
+  def _ReadLargeInteger(self, data, offset):
+    """Reads an integer value that does not fit in 64-bit.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[int, int]: value and offset of the data following the value.
+    """
+    string_value, offset = self._ReadString(data, offset)
+    return int(string_value, 10), offset
+
+  def _ReadList(self, data, offset):
+    """Reads a list value.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[list, int]: value and offset of the data following the value.
+    """
+    number_of_values = self._UINT32.unpack_from(data, offset)[0]
+    offset += 4
+
+    list_value = []
+    for _ in range(number_of_values):
+      value, offset = self._ReadValue(data, offset)
+      list_value.append(value)
+
+    return list_value, offset
+
+  def _ReadName(self, data, offset, names):
+    """Reads a name.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the name in the data.
+      names (tuple[str]): names in the schema.
+
+    Returns:
+      tuple[str, int]: name and offset of the data following the name.
+
+    Raises:
+      ValueError: if the name index is not defined in the schema.
+    """
+    name_value = self._UINT16.unpack_from(data, offset)[0]
+    offset += 2
+
+    if name_value & 0x8000:
+      name_size = name_value & self._MAXIMUM_INLINE_NAME_SIZE
+      name = data[offset:offset + name_size].decode('utf-8')
+      return name, offset + name_size
+
+    if name_value >= len(names):
+      raise ValueError('Name index: {0:d} not defined in schema.'.format(
+          name_value))
+
+    return names[name_value], offset
+
+  def _ReadNone(self, unused_data, offset):
+    """Reads a None value.
+
+    Args:
+      unused_data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[None, int]: value and offset of the data following the value.
+    """
+    return None, offset
+
+  def _ReadPathSpec(self, data, offset):
+    """Reads a path specification.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the path specification in the data.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+    """
+    type_indicator, offset = self._ReadName(
+        data, offset, self._PATH_SPEC_TYPE_INDICATORS)
+
+    has_parent = self._UINT8.unpack_from(data, offset)[0]
+    offset += 1
+
+    kwargs = {}
+    if has_parent:
+      kwargs['parent'], offset = self._ReadPathSpecValue(data, offset)
+
+    number_of_properties = self._UINT16.unpack_from(data, offset)[0]
+    offset += 2
+
+    for _ in range(number_of_properties):
+      property_name, offset = self._ReadName(
+          data, offset, self._PATH_SPEC_PROPERTY_NAMES)
+      kwargs[property_name], offset = self._ReadValue(data, offset)
+
+    return dfvfs_path_spec_factory.Factory.NewPathSpec(type_indicator, **kwargs)
+
+  def _ReadPathSpecValue(self, data, offset):
+    """Reads a path specification value.
+
+    Path specifications are cached by their serialized data, so identical
+    path specifications are only deserialized once.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[dfvfs.PathSpec, int]: path specification and offset of the data
+          following the value.
+    """
+    data_size = self._UINT32.unpack_from(data, offset)[0]
+    offset += 4
+
+    path_spec_data = data[offset:offset + data_size]
+
+    path_spec = self._path_spec_cache.GetValue(path_spec_data)
+    if path_spec is None:
+      path_spec = self._ReadPathSpec(path_spec_data, 0)
+      self._path_spec_cache.SetValue(path_spec_data, path_spec)
+
+    return path_spec, offset + data_size
+
+  def _ReadString(self, data, offset):
+    """Reads a string value.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[str, int]: value and offset of the data following the value.
+    """
+    data_size = self._UINT32.unpack_from(data, offset)[0]
+    offset += 4
+
+    string_value = data[offset:offset + data_size].decode(
+        'utf-8', 'surrogatepass')
+    return string_value, offset + data_size
+
+  def _ReadTrue(self, unused_data, offset):
+    """Reads a True value.
+
+    Args:
+      unused_data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[bool, int]: value and offset of the data following the value.
+    """
+    return True, offset
+
+  def _ReadTuple(self, data, offset):
+    """Reads a tuple value.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value data in the data.
+
+    Returns:
+      tuple[tuple, int]: value and offset of the data following the value.
+    """
+    list_value, offset = self._ReadList(data, offset)
+    return tuple(list_value), offset
+
+  def _ReadValue(self, data, offset):
+    """Reads a value.
+
+    Args:
+      data (bytes): serialized data.
+      offset (int): offset of the value in the data.
+
+    Returns:
+      tuple[object, int]: value and offset of the data following the value.
+
+    Raises:
+      ValueError: if the value type is not supported.
+    """
+    value_type = self._UINT8.unpack_from(data, offset)[0]
+
+    read_value_method = self._read_value_methods.get(value_type, None)
+    if not read_value_method:
+      raise ValueError('Unsupported value type: {0:d}'.format(value_type))
+
+    return read_value_method(data, offset + 1)
+
+  def _WriteAttributeContainer(self, attribute_container, data_segments):
+    """Writes an attribute container.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+      data_segments (list[bytes]): data segments to which the serialized data
+          is appended.
+
+    Raises:
+      ValueError: if the attribute container type is not supported.
+    """
+    container_type = getattr(attribute_container, 'CONTAINER_TYPE', None)
+    if not container_type:
+      raise ValueError('Unsupported attribute container type: {0!s}.'.format(
+          type(attribute_container)))
+
+    self._WriteName(container_type, self._container_type_indexes, data_segments)
+
+    attribute_name_indexes = (
+        self._attribute_name_indexes_per_container_type.get(
+            container_type, {}))
+
+    attributes = list(attribute_container.GetAttributes())
+    data_segments.append(self._UINT16.pack(len(attributes)))
+
+    for attribute_name, attribute_value in attributes:
+      self._WriteName(attribute_name, attribute_name_indexes, data_segments)
+      self._WriteValue(attribute_value, data_segments)
+
+  def _WriteName(self, name, name_indexes, data_segments):
+    """Writes a name.
+
+    Args:
+      name (str): name.
+      name_indexes (dict[str, int]): index of the name in the schema per name.
+      data_segments (list[bytes]): data segments to which the serialized data
+          is appended.
+
+    Raises:
+      ValueError: if the name is too large.
+    """
+    name_index = name_indexes.get(name, None)
+    if name_index is not None:
+      data_segments.append(self._UINT16.pack(name_index))
+      return
+
+    encoded_name = name.encode('utf-8')
+    name_size = len(encoded_name)
+    if name_size > self._MAXIMUM_INLINE_NAME_SIZE:
+      raise ValueError('Name: {0:s} too large.'.format(name))
+
+    data_segments.append(self._UINT16.pack(0x8000 | name_size))
+    data_segments.append(encoded_name)
+
+  def _WritePathSpec(self, path_spec, data_segments):
+    """Writes a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+      data_segments (list[bytes]): data segments to which the serialized data
+          is appended.
+    """
+    self._WriteName(
+        path_spec.type_indicator, self._path_spec_type_indicator_indexes,
+        data_segments)
+
+    if path_spec.HasParent():
+      data_segments.append(self._UINT8.pack(1))
+      self._WritePathSpecValue(path_spec.parent, data_segments)
+    else:
+      data_segments.append(self._UINT8.pack(0))
+
+    properties = []
+    for property_name in dfvfs_path_spec_factory.Factory.PROPERTY_NAMES:
+      property_value = getattr(path_spec, property_name, None)
+      if property_value is not None:
+        properties.append((property_name, property_value))
+
+    data_segments.append(self._UINT16.pack(len(properties)))
+
+    for property_name, property_value in properties:
+      self._WriteName(
+          property_name, self._path_spec_property_name_indexes, data_segments)
+      self._WriteValue(property_value, data_segments)
+
+  def _WritePathSpecValue(self, path_spec, data_segments):
+    """Writes a path specification value.
+
+    The serialized path specification is prefixed with its size, so that
+    it can be looked up in the path specification cache when read. Since
+    many attribute containers share the same path specification object, the
+    serialized data is cached per path specification object.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+      data_segments (list[bytes]): data segments to which the serialized data
+          is appended.
+    """
+    # The path specification is stored with its serialized data so that
+    # the identifier of the object cannot be reused while cached.
+    cached_value = self._path_spec_data_cache.GetValue(id(path_spec))
+    if cached_value and cached_value[0] is path_spec:
+      path_spec_data = cached_value[1]
+    else:
+      path_spec_data_segments = []
+      self._WritePathSpec(path_spec, path_spec_data_segments)
+      path_spec_data = b''.join(path_spec_data_segments)
+      self._path_spec_data_cache.SetValue(
+          id(path_spec), (path_spec, path_spec_data))
+
+    data_segments.append(self._UINT32.pack(len(path_spec_data)))
+    data_segments.append(path_spec_data)
+
+  def _WriteValue(self, value, data_segments):
+    """Writes a value.
+
+    Args:
+      value (object): value.
+      data_segments (list[bytes]): data segments to which the serialized data
+          is appended.
+
+    Raises:
+      TypeError: if the value type is not supported.
+    """
+    if value is None:
+      data_segments.append(self._UINT8.pack(self._VALUE_TYPE_NONE))
+
+    elif isinstance(value, bool):
+      if value:
+        data_segments.append(self._UINT8.pack(self._VALUE_TYPE_TRUE))
+      else:
+        data_segments.append(self._UINT8.pack(self._VALUE_TYPE_FALSE))
+
+    elif isinstance(value, py2to3.INTEGER_TYPES):
+      if self._MINIMUM_INTEGER <= value <= self._MAXIMUM_INTEGER:
+        data_segments.append(self._UINT8.pack(self._VALUE_TYPE_INTEGER))
+        data_segments.append(self._INT64.pack(value))
+      else:
+        data_segments.append(self._UINT8.pack(self._VALUE_TYPE_LARGE_INTEGER))
+        self._WriteString('{0:d}'.format(value), data_segments)
+
+    elif isinstance(value, float):
+      data_segments.append(self._UINT8.pack(self._VALUE_TYPE_FLOAT))
+      data_segments.append(self._DOUBLE.pack(value))
+
+    elif isinstance(value, py2to3.UNICODE_TYPE):
+      data_segments.append(self._UINT8.pack(self._VALUE_TYPE_STRING))
+      self._WriteString(value, data_segments)
+
+    elif isinstance(value, py2to3.BYTES_TYPE):
+      data_segments.append(self._UINT8.pack(self._VALUE_TYPE_BYTES))
+      data_segments.append(self._UINT32.pack(len(value)))
+      data_segments.append(value)
+
+    elif isinstance(value, (list, tuple)):
+      if isinstance(value, list):
+        value_type = self._VALUE_TYPE_LIST
+      else:
+        value_type = self._VALUE_TYPE_TUPLE
+
+      data_segments.append(self._UINT8.pack(value_type))
+      data_segments.append(self._UINT32.pack(len(value)))
+      for list_element in value:
+        self._WriteValue(list_element, data_segments)
+
+    elif isinstance(value, dict):
+      if isinstance(value, collections.Counter):
+        value_type = self._VALUE_TYPE_COUNTER
+      else:
+        value_type = self._VALUE_TYPE_DICT
+
+      data_segments.append(self._UINT8.pack(value_type))
+      data_segments.append(self._UINT32.pack(len(value)))
+      for key, dict_value in iter(value.items()):
+        self._WriteValue(key, data_segments)
+        self._WriteValue(dict_value, data_segments)
+
+    elif isinstance(value, dfvfs_path_spec.PathSpec):
+      data_segments.append(self._UINT8.pack(self._VALUE_TYPE_PATH_SPEC))
+      self._WritePathSpecValue(value, data_segments)
+
+    elif isinstance(value, containers_interface.AttributeContainer):
+      data_segments.append(self._UINT8.pack(
+          self._VALUE_TYPE_ATTRIBUTE_CONTAINER))
+      self._WriteAttributeContainer(value, data_segments)
+
+    else:
+      raise TypeError('Unsupported value type: {0!s}.'.format(type(value)))
+
+  def _WriteString(self, string_value, data_segments):
+    """Writes string value data.
+
+    Args:
+      string_value (str): string value.
+      data_segments (list[bytes]): data segments to which the serialized data
+          is appended.
+    """
+    encoded_string = string_value.encode('utf-8', 'surrogatepass')
+    data_segments.append(self._UINT32.pack(len(encoded_string)))
+    data_segments.append(encoded_string)
+
+  def ReadSerialized(self, serialized):  # pylint: disable=arguments-differ
+    """Reads an attribute container from serialized form.
+
+    Args:
+      serialized (bytes): binary serialized attribute container.
+
+    Returns:
+      AttributeContainer: attribute container or None.
+
+    Raises:
+      ValueError: if the format version is not supported or the serialized
+          data cannot be read.
+    """
+    if not serialized:
+      return None
+
+    format_version = self._UINT8.unpack_from(serialized, 0)[0]
+    if format_version != self._FORMAT_VERSION:
+      raise ValueError('Unsupported format version: {0:d}'.format(
+          format_version))
+
+    try:
+      attribute_container, offset = self._ReadAttributeContainer(
+          serialized, 1)
+    except (struct.error, UnicodeDecodeError) as exception:
+      raise ValueError(
+          'Unable to read serialized attribute container with error: '
+          '{0!s}'.format(exception))
+
+    if offset != len(serialized):
+      raise ValueError('Size of serialized attribute container mismatch.')
+
+    return attribute_container
+
+  def WriteSerialized(self, attribute_container):
+    """Writes an attribute container to serialized form.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      bytes: binary serialized attribute container.
+
+    Raises:
+      TypeError: if not an instance of AttributeContainer.
+    """
+    if not isinstance(
+        attribute_container, containers_interface.AttributeContainer):
+      raise TypeError('{0!s} is not an attribute container type.'.format(
+          type(attribute_container)))
+
+    data_segments = [self._UINT8.pack(self._FORMAT_VERSION)]
+    self._WriteAttributeContainer(attribute_container, data_segments)
+    return b''.join(data_segments)
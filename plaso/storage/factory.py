@@ -13,18 +13,28 @@ class StorageFactory(object):
   """Storage factory."""
 
   @classmethod
-  def CreateStorageFile(cls, storage_format):
+  def CreateStorageFile(
+      cls, storage_format, cache_size=None, journal_mode=None, page_size=None):
     """Creates a storage file.
 
     Args:
       storage_format (str): storage format.
+      cache_size (Optional[int]): SQLite page cache size, where a positive
+          value represents a number of pages and a negative value a size in
+          KiB, or None to use the SQLite default.
+      journal_mode (Optional[str]): SQLite journal mode, such as "MEMORY" or
+          "WAL", or None to use the SQLite default.
+      page_size (Optional[int]): SQLite page size in bytes, or None to use
+          the SQLite default.
 
     Returns:
       StorageFile: a storage file or None if the storage file cannot be
           opened or the storage format is not supported.
     """
     if storage_format == definitions.STORAGE_FORMAT_SQLITE:
-      return sqlite_file.SQLiteStorageFile()
+      return sqlite_file.SQLiteStorageFile(
+          cache_size=cache_size, journal_mode=journal_mode,
+          page_size=page_size)
 
     return None
 
@@ -45,52 +55,75 @@ class StorageFactory(object):
     return None
 
   @classmethod
-  def CreateStorageReaderForFile(cls, path):
+  def CreateStorageReaderForFile(cls, path, cache_size=None):
     """Creates a storage reader based on the file.
 
     Args:
       path (str): path to the storage file.
+      cache_size (Optional[int]): SQLite page cache size, where a positive
+          value represents a number of pages and a negative value a size in
+          KiB, or None to use the SQLite default.
 
     Returns:
       StorageReader: a storage reader or None if the storage file cannot be
           opened or the storage format is not supported.
     """
     if sqlite_file.SQLiteStorageFile.CheckSupportedFormat(path):
-      return sqlite_reader.SQLiteStorageFileReader(path)
+      return sqlite_reader.SQLiteStorageFileReader(path, cache_size=cache_size)
 
     return None
 
   @classmethod
-  def CreateStorageWriter(cls, storage_format, session, path):
+  def CreateStorageWriter(
+      cls, storage_format, session, path, cache_size=None, journal_mode=None,
+      page_size=None, serialization_format=definitions.SERIALIZER_FORMAT_JSON):
     """Creates a storage writer.
 
     Args:
       session (Session): session the storage changes are part of.
       path (str): path to the storage file.
       storage_format (str): storage format.
+      cache_size (Optional[int]): SQLite page cache size, where a positive
+          value represents a number of pages and a negative value a size in
+          KiB, or None to use the SQLite default.
+      journal_mode (Optional[str]): SQLite journal mode, such as "MEMORY" or
+          "WAL", or None to use the SQLite default.
+      page_size (Optional[int]): SQLite page size in bytes, or None to use
+          the SQLite default.
+      serialization_format (Optional[str]): serialization format of
+          the attribute containers in the storage file.
 
     Returns:
       StorageWriter: a storage writer or None if the storage file cannot be
           opened or the storage format is not supported.
     """
     if storage_format == definitions.STORAGE_FORMAT_SQLITE:
-      return sqlite_writer.SQLiteStorageFileWriter(session, path)
+      return sqlite_writer.SQLiteStorageFileWriter(
+          session, path, cache_size=cache_size, journal_mode=journal_mode,
+          page_size=page_size, serialization_format=serialization_format)
 
     return None
 
   @classmethod
-  def CreateStorageWriterForFile(cls, session, path):
+  def CreateStorageWriterForFile(
+      cls, session, path, cache_size=None, journal_mode=None):
     """Creates a storage writer based on the file.
 
     Args:
       session (Session): session the storage changes are part of.
       path (str): path to the storage file.
+      cache_size (Optional[int]): SQLite page cache size, where a positive
+          value represents a number of pages and a negative value a size in
+          KiB, or None to use the SQLite default.
+      journal_mode (Optional[str]): SQLite journal mode, such as "MEMORY" or
+          "WAL", or None to use the SQLite default.
 
     Returns:
       StorageWriter: a storage writer or None if the storage file cannot be
           opened or the storage format is not supported.
     """
     if sqlite_file.SQLiteStorageFile.CheckSupportedFormat(path):
-      return sqlite_writer.SQLiteStorageFileWriter(session, path)
+      return sqlite_writer.SQLiteStorageFileWriter(
+          session, path, cache_size=cache_size, journal_mode=journal_mode)
 
     return None
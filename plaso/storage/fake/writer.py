@@ -251,6 +251,22 @@ class FakeStorageWriter(interface.StorageWriter):
     """
     return iter(self._errors)
 
+  def GetEVTXXMLTemplateByRowIdentifier(self, row_identifier):
+    """Retrieves an EVTX XML template.
+
+    The fake storage writer keeps the XML templates of event data in memory,
+    hence there are no XML templates referenced by row identifier.
+
+    Args:
+      row_identifier (int): row identifier of the XML template, as stored
+          in the xml_template_row_identifier attribute of event data.
+
+    Raises:
+      IOError: since the XML template is missing.
+      OSError: since the XML template is missing.
+    """
+    raise IOError('Missing EVTX XML template: {0:d}'.format(row_identifier))
+
   def GetEvents(self):
     """Retrieves the events.
 
@@ -9,9 +9,63 @@ import shutil
 import tempfile
 
 from plaso.lib import definitions
+from plaso.serializer import binary_serializer
 from plaso.serializer import json_serializer
 
 
+def _CreateSerializer(serialization_format):
+  """Creates an attribute container serializer.
+
+  Args:
+    serialization_format (str): serialization format.
+
+  Returns:
+    AttributeContainerSerializer: attribute container serializer.
+
+  Raises:
+    ValueError: if the serialization format is not supported.
+  """
+  if serialization_format == definitions.SERIALIZER_FORMAT_BINARY:
+    return binary_serializer.BinaryAttributeContainerSerializer()
+
+  if serialization_format == definitions.SERIALIZER_FORMAT_JSON:
+    return json_serializer.JSONAttributeContainerSerializer
+
+  raise ValueError('Unsupported serialization format: {0!s}'.format(
+      serialization_format))
+
+
+def _ReadSerializedAttributeContainer(
+    serialization_format, serializer, serialized_data):
+  """Reads an attribute container from serialized data.
+
+  Args:
+    serialization_format (str): serialization format.
+    serializer (AttributeContainerSerializer): attribute container serializer.
+    serialized_data (bytes): serialized attribute container data.
+
+  Returns:
+    AttributeContainer: attribute container or None.
+
+  Raises:
+    IOError: if the serialized data cannot be decoded.
+    OSError: if the serialized data cannot be decoded.
+  """
+  if serialization_format == definitions.SERIALIZER_FORMAT_JSON:
+    try:
+      serialized_data = serialized_data.decode('utf-8')
+    except UnicodeDecodeError as exception:
+      raise IOError('Unable to decode serialized data: {0!s}'.format(
+          exception))
+
+    return serializer.ReadSerialized(serialized_data)
+
+  try:
+    return serializer.ReadSerialized(bytes(serialized_data))
+  except ValueError as exception:
+    raise IOError('Unable to read serialized data: {0!s}'.format(exception))
+
+
 class SerializedAttributeContainerList(object):
   """Serialized attribute container list.
 
@@ -214,6 +268,20 @@ class BaseStore(object):
       EventTag: event tag.
     """
 
+  @abc.abstractmethod
+  def GetEventTimeRanges(self, number_of_time_ranges):
+    """Retrieves time ranges that partition the events.
+
+    Events with the same timestamp are always part of the same time range.
+
+    Args:
+      number_of_time_ranges (int): maximum number of time ranges.
+
+    Returns:
+      list[TimeRange]: time ranges in increasing chronological order or None
+          if the events cannot be partitioned.
+    """
+
   @abc.abstractmethod
   def GetNumberOfEventSources(self):
     """Retrieves the number event sources.
@@ -261,6 +329,14 @@ class BaseStore(object):
       bool: True if the store contains event tags.
     """
 
+  @abc.abstractmethod
+  def HasEventTimestampIndex(self):
+    """Determines if a store contains an event timestamp index.
+
+    Returns:
+      bool: True if the store contains an event timestamp index.
+    """
+
   @abc.abstractmethod
   def Open(self, **kwargs):
     """Opens the storage."""
@@ -345,6 +421,7 @@ class BaseStorageFile(BaseStore):
     super(BaseStorageFile, self).__init__()
     self._is_open = False
     self._read_only = True
+    self._serialization_format = definitions.SERIALIZER_FORMAT_JSON
     self._serialized_attribute_containers = {}
     self._serializer = json_serializer.JSONAttributeContainerSerializer
 
@@ -368,12 +445,8 @@ class BaseStorageFile(BaseStore):
     if self._serializers_profiler:
       self._serializers_profiler.StartTiming(container_type)
 
-    try:
-      serialized_string = serialized_data.decode('utf-8')
-    except UnicodeDecodeError as exception:
-      raise IOError('Unable to decode serialized data: {0!s}'.format(
-          exception))
-    attribute_container = self._serializer.ReadSerialized(serialized_string)
+    attribute_container = _ReadSerializedAttributeContainer(
+        self._serialization_format, self._serializer, serialized_data)
 
     if self._serializers_profiler:
       self._serializers_profiler.StopTiming(container_type)
@@ -422,6 +495,18 @@ class BaseStorageFile(BaseStore):
 
     return container_list
 
+  def _SetSerializationFormat(self, serialization_format):
+    """Sets the serialization format.
+
+    Args:
+      serialization_format (str): serialization format.
+
+    Raises:
+      ValueError: if the serialization format is not supported.
+    """
+    self._serializer = _CreateSerializer(serialization_format)
+    self._serialization_format = serialization_format
+
   def _SerializeAttributeContainer(self, attribute_container):
     """Serializes an attribute container.
 
@@ -447,7 +532,8 @@ class BaseStorageFile(BaseStore):
             'Unable to serialize attribute container: {0:s}.'.format(
                 attribute_container.CONTAINER_TYPE))
 
-      attribute_container_data = attribute_container_data.encode('utf-8')
+      if self._serialization_format == definitions.SERIALIZER_FORMAT_JSON:
+        attribute_container_data = attribute_container_data.encode('utf-8')
 
     finally:
       if self._serializers_profiler:
@@ -510,6 +596,7 @@ class StorageFileMergeReader(StorageMergeReader):
       storage_writer (StorageWriter): storage writer.
     """
     super(StorageFileMergeReader, self).__init__(storage_writer)
+    self._serialization_format = definitions.SERIALIZER_FORMAT_JSON
     self._serializer = json_serializer.JSONAttributeContainerSerializer
     self._serializers_profiler = None
 
@@ -533,18 +620,27 @@ class StorageFileMergeReader(StorageMergeReader):
     if self._serializers_profiler:
       self._serializers_profiler.StartTiming(container_type)
 
-    try:
-      serialized_string = serialized_data.decode('utf-8')
-    except UnicodeDecodeError as exception:
-      raise IOError('Unable to decode serialized data: {0!s}'.format(
-          exception))
-    attribute_container = self._serializer.ReadSerialized(serialized_string)
+    attribute_container = _ReadSerializedAttributeContainer(
+        self._serialization_format, self._serializer, serialized_data)
 
     if self._serializers_profiler:
       self._serializers_profiler.StopTiming(container_type)
 
     return attribute_container
 
+  def _SetSerializationFormat(self, serialization_format):
+    """Sets the serialization format.
+
+    Args:
+      serialization_format (str): serialization format.
+
+    Raises:
+      ValueError: if the serialization format is not supported.
+    """
+    self._serializer = _CreateSerializer(serialization_format)
+    self._serialization_format = serialization_format
+
+
 # pylint: disable=redundant-returns-doc,redundant-yields-doc
 class StorageReader(object):
   """Storage reader interface."""
@@ -597,6 +693,22 @@ class StorageReader(object):
       EventData: event data or None if not available.
     """
 
+  @abc.abstractmethod
+  def GetEVTXXMLTemplateByRowIdentifier(self, row_identifier):
+    """Retrieves an EVTX XML template.
+
+    Args:
+      row_identifier (int): row identifier of the XML template, as stored
+          in the xml_template_row_identifier attribute of event data.
+
+    Returns:
+      WindowsEventLogXMLTemplate: XML template.
+
+    Raises:
+      IOError: if the XML template is missing.
+      OSError: if the XML template is missing.
+    """
+
   @abc.abstractmethod
   def GetEvents(self):
     """Retrieves the events.
@@ -632,6 +744,20 @@ class StorageReader(object):
       EventTag: event tag.
     """
 
+  @abc.abstractmethod
+  def GetEventTimeRanges(self, number_of_time_ranges):
+    """Retrieves time ranges that partition the events.
+
+    Events with the same timestamp are always part of the same time range.
+
+    Args:
+      number_of_time_ranges (int): maximum number of time ranges.
+
+    Returns:
+      list[TimeRange]: time ranges in increasing chronological order or None
+          if the events cannot be partitioned.
+    """
+
   @abc.abstractmethod
   def GetNumberOfAnalysisReports(self):
     """Retrieves the number analysis reports.
@@ -739,6 +865,23 @@ class StorageFileReader(StorageReader):
     """
     return self._storage_file.GetEventDataByIdentifier(identifier)
 
+  def GetEVTXXMLTemplateByRowIdentifier(self, row_identifier):
+    """Retrieves an EVTX XML template.
+
+    Args:
+      row_identifier (int): row identifier of the XML template, as stored
+          in the xml_template_row_identifier attribute of event data.
+
+    Returns:
+      WindowsEventLogXMLTemplate: XML template.
+
+    Raises:
+      IOError: if the XML template is missing.
+      OSError: if the XML template is missing.
+    """
+    return self._storage_file.GetEVTXXMLTemplateByRowIdentifier(
+        row_identifier)
+
   def GetEvents(self):
     """Retrieves the events.
 
@@ -774,6 +917,20 @@ class StorageFileReader(StorageReader):
     """
     return self._storage_file.GetEventTags()
 
+  def GetEventTimeRanges(self, number_of_time_ranges):
+    """Retrieves time ranges that partition the events.
+
+    Events with the same timestamp are always part of the same time range.
+
+    Args:
+      number_of_time_ranges (int): maximum number of time ranges.
+
+    Returns:
+      list[TimeRange]: time ranges in increasing chronological order or None
+          if the events cannot be partitioned.
+    """
+    return self._storage_file.GetEventTimeRanges(number_of_time_ranges)
+
   def GetNumberOfAnalysisReports(self):
     """Retrieves the number analysis reports.
 
@@ -931,6 +1088,22 @@ class StorageWriter(object):
       EventData: event data or None if not available.
     """
 
+  @abc.abstractmethod
+  def GetEVTXXMLTemplateByRowIdentifier(self, row_identifier):
+    """Retrieves an EVTX XML template.
+
+    Args:
+      row_identifier (int): row identifier of the XML template, as stored
+          in the xml_template_row_identifier attribute of event data.
+
+    Returns:
+      WindowsEventLogXMLTemplate: XML template.
+
+    Raises:
+      IOError: if the XML template is missing.
+      OSError: if the XML template is missing.
+    """
+
   @abc.abstractmethod
   def GetEvents(self):
     """Retrieves the events.
@@ -1365,6 +1538,23 @@ class StorageFileWriter(StorageWriter):
     """
     return self._storage_file.GetEventDataByIdentifier(identifier)
 
+  def GetEVTXXMLTemplateByRowIdentifier(self, row_identifier):
+    """Retrieves an EVTX XML template.
+
+    Args:
+      row_identifier (int): row identifier of the XML template, as stored
+          in the xml_template_row_identifier attribute of event data.
+
+    Returns:
+      WindowsEventLogXMLTemplate: XML template.
+
+    Raises:
+      IOError: if the XML template is missing.
+      OSError: if the XML template is missing.
+    """
+    return self._storage_file.GetEVTXXMLTemplateByRowIdentifier(
+        row_identifier)
+
   def GetEvents(self):
     """Retrieves the events.
 
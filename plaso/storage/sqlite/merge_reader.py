@@ -11,7 +11,9 @@ from plaso.containers import errors
 from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import reports
+from plaso.containers import storage_media
 from plaso.containers import tasks
+from plaso.containers import windows_events
 from plaso.lib import definitions
 from plaso.storage import identifiers
 from plaso.storage import interface
@@ -25,7 +27,10 @@ class SQLiteStorageMergeReader(interface.StorageFileMergeReader):
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVTX_XML_TEMPLATE = (
+      windows_events.WindowsEventLogXMLTemplate.CONTAINER_TYPE)
   _CONTAINER_TYPE_EXTRACTION_ERROR = errors.ExtractionError.CONTAINER_TYPE
+  _CONTAINER_TYPE_PATH_SPEC = storage_media.PathSpecification.CONTAINER_TYPE
   _CONTAINER_TYPE_TASK_COMPLETION = tasks.TaskCompletion.CONTAINER_TYPE
   _CONTAINER_TYPE_TASK_START = tasks.TaskStart.CONTAINER_TYPE
 
@@ -49,6 +54,13 @@ class SQLiteStorageMergeReader(interface.StorageFileMergeReader):
       _CONTAINER_TYPE_EXTRACTION_ERROR: '_AddError',
   }
 
+  # Attribute name of the path specification per container type that can
+  # reference a path specification in the path_spec table.
+  _PATH_SPEC_ATTRIBUTE_NAMES = {
+      _CONTAINER_TYPE_EVENT_DATA: 'pathspec',
+      _CONTAINER_TYPE_EVENT_SOURCE: 'path_spec',
+      _CONTAINER_TYPE_EXTRACTION_ERROR: 'path_spec'}
+
   _TABLE_NAMES_QUERY = (
       'SELECT name FROM sqlite_master WHERE type = "table"')
 
@@ -73,7 +85,9 @@ class SQLiteStorageMergeReader(interface.StorageFileMergeReader):
     self._container_types = None
     self._cursor = None
     self._event_data_identifier_mappings = {}
+    self._evtx_xml_templates = {}
     self._path = path
+    self._path_specs = {}
 
     # Create a runtime lookup table for the add container type method. This
     # prevents having to create a series of if-else checks for container types.
@@ -158,6 +172,8 @@ class SQLiteStorageMergeReader(interface.StorageFileMergeReader):
     self._connection.close()
     self._connection = None
     self._cursor = None
+    self._evtx_xml_templates = {}
+    self._path_specs = {}
 
   def _GetContainerTypes(self):
     """Retrieves the container types to merge.
@@ -184,6 +200,52 @@ class SQLiteStorageMergeReader(interface.StorageFileMergeReader):
         self._path, detect_types=sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES)
     self._cursor = self._connection.cursor()
 
+  def _ReadEVTXXMLTemplates(self):
+    """Reads the EVTX XML templates referenced by the task storage."""
+    self._evtx_xml_templates = {}
+
+    self._cursor.execute(self._TABLE_NAMES_QUERY)
+    table_names = [row[0] for row in self._cursor.fetchall()]
+    if self._CONTAINER_TYPE_EVTX_XML_TEMPLATE not in table_names:
+      return
+
+    query = 'SELECT _identifier, _data FROM {0:s}'.format(
+        self._CONTAINER_TYPE_EVTX_XML_TEMPLATE)
+    self._cursor.execute(query)
+
+    for row in self._cursor.fetchall():
+      if self._compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+        serialized_data = zlib.decompress(row[1])
+      else:
+        serialized_data = row[1]
+
+      xml_template = self._DeserializeAttributeContainer(
+          self._CONTAINER_TYPE_EVTX_XML_TEMPLATE, serialized_data)
+      self._evtx_xml_templates[row[0]] = xml_template.template
+
+  def _ReadPathSpecs(self):
+    """Reads the path specifications referenced by the task storage."""
+    self._path_specs = {}
+
+    self._cursor.execute(self._TABLE_NAMES_QUERY)
+    table_names = [row[0] for row in self._cursor.fetchall()]
+    if self._CONTAINER_TYPE_PATH_SPEC not in table_names:
+      return
+
+    query = 'SELECT _identifier, _data FROM {0:s}'.format(
+        self._CONTAINER_TYPE_PATH_SPEC)
+    self._cursor.execute(query)
+
+    for row in self._cursor.fetchall():
+      if self._compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+        serialized_data = zlib.decompress(row[1])
+      else:
+        serialized_data = row[1]
+
+      path_spec_container = self._DeserializeAttributeContainer(
+          self._CONTAINER_TYPE_PATH_SPEC, serialized_data)
+      self._path_specs[row[0]] = path_spec_container.path_spec
+
   def _ReadStorageMetadata(self):
     """Reads the task storage metadata."""
     query = 'SELECT key, value FROM metadata'
@@ -193,6 +255,10 @@ class SQLiteStorageMergeReader(interface.StorageFileMergeReader):
 
     self._compression_format = metadata_values['compression_format']
 
+    serialization_format = metadata_values.get(
+        'serialization_format', definitions.SERIALIZER_FORMAT_JSON)
+    self._SetSerializationFormat(serialization_format)
+
   def _PrepareForNextContainerType(self):
     """Prepares for the next container type.
 
@@ -236,6 +302,8 @@ class SQLiteStorageMergeReader(interface.StorageFileMergeReader):
     if not self._cursor:
       self._Open()
       self._ReadStorageMetadata()
+      self._ReadEVTXXMLTemplates()
+      self._ReadPathSpecs()
       self._container_types = self._GetContainerTypes()
 
     number_of_containers = 0
@@ -274,6 +342,28 @@ class SQLiteStorageMergeReader(interface.StorageFileMergeReader):
 
           del attribute_container.event_row_identifier
 
+        elif self._active_container_type in self._PATH_SPEC_ATTRIBUTE_NAMES:
+          row_identifier = getattr(
+              attribute_container, 'path_spec_row_identifier', None)
+          if row_identifier is not None:
+            path_spec_attribute_name = self._PATH_SPEC_ATTRIBUTE_NAMES[
+                self._active_container_type]
+            setattr(
+                attribute_container, path_spec_attribute_name,
+                self._path_specs[row_identifier])
+
+            del attribute_container.path_spec_row_identifier
+
+        if self._active_container_type == self._CONTAINER_TYPE_EVENT_DATA:
+          # The XML template is stored once again by the session storage.
+          row_identifier = getattr(
+              attribute_container, 'xml_template_row_identifier', None)
+          if row_identifier is not None:
+            attribute_container.xml_template = self._evtx_xml_templates[
+                row_identifier]
+
+            del attribute_container.xml_template_row_identifier
+
         if callback:
           callback(self._storage_writer, attribute_container)
 
@@ -10,12 +10,19 @@ from plaso.storage.sqlite import sqlite_file
 class SQLiteStorageFileReader(interface.StorageFileReader):
   """SQLite-based storage file reader."""
 
-  def __init__(self, path):
+  def __init__(self, path, cache_size=None, event_data_cache_size=None):
     """Initializes a storage reader.
 
     Args:
       path (str): path to the input file.
+      cache_size (Optional[int]): SQLite page cache size, where a positive
+          value represents a number of pages and a negative value a size in
+          KiB, or None to use the SQLite default.
+      event_data_cache_size (Optional[int]): maximum number of deserialized
+          event data attribute containers to cache, where None represents
+          the default and 0 disables the cache.
     """
     super(SQLiteStorageFileReader, self).__init__(path)
-    self._storage_file = sqlite_file.SQLiteStorageFile()
+    self._storage_file = sqlite_file.SQLiteStorageFile(
+        cache_size=cache_size, event_data_cache_size=event_data_cache_size)
     self._storage_file.Open(path=path)
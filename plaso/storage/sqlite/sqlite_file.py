@@ -5,20 +5,106 @@ from __future__ import unicode_literals
 
 import os
 import sqlite3
+import threading
+import time
 import zlib
 
+# The 'Queue' module was renamed to 'queue' in Python 3
+try:
+  import Queue
+except ImportError:
+  import queue as Queue  # pylint: disable=import-error
+
 from plaso.containers import artifacts
 from plaso.containers import errors
 from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import reports
 from plaso.containers import sessions
+from plaso.containers import storage_media
 from plaso.containers import tasks
+from plaso.containers import windows_events
+from plaso.lib import cachelib
 from plaso.lib import definitions
 from plaso.storage import event_heaps
 from plaso.storage import identifiers
 from plaso.storage import interface
 from plaso.storage import logger
+from plaso.storage import time_range as storage_time_range
+
+
+class _BackgroundIterator(object):
+  """Iterator that retrieves the values of another iterator in a thread.
+
+  This allows values to be produced, for example compressed, while the
+  consumer of the values is waiting for I/O.
+  """
+
+  _END_OF_ITERATION = object()
+
+  def __init__(self, iterator, maximum_number_of_queued_values=4):
+    """Initializes a background iterator.
+
+    Args:
+      iterator (iterator): iterator of which the values are retrieved in
+          a separate thread.
+      maximum_number_of_queued_values (Optional[int]): maximum number of
+          values retrieved in advance.
+    """
+    super(_BackgroundIterator, self).__init__()
+    self._abort = False
+    self._exception = None
+    self._iterator = iterator
+    self._queue = Queue.Queue(maxsize=maximum_number_of_queued_values)
+    self._thread = threading.Thread(
+        name='Background iterator', target=self._ThreadMain)
+    self._thread.daemon = True
+    self._thread.start()
+
+  def __iter__(self):
+    """Retrieves the values.
+
+    Yields:
+      object: value.
+
+    Raises:
+      Exception: if the iterator raised an exception.
+    """
+    try:
+      while True:
+        value = self._queue.get()
+        if value is self._END_OF_ITERATION:
+          break
+
+        yield value
+
+    finally:
+      # Unblock the thread in case the consumer stopped early.
+      self._abort = True
+      while self._thread.is_alive():
+        try:
+          self._queue.get(timeout=0.1)
+        except Queue.Empty:
+          pass
+
+      self._thread.join()
+
+    if self._exception:
+      raise self._exception  # pylint: disable=raising-bad-type
+
+  def _ThreadMain(self):
+    """Main function of the thread."""
+    try:
+      for value in self._iterator:
+        if self._abort:
+          break
+        self._queue.put(value)
+
+    except Exception as exception:  # pylint: disable=broad-except
+      self._exception = exception
+
+    finally:
+      self._queue.put(self._END_OF_ITERATION)
 
 
 class SQLiteStorageFile(interface.BaseStorageFile):
@@ -30,7 +116,7 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     storage_type (str): storage type.
   """
 
-  _FORMAT_VERSION = 20180101
+  _FORMAT_VERSION = 20181018
 
   # The earliest format version, stored in-file, that this class
   # is able to read.
@@ -41,7 +127,10 @@ class SQLiteStorageFile(interface.BaseStorageFile):
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVTX_XML_TEMPLATE = (
+      windows_events.WindowsEventLogXMLTemplate.CONTAINER_TYPE)
   _CONTAINER_TYPE_EXTRACTION_ERROR = errors.ExtractionError.CONTAINER_TYPE
+  _CONTAINER_TYPE_PATH_SPEC = storage_media.PathSpecification.CONTAINER_TYPE
   _CONTAINER_TYPE_SESSION_COMPLETION = sessions.SessionCompletion.CONTAINER_TYPE
   _CONTAINER_TYPE_SESSION_START = sessions.SessionStart.CONTAINER_TYPE
   _CONTAINER_TYPE_SYSTEM_CONFIGURATION = (
@@ -56,6 +145,8 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       _CONTAINER_TYPE_EVENT_DATA,
       _CONTAINER_TYPE_EVENT_SOURCE,
       _CONTAINER_TYPE_EVENT_TAG,
+      _CONTAINER_TYPE_EVTX_XML_TEMPLATE,
+      _CONTAINER_TYPE_PATH_SPEC,
       _CONTAINER_TYPE_SESSION_COMPLETION,
       _CONTAINER_TYPE_SESSION_START,
       _CONTAINER_TYPE_SYSTEM_CONFIGURATION,
@@ -68,6 +159,15 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       _CONTAINER_TYPE_EVENT_DATA,
       _CONTAINER_TYPE_EVENT_SOURCE)
 
+  # Path specifications of these container types are stored once in the
+  # path_spec table, which the attribute containers reference by row
+  # identifier, instead of being serialized as part of every attribute
+  # container.
+  _PATH_SPEC_ATTRIBUTE_NAMES = {
+      _CONTAINER_TYPE_EVENT_DATA: 'pathspec',
+      _CONTAINER_TYPE_EVENT_SOURCE: 'path_spec',
+      _CONTAINER_TYPE_EXTRACTION_ERROR: 'path_spec'}
+
   _CREATE_METADATA_TABLE_QUERY = (
       'CREATE TABLE metadata (key TEXT, value TEXT);')
 
@@ -82,40 +182,126 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       '_timestamp BIGINT,'
       '_data {1:s});')
 
+  _CREATE_EVENT_TIMESTAMP_INDEX_QUERY = (
+      'CREATE INDEX IF NOT EXISTS {0:s} ON event (_timestamp);')
+
+  _EVENT_TIMESTAMP_INDEX_NAME = 'event_timestamp_index'
+
+  _HAS_INDEX_QUERY = (
+      'SELECT name FROM sqlite_master '
+      'WHERE type = "index" AND name = "{0:s}"')
+
   _HAS_TABLE_QUERY = (
       'SELECT name FROM sqlite_master '
       'WHERE type = "table" AND name = "{0:s}"')
 
+  # The default maximum number of deserialized event data attribute
+  # containers that are cached.
+  _DEFAULT_EVENT_DATA_CACHE_SIZE = 32 * 1024
+
+  # The default maximum number of deserialized path specifications that
+  # are cached.
+  _DEFAULT_PATH_SPEC_CACHE_SIZE = 64 * 1024
+
+  # The default maximum number of interned parent path specifications
+  # that are cached.
+  _DEFAULT_PATH_SPEC_PARENT_CACHE_SIZE = 4 * 1024
+
+  # The default maximum number of Windows XML EventLog (EVTX) XML templates
+  # that are cached.
+  _DEFAULT_EVTX_XML_TEMPLATE_CACHE_SIZE = 4 * 1024
+
+  # The number of events that are read before the event data they reference
+  # is read in a single query.
+  _EVENT_DATA_PREFETCH_BATCH_SIZE = 512
+
   # The maximum buffer size of serialized data before triggering
   # a flush to disk (64 MiB).
   _MAXIMUM_BUFFER_SIZE = 64 * 1024 * 1024
 
+  # The number of serialized attribute containers that are compressed
+  # and inserted per batch when the buffer is flushed to disk.
+  _WRITE_BATCH_SIZE = 1024
+
+  SUPPORTED_JOURNAL_MODES = frozenset([
+      'DELETE', 'MEMORY', 'OFF', 'PERSIST', 'TRUNCATE', 'WAL'])
+
   def __init__(
-      self, maximum_buffer_size=0,
+      self, cache_size=None, event_data_cache_size=None, journal_mode=None,
+      maximum_buffer_size=0, page_size=None,
+      serialization_format=definitions.SERIALIZER_FORMAT_JSON,
       storage_type=definitions.STORAGE_TYPE_SESSION):
     """Initializes a store.
 
     Args:
+      cache_size (Optional[int]): SQLite page cache size, where a positive
+          value represents a number of pages and a negative value a size in
+          KiB, or None to use the SQLite default.
+      event_data_cache_size (Optional[int]): maximum number of deserialized
+          event data attribute containers to cache, where None represents
+          the default of _DEFAULT_EVENT_DATA_CACHE_SIZE and 0 disables
+          the cache.
+      journal_mode (Optional[str]): SQLite journal mode used when the storage
+          is opened for writing, such as "MEMORY" or "WAL", or None to use
+          the SQLite default.
       maximum_buffer_size (Optional[int]):
           maximum size of a single storage stream. A value of 0 indicates
           the limit is _MAXIMUM_BUFFER_SIZE.
+      page_size (Optional[int]): SQLite page size in bytes used when the
+          storage is created, or None to use the SQLite default.
+      serialization_format (Optional[str]): serialization format used when
+          the storage is created. The serialization format of an existing
+          storage is read from its metadata.
       storage_type (Optional[str]): storage type.
 
     Raises:
-      ValueError: if the maximum buffer size value is out of bounds.
+      ValueError: if the maximum buffer size value, the event data cache
+          size, the journal mode, the page size or the serialization format
+          is out of bounds or not supported.
     """
     if (maximum_buffer_size < 0 or
         maximum_buffer_size > self._MAXIMUM_BUFFER_SIZE):
       raise ValueError('Maximum buffer size value out of bounds.')
 
+    if journal_mode is not None:
+      journal_mode = journal_mode.upper()
+      if journal_mode not in self.SUPPORTED_JOURNAL_MODES:
+        raise ValueError('Unsupported journal mode: {0:s}.'.format(
+            journal_mode))
+
+    # The SQLite page size must be a power of 2 between 512 and 65536.
+    if page_size is not None and (
+        page_size < 512 or page_size > 65536 or page_size & (page_size - 1)):
+      raise ValueError('Page size value out of bounds.')
+
     if not maximum_buffer_size:
       maximum_buffer_size = self._MAXIMUM_BUFFER_SIZE
 
+    if event_data_cache_size is None:
+      event_data_cache_size = self._DEFAULT_EVENT_DATA_CACHE_SIZE
+
     super(SQLiteStorageFile, self).__init__()
+    self._cache_size = cache_size
     self._connection = None
     self._cursor = None
+    self._event_data_cache = cachelib.LeastRecentlyUsedCache(
+        event_data_cache_size)
+    self._evtx_xml_template_cache = cachelib.LeastRecentlyUsedCache(
+        self._DEFAULT_EVTX_XML_TEMPLATE_CACHE_SIZE)
+    self._evtx_xml_template_row_identifiers = None
+    self._is_new_storage_file = False
+    self._journal_mode = journal_mode
+    self._last_path_spec_parent = None
+    self._last_path_spec_parent_identifier = None
+    self._last_path_spec_parent_number = 0
     self._last_session = 0
     self._maximum_buffer_size = maximum_buffer_size
+    self._page_size = page_size
+    self._path_spec_cache = cachelib.LeastRecentlyUsedCache(
+        self._DEFAULT_PATH_SPEC_CACHE_SIZE)
+    self._path_spec_parent_identifiers = cachelib.LeastRecentlyUsedCache(
+        self._DEFAULT_PATH_SPEC_PARENT_CACHE_SIZE)
+    self._path_spec_row_identifiers = None
     self._serialized_event_heap = event_heaps.SerializedEventHeap()
 
     if storage_type == definitions.STORAGE_TYPE_SESSION:
@@ -124,9 +310,11 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       self.compression_format = definitions.COMPRESSION_FORMAT_NONE
 
     self.format_version = self._FORMAT_VERSION
-    self.serialization_format = definitions.SERIALIZER_FORMAT_JSON
+    self.serialization_format = serialization_format
     self.storage_type = storage_type
 
+    self._SetSerializationFormat(serialization_format)
+
   def _AddAttributeContainer(self, container_type, attribute_container):
     """Adds an attribute container.
 
@@ -144,7 +332,44 @@ class SQLiteStorageFile(interface.BaseStorageFile):
         container_type, container_list.next_sequence_number + 1)
     attribute_container.SetIdentifier(identifier)
 
-    serialized_data = self._SerializeAttributeContainer(attribute_container)
+    path_spec_attribute_name = self._PATH_SPEC_ATTRIBUTE_NAMES.get(
+        container_type, None)
+    path_spec = None
+    if path_spec_attribute_name:
+      path_spec = getattr(attribute_container, path_spec_attribute_name, None)
+
+    xml_template = None
+    if container_type == self._CONTAINER_TYPE_EVENT_DATA:
+      xml_template = getattr(attribute_container, 'xml_template', None)
+
+    if not path_spec and not xml_template:
+      serialized_data = self._SerializeAttributeContainer(attribute_container)
+
+    else:
+      # The path specification and XML template are temporarily replaced by
+      # a reference to the path_spec and evtx_xml_template table while the
+      # attribute container is serialized.
+      if path_spec:
+        attribute_container.path_spec_row_identifier = (
+            self._GetPathSpecRowIdentifier(path_spec))
+        setattr(attribute_container, path_spec_attribute_name, None)
+
+      if xml_template:
+        attribute_container.xml_template_row_identifier = (
+            self._GetEVTXXMLTemplateRowIdentifier(xml_template))
+        attribute_container.xml_template = None
+
+      try:
+        serialized_data = self._SerializeAttributeContainer(
+            attribute_container)
+      finally:
+        if path_spec:
+          setattr(attribute_container, path_spec_attribute_name, path_spec)
+          del attribute_container.path_spec_row_identifier
+
+        if xml_template:
+          attribute_container.xml_template = xml_template
+          del attribute_container.xml_template_row_identifier
 
     container_list.PushAttributeContainer(serialized_data)
 
@@ -212,7 +437,7 @@ class SQLiteStorageFile(interface.BaseStorageFile):
           compression_format))
 
     serialization_format = metadata_values.get('serialization_format', None)
-    if serialization_format != definitions.SERIALIZER_FORMAT_JSON:
+    if serialization_format not in definitions.SERIALIZER_FORMATS:
       raise IOError('Unsupported serialization format: {0:s}'.format(
           serialization_format))
 
@@ -292,6 +517,9 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       attribute_container = self._DeserializeAttributeContainer(
           container_type, serialized_data)
       attribute_container.SetIdentifier(identifier)
+
+      if container_type in self._PATH_SPEC_ATTRIBUTE_NAMES:
+        self._ReadPathSpecReference(container_type, attribute_container)
       return attribute_container
 
     count = self._CountStoredAttributeContainers(container_type)
@@ -306,18 +534,23 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       identifier = identifiers.SQLTableIdentifier(
           container_type, sequence_number)
       attribute_container.SetIdentifier(identifier)
+
+      if container_type in self._PATH_SPEC_ATTRIBUTE_NAMES:
+        self._ReadPathSpecReference(container_type, attribute_container)
     return attribute_container
 
   # TODO: determine if this method should account for non-stored attribute
   # containers or that it is better to rename the method to
   # _GetStoredAttributeContainers.
   def _GetAttributeContainers(
-      self, container_type, filter_expression=None, order_by=None):
+      self, container_type, filter_expression=None, index_name=None,
+      order_by=None):
     """Retrieves a specific type of stored attribute containers.
 
     Args:
       container_type (str): attribute container type.
       filter_expression (Optional[str]): expression to filter results by.
+      index_name (Optional[str]): name of the index the query should use.
       order_by (Optional[str]): name of a column to order the results by.
 
     Yields:
@@ -328,6 +561,8 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       OSError: when there is an error querying the storage file.
     """
     query = 'SELECT _identifier, _data FROM {0:s}'.format(container_type)
+    if index_name:
+      query = '{0:s} INDEXED BY {1:s}'.format(query, index_name)
     if filter_expression:
       query = '{0:s} WHERE {1:s}'.format(query, filter_expression)
     if order_by:
@@ -342,6 +577,9 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       raise IOError('Unable to query storage file with error: {0!s}'.format(
           exception))
 
+    has_path_spec_references = (
+        container_type in self._PATH_SPEC_ATTRIBUTE_NAMES)
+
     row = cursor.fetchone()
     while row:
       identifier = identifiers.SQLTableIdentifier(container_type, row[0])
@@ -358,10 +596,207 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       attribute_container = self._DeserializeAttributeContainer(
           container_type, serialized_data)
       attribute_container.SetIdentifier(identifier)
+
+      if has_path_spec_references:
+        self._ReadPathSpecReference(container_type, attribute_container)
+
       yield attribute_container
 
       row = cursor.fetchone()
 
+  def _GetEVTXXMLTemplateRowIdentifier(self, template):
+    """Retrieves the row identifier of an EVTX XML template.
+
+    XML templates that are not yet stored in the evtx_xml_template table are
+    added to it.
+
+    Args:
+      template (str): XML template.
+
+    Returns:
+      int: row identifier of the XML template.
+    """
+    if self._evtx_xml_template_row_identifiers is None:
+      # XML templates stored by a previous session are read once when
+      # the storage is appended to.
+      self._evtx_xml_template_row_identifiers = {}
+      for xml_template in self._GetAttributeContainers(
+          self._CONTAINER_TYPE_EVTX_XML_TEMPLATE):
+        identifier = xml_template.GetIdentifier()
+        self._evtx_xml_template_row_identifiers[xml_template.template] = (
+            identifier.row_identifier)
+
+    row_identifier = self._evtx_xml_template_row_identifiers.get(
+        template, None)
+    if row_identifier is None:
+      xml_template = windows_events.WindowsEventLogXMLTemplate(
+          template=template)
+      self._WriteAttributeContainer(xml_template)
+
+      identifier = xml_template.GetIdentifier()
+      row_identifier = identifier.row_identifier
+      self._evtx_xml_template_row_identifiers[template] = row_identifier
+
+    return row_identifier
+
+  def _GetPathSpecByRowIdentifier(self, row_identifier):
+    """Retrieves a path specification stored in the path_spec table.
+
+    Path specifications are cached by row identifier, so that a path
+    specification shared by multiple attribute containers is only read and
+    deserialized once.
+
+    Args:
+      row_identifier (int): row identifier of the path specification.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+
+    Raises:
+      IOError: if the path specification is missing.
+      OSError: if the path specification is missing.
+    """
+    path_spec = self._path_spec_cache.GetValue(row_identifier)
+    if not path_spec:
+      path_spec_container = self._GetAttributeContainerByIndex(
+          self._CONTAINER_TYPE_PATH_SPEC, row_identifier - 1)
+      if not path_spec_container or not path_spec_container.path_spec:
+        raise IOError('Missing path specification: {0:d}'.format(
+            row_identifier))
+
+      path_spec = path_spec_container.path_spec
+      self._path_spec_cache.SetValue(row_identifier, path_spec)
+
+    return path_spec
+
+  def _GetPathSpecLookupKey(self, path_spec):
+    """Retrieves the lookup key of a path specification.
+
+    The lookup key consists of the identifier of the interned parent chain
+    and the attributes of the path specification itself. Unlike the
+    comparable of the path specification, that is rebuilt from the entire
+    parent chain every time it is accessed, the parent chain is only
+    interned once for consecutive path specifications with the same parent.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      tuple[int, tuple[object]]: lookup key of the path specification.
+    """
+    parent_path_spec = path_spec.parent
+    if parent_path_spec is None:
+      parent_identifier = 0
+
+    elif parent_path_spec is self._last_path_spec_parent:
+      parent_identifier = self._last_path_spec_parent_identifier
+
+    else:
+      parent_identifier = self._InternPathSpecParent(parent_path_spec)
+      self._last_path_spec_parent = parent_path_spec
+      self._last_path_spec_parent_identifier = parent_identifier
+
+    attribute_values = [path_spec.type_indicator]
+    for name, value in sorted(path_spec.__dict__.items()):
+      if name != 'parent' and value is not None:
+        attribute_values.append((name, value))
+
+    return parent_identifier, tuple(attribute_values)
+
+  def _GetPathSpecRowIdentifier(self, path_spec):
+    """Retrieves the row identifier of a path specification.
+
+    Path specifications that are not yet stored in the path_spec table are
+    added to it. The row identifiers are kept in a bounded cache, hence a
+    path specification that was evicted from the cache is stored again in
+    a new row. Both rows resolve to the same path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      int: row identifier of the path specification.
+    """
+    if self._path_spec_row_identifiers is None:
+      # Path specifications stored by a previous session are read once
+      # when the storage is appended to. Only the most recently stored
+      # ones are retained by the cache.
+      self._path_spec_row_identifiers = cachelib.LeastRecentlyUsedCache(
+          self._DEFAULT_PATH_SPEC_CACHE_SIZE)
+      for path_spec_container in self._GetAttributeContainers(
+          self._CONTAINER_TYPE_PATH_SPEC):
+        identifier = path_spec_container.GetIdentifier()
+        lookup_key = self._GetPathSpecLookupKey(path_spec_container.path_spec)
+        self._path_spec_row_identifiers.SetValue(
+            lookup_key, identifier.row_identifier)
+
+    lookup_key = self._GetPathSpecLookupKey(path_spec)
+    row_identifier = self._path_spec_row_identifiers.GetValue(lookup_key)
+    if row_identifier is None:
+      path_spec_container = storage_media.PathSpecification(
+          path_spec=path_spec)
+      self._WriteAttributeContainer(path_spec_container)
+
+      identifier = path_spec_container.GetIdentifier()
+      row_identifier = identifier.row_identifier
+      self._path_spec_row_identifiers.SetValue(lookup_key, row_identifier)
+
+    return row_identifier
+
+  def _InternPathSpecParent(self, path_spec):
+    """Interns the parent chain of a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): parent path specification.
+
+    Returns:
+      int: identifier of the interned parent chain, which is never 0.
+    """
+    lookup_key = self._GetPathSpecLookupKey(path_spec)
+    parent_identifier = self._path_spec_parent_identifiers.GetValue(
+        lookup_key)
+    if parent_identifier is None:
+      self._last_path_spec_parent_number += 1
+      parent_identifier = self._last_path_spec_parent_number
+      self._path_spec_parent_identifiers.SetValue(
+          lookup_key, parent_identifier)
+
+    return parent_identifier
+
+  def _ReadEventDataIntoCache(self, events):
+    """Reads the event data referenced by events into the event data cache.
+
+    The event data that is not already cached is read with a single query.
+
+    Args:
+      events (list[EventObject]): events.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    row_identifiers = set()
+    for event in events:
+      event_data_identifier = event.GetEventDataIdentifier()
+      if not event_data_identifier:
+        continue
+
+      row_identifier = event_data_identifier.row_identifier
+      if row_identifier not in self._event_data_cache:
+        row_identifiers.add(row_identifier)
+
+    if not row_identifiers:
+      return
+
+    filter_expression = '_identifier IN ({0:s})'.format(', '.join([
+        '{0:d}'.format(row_identifier)
+        for row_identifier in sorted(row_identifiers)]))
+
+    for event_data in self._GetAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_DATA, filter_expression=filter_expression):
+      identifier = event_data.GetIdentifier()
+      self._event_data_cache.SetValue(identifier.row_identifier, event_data)
+
   # TODO: determine if this method should account for non-stored attribute
   # containers or that it is better to rename the method to
   # _HasStoredAttributeContainers.
@@ -378,6 +813,20 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     count = self._CountStoredAttributeContainers(container_type)
     return count > 0
 
+  def _HasIndex(self, index_name):
+    """Determines if a specific index exists.
+
+    Args:
+      index_name (str): name of the index.
+
+    Returns:
+      bool: True if the index exists, false otherwise.
+    """
+    query = self._HAS_INDEX_QUERY.format(index_name)
+
+    self._cursor.execute(query)
+    return bool(self._cursor.fetchone())
+
   def _HasTable(self, table_name):
     """Determines if a specific table exists.
 
@@ -392,6 +841,27 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     self._cursor.execute(query)
     return bool(self._cursor.fetchone())
 
+  def _ReadPathSpecReference(self, container_type, attribute_container):
+    """Replaces a path specification reference by the path specification.
+
+    Args:
+      container_type (str): attribute container type.
+      attribute_container (AttributeContainer): attribute container.
+
+    Raises:
+      IOError: if the path specification is missing.
+      OSError: if the path specification is missing.
+    """
+    row_identifier = getattr(
+        attribute_container, 'path_spec_row_identifier', None)
+    if row_identifier is not None:
+      path_spec = self._GetPathSpecByRowIdentifier(row_identifier)
+      setattr(
+          attribute_container, self._PATH_SPEC_ATTRIBUTE_NAMES[container_type],
+          path_spec)
+
+      del attribute_container.path_spec_row_identifier
+
   def _ReadStorageMetadata(self):
     """Reads the storage metadata."""
     query = 'SELECT key, value FROM metadata'
@@ -406,6 +876,8 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     self.serialization_format = metadata_values['serialization_format']
     self.storage_type = metadata_values['storage_type']
 
+    self._SetSerializationFormat(self.serialization_format)
+
   def _WriteAttributeContainer(self, attribute_container):
     """Writes an attribute container.
 
@@ -442,6 +914,50 @@ class SQLiteStorageFile(interface.BaseStorageFile):
         attribute_container.CONTAINER_TYPE, self._cursor.lastrowid)
     attribute_container.SetIdentifier(identifier)
 
+  def _GetValuesTupleLists(
+      self, container_type, container_list, number_of_attribute_containers):
+    """Retrieves batches of values to insert from serialized containers.
+
+    Args:
+      container_type (str): attribute container type.
+      container_list (SerializedAttributeContainerList): serialized attribute
+          container list or None if the container type is event.
+      number_of_attribute_containers (int): number of serialized attribute
+          containers to retrieve.
+
+    Yields:
+      list[tuple[object]]: values to insert into the table of the container
+          type, per row.
+    """
+    values_tuple_list = []
+    for _ in range(number_of_attribute_containers):
+      if container_type == self._CONTAINER_TYPE_EVENT:
+        timestamp, serialized_data = self._serialized_event_heap.PopEvent()
+      else:
+        serialized_data = container_list.PopAttributeContainer()
+
+      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+        compressed_data = zlib.compress(serialized_data)
+        serialized_data = sqlite3.Binary(compressed_data)
+      else:
+        compressed_data = ''
+
+      if self._storage_profiler:
+        self._storage_profiler.Sample(
+            'write', container_type, len(serialized_data), len(compressed_data))
+
+      if container_type == self._CONTAINER_TYPE_EVENT:
+        values_tuple_list.append((timestamp, serialized_data))
+      else:
+        values_tuple_list.append((serialized_data, ))
+
+      if len(values_tuple_list) >= self._WRITE_BATCH_SIZE:
+        yield values_tuple_list
+        values_tuple_list = []
+
+    if values_tuple_list:
+      yield values_tuple_list
+
   def _WriteSerializedAttributeContainerList(self, container_type):
     """Writes a serialized attribute container list.
 
@@ -468,33 +984,24 @@ class SQLiteStorageFile(interface.BaseStorageFile):
 
     if container_type == self._CONTAINER_TYPE_EVENT:
       query = 'INSERT INTO event (_timestamp, _data) VALUES (?, ?)'
+      container_list = None
     else:
       query = 'INSERT INTO {0:s} (_data) VALUES (?)'.format(container_type)
 
-    # TODO: directly use container_list instead of values_tuple_list.
-    values_tuple_list = []
-    for _ in range(number_of_attribute_containers):
-      if container_type == self._CONTAINER_TYPE_EVENT:
-        timestamp, serialized_data = self._serialized_event_heap.PopEvent()
-      else:
-        serialized_data = container_list.PopAttributeContainer()
-
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        compressed_data = zlib.compress(serialized_data)
-        serialized_data = sqlite3.Binary(compressed_data)
-      else:
-        compressed_data = ''
+    values_tuple_lists = self._GetValuesTupleLists(
+        container_type, container_list, number_of_attribute_containers)
 
-      if self._storage_profiler:
-        self._storage_profiler.Sample(
-            'write', container_type, len(serialized_data), len(compressed_data))
+    # Compress the next batch in a separate thread while the current batch
+    # is inserted, zlib and SQLite both release the GIL while busy.
+    if (self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB and
+        number_of_attribute_containers > self._WRITE_BATCH_SIZE):
+      values_tuple_lists = _BackgroundIterator(values_tuple_lists)
 
-      if container_type == self._CONTAINER_TYPE_EVENT:
-        values_tuple_list.append((timestamp, serialized_data))
-      else:
-        values_tuple_list.append((serialized_data, ))
+    # The batches are inserted in a single transaction.
+    for values_tuple_list in values_tuple_lists:
+      self._cursor.executemany(query, values_tuple_list)
 
-    self._cursor.executemany(query, values_tuple_list)
+    self._connection.commit()
 
     if self._serializers_profiler:
       self._serializers_profiler.StopTiming('write')
@@ -701,6 +1208,42 @@ class SQLiteStorageFile(interface.BaseStorageFile):
       self._WriteSerializedAttributeContainerList(
           self._CONTAINER_TYPE_EXTRACTION_ERROR)
 
+      # The event timestamp index is only created for session stores since
+      # task stores are read back in insertion order when merged. Once
+      # created SQLite maintains the index when events are appended. The
+      # index is not created for existing stores, such as stores opened
+      # for analysis, since that can take a long time. These can be upgraded
+      # with pinfo instead.
+      if (self._is_new_storage_file and
+          self.storage_type == definitions.STORAGE_TYPE_SESSION and
+          not self._HasIndex(self._EVENT_TIMESTAMP_INDEX_NAME)):
+        number_of_events = self._CountStoredAttributeContainers(
+            self._CONTAINER_TYPE_EVENT)
+        logger.info((
+            'Creating event timestamp index of {0:d} events, which can take '
+            'a while.').format(number_of_events))
+
+        start_time = time.time()
+        self.CreateEventTimestampIndex()
+
+        logger.info('Created event timestamp index in {0:.2f} seconds.'.format(
+            time.time() - start_time))
+
+    if self._event_data_cache.number_of_hits:
+      logger.debug((
+          'Event data cache hits: {0:d}, misses: {1:d}').format(
+              self._event_data_cache.number_of_hits,
+              self._event_data_cache.number_of_misses))
+
+    self._event_data_cache.Empty()
+    self._evtx_xml_template_cache.Empty()
+    self._evtx_xml_template_row_identifiers = None
+    self._last_path_spec_parent = None
+    self._last_path_spec_parent_identifier = None
+    self._path_spec_cache.Empty()
+    self._path_spec_parent_identifiers.Empty()
+    self._path_spec_row_identifiers = None
+
     if self._connection:
       # We need to run commit or not all data is stored in the database.
       self._connection.commit()
@@ -711,6 +1254,33 @@ class SQLiteStorageFile(interface.BaseStorageFile):
 
     self._is_open = False
 
+  def CreateEventTimestampIndex(self):
+    """Creates the event timestamp index if it does not already exist.
+
+    The index allows events to be read in chronological order, optionally
+    limited to a time range, without the need to sort the entire event table.
+    Stores created by older versions of plaso can be upgraded in place by
+    opening them in write mode and calling this method.
+
+    Raises:
+      IOError: when the storage file is closed or read-only or if the index
+          cannot be created.
+      OSError: when the storage file is closed or read-only or if the index
+          cannot be created.
+    """
+    self._RaiseIfNotWritable()
+
+    query = self._CREATE_EVENT_TIMESTAMP_INDEX_QUERY.format(
+        self._EVENT_TIMESTAMP_INDEX_NAME)
+
+    try:
+      self._cursor.execute(query)
+    except sqlite3.OperationalError as exception:
+      raise IOError('Unable to create event timestamp index: {0!s}'.format(
+          exception))
+
+    self._connection.commit()
+
   def GetAnalysisReports(self):
     """Retrieves the analysis reports.
 
@@ -727,6 +1297,36 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     """
     return self._GetAttributeContainers(self._CONTAINER_TYPE_EXTRACTION_ERROR)
 
+  def GetEVTXXMLTemplateByRowIdentifier(self, row_identifier):
+    """Retrieves an EVTX XML template stored in the evtx_xml_template table.
+
+    Event data read from the storage file reference their XML template by
+    the xml_template_row_identifier attribute. XML templates are cached by
+    row identifier, so that a XML template shared by multiple event data is
+    only read, deserialized and split into parts once.
+
+    Args:
+      row_identifier (int): row identifier of the XML template.
+
+    Returns:
+      WindowsEventLogXMLTemplate: XML template.
+
+    Raises:
+      IOError: if the XML template is missing.
+      OSError: if the XML template is missing.
+    """
+    xml_template = self._evtx_xml_template_cache.GetValue(row_identifier)
+    if not xml_template:
+      xml_template = self._GetAttributeContainerByIndex(
+          self._CONTAINER_TYPE_EVTX_XML_TEMPLATE, row_identifier - 1)
+      if not xml_template or not xml_template.template:
+        raise IOError('Missing EVTX XML template: {0:d}'.format(
+            row_identifier))
+
+      self._evtx_xml_template_cache.SetValue(row_identifier, xml_template)
+
+    return xml_template
+
   def GetEvents(self):
     """Retrieves the events.
 
@@ -760,8 +1360,19 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     Returns:
       EventData: event data or None if not available.
     """
-    return self._GetAttributeContainerByIndex(
-        self._CONTAINER_TYPE_EVENT_DATA, identifier.row_identifier - 1)
+    event_data = self._event_data_cache.GetValue(identifier.row_identifier)
+    if not event_data:
+      event_data = self._GetAttributeContainerByIndex(
+          self._CONTAINER_TYPE_EVENT_DATA, identifier.row_identifier - 1)
+
+      # Only cache event data when all event data has been written to
+      # the storage file, since event data on the serialized attribute
+      # container list is not read from the storage file.
+      if event_data and not self._GetNumberOfSerializedAttributeContainers(
+          self._CONTAINER_TYPE_EVENT_DATA):
+        self._event_data_cache.SetValue(identifier.row_identifier, event_data)
+
+    return event_data
 
   def GetEventSourceByIndex(self, index):
     """Retrieves a specific event source.
@@ -783,6 +1394,86 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     """
     return self._GetAttributeContainers(self._CONTAINER_TYPE_EVENT_SOURCE)
 
+  def GetEventTimeRanges(self, number_of_time_ranges):
+    """Retrieves time ranges that partition the events.
+
+    The time ranges are determined using the event timestamp index and contain
+    roughly the same number of events. Events with the same timestamp are
+    always part of the same time range, hence events in different time ranges
+    can be sorted, deduplicated and MACB grouped independently.
+
+    Args:
+      number_of_time_ranges (int): maximum number of time ranges.
+
+    Returns:
+      list[TimeRange]: time ranges in increasing chronological order, where
+          fewer time ranges are returned if there are not enough distinct
+          timestamps, or None if the store has no event timestamp index.
+
+    Raises:
+      ValueError: if the number of time ranges is out of bounds.
+    """
+    if number_of_time_ranges < 1:
+      raise ValueError('Number of time ranges out of bounds.')
+
+    if not self.HasEventTimestampIndex():
+      return None
+
+    number_of_events = self._CountStoredAttributeContainers(
+        self._CONTAINER_TYPE_EVENT)
+    if not number_of_events:
+      return []
+
+    self._cursor.execute(
+        'SELECT MIN(_timestamp), MAX(_timestamp) FROM event')
+    minimum_timestamp, maximum_timestamp = self._cursor.fetchone()
+
+    # The index is paged by timestamp and row identifier, relative to the
+    # previous boundary, so that the offset of every query only skips the
+    # events of a single time range instead of all preceding events.
+    first_query = (
+        'SELECT _timestamp, _ROWID_ FROM event INDEXED BY {0:s} '
+        'ORDER BY _timestamp, _ROWID_ LIMIT 1 OFFSET ?').format(
+            self._EVENT_TIMESTAMP_INDEX_NAME)
+    next_query = (
+        'SELECT _timestamp, _ROWID_ FROM event INDEXED BY {0:s} '
+        'WHERE (_timestamp, _ROWID_) > (?, ?) '
+        'ORDER BY _timestamp, _ROWID_ LIMIT 1 OFFSET ?').format(
+            self._EVENT_TIMESTAMP_INDEX_NAME)
+
+    last_row = None
+    last_position = None
+    start_timestamps = [minimum_timestamp]
+    for time_range_index in range(1, number_of_time_ranges):
+      position = (
+          number_of_events * time_range_index) // number_of_time_ranges
+
+      if last_row is None:
+        self._cursor.execute(first_query, (position, ))
+      elif position > last_position:
+        self._cursor.execute(next_query, (
+            last_row[0], last_row[1], position - last_position - 1))
+      else:
+        continue
+
+      row = self._cursor.fetchone()
+      if not row:
+        break
+
+      last_row = row
+      last_position = position
+
+      if row[0] > start_timestamps[-1]:
+        start_timestamps.append(row[0])
+
+    end_timestamps = [timestamp - 1 for timestamp in start_timestamps[1:]]
+    end_timestamps.append(maximum_timestamp)
+
+    return [
+        storage_time_range.TimeRange(start_timestamp, end_timestamp)
+        for start_timestamp, end_timestamp in zip(
+            start_timestamps, end_timestamps)]
+
   def GetEventTagByIdentifier(self, identifier):
     """Retrieves a specific event tag.
 
@@ -879,6 +1570,11 @@ class SQLiteStorageFile(interface.BaseStorageFile):
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
+    If the event data cache is enabled the events are read in batches and
+    the event data referenced by a batch is read into the cache with a single
+    query, to prevent a query per event when the event data is retrieved
+    with GetEventDataByIdentifier.
+
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
@@ -890,20 +1586,31 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     if time_range:
       filter_expression = []
 
-      if time_range.start_timestamp:
+      if time_range.start_timestamp is not None:
         filter_expression.append(
             '_timestamp >= {0:d}'.format(time_range.start_timestamp))
 
-      if time_range.end_timestamp:
+      if time_range.end_timestamp is not None:
         filter_expression.append(
             '_timestamp <= {0:d}'.format(time_range.end_timestamp))
 
       filter_expression = ' AND '.join(filter_expression)
 
+    # Stores with an event timestamp index can be scanned in order, otherwise
+    # SQLite needs to sort the (filtered) event table first.
+    index_name = None
+    if self.HasEventTimestampIndex():
+      index_name = self._EVENT_TIMESTAMP_INDEX_NAME
+
     event_generator = self._GetAttributeContainers(
         self._CONTAINER_TYPE_EVENT, filter_expression=filter_expression,
-        order_by='_timestamp')
+        index_name=index_name, order_by='_timestamp')
 
+    batch_size = min(
+        self._EVENT_DATA_PREFETCH_BATCH_SIZE,
+        self._event_data_cache.maximum_number_of_values)
+
+    events = []
     for event in event_generator:
       if hasattr(event, 'event_data_row_identifier'):
         event_data_identifier = identifiers.SQLTableIdentifier(
@@ -912,7 +1619,22 @@ class SQLiteStorageFile(interface.BaseStorageFile):
 
         del event.event_data_row_identifier
 
-      yield event
+      if not batch_size:
+        yield event
+        continue
+
+      events.append(event)
+      if len(events) >= batch_size:
+        self._ReadEventDataIntoCache(events)
+        for batched_event in events:
+          yield batched_event
+
+        events = []
+
+    if events:
+      self._ReadEventDataIntoCache(events)
+      for batched_event in events:
+        yield batched_event
 
   def HasAnalysisReports(self):
     """Determines if a store contains analysis reports.
@@ -938,6 +1660,14 @@ class SQLiteStorageFile(interface.BaseStorageFile):
     """
     return self._HasAttributeContainers(self._CONTAINER_TYPE_EVENT_TAG)
 
+  def HasEventTimestampIndex(self):
+    """Determines if a store contains an event timestamp index.
+
+    Returns:
+      bool: True if the store contains an event timestamp index.
+    """
+    return self._HasIndex(self._EVENT_TIMESTAMP_INDEX_NAME)
+
   # pylint: disable=arguments-differ
   def Open(self, path=None, read_only=True, **unused_kwargs):
     """Opens the storage.
@@ -962,8 +1692,11 @@ class SQLiteStorageFile(interface.BaseStorageFile):
 
     path = os.path.abspath(path)
 
+    # The session storage is merged by a different thread than the one that
+    # opened it. Access to the connection is serialized by the caller.
     connection = sqlite3.connect(
-        path, detect_types=sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES)
+        path, check_same_thread=False,
+        detect_types=sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES)
 
     cursor = connection.cursor()
     if not cursor:
@@ -971,23 +1704,35 @@ class SQLiteStorageFile(interface.BaseStorageFile):
 
     self._connection = connection
     self._cursor = cursor
+    self._is_new_storage_file = False
     self._is_open = True
     self._read_only = read_only
 
+    if self._cache_size is not None:
+      self._cursor.execute('PRAGMA cache_size={0:d}'.format(self._cache_size))
+
     if read_only:
       self._ReadStorageMetadata()
     else:
-      # self._cursor.execute('PRAGMA journal_mode=MEMORY')
+      # The page size only affects a database that has no tables yet.
+      if self._page_size is not None:
+        self._cursor.execute('PRAGMA page_size={0:d}'.format(self._page_size))
+
+      if self._journal_mode is not None:
+        self._cursor.execute('PRAGMA journal_mode={0:s}'.format(
+            self._journal_mode))
 
       # Turn off insert transaction integrity since we want to do bulk insert.
       self._cursor.execute('PRAGMA synchronous=OFF')
 
       if not self._HasTable('metadata'):
         self._WriteStorageMetadata()
+        self._is_new_storage_file = True
       else:
         self._ReadStorageMetadata()
 
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+      if (self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB or
+          self.serialization_format == definitions.SERIALIZER_FORMAT_BINARY):
         data_column_type = 'BLOB'
       else:
         data_column_type = 'TEXT'
@@ -10,13 +10,49 @@ from plaso.storage.sqlite import sqlite_file
 class SQLiteStorageFileWriter(interface.StorageFileWriter):
   """SQLite-based storage file writer."""
 
+  def __init__(
+      self, session, output_file, cache_size=None, journal_mode=None,
+      page_size=None, serialization_format=definitions.SERIALIZER_FORMAT_JSON,
+      storage_type=definitions.STORAGE_TYPE_SESSION, task=None):
+    """Initializes a storage writer.
+
+    Args:
+      session (Session): session the storage changes are part of.
+      output_file (str): path to the output file.
+      cache_size (Optional[int]): SQLite page cache size, where a positive
+          value represents a number of pages and a negative value a size in
+          KiB, or None to use the SQLite default.
+      journal_mode (Optional[str]): SQLite journal mode, such as "MEMORY" or
+          "WAL", or None to use the SQLite default.
+      page_size (Optional[int]): SQLite page size in bytes, or None to use
+          the SQLite default.
+      serialization_format (Optional[str]): serialization format used when
+          the storage file is created.
+      storage_type (Optional[str]): storage type.
+      task(Optional[Task]): task.
+    """
+    super(SQLiteStorageFileWriter, self).__init__(
+        session, output_file, storage_type=storage_type, task=task)
+    self._cache_size = cache_size
+    self._journal_mode = journal_mode
+    self._page_size = page_size
+    self._serialization_format = serialization_format
+
   def _CreateStorageFile(self):
     """Creates a storage file.
 
     Returns:
       SQLiteStorageFile: storage file.
+
+    Raises:
+      ValueError: if the journal mode, the page size or the serialization
+          format is not supported.
     """
-    return sqlite_file.SQLiteStorageFile(storage_type=self._storage_type)
+    return sqlite_file.SQLiteStorageFile(
+        cache_size=self._cache_size, journal_mode=self._journal_mode,
+        page_size=self._page_size,
+        serialization_format=self._serialization_format,
+        storage_type=self._storage_type)
 
   def _CreateTaskStorageMergeReader(self, path):
     """Creates a task storage merge reader.
@@ -40,5 +76,7 @@ class SQLiteStorageFileWriter(interface.StorageFileWriter):
       SQLiteStorageFileWriter: storage writer.
     """
     return SQLiteStorageFileWriter(
-        self._session, path,
+        self._session, path, cache_size=self._cache_size,
+        journal_mode=self._journal_mode, page_size=self._page_size,
+        serialization_format=self._serialization_format,
         storage_type=definitions.STORAGE_TYPE_TASK, task=task)
@@ -4,8 +4,11 @@
 
 from __future__ import unicode_literals
 
+import io
 import unittest
 
+import yara
+
 from plaso.containers import analyzer_result
 from plaso.analyzers import yara_analyzer
 
@@ -57,5 +60,67 @@ class YaraAnalyzerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(first_result.attribute_value, 'PEfileBasic,PEfile')
 
 
+  def testAnalyzeBlocks(self):
+    """Tests that matches are accumulated across blocks of data."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(
+        'rule first { strings: $a = "first" condition: $a }\n'
+        'rule second { strings: $a = "second" condition: $a }\n'
+        'rule boundary { strings: $a = "boundary" condition: $a }')
+
+    analyzer.Analyze(b'first' + b'\x00' * 32 + b'bound')
+    analyzer.Analyze(b'ary' + b'\x00' * 32)
+    analyzer.Analyze(b'second' + b'\x00' * 32)
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'first,boundary,second')
+
+    analyzer.Reset()
+    analyzer.Analyze(b'second')
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'second')
+
+  def testAnalyzeWithTimeBudget(self):
+    """Tests that the time budget stops scanning of a data stream."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules('rule first { strings: $a = "first" condition: $a }')
+    analyzer.SetTimeBudget(10)
+
+    analyzer._elapsed_time = 10.0
+    analyzer.Analyze(b'first')
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, '')
+    self.assertTrue(analyzer._time_budget_exceeded)
+
+    analyzer.Reset()
+    analyzer.Analyze(b'first')
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'first')
+
+  @shared_test_lib.skipUnlessHasTestFile(['test_pe.exe'])
+  def testSetCompiledRules(self):
+    """Tests the SetCompiledRules function."""
+    rule_path = self._GetTestFilePath(self._RULE_FILE)
+    rules = yara.compile(filepath=rule_path)
+
+    file_object = io.BytesIO()
+    rules.save(file=file_object)
+
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetCompiledRules(file_object.getvalue())
+    self.assertIsNotNone(analyzer._rules)
+
+    target_path = self._GetTestFilePath(['test_pe.exe'])
+    with open(target_path, 'rb') as target_file:
+      target_data = target_file.read()
+
+    analyzer.Analyze(target_data)
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, 'PEfileBasic,PEfile')
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -23,7 +23,9 @@ class ElasticSearchOutputArgumentsHelperTest(
 
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--index_name INDEX_NAME] [--doc_type DOCUMENT_TYPE]
-                     [--flush_interval FLUSH_INTERVAL] [--raw_fields]
+                     [--flush_interval FLUSH_INTERVAL]
+                     [--elastic_chunk_size BYTES]
+                     [--elastic_sender_threads NUMBER] [--raw_fields]
                      [--elastic_user ELASTIC_USER] [--use_ssl]
                      [--ca_certificates_file_path CA_CERTIFICATES_FILE_PATH]
                      [--elastic_url_prefix ELASTIC_URL_PREFIX]
@@ -38,6 +40,12 @@ optional arguments:
   --doc_type DOCUMENT_TYPE
                         Name of the document type that will be used in
                         ElasticSearch.
+  --elastic_chunk_size BYTES
+                        Maximum size, in bytes, of the events of a bulk insert
+                        to ElasticSearch.
+  --elastic_sender_threads NUMBER
+                        Number of threads that send bulk inserts to
+                        ElasticSearch concurrently.
   --elastic_url_prefix ELASTIC_URL_PREFIX
                         URL prefix for elastic search.
   --elastic_user ELASTIC_USER
@@ -76,10 +84,25 @@ optional arguments:
     elastic_output.ElasticSearchOutputArgumentsHelper.ParseOptions(
         options, output_module)
 
+    options.elastic_chunk_size = 1024
+    options.elastic_sender_threads = 4
+
+    elastic_output.ElasticSearchOutputArgumentsHelper.ParseOptions(
+        options, output_module)
+
+    self.assertEqual(output_module._chunk_size, 1024)
+    self.assertEqual(output_module._number_of_sender_threads, 4)
+
     with self.assertRaises(errors.BadConfigObject):
       elastic_output.ElasticSearchOutputArgumentsHelper.ParseOptions(
           options, None)
 
+    options.elastic_sender_threads = 0
+
+    with self.assertRaises(errors.BadConfigOption):
+      elastic_output.ElasticSearchOutputArgumentsHelper.ParseOptions(
+          options, output_module)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -20,12 +20,17 @@ class ExtractionArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--preferred_year YEAR] [--process_archives]
-                     [--skip_compressed_streams]
+usage: cli_helper.py [--evtx_xml_templates] [--preferred_year YEAR]
+                     [--process_archives] [--skip_compressed_streams]
 
 Test argument parser.
 
 optional arguments:
+  --evtx_xml_templates, --evtx-xml-templates
+                        Store the XML representation of Windows XML EventLog
+                        (EVTX) records as a template, that is stored once per
+                        distinct template, and the values of the record. This
+                        reduces the size of the storage file.
   --preferred_year YEAR, --preferred-year YEAR
                         When a format\'s timestamp does not include a year,
                         e.g. syslog, use this as the initial year instead of
@@ -58,6 +63,7 @@ optional arguments:
     test_tool = tools.CLITool()
     extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertFalse(test_tool._evtx_xml_templates)
     self.assertIsNone(test_tool._preferred_year)
     self.assertFalse(test_tool._process_archives)
     self.assertTrue(test_tool._process_compressed_streams)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the Apache Parquet output module CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import unittest
+
+from plaso.cli.helpers import parquet_output
+from plaso.lib import errors
+from plaso.output import parquet_out
+
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class ParquetOutputArgumentsHelperTest(
+    test_lib.OutputModuleArgumentsHelperTest):
+  """Tests the Apache Parquet output module CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--row_group_size ROW_GROUP_SIZE]
+
+Test argument parser.
+
+optional arguments:
+  --row_group_size ROW_GROUP_SIZE
+                        Maximum number of events per row group, which is also
+                        the number of events that are buffered in memory
+                        before they are written.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py',
+        description='Test argument parser.', add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    parquet_output.ParquetOutputArgumentsHelper.AddArguments(argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+    output_mediator = self._CreateOutputMediator()
+    output_module = parquet_out.ParquetOutputModule(output_mediator)
+
+    with self.assertRaises(errors.BadConfigOption):
+      parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+          options, output_module)
+
+    options.write = 'plaso.parquet'
+    parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+        options, output_module)
+
+    self.assertEqual(output_module._filename, 'plaso.parquet')
+    self.assertEqual(output_module._row_group_size, 64 * 1024)
+
+    options.row_group_size = 0
+    with self.assertRaises(errors.BadConfigOption):
+      parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+          options, output_module)
+
+    with self.assertRaises(errors.BadConfigObject):
+      parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+          options, None)
+
+
+if __name__ == '__main__':
+  unittest.main()
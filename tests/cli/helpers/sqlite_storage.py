@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the SQLite storage CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+import argparse
+import unittest
+
+from plaso.cli import tools
+from plaso.cli.helpers import sqlite_storage
+from plaso.lib import errors
+
+from tests.cli import test_lib as cli_test_lib
+
+
+class SQLiteStorageArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
+  """Tests for the SQLite storage CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--sqlite_cache_size SIZE] [--sqlite_journal_mode MODE]
+                     [--sqlite_page_size SIZE]
+
+Test argument parser.
+
+optional arguments:
+  --sqlite_cache_size SIZE, --sqlite-cache-size SIZE
+                        SQLite page cache size of the storage file, where a
+                        positive value represents a number of pages and a
+                        negative value a size in KiB. By default the SQLite
+                        default is used.
+  --sqlite_journal_mode MODE, --sqlite-journal-mode MODE
+                        SQLite journal mode used when writing the storage
+                        file. By default the SQLite default is used. Supported
+                        options: DELETE, MEMORY, OFF, PERSIST, TRUNCATE, WAL
+  --sqlite_page_size SIZE, --sqlite-page-size SIZE
+                        SQLite page size, in bytes, used when the storage file
+                        is created, which must be a power of 2 between 512 and
+                        65536. By default the SQLite default is used.
+"""
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = argparse.ArgumentParser(
+        prog='cli_helper.py', description='Test argument parser.',
+        add_help=False,
+        formatter_class=cli_test_lib.SortedArgumentsHelpFormatter)
+
+    sqlite_storage.SQLiteStorageArgumentsHelper.AddArguments(argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+
+    test_tool = tools.CLITool()
+    sqlite_storage.SQLiteStorageArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertIsNone(test_tool._sqlite_cache_size)
+    self.assertIsNone(test_tool._sqlite_journal_mode)
+    self.assertIsNone(test_tool._sqlite_page_size)
+
+    options.sqlite_cache_size = -65536
+    options.sqlite_journal_mode = 'wal'
+    options.sqlite_page_size = 8192
+
+    sqlite_storage.SQLiteStorageArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._sqlite_cache_size, -65536)
+    self.assertEqual(test_tool._sqlite_journal_mode, 'WAL')
+    self.assertEqual(test_tool._sqlite_page_size, 8192)
+
+    with self.assertRaises(errors.BadConfigObject):
+      sqlite_storage.SQLiteStorageArgumentsHelper.ParseOptions(options, None)
+
+    options.sqlite_journal_mode = 'bogus'
+
+    with self.assertRaises(errors.BadConfigOption):
+      sqlite_storage.SQLiteStorageArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+    options.sqlite_journal_mode = None
+    options.sqlite_page_size = 1000
+
+    with self.assertRaises(errors.BadConfigOption):
+      sqlite_storage.SQLiteStorageArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+
+if __name__ == '__main__':
+  unittest.main()
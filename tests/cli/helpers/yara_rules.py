@@ -5,8 +5,11 @@
 from __future__ import unicode_literals
 
 import argparse
+import os
 import unittest
 
+import yara
+
 from plaso.cli import tools
 from plaso.cli.helpers import yara_rules
 from plaso.lib import errors
@@ -21,13 +24,18 @@ class YaraRulesArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--yara_rules PATH]
+usage: cli_helper.py [--yara_rules PATH] [--yara_time_budget SECONDS]
 
 Test argument parser.
 
 optional arguments:
   --yara_rules PATH, --yara-rules PATH
-                        Path to a file containing Yara rules definitions.
+                        Path to a file containing Yara rules definitions or
+                        rules compiled with yarac.
+  --yara_time_budget SECONDS, --yara-time-budget SECONDS
+                        Define the maximum number of seconds Yara rules
+                        matching should spend on a single file. A value of 0
+                        represents no limit.
 """
 
   def testAddArguments(self):
@@ -51,11 +59,38 @@ optional arguments:
     test_tool = tools.CLITool()
     yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertIsNotNone(test_tool._yara_compiled_rules)
     self.assertIsNotNone(test_tool._yara_rules_string)
+    self.assertEqual(test_tool._yara_time_budget, 60)
 
     with self.assertRaises(errors.BadConfigObject):
       yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, None)
 
+    options.yara_time_budget = -1
+
+    with self.assertRaises(errors.BadConfigOption):
+      yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
+
+  @shared_test_lib.skipUnlessHasTestFile(['yara.rules'])
+  def testParseOptionsWithCompiledRules(self):
+    """Tests the ParseOptions function with compiled rules."""
+    rules = yara.compile(filepath=self._GetTestFilePath(['yara.rules']))
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      compiled_rules_path = os.path.join(temp_directory, 'yara.compiled')
+      rules.save(compiled_rules_path)
+
+      options = cli_test_lib.TestOptions()
+      options.yara_rules_path = compiled_rules_path
+      options.yara_time_budget = 0
+
+      test_tool = tools.CLITool()
+      yara_rules.YaraRulesArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertIsNotNone(test_tool._yara_compiled_rules)
+    self.assertIsNone(test_tool._yara_rules_string)
+    self.assertEqual(test_tool._yara_time_budget, 0)
+
 
 if __name__ == '__main__':
   unittest.main()
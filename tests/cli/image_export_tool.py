@@ -5,6 +5,7 @@
 from __future__ import unicode_literals
 
 import io
+import multiprocessing
 import os
 import unittest
 
@@ -19,6 +20,47 @@ from tests import test_lib as shared_test_lib
 from tests.cli import test_lib
 
 
+class ImageExportDigestIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the image export digest index."""
+
+  def testAddAndGet(self):
+    """Tests the AddDigest, AddTarget and Get functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'digests.sqlite')
+
+      digest_index = image_export_tool.ImageExportDigestIndex()
+      digest_index.Open(path=path)
+
+      with self.assertRaises(IOError):
+        digest_index.Open(path=path)
+
+      digest_index.AddDigest('0123', '/a_file')
+      digest_index.AddTarget('a_file', '0123')
+      digest_index.AddTarget('another_file', '0123', is_duplicate=True)
+
+      self.assertEqual(digest_index.GetDisplayNameByDigest('0123'), '/a_file')
+      self.assertIsNone(digest_index.GetDisplayNameByDigest('4567'))
+
+      digest_index.Close()
+
+      with self.assertRaises(IOError):
+        digest_index.GetDigestByTarget('a_file')
+
+      # Test that the index survives closing it.
+      digest_index.Open(path=path)
+
+      self.assertEqual(digest_index.GetDigestByTarget('another_file'), '0123')
+      self.assertIsNone(digest_index.GetDigestByTarget('passwords.txt'))
+
+      self.assertFalse(digest_index.IsDuplicateTarget('a_file'))
+      self.assertTrue(digest_index.IsDuplicateTarget('another_file'))
+
+      digest_index.RemoveDigest('0123')
+      self.assertIsNone(digest_index.GetDisplayNameByDigest('0123'))
+
+      digest_index.Close()
+
+
 class ImageExportToolTest(test_lib.CLIToolTestCase):
   """Tests for the image export CLI tool."""
 
@@ -111,6 +153,183 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool._ExtractDataStream(
           file_entry, '', temp_directory, output_writer)
 
+      exported_file_path = os.path.join(
+          temp_directory, 'a_directory', 'another_file')
+      self.assertTrue(os.path.exists(exported_file_path))
+
+      # Test that the same content from another source is skipped as
+      # a duplicate.
+      os_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=exported_file_path)
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(os_path_spec)
+
+      test_tool._ExtractDataStream(
+          file_entry, '', temp_directory, output_writer)
+
+      number_of_exported_files = len([
+          path for path in self._RecursiveList(temp_directory)
+          if os.path.basename(path) == 'another_file'])
+      self.assertEqual(number_of_exported_files, 1)
+
+    output = output_writer.ReadOutput()
+    self.assertIn('is a duplicate of: TSK:/a_directory/another_file', output)
+
+  @shared_test_lib.skipUnlessHasTestFile(['ímynd.dd'])
+  def testExtractDataStreamInterrupted(self):
+    """Tests the _ExtractDataStream function with an interrupted export."""
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = image_export_tool.ImageExportTool()
+
+    test_path = self._GetTestFilePath(['ímynd.dd'])
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
+        location='/a_directory/another_file', parent=os_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      destination_path = os.path.join(temp_directory, 'export')
+      digest_index_path = os.path.join(temp_directory, 'digests.sqlite')
+
+      test_tool._digest_index = image_export_tool.ImageExportDigestIndex()
+      test_tool._digest_index.Open(path=digest_index_path)
+
+      test_tool._number_of_workers = 1
+      test_tool._worker_pool = multiprocessing.Pool(
+          processes=1, initializer=image_export_tool._InitializeExportWorker)
+
+      try:
+        test_tool._ExtractDataStream(
+            file_entry, '', destination_path, output_writer)
+
+      finally:
+        # Simulate an interruption before the pending export is completed.
+        test_tool._worker_pool.terminate()
+        test_tool._worker_pool.join()
+        test_tool._worker_pool = None
+        test_tool._digest_index.Close()
+
+      self.assertEqual(len(test_tool._pending_exports), 1)
+
+      exported_file_path = os.path.join(
+          destination_path, 'a_directory', 'another_file')
+      self.assertFalse(os.path.exists(exported_file_path))
+
+      # The partial export is not recorded in the digest index.
+      digest_index = image_export_tool.ImageExportDigestIndex()
+      digest_index.Open(path=digest_index_path)
+
+      try:
+        digest = digest_index.GetDigestByTarget(
+            os.path.join('a_directory', 'another_file'))
+      finally:
+        digest_index.Close()
+
+      self.assertIsNone(digest)
+
+      # Test that a failed export is not recorded in the digest index.
+      test_tool = image_export_tool.ImageExportTool()
+      test_tool._digest_index = image_export_tool.ImageExportDigestIndex()
+      test_tool._digest_index.Open(path=digest_index_path)
+
+      temporary_path = os.path.join(temp_directory, 'partial_copy')
+      with open(temporary_path, 'wb') as file_object:
+        file_object.write(b'partial')
+
+      try:
+        test_tool._FinalizeExport(
+            'TSK:/a_directory/another_file', exported_file_path,
+            os.path.join('a_directory', 'another_file'), temporary_path,
+            None, 'read error', output_writer)
+
+        digest = test_tool._digest_index.GetDigestByTarget(
+            os.path.join('a_directory', 'another_file'))
+      finally:
+        test_tool._digest_index.Close()
+
+      self.assertIsNone(digest)
+      self.assertFalse(os.path.exists(temporary_path))
+      self.assertFalse(os.path.exists(exported_file_path))
+
+    output = output_writer.ReadOutput()
+    self.assertIn('with error: read error', output)
+
+  @shared_test_lib.skipUnlessHasTestFile(['ímynd.dd'])
+  def testExtractDataStreamWithWorkers(self):
+    """Tests the _ExtractDataStream function with export worker processes."""
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = image_export_tool.ImageExportTool()
+
+    test_path = self._GetTestFilePath(['ímynd.dd'])
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
+        location='/a_directory/another_file', parent=os_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      # Create a file with the same content as another_file in another source.
+      source_path = os.path.join(temp_directory, 'source_file')
+      test_tool._WriteFileEntry(file_entry, '', source_path)
+
+      os_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=source_path)
+      duplicate_file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+          os_path_spec)
+
+      destination_path = os.path.join(temp_directory, 'export')
+
+      test_tool._digest_index = image_export_tool.ImageExportDigestIndex()
+      test_tool._digest_index.Open()
+
+      test_tool._number_of_workers = 2
+      test_tool._worker_pool = multiprocessing.Pool(
+          processes=2, initializer=image_export_tool._InitializeExportWorker)
+
+      try:
+        # Both data streams are exported concurrently by the worker processes
+        # before either export is completed.
+        test_tool._ExtractDataStream(
+            file_entry, '', destination_path, output_writer)
+        test_tool._ExtractDataStream(
+            duplicate_file_entry, '', destination_path, output_writer)
+
+        self.assertEqual(len(test_tool._pending_exports), 2)
+
+        test_tool._ProcessPendingExports(output_writer)
+
+        test_tool._digest_index._cursor.execute(
+            'SELECT COUNT(*) FROM digests')
+        number_of_digests = test_tool._digest_index._cursor.fetchone()[0]
+
+        test_tool._digest_index._cursor.execute(
+            'SELECT COUNT(*) FROM targets WHERE is_duplicate = 1')
+        number_of_duplicates = test_tool._digest_index._cursor.fetchone()[0]
+
+      finally:
+        test_tool._worker_pool.terminate()
+        test_tool._worker_pool.join()
+        test_tool._worker_pool = None
+        test_tool._digest_index.Close()
+
+      self.assertEqual(number_of_digests, 1)
+      self.assertEqual(number_of_duplicates, 1)
+
+      # Only one of the data streams is exported.
+      exported_files = [
+          path for path in self._RecursiveList(destination_path)
+          if os.path.isfile(path)]
+      self.assertEqual(len(exported_files), 1)
+
+      temporary_directory = os.path.join(
+          destination_path, test_tool._TEMPORARY_DIRECTORY_NAME)
+      self.assertEqual(os.listdir(temporary_directory), [])
+
+    output = output_writer.ReadOutput()
+    self.assertEqual(output.count('is a duplicate of:'), 1)
+
   @shared_test_lib.skipUnlessHasTestFile(['ímynd.dd'])
   def testExtractFileEntry(self):
     """Tests the _ExtractFileEntry function."""
@@ -176,7 +395,15 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
     file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
     with shared_test_lib.TempDirectory() as temp_directory:
       destination_path = os.path.join(temp_directory, 'another_file')
-      test_tool._WriteFileEntry(file_entry, '', destination_path)
+      digest_hash = test_tool._WriteFileEntry(file_entry, '', destination_path)
+      self.assertIsNone(digest_hash)
+
+      digest_hash = test_tool._WriteFileEntry(
+          file_entry, '', destination_path, calculate_digest=True)
+
+    expected_digest_hash = (
+        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
+    self.assertEqual(digest_hash, expected_digest_hash)
 
   # TODO: add tests for AddFilterOptions.
 
@@ -233,6 +460,15 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
     options = test_lib.TestOptions()
 
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool.ParseOptions(options)
+
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = self._GetTestFilePath(['artifacts'])
+    options.image = self._GetTestFilePath(['image.qcow2'])
+    options.include_duplicates = True
+    options.resume = 'digests.sqlite'
+
     with self.assertRaises(errors.BadConfigOption):
       test_tool.ParseOptions(options)
 
@@ -289,6 +525,80 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       output = output_writer.ReadOutput()
       self.assertEqual(output, expected_output)
 
+  def testProcessSourcesWithImageResume(self):
+    """Tests the ProcessSources function resuming a previous export."""
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = self._GetTestFilePath(['artifacts'])
+    options.image = self._GetTestFilePath(['ímynd.dd'])
+    options.quiet = True
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      destination_path = os.path.join(temp_directory, 'export')
+      options.path = destination_path
+      options.resume = os.path.join(temp_directory, 'digests.sqlite')
+
+      test_tool = image_export_tool.ImageExportTool()
+      test_tool.ParseOptions(options)
+      test_tool.ProcessSources()
+
+      # The digest index is not stored in the destination.
+      self.assertTrue(os.path.exists(options.resume))
+
+      extracted_files = sorted(self._RecursiveList(destination_path))
+      self.assertNotIn(
+          os.path.join(destination_path, 'digests.sqlite'), extracted_files)
+
+      # Simulate an interrupted export.
+      os.remove(os.path.join(destination_path, 'a_directory', 'another_file'))
+      os.makedirs(os.path.join(
+          destination_path, test_tool._TEMPORARY_DIRECTORY_NAME))
+
+      output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+      test_tool = image_export_tool.ImageExportTool(output_writer=output_writer)
+      test_tool.ParseOptions(options)
+      test_tool.ProcessSources()
+
+      self.assertEqual(
+          sorted(self._RecursiveList(destination_path)), extracted_files)
+
+      output = output_writer.ReadOutput()
+      self.assertIn('a_file already exists', output)
+      self.assertNotIn('another_file already exists', output)
+
+  @shared_test_lib.skipUnlessHasTestFile(['image.qcow2'])
+  def testProcessSourcesWithWorkers(self):
+    """Tests the ProcessSources function with export worker processes."""
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = image_export_tool.ImageExportTool(output_writer=output_writer)
+
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = self._GetTestFilePath(['artifacts'])
+    options.image = self._GetTestFilePath(['image.qcow2'])
+    options.quiet = True
+    options.workers = 2
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.path = temp_directory
+
+      test_tool.ParseOptions(options)
+
+      test_tool.ProcessSources()
+
+      expected_extracted_files = sorted([
+          os.path.join(temp_directory, 'a_directory'),
+          os.path.join(temp_directory, 'a_directory', 'another_file'),
+          os.path.join(temp_directory, 'a_directory', 'a_file'),
+          os.path.join(temp_directory, 'passwords.txt')])
+
+      extracted_files = self._RecursiveList(temp_directory)
+      self.assertEqual(sorted(extracted_files), expected_extracted_files)
+
+      file_path = os.path.join(temp_directory, 'passwords.txt')
+      with open(file_path, 'rb') as file_object:
+        data = file_object.read()
+
+      self.assertTrue(data.startswith(b'place,user,password'))
+
   @shared_test_lib.skipUnlessHasTestFile(['image.qcow2'])
   def testProcessSourcesExtractWithDateTimeFilter(self):
     """Tests the ProcessSources function with a date time filter."""
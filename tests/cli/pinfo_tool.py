@@ -5,6 +5,8 @@
 from __future__ import unicode_literals
 
 import json
+import os
+import shutil
 import unittest
 
 from plaso.cli import views as cli_views
@@ -64,6 +66,35 @@ class PinfoToolTest(test_lib.CLIToolTestCase):
     output = output_writer.ReadOutput()
     self.assertEqual(output, 'Storage files are different.\n')
 
+  @shared_test_lib.skipUnlessHasTestFile(['pinfo_test.plaso'])
+  def testCreateEventTimestampIndex(self):
+    """Tests the CreateEventTimestampIndex function."""
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = pinfo_tool.PinfoTool(output_writer=output_writer)
+
+    test_file = self._GetTestFilePath(['pinfo_test.plaso'])
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'pinfo_test.plaso')
+      shutil.copyfile(test_file, temp_file)
+
+      options = test_lib.TestOptions()
+      options.create_index = True
+      options.storage_file = temp_file
+
+      test_tool.ParseOptions(options)
+      self.assertTrue(test_tool.create_event_timestamp_index)
+
+      self.assertTrue(test_tool.CreateEventTimestampIndex())
+
+      output = output_writer.ReadOutput()
+      self.assertEqual(output, 'Event timestamp index created.\n')
+
+      self.assertTrue(test_tool.CreateEventTimestampIndex())
+
+      output = output_writer.ReadOutput()
+      self.assertEqual(output, 'Event timestamp index already exists.\n')
+
   def testParseArguments(self):
     """Tests the ParseArguments function."""
     output_writer = test_lib.TestBinaryOutputWriter(encoding='utf-8')
@@ -169,6 +200,7 @@ class PinfoToolTest(test_lib.CLIToolTestCase):
     table_view.AddRow(['Filename', test_filename])
     table_view.AddRow(['Format version', format_version])
     table_view.AddRow(['Serialization format', 'json'])
+    table_view.AddRow(['Event timestamp index', 'No'])
     table_view.Write(output_writer)
 
     table_view = cli_views.ViewsFactory.GetTableView(
@@ -246,6 +278,8 @@ class PinfoToolTest(test_lib.CLIToolTestCase):
     output = output_writer.ReadOutput()
     json_output = json.loads(output)
 
+    self.assertFalse(json_output['event_timestamp_index'])
+
     first_session_identifier = 'session_{0:s}'.format(session_identifier)
     first_session = json_output.get(first_session_identifier, None)
     self.assertIsNotNone(first_session)
@@ -118,7 +118,7 @@ class PsortToolTest(test_lib.CLIToolTestCase):
   if resource is None:
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--temporary_directory DIRECTORY] [--disable_zeromq]
-                     [--worker-memory-limit SIZE]
+                     [--worker-memory-limit SIZE] [--export-workers NUMBER]
 
 Test argument parser.
 
@@ -126,6 +126,13 @@ optional arguments:
   --disable_zeromq, --disable-zeromq
                         Disable queueing using ZeroMQ. A Multiprocessing queue
                         will be used instead.
+  --export-workers NUMBER, --export_workers NUMBER
+                        Number of worker processes used to export the events,
+                        where 0 or 1 represents the events are exported by the
+                        main process. Multiple export workers require a
+                        storage file with an event timestamp index, see pinfo
+                        --create-index, and an output format that supports
+                        partitioned output.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -140,7 +147,7 @@ optional arguments:
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY] [--disable_zeromq]
-                     [--worker-memory-limit SIZE]
+                     [--worker-memory-limit SIZE] [--export-workers NUMBER]
 
 Test argument parser.
 
@@ -148,6 +155,13 @@ optional arguments:
   --disable_zeromq, --disable-zeromq
                         Disable queueing using ZeroMQ. A Multiprocessing queue
                         will be used instead.
+  --export-workers NUMBER, --export_workers NUMBER
+                        Number of worker processes used to export the events,
+                        where 0 or 1 represents the events are exported by the
+                        main process. Multiple export workers require a
+                        storage file with an event timestamp index, see pinfo
+                        --create-index, and an output format that supports
+                        partitioned output.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -159,7 +159,28 @@ class StatusViewTest(test_lib.CLIToolTestCase):
     self._CheckOutput(output, expected_output)
 
   # TODO: add tests for _PrintProcessingTime
-  # TODO: add tests for _PrintTasksStatus
+  def testPrintTasksStatus(self):
+    """Tests the _PrintTasksStatus function."""
+    output_writer = test_lib.TestOutputWriter()
+
+    test_view = status_view.StatusView(output_writer, 'test_tool')
+
+    tasks_status = processing_status.TasksStatus()
+    tasks_status.merge_rate = 12.5
+    tasks_status.number_of_merged_attribute_containers = 250
+    tasks_status.number_of_queued_tasks = 2
+    tasks_status.total_number_of_tasks = 5
+
+    process_status = processing_status.ProcessingStatus()
+    process_status.UpdateTasksStatus(tasks_status)
+
+    test_view._PrintTasksStatus(process_status)
+
+    output = output_writer.ReadOutput()
+    self.assertIn(
+        'Merged\t\t\t: 250 attribute containers (12.5 per second)\n',
+        output)
+
   # TODO: add tests for GetAnalysisStatusUpdateCallback
   # TODO: add tests for GetExtractionStatusUpdateCallback
   # TODO: add tests for PrintAnalysisReportsDetails
@@ -19,7 +19,7 @@ class ExtractionErrorTest(shared_test_lib.BaseTestCase):
     attribute_container = errors.ExtractionError()
 
     expected_attribute_names = [
-        'message', 'parser_chain', 'path_spec']
+        'message', 'parser_chain', 'path_spec', 'path_spec_row_identifier']
 
     attribute_names = sorted(attribute_container.GetAttributeNames())
 
@@ -25,5 +25,19 @@ class MountPointTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class PathSpecificationTest(shared_test_lib.BaseTestCase):
+  """Tests for the path specification attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = storage_media.PathSpecification()
+
+    expected_attribute_names = ['path_spec']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
 if __name__ == '__main__':
   unittest.main()
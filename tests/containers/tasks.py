@@ -42,12 +42,39 @@ class TaskTest(shared_test_lib.BaseTestCase):
     session_identifier = '{0:s}'.format(uuid.uuid4().hex)
     task = tasks.Task(session_identifier=session_identifier)
     task.path_spec = 'test_path_spec'
+    task.storage_file_size = 10
 
     retry_task = task.CreateRetryTask()
     self.assertNotEqual(retry_task.identifier, task.identifier)
     self.assertTrue(task.has_retry)
     self.assertFalse(retry_task.has_retry)
     self.assertEqual(retry_task.path_spec, task.path_spec)
+    self.assertEqual(retry_task.storage_file_size, 10)
+
+  def testCreateRetryTasks(self):
+    """Tests the CreateRetryTasks function."""
+    session_identifier = '{0:s}'.format(uuid.uuid4().hex)
+    task = tasks.Task(session_identifier=session_identifier)
+    task.path_spec = 'test_path_spec'
+
+    retry_tasks = task.CreateRetryTasks()
+    self.assertEqual(len(retry_tasks), 1)
+    self.assertTrue(task.has_retry)
+    self.assertEqual(retry_tasks[0].path_spec, task.path_spec)
+
+    task = tasks.Task(session_identifier=session_identifier)
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+    task.storage_file_size = 10
+
+    retry_tasks = task.CreateRetryTasks()
+    self.assertEqual(len(retry_tasks), 2)
+    self.assertTrue(task.has_retry)
+    self.assertNotEqual(retry_tasks[0].identifier, retry_tasks[1].identifier)
+    self.assertEqual(retry_tasks[0].path_spec, 'test_path_spec1')
+    self.assertIsNone(retry_tasks[0].path_specs)
+    self.assertEqual(retry_tasks[1].path_spec, 'test_path_spec2')
+    self.assertIsNone(retry_tasks[0].storage_file_size)
+    self.assertIsNone(retry_tasks[1].storage_file_size)
 
   def testCreateTaskCompletion(self):
     """Tests the CreateTaskCompletion function."""
@@ -65,6 +92,21 @@ class TaskTest(shared_test_lib.BaseTestCase):
     task_start = task.CreateTaskStart()
     self.assertIsNotNone(task_start)
 
+  def testGetPathSpecs(self):
+    """Tests the GetPathSpecs function."""
+    session_identifier = '{0:s}'.format(uuid.uuid4().hex)
+    task = tasks.Task(session_identifier=session_identifier)
+
+    self.assertEqual(task.GetPathSpecs(), [])
+
+    task.path_spec = 'test_path_spec'
+    self.assertEqual(task.GetPathSpecs(), ['test_path_spec'])
+
+    task.path_spec = None
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+    self.assertEqual(
+        task.GetPathSpecs(), ['test_path_spec1', 'test_path_spec2'])
+
   def testUpdateProcessingTime(self):
     """Tests the UpdateProcessingTime function."""
     session_identifier = '{0:s}'.format(uuid.uuid4().hex)
@@ -29,6 +29,72 @@ class WindowsDistributedLinkTrackingEventDataTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class WindowsEventLogXMLTemplateTest(shared_test_lib.BaseTestCase):
+  """Tests for the Windows XML EventLog (EVTX) XML template."""
+
+  _XML_STRING = (
+      '<Event xmlns="http://schemas.microsoft.com/win/2004/08/events/event">\n'
+      '  <System>\n'
+      '    <Provider Name="Service Control Manager" Guid="{555908d1-a6d7}"/>\n'
+      '    <EventID Qualifiers="16384">7036</EventID>\n'
+      '    <TimeCreated SystemTime="2012-03-14T04:17:38.276340200Z"/>\n'
+      '    <Security/>\n'
+      '  </System>\n'
+      '  <EventData>\n'
+      '    <Data Name="param1">Windows Update</Data>\n'
+      '    <Data Name="param2"></Data>\n'
+      '  </EventData>\n'
+      '</Event>\n')
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = windows_events.WindowsEventLogXMLTemplate()
+
+    expected_attribute_names = ['template']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+  def testSplitXMLString(self):
+    """Tests the SplitXMLString function."""
+    template, values = (
+        windows_events.WindowsEventLogXMLTemplate.SplitXMLString(
+            self._XML_STRING))
+
+    expected_values = [
+        '16384', '7036', '2012-03-14T04:17:38.276340200Z', 'Windows Update']
+    self.assertEqual(values, expected_values)
+
+    self.assertIn('<Provider Name="Service Control Manager"', template)
+    self.assertIn('<Data Name="param1">\x00</Data>', template)
+
+    template, values = (
+        windows_events.WindowsEventLogXMLTemplate.SplitXMLString(
+            '<Event>\x00</Event>'))
+    self.assertIsNone(template)
+    self.assertIsNone(values)
+
+  def testRender(self):
+    """Tests the Render function."""
+    template, values = (
+        windows_events.WindowsEventLogXMLTemplate.SplitXMLString(
+            self._XML_STRING))
+
+    xml_template = windows_events.WindowsEventLogXMLTemplate(
+        template=template)
+
+    xml_string = xml_template.Render(values)
+    self.assertEqual(xml_string, self._XML_STRING)
+
+    values[3] = 'Windows Defender'
+    xml_string = xml_template.Render(values)
+    self.assertIn('<Data Name="param1">Windows Defender</Data>', xml_string)
+
+    with self.assertRaises(ValueError):
+      xml_template.Render(values[:3])
+
+
 class WindowsRegistryInstallationEventDataTest(shared_test_lib.BaseTestCase):
   """Tests for the Windows installation event data attribute container."""
 
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the read-through block cache."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import unittest
+
+from plaso.engine import block_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class TestFileObject(io.BytesIO):
+  """File-like object for testing.
+
+  Attributes:
+    number_of_reads (int): number of reads.
+  """
+
+  def __init__(self, data):
+    """Initializes a file-like object for testing.
+
+    Args:
+      data (bytes): data.
+    """
+    super(TestFileObject, self).__init__(data)
+    self.number_of_reads = 0
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+    """
+    return len(self.getvalue())
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    self.number_of_reads += 1
+    return super(TestFileObject, self).read(size)
+
+
+class BlockCacheFileObjectTest(shared_test_lib.BaseTestCase):
+  """Tests for the read-through block cache file-like object."""
+
+  _TEST_DATA = bytes(bytearray(range(256))) * 40
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    test_file_object = TestFileObject(self._TEST_DATA)
+
+    file_object = block_cache.BlockCacheFileObject(test_file_object)
+    self.assertEqual(file_object.get_size(), 10240)
+
+    with self.assertRaises(ValueError):
+      block_cache.BlockCacheFileObject(test_file_object, block_size=-1)
+
+    with self.assertRaises(ValueError):
+      block_cache.BlockCacheFileObject(
+          test_file_object, maximum_cache_size=-1)
+
+  def testRead(self):
+    """Tests the read function."""
+    test_file_object = TestFileObject(self._TEST_DATA)
+
+    file_object = block_cache.BlockCacheFileObject(
+        test_file_object, block_size=1024, maximum_cache_size=8192)
+
+    data = file_object.read()
+    self.assertEqual(data, self._TEST_DATA)
+    self.assertEqual(file_object.get_offset(), 10240)
+    self.assertEqual(file_object.number_of_hits, 0)
+    self.assertEqual(file_object.number_of_misses, 10)
+    self.assertEqual(test_file_object.number_of_reads, 1)
+
+    self.assertEqual(file_object.read(16), b'')
+
+    # The last 8 blocks remain cached.
+    file_object.seek(2100, os.SEEK_SET)
+    data = file_object.read(5000)
+    self.assertEqual(data, self._TEST_DATA[2100:7100])
+    self.assertEqual(file_object.tell(), 7100)
+    self.assertEqual(file_object.number_of_hits, 5)
+    self.assertEqual(file_object.number_of_misses, 10)
+    self.assertEqual(test_file_object.number_of_reads, 1)
+
+    # The uncached blocks are read with a single read.
+    file_object.seek(0, os.SEEK_SET)
+    data = file_object.read(4096)
+    self.assertEqual(data, self._TEST_DATA[:4096])
+    self.assertEqual(file_object.number_of_hits, 7)
+    self.assertEqual(file_object.number_of_misses, 12)
+    self.assertEqual(test_file_object.number_of_reads, 2)
+
+    file_object.seek(-10, os.SEEK_END)
+    data = file_object.read(100)
+    self.assertEqual(data, self._TEST_DATA[-10:])
+
+    file_object.close()
+
+  def testReadSequential(self):
+    """Tests the read function with sequential read enabled."""
+    test_file_object = TestFileObject(self._TEST_DATA)
+
+    file_object = block_cache.BlockCacheFileObject(
+        test_file_object, block_size=1024, maximum_cache_size=4096)
+
+    # Read the first and last block as a parser would.
+    header_data = file_object.read(16)
+    file_object.seek(-16, os.SEEK_END)
+    footer_data = file_object.read(16)
+    self.assertEqual(test_file_object.number_of_reads, 2)
+
+    file_object.SetSequentialRead(True)
+
+    file_object.seek(0, os.SEEK_SET)
+    data = file_object.read(4096)
+    data += file_object.read()
+    self.assertEqual(data, self._TEST_DATA)
+
+    file_object.SetSequentialRead(False)
+
+    # The full pass did not evict the previously cached blocks.
+    self.assertEqual(len(file_object._block_cache), 4)
+    self.assertIn(0, file_object._block_cache)
+    self.assertIn(9, file_object._block_cache)
+
+    number_of_reads = test_file_object.number_of_reads
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(16), header_data)
+    file_object.seek(-16, os.SEEK_END)
+    self.assertEqual(file_object.read(16), footer_data)
+    self.assertEqual(test_file_object.number_of_reads, number_of_reads)
+
+    file_object.close()
+
+  def testSeek(self):
+    """Tests the seek function."""
+    test_file_object = TestFileObject(self._TEST_DATA)
+
+    file_object = block_cache.BlockCacheFileObject(test_file_object)
+
+    file_object.seek(100, os.SEEK_SET)
+    self.assertEqual(file_object.get_offset(), 100)
+
+    file_object.seek(10, os.SEEK_CUR)
+    self.assertEqual(file_object.get_offset(), 110)
+
+    file_object.seek(-40, os.SEEK_END)
+    self.assertEqual(file_object.get_offset(), 10200)
+
+    file_object.seek(20000, os.SEEK_SET)
+    self.assertEqual(file_object.read(), b'')
+
+    with self.assertRaises(IOError):
+      file_object.seek(-1, os.SEEK_SET)
+
+    with self.assertRaises(IOError):
+      file_object.seek(0, 10)
+
+    self.assertTrue(file_object.seekable())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,6 +4,9 @@
 
 from __future__ import unicode_literals
 
+import gzip
+import os
+import threading
 import time
 import unittest
 
@@ -57,6 +60,28 @@ class SampleFileProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class CacheProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the cache profiler."""
+
+  def testSample(self):
+    """Tests the Sample function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.CacheProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      for _ in range(5):
+        test_profiler.Sample('test_cache', 10, 2)
+        time.sleep(0.01)
+
+      test_profiler.Stop()
+
+
 class CPUTimeProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the CPU time profiler."""
 
@@ -129,6 +154,48 @@ class MemoryProfilerTest(shared_test_lib.BaseTestCase):
 
       test_profiler.Stop()
 
+  def testSampleWithThreads(self):
+    """Tests the Sample function from multiple threads."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.MemoryProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      def _SampleThreadMain(profile_name):
+        """Takes samples for profiling.
+
+        Args:
+          profile_name (str): name of the profile to sample.
+        """
+        for _ in range(500):
+          test_profiler.Sample(profile_name, 400)
+
+      test_threads = [
+          threading.Thread(target=_SampleThreadMain, args=(profile_name, ))
+          for profile_name in ('main', 'merge', 'status')]
+
+      for test_thread in test_threads:
+        test_thread.start()
+      for test_thread in test_threads:
+        test_thread.join()
+
+      test_profiler.Stop()
+
+      sample_file_path = os.path.join(temp_directory, 'memory-test.csv.gz')
+      with gzip.open(sample_file_path, 'rb') as file_object:
+        lines = file_object.read().decode('utf-8').splitlines()
+
+      self.assertEqual(len(lines), 1501)
+      for line in lines[1:]:
+        _, profile_name, used_memory = line.split('\t')
+        self.assertIn(profile_name, ('main', 'merge', 'status'))
+        self.assertEqual(used_memory, '400')
+
 
 class ProcessingProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the processing CPU time profiler."""
@@ -152,6 +219,27 @@ class ProcessingProfilerTest(shared_test_lib.BaseTestCase):
 
       test_profiler.Stop()
 
+  def testSampleCacheUsage(self):
+    """Tests the SampleCacheUsage function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.ProcessingProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      for _ in range(5):
+        test_profiler.SampleCacheUsage('test_cache', 10, 2)
+        time.sleep(0.01)
+
+      test_profiler.Stop()
+
+      expected_filenames = ['cache-test.csv.gz', 'processing-test.csv.gz']
+      self.assertEqual(sorted(os.listdir(temp_directory)), expected_filenames)
+
 
 class SerializersProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the serializers CPU time profiler."""
@@ -4,6 +4,7 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -11,6 +12,7 @@ from dfvfs.resolver import context
 from dfvfs.path import factory as path_spec_factory
 
 from plaso.containers import sessions
+from plaso.engine import block_cache
 from plaso.engine import configurations
 from plaso.engine import knowledge_base
 from plaso.engine import worker
@@ -109,6 +111,58 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     event_attribute = mediator._extra_event_attributes.get('test_result', None)
     self.assertEqual(event_attribute, 'is_vegetable')
 
+  @shared_test_lib.skipUnlessHasTestFile(['yara.rules'])
+  @shared_test_lib.skipUnlessHasTestFile(['test_pe.exe'])
+  def testAnalyzeDataStreamWithBlockCache(self):
+    """Tests the _AnalyzeDataStream function with a block cache."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    resolver_context = context.Context()
+    mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base_object,
+        resolver_context=resolver_context)
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker._SetHashers('sha256')
+
+    rule_path = self._GetTestFilePath(['yara.rules'])
+    with open(rule_path, 'r') as rule_file:
+      rule_string = rule_file.read()
+
+    extraction_worker._SetYaraRules(rule_string)
+
+    file_entry = self._GetTestFileEntry(['test_pe.exe'])
+    mediator.SetFileEntry(file_entry)
+
+    # The block cache is smaller than the 3072 bytes of the test file.
+    file_object = block_cache.BlockCacheFileObject(
+        file_entry.GetFileObject(), block_size=512, maximum_cache_size=1024)
+
+    try:
+      # Read the header as the signature scanner would.
+      header_data = file_object.read(64)
+
+      extraction_worker._AnalyzeDataStream(
+          mediator, file_entry, '', file_object=file_object)
+
+      # The full-file hash and Yara pass did not evict the header block.
+      self.assertIn(0, file_object._block_cache)
+
+      number_of_misses = file_object.number_of_misses
+
+      file_object.seek(0, os.SEEK_SET)
+      self.assertEqual(file_object.read(64), header_data)
+      self.assertEqual(file_object.number_of_misses, number_of_misses)
+
+    finally:
+      file_object.close()
+
+    event_attribute = mediator._extra_event_attributes.get('yara_match', None)
+    self.assertEqual(event_attribute, 'PEfileBasic,PEfile')
+    self.assertIn('sha256_hash', mediator._extra_event_attributes)
+
   @shared_test_lib.skipUnlessHasTestFile(['syslog'])
   def testProcessPathSpecFile(self):
     """Tests the ProcessPathSpec function on a file."""
@@ -71,7 +71,42 @@ class EventFormatterTest(unittest.TestCase):
     attribute_names = event_formatter.GetFormatStringAttributeNames()
     self.assertEqual(sorted(attribute_names), expected_attribute_names)
 
-  # TODO: add test for GetMessages.
+  def testGetFieldNames(self):
+    """Tests the _GetFieldNames function."""
+    event_formatter = test_lib.TestEventFormatter()
+
+    # pylint: disable=protected-access
+    field_names = event_formatter._GetFieldNames([
+        'Value: 0x{numeric:02x}', '{text!r} {{literal}}',
+        '{regvalue[Value]} {path.name}', ''])
+    self.assertEqual(field_names, ['numeric', 'path', 'regvalue', 'text'])
+
+    field_names = event_formatter._GetFieldNames(['{0:s}'])
+    self.assertIsNone(field_names)
+
+    field_names = event_formatter._GetFieldNames(['{text'])
+    self.assertIsNone(field_names)
+
+  def testGetMessages(self):
+    """Tests the GetMessages function."""
+    formatter_mediator = mediator.FormatterMediator()
+    event_formatter = test_lib.TestEventFormatter()
+
+    event = self._event_objects[6]
+    message, message_short = event_formatter.GetMessages(
+        formatter_mediator, event)
+
+    expected_message = (
+        'Mr. Evil just logged into the machine and got root.')
+    self.assertEqual(message, expected_message)
+    self.assertEqual(message_short, expected_message)
+
+    # An event that is missing an attribute used by the format string is
+    # formatted with all its attribute values.
+    event.text = None
+    message, _ = event_formatter.GetMessages(formatter_mediator, event)
+    self.assertIn('hostname: MYHOSTNAME', message)
+
   # TODO: add test for GetSources.
 
 
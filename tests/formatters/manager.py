@@ -9,6 +9,7 @@ import unittest
 from plaso.formatters import manager
 from plaso.formatters import mediator
 from plaso.formatters import winreg  # pylint: disable=unused-import
+from plaso.storage import identifiers
 
 from tests import test_lib as shared_test_lib
 from tests.containers import test_lib as containers_test_lib
@@ -36,6 +37,24 @@ class FormattersManagerTest(shared_test_lib.BaseTestCase):
         len(manager.FormattersManager._formatter_classes),
         number_of_formatters)
 
+  def testGetFormatterObject(self):
+    """Tests the GetFormatterObject function."""
+    manager.FormattersManager.RegisterFormatter(test_lib.TestEventFormatter)
+
+    try:
+      formatter_object = manager.FormattersManager.GetFormatterObject(
+          'test:event')
+      self.assertIsInstance(formatter_object, test_lib.TestEventFormatter)
+
+      # The data type is matched case insensitive.
+      mixed_case_formatter_object = (
+          manager.FormattersManager.GetFormatterObject('Test:Event'))
+      self.assertIs(mixed_case_formatter_object, formatter_object)
+
+    finally:
+      manager.FormattersManager.DeregisterFormatter(
+          test_lib.TestEventFormatter)
+
   def testMessageStrings(self):
     """Tests the GetMessageStrings and GetSourceStrings functions."""
     manager.FormattersManager.RegisterFormatter(test_lib.TestEventFormatter)
@@ -96,6 +115,67 @@ class FormattersManagerTest(shared_test_lib.BaseTestCase):
 
     manager.FormattersManager.DeregisterFormatter(test_lib.TestEventFormatter)
 
+  def testFormattedStringsCache(self):
+    """Tests the formatted strings cache."""
+    manager.FormattersManager.RegisterFormatter(test_lib.TestEventFormatter)
+
+    formatter_mediator = mediator.FormatterMediator()
+
+    test_events = containers_test_lib.CreateTestEvents()
+    event = test_events[-1]
+    event_data_identifier = identifiers.SQLTableIdentifier('event_data', 1)
+    event.SetEventDataIdentifier(event_data_identifier)
+
+    expected_messages = manager.FormattersManager.GetMessageStrings(
+        formatter_mediator, event)
+    expected_sources = manager.FormattersManager.GetSourceStrings(event)
+
+    manager.FormattersManager.EnableFormattedStringsCache(formatter_mediator)
+
+    try:
+      for _ in range(3):
+        messages = manager.FormattersManager.GetMessageStrings(
+            formatter_mediator, event)
+        self.assertEqual(messages, expected_messages)
+
+        # A formatter mediator of None represents the formatter mediator of
+        # the formatted strings cache.
+        messages = manager.FormattersManager.GetMessageStrings(None, event)
+        self.assertEqual(messages, expected_messages)
+
+        sources = manager.FormattersManager.GetSourceStrings(event)
+        self.assertEqual(sources, expected_sources)
+
+      number_of_hits, number_of_misses = (
+          manager.FormattersManager.GetFormattedStringsCacheStatistics())
+      self.assertEqual(number_of_hits, 7)
+      self.assertEqual(number_of_misses, 2)
+
+      # Message strings formatted with another formatter mediator are
+      # not cached.
+      messages = manager.FormattersManager.GetMessageStrings(
+          mediator.FormatterMediator(), event)
+      self.assertEqual(messages, expected_messages)
+
+      # Events without an event data identifier are not cached.
+      manager.FormattersManager.GetMessageStrings(
+          formatter_mediator, test_events[0])
+
+      number_of_hits, number_of_misses = (
+          manager.FormattersManager.GetFormattedStringsCacheStatistics())
+      self.assertEqual(number_of_hits, 7)
+      self.assertEqual(number_of_misses, 2)
+
+    finally:
+      manager.FormattersManager.DisableFormattedStringsCache()
+      manager.FormattersManager.DeregisterFormatter(
+          test_lib.TestEventFormatter)
+
+    number_of_hits, number_of_misses = (
+        manager.FormattersManager.GetFormattedStringsCacheStatistics())
+    self.assertEqual(number_of_hits, 0)
+    self.assertEqual(number_of_misses, 0)
+
 
 if __name__ == '__main__':
   unittest.main()
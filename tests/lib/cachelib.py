@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the least recently used (LRU) cache."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from plaso.lib import cachelib
+
+
+class LeastRecentlyUsedCacheTest(unittest.TestCase):
+  """Tests for the least recently used (LRU) cache."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    lru_cache = cachelib.LeastRecentlyUsedCache(10)
+    self.assertEqual(lru_cache.maximum_number_of_values, 10)
+    self.assertEqual(len(lru_cache), 0)
+
+    with self.assertRaises(ValueError):
+      cachelib.LeastRecentlyUsedCache(-1)
+
+  def testGetAndSetValue(self):
+    """Tests the GetValue and SetValue functions."""
+    lru_cache = cachelib.LeastRecentlyUsedCache(2)
+
+    self.assertIsNone(lru_cache.GetValue(1))
+    self.assertEqual(lru_cache.number_of_misses, 1)
+
+    lru_cache.SetValue(1, 'one')
+    lru_cache.SetValue(2, 'two')
+    self.assertEqual(len(lru_cache), 2)
+
+    self.assertEqual(lru_cache.GetValue(1), 'one')
+    self.assertEqual(lru_cache.number_of_hits, 1)
+
+    # Key 2 is the least recently used and is evicted.
+    lru_cache.SetValue(3, 'three')
+    self.assertEqual(len(lru_cache), 2)
+    self.assertIn(1, lru_cache)
+    self.assertNotIn(2, lru_cache)
+    self.assertIn(3, lru_cache)
+
+    self.assertIsNone(lru_cache.GetValue(2))
+    self.assertEqual(lru_cache.number_of_misses, 2)
+
+    lru_cache.SetValue(4, None)
+    self.assertNotIn(4, lru_cache)
+
+    lru_cache.Empty()
+    self.assertEqual(len(lru_cache), 0)
+
+  def testDisabledCache(self):
+    """Tests a cache with a maximum number of values of 0."""
+    lru_cache = cachelib.LeastRecentlyUsedCache(0)
+
+    lru_cache.SetValue(1, 'one')
+    self.assertEqual(len(lru_cache), 0)
+    self.assertIsNone(lru_cache.GetValue(1))
+
+
+if __name__ == '__main__':
+  unittest.main()
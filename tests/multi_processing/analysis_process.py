@@ -8,7 +8,9 @@ import unittest
 
 from plaso.analysis import interface as analysis_interface
 from plaso.containers import sessions
+from plaso.containers import events
 from plaso.engine import configurations
+from plaso.engine import plaso_queue
 from plaso.multi_processing import analysis_process
 from plaso.multi_processing import multi_process_queue
 
@@ -45,6 +47,33 @@ class TestAnalysisPlugin(analysis_interface.AnalysisPlugin):
     return
 
 
+class SerializedEventBatchTest(test_lib.MultiProcessingTestCase):
+  """Tests the serialized event batch."""
+
+  def testFromEventsAndGetEvents(self):
+    """Tests the FromEvents and GetEvents functions."""
+    test_events = []
+    for timestamp in (1542361800000000, 1542361800000001):
+      event = events.EventObject()
+      event.data_type = 'test:event'
+      event.timestamp = timestamp
+      test_events.append(event)
+
+    event_batch = analysis_process.SerializedEventBatch.FromEvents(
+        test_events)
+    self.assertIsNotNone(event_batch.data)
+    self.assertEqual(event_batch.number_of_events, 2)
+
+    batch_events = event_batch.GetEvents()
+    self.assertEqual(len(batch_events), 2)
+    self.assertEqual(batch_events[0].data_type, 'test:event')
+    self.assertEqual(batch_events[0].timestamp, 1542361800000000)
+    self.assertEqual(batch_events[1].timestamp, 1542361800000001)
+
+    event_batch = analysis_process.SerializedEventBatch()
+    self.assertEqual(event_batch.GetEvents(), [])
+
+
 class AnalysisProcessTest(test_lib.MultiProcessingTestCase):
   """Tests the multi-processing analysis process."""
 
@@ -91,6 +120,38 @@ class AnalysisProcessTest(test_lib.MultiProcessingTestCase):
 
     test_process._Main()
 
+  def testMainWithSerializedEventBatch(self):
+    """Tests the _Main function with a serialized event batch."""
+    event_queue = multi_process_queue.MultiProcessingQueue(timeout=1)
+
+    test_events = []
+    for timestamp in (1542361800000000, 1542361800000001, 1542361800000002):
+      event = events.EventObject()
+      event.data_type = 'test:event'
+      event.timestamp = timestamp
+      test_events.append(event)
+
+    event_batch = analysis_process.SerializedEventBatch.FromEvents(
+        test_events)
+    event_queue.PushItem(event_batch)
+    event_queue.PushItem(plaso_queue.QueueAbort())
+
+    session = sessions.Session()
+    storage_writer = self._CreateStorageWriter(session)
+    analysis_plugin = TestAnalysisPlugin()
+
+    configuration = configurations.ProcessingConfiguration()
+
+    test_process = analysis_process.AnalysisProcess(
+        event_queue, storage_writer, None, analysis_plugin, configuration,
+        name='TestAnalysis')
+    test_process._FOREMAN_STATUS_WAIT = 1
+    test_process._pid = 0
+
+    test_process._Main()
+
+    self.assertEqual(test_process._number_of_consumed_events, 3)
+
   # TODO: add test for _ProcessEvent.
 
   def testSignalAbort(self):
@@ -5,26 +5,37 @@
 from __future__ import unicode_literals
 
 import codecs
+import hashlib
+import multiprocessing
 import os
 import shutil
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
 from plaso.analysis import interface as analysis_interface
 from plaso.analysis import tagging
 from plaso.containers import events
 from plaso.containers import sessions
+from plaso.containers import windows_events
 from plaso.engine import configurations
 from plaso.engine import knowledge_base
 from plaso.formatters import interface as formatters_interface
 from plaso.formatters import manager as formatters_manager
 from plaso.formatters import mediator as formatters_mediator
 from plaso.lib import definitions
+from plaso.multi_processing import analysis_process
+from plaso.multi_processing import multi_process_queue
 from plaso.multi_processing import psort
 from plaso.output import dynamic
 from plaso.output import interface as output_interface
 from plaso.output import mediator as output_mediator
 from plaso.output import null
 from plaso.storage import factory as storage_factory
+from plaso.storage import identifiers
 
 from tests import test_lib as shared_test_lib
 from tests.cli import test_lib as cli_test_lib
@@ -175,15 +186,75 @@ class PsortEventHeapTest(shared_test_lib.BaseTestCase):
 
     event = containers_test_lib.TestEvent(
         5134324321, attributes=self._TEST_EVENT_ATTRIBUTES)
-    macb_group_identifier, content_identifier = (
-        event_heap._GetEventIdentifiers(event))
+    (macb_group_identifier, content_identifier, macb_group_string,
+     content_string) = event_heap._GetEventIdentifiers(event)
 
-    expected_identifier = 'data_type: test:event'
+    expected_identifier = hashlib.md5(b'data_type: test:event').digest()
     self.assertEqual(macb_group_identifier, expected_identifier)
 
-    expected_identifier = 'Metadata Modification Time, data_type: test:event'
+    expected_identifier = hashlib.md5(
+        expected_identifier + b'Metadata Modification Time').digest()
     self.assertEqual(content_identifier, expected_identifier)
 
+    self.assertEqual(macb_group_string, 'data_type: test:event')
+
+    expected_string = 'Metadata Modification Time, data_type: test:event'
+    self.assertEqual(content_string, expected_string)
+
+    event.timestamp_desc = definitions.TIME_DESCRIPTION_RECORDED
+    macb_group_identifier, other_content_identifier, macb_group_string, _ = (
+        event_heap._GetEventIdentifiers(event))
+
+    self.assertIsNone(macb_group_identifier)
+    self.assertEqual(macb_group_string, '')
+    self.assertNotEqual(other_content_identifier, content_identifier)
+
+  def testGetEventIdentifiersWithEventData(self):
+    """Tests the _GetEventIdentifiers function with event data."""
+    event_heap = psort.PsortEventHeap()
+
+    event_data = events.EventData()
+    event_data.data_type = 'test:event'
+    event_data.offset = 12
+    event_data.text = 'My text'
+    event_data.SetIdentifier(identifiers.SQLTableIdentifier('event_data', 1))
+
+    expected_identifier = hashlib.md5((
+        b'data_type: test:event, name: Summary Information, offset: 12, '
+        b'text: My text')).digest()
+
+    for timestamp_description in (
+        definitions.TIME_DESCRIPTION_CHANGE,
+        definitions.TIME_DESCRIPTION_WRITTEN):
+      event = events.EventObject()
+      event.name = 'Summary Information'
+      event.timestamp = 5134324321
+      event.timestamp_desc = timestamp_description
+
+      for attribute_name, attribute_value in event_data.GetAttributes():
+        setattr(event, attribute_name, attribute_value)
+
+      expected_content_identifier = hashlib.md5(
+          expected_identifier + timestamp_description.encode('utf-8'))
+
+      expected_identifiers = event_heap._GetEventIdentifiers(event)
+      self.assertEqual(
+          expected_identifiers[1], expected_content_identifier.digest())
+
+      # The event data must not change the identifiers.
+      test_identifiers = event_heap._GetEventIdentifiers(
+          event, event_data=event_data)
+      self.assertEqual(test_identifiers, expected_identifiers)
+
+    self.assertEqual(test_identifiers[3], (
+        'Content Modification Time, data_type: test:event, '
+        'name: Summary Information, offset: 12, text: My text'))
+
+    # The event data identifier values are only determined once.
+    cache = event_heap._event_data_identifier_values_cache
+    self.assertEqual(cache.number_of_misses, 1)
+    self.assertEqual(cache.number_of_hits, 1)
+
   def testPopEvent(self):
     """Tests the PopEvent function."""
     event_heap = psort.PsortEventHeap()
@@ -352,6 +423,37 @@ class PsortMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   # TODO: add test for _CheckStatusAnalysisProcess.
   # TODO: add test for _ExportEvent.
 
+  def testInternalPushEventBatch(self):
+    """Tests the _PushEventBatch function."""
+    test_engine = psort.PsortMultiProcessEngine()
+
+    test_events = [
+        TestEvent(timestamp, **kwargs)
+        for timestamp, kwargs in self._TEST_EVENTS]
+
+    test_queues = []
+    for plugin_name in ('test_plugin1', 'test_plugin2'):
+      event_queue = multi_process_queue.MultiProcessingQueue(timeout=1)
+      test_engine._event_queues[plugin_name] = event_queue
+      test_queues.append(event_queue)
+
+    test_engine._PushEventBatch(test_events)
+
+    first_event_batch = test_queues[0].PopItem()
+    self.assertIsInstance(
+        first_event_batch, analysis_process.SerializedEventBatch)
+    self.assertEqual(first_event_batch.number_of_events, 17)
+
+    second_event_batch = test_queues[1].PopItem()
+    self.assertEqual(second_event_batch.data, first_event_batch.data)
+
+    batch_events = first_event_batch.GetEvents()
+    self.assertEqual(len(batch_events), 17)
+    self.assertEqual(batch_events[0].timestamp, 5134324321)
+
+    for event_queue in test_queues:
+      event_queue.Close()
+
   def testInternalExportEvents(self):
     """Tests the _ExportEvents function."""
     knowledge_base_object = knowledge_base.KnowledgeBase()
@@ -422,13 +524,201 @@ class PsortMultiProcessEngineTest(shared_test_lib.BaseTestCase):
     self.assertEqual(len(output_module.events), 15)
     self.assertEqual(len(output_module.macb_groups), 3)
 
+  @shared_test_lib.skipUnlessHasTestFile(['psort_test.plaso'])
+  def testInternalExportEventsOrder(self):
+    """Tests the order of the events exported by the _ExportEvents function."""
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    output_writer = cli_test_lib.TestBinaryOutputWriter()
+
+    formatter_mediator = formatters_mediator.FormatterMediator()
+
+    output_mediator_object = output_mediator.OutputMediator(
+        knowledge_base_object, formatter_mediator)
+
+    output_module = TestOutputModule(output_mediator_object)
+    output_module.SetOutputWriter(output_writer)
+
+    test_engine = psort.PsortMultiProcessEngine()
+
+    storage_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        storage_file_path)
+    storage_reader.ReadPreprocessingInformation(knowledge_base_object)
+
+    test_engine._ExportEvents(storage_reader, output_module)
+
+    storage_reader.Close()
+
+    # Events with the same timestamp are ordered by the strings that
+    # represent their attributes and values.
+    expected_events = [
+        (1327218753000000, 'INFO No change in [/etc/netgroup]. Done'),
+        (1327218753000000, 'INFO No new content in \xedmynd.dd.'),
+        (1327218781000000, '(root) CMD (touch /var/run/crond.somecheck)'),
+        (1327218841000000, '(root) CMD (/sbin/status.mycheck))'),
+        (1327218841000000, '(root) CMD (touch /var/run/crond.somecheck)'),
+        (1327218872000000, '`cron.daily\' terminated'),
+        (1330478143000000, (
+            'testing leap year in parsing, events take place in 2012 ---')),
+        (1355853272000000, 'No true exit can exist (124 job run)'),
+        (1364079678000000, (
+            'This syslog message has a fractional value for seconds.')),
+        (1364079678000000, (
+            'This syslog message is brought to you by me (and not the '
+            'other guy)')),
+        (1384737320000000, (
+            'This is a multi-line message that screws up\n\tmany syslog '
+            'parsers.')),
+        (1388512472000000, 'Another one just like this (124 job run)'),
+        (1391699790000000, 'Test message with single character day'),
+        (1416273343000000, 'last message repeated 5 times ---'),
+        (1416299420000000, '[997.390602] sda2: rw=0, want=65, limit=2'),
+        (1416299480000000, '[998.390602] sda2: rw=0, want=66, limit=2'),
+        (1535724731000000, definitions.TIME_DESCRIPTION_MODIFICATION),
+        (1535724731000000, definitions.TIME_DESCRIPTION_CHANGE),
+        (1535724733000000, definitions.TIME_DESCRIPTION_LAST_ACCESS)]
+
+    test_events = [
+        (event.timestamp, getattr(event, 'body', None) or event.timestamp_desc)
+        for event in output_module.events]
+    self.assertEqual(test_events, expected_events)
+
+  def testInternalExportEventsInPartitions(self):
+    """Tests the _ExportEventsInPartitions function."""
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+
+    formatter_mediator = formatters_mediator.FormatterMediator()
+
+    output_mediator_object = output_mediator.OutputMediator(
+        knowledge_base_object, formatter_mediator)
+
+    test_engine = psort.PsortMultiProcessEngine()
+    test_engine._processing_configuration = (
+        configurations.ProcessingConfiguration())
+
+    formatters_manager.FormattersManager.RegisterFormatter(TestEventFormatter)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+      storage_reader.ReadPreprocessingInformation(knowledge_base_object)
+
+      output_writer = cli_test_lib.TestBinaryOutputWriter()
+      output_module = dynamic.DynamicOutputModule(output_mediator_object)
+      output_module.SetOutputWriter(output_writer)
+
+      test_engine._ExportEvents(storage_reader, output_module)
+      expected_output = output_writer.ReadOutput()
+
+      time_ranges = storage_reader.GetEventTimeRanges(3)
+      self.assertEqual(len(time_ranges), 3)
+
+      storage_reader.Close()
+
+      output_writer = cli_test_lib.TestBinaryOutputWriter()
+      output_module = dynamic.DynamicOutputModule(output_mediator_object)
+      output_module.SetOutputWriter(output_writer)
+
+      test_engine = psort.PsortMultiProcessEngine()
+      test_engine._processing_configuration = (
+          configurations.ProcessingConfiguration())
+
+      counter = test_engine._ExportEventsInPartitions(
+          temp_file, output_module, time_ranges,
+          temporary_directory=temp_directory)
+
+      self.assertEqual(os.listdir(temp_directory), ['storage.plaso'])
+
+    formatters_manager.FormattersManager.DeregisterFormatter(TestEventFormatter)
+
+    self.assertEqual(counter['Events processed'], 17)
+    self.assertEqual(counter['Duplicate events removed'], 2)
+
+    output = output_writer.ReadOutput()
+    self.assertEqual(output, expected_output)
+
   # TODO: add test for _FlushExportBuffer.
   # TODO: add test for _StartAnalysisProcesses.
   # TODO: add test for _StatusUpdateThreadMain.
   # TODO: add test for _StopAnalysisProcesses.
   # TODO: add test for _UpdateProcessingStatus.
 
+  def testInternalHasForkStartMethod(self):
+    """Tests the _HasForkStartMethod function."""
+    test_engine = psort.PsortMultiProcessEngine()
+
+    if not hasattr(multiprocessing, 'get_start_method'):
+      raise unittest.SkipTest('missing multiprocessing start methods.')
+
+    with mock.patch('multiprocessing.get_start_method', return_value='fork'):
+      self.assertTrue(test_engine._HasForkStartMethod())
+
+    with mock.patch('multiprocessing.get_start_method', return_value='spawn'):
+      self.assertFalse(test_engine._HasForkStartMethod())
+
   @shared_test_lib.skipUnlessHasTestFile(['psort_test.plaso'])
+  def testInternalRenderEVTXXMLString(self):
+    """Tests the _RenderEVTXXMLString function."""
+    template, values = (
+        windows_events.WindowsEventLogXMLTemplate.SplitXMLString(
+            '<Event><EventID>1</EventID></Event>'))
+
+    test_engine = psort.PsortMultiProcessEngine()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_file = storage_factory.StorageFactory.CreateStorageFile(
+          definitions.DEFAULT_STORAGE_FORMAT)
+      storage_file.Open(path=temp_file, read_only=False)
+
+      event_data = events.EventData()
+      event_data.xml_template = template
+      event_data.xml_values = values
+      storage_file.AddEventData(event_data)
+
+      storage_file.Close()
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+
+      event_data = list(storage_reader.GetEventData())[0]
+
+      event = events.EventObject()
+      for attribute_name, attribute_value in event_data.GetAttributes():
+        setattr(event, attribute_name, attribute_value)
+
+      test_engine._RenderEVTXXMLString(storage_reader, event)
+
+      storage_reader.Close()
+
+    self.assertEqual(event.xml_string, '<Event><EventID>1</EventID></Event>')
+    self.assertFalse(hasattr(event, 'xml_template_row_identifier'))
+    self.assertFalse(hasattr(event, 'xml_values'))
+
+    # Test with an XML template that is not stored by row identifier.
+    event = events.EventObject()
+    event.xml_template = template
+    event.xml_values = values
+
+    test_engine._RenderEVTXXMLString(None, event)
+
+    self.assertEqual(event.xml_string, '<Event><EventID>1</EventID></Event>')
+    self.assertFalse(hasattr(event, 'xml_template'))
+    self.assertFalse(hasattr(event, 'xml_values'))
+
+    # Test with values that do not match the XML template.
+    event = events.EventObject()
+    event.xml_template = template
+    event.xml_values = []
+
+    test_engine._RenderEVTXXMLString(None, event)
+
+    self.assertFalse(hasattr(event, 'xml_string'))
+    self.assertEqual(event.xml_values, [])
+
   def testAnalyzeEvents(self):
     """Tests the AnalyzeEvents function."""
     storage_file_path = self._GetTestFilePath(['psort_test.plaso'])
@@ -12,8 +12,10 @@ from artifacts import registry as artifacts_registry
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import event_sources
 from plaso.containers import sessions
 from plaso.engine import configurations
+from plaso.engine import processing_status
 from plaso.multi_processing import task_engine
 from plaso.storage.sqlite import writer as sqlite_writer
 
@@ -23,6 +25,119 @@ from tests import test_lib as shared_test_lib
 class TaskMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task multi-process engine."""
 
+  # pylint: disable=protected-access
+
+  def _CreateTestEventSource(self, location, file_entry_type, size=None):
+    """Creates an event source for testing.
+
+    Args:
+      location (str): location of the path specification.
+      file_entry_type (str): dfVFS file entry type.
+      size (Optional[int]): size of the data of the event source.
+
+    Returns:
+      EventSource: event source.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=location)
+
+    event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+    event_source.file_entry_type = file_entry_type
+    event_source.size = size
+    return event_source
+
+  def testCreateTask(self):
+    """Tests the _CreateTask function."""
+    test_engine = task_engine.TaskMultiProcessEngine(
+        maximum_number_of_path_specs_per_task=3, maximum_task_data_size=1024)
+
+    event_source_heap = task_engine._EventSourceHeap()
+    for index in range(4):
+      event_source = self._CreateTestEventSource(
+          '/file{0:d}'.format(index), dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          size=100)
+      event_source_heap.PushEventSource(event_source)
+
+    event_source = self._CreateTestEventSource(
+        '/file4', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, size=2048)
+    event_source_heap.PushEventSource(event_source)
+
+    event_source = self._CreateTestEventSource(
+        '/directory', dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    event_source_heap.PushEventSource(event_source)
+
+    # Directories are processed by a task of their own.
+    event_source = event_source_heap.PopEventSource()
+    task = test_engine._CreateTask(event_source, event_source_heap)
+    self.assertEqual(task.path_spec.location, '/directory')
+    self.assertIsNone(task.path_specs)
+
+    # Files are batched up to the maximum number of path specifications.
+    event_source = event_source_heap.PopEventSource()
+    task = test_engine._CreateTask(event_source, event_source_heap)
+    self.assertIsNone(task.path_spec)
+    locations = [path_spec.location for path_spec in task.path_specs]
+    self.assertEqual(locations, ['/file0', '/file1', '/file2'])
+
+    # Files are batched up to the maximum task data size.
+    event_source = event_source_heap.PopEventSource()
+    task = test_engine._CreateTask(event_source, event_source_heap)
+    self.assertEqual(task.path_spec.location, '/file3')
+    self.assertIsNone(task.path_specs)
+
+    event_source = event_source_heap.PopEventSource()
+    task = test_engine._CreateTask(event_source, event_source_heap)
+    self.assertEqual(task.path_spec.location, '/file4')
+
+    self.assertIsNone(event_source_heap.PopEventSource())
+    self.assertEqual(test_engine._number_of_consumed_sources, 6)
+
+  def testMergeThread(self):
+    """Tests the _StartMergeThread and _StopMergeThread functions."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+    test_engine._MERGE_THREAD_IDLE_INTERVAL = 0.01
+
+    session = sessions.Session()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageFileWriter(session, temp_file)
+      storage_writer.StartTaskStorage()
+      storage_writer.Open()
+
+      try:
+        test_engine._StartMergeThread(storage_writer)
+        self.assertTrue(test_engine._merge_thread.is_alive())
+
+        test_engine._StopMergeThread()
+        self.assertIsNone(test_engine._merge_thread)
+        self.assertFalse(test_engine._abort)
+
+      finally:
+        storage_writer.Close()
+        storage_writer.StopTaskStorage(abort=True)
+
+  def testUpdateMergeStatus(self):
+    """Tests the _UpdateMergeStatus function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    tasks_status = processing_status.TasksStatus()
+    test_engine._number_of_merged_attribute_containers = 100
+    test_engine._UpdateMergeStatus(tasks_status)
+
+    self.assertEqual(tasks_status.number_of_merged_attribute_containers, 100)
+    self.assertEqual(tasks_status.merge_rate, 0.0)
+
+    # Backdate the previous update to have a deterministic merge rate.
+    test_engine._last_merge_rate_time -= 2.0
+
+    tasks_status = processing_status.TasksStatus()
+    test_engine._number_of_merged_attribute_containers = 300
+    test_engine._UpdateMergeStatus(tasks_status)
+
+    self.assertEqual(tasks_status.number_of_merged_attribute_containers, 300)
+    self.assertAlmostEqual(tasks_status.merge_rate, 100.0, delta=1.0)
+
   @shared_test_lib.skipUnlessHasTestFile(['ímynd.dd'])
   def testProcessSources(self):
     """Tests the PreprocessSources and ProcessSources function."""
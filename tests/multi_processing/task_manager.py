@@ -298,6 +298,7 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
     """Tests the CreateRetryTask function."""
     manager = task_manager.TaskManager()
     task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    task.storage_file_size = 10
 
     self.assertEqual(len(manager._tasks_queued), 1)
     self.assertEqual(len(manager._tasks_abandoned), 0)
@@ -315,12 +316,37 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
     retry_task = manager.CreateRetryTask()
     self.assertIsNotNone(retry_task)
     self.assertNotEqual(retry_task, task)
+    self.assertEqual(retry_task.storage_file_size, 10)
 
     self.assertEqual(len(manager._tasks_queued), 1)
     self.assertEqual(len(manager._tasks_abandoned), 1)
 
     self.assertEqual(manager._total_number_of_tasks, 2)
 
+    # Test an abandoned task with multiple path specifications.
+    manager = task_manager.TaskManager()
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+    task.storage_file_size = 10
+
+    manager._AbandonQueuedTasks()
+
+    retry_task = manager.CreateRetryTask()
+    self.assertEqual(retry_task.path_spec, 'test_path_spec1')
+    self.assertIsNone(retry_task.storage_file_size)
+    self.assertTrue(manager._HasTasksPendingRetry())
+
+    retry_task = manager.CreateRetryTask()
+    self.assertEqual(retry_task.path_spec, 'test_path_spec2')
+    self.assertIsNone(retry_task.storage_file_size)
+    self.assertFalse(manager._HasTasksPendingRetry())
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNone(retry_task)
+
+    self.assertEqual(len(manager._tasks_queued), 2)
+    self.assertEqual(manager._total_number_of_tasks, 3)
+
   def testCreateTask(self):
     """Tests the CreateTask function."""
     manager = task_manager.TaskManager()
@@ -530,6 +556,23 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(result_status.number_of_tasks_processing, 0)
     self.assertEqual(result_status.total_number_of_tasks, 1)
 
+  def testGetNumberOfTasksPendingMerge(self):
+    """Tests the GetNumberOfTasksPendingMerge function."""
+    manager = task_manager.TaskManager()
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    task.storage_file_size = 10
+
+    self.assertEqual(manager.GetNumberOfTasksPendingMerge(), 0)
+
+    manager.UpdateTaskAsPendingMerge(task)
+    self.assertEqual(manager.GetNumberOfTasksPendingMerge(), 1)
+
+    manager.GetTaskPendingMerge(None)
+    self.assertEqual(manager.GetNumberOfTasksPendingMerge(), 1)
+
+    manager.CompleteTask(task)
+    self.assertEqual(manager.GetNumberOfTasksPendingMerge(), 0)
+
   def testGetTaskPendingMerge(self):
     """Tests the GetTaskPendingMerge function."""
     current_task = tasks.Task()
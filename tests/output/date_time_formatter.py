@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the date and time formatter for output modules."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+import pytz
+
+from plaso.lib import timelib
+from plaso.output import date_time_formatter
+
+
+class DateTimeFormatterTest(unittest.TestCase):
+  """Tests for the date and time formatter for output modules."""
+
+  def testCopyToIsoFormat(self):
+    """Tests the CopyToIsoFormat function."""
+    test_formatter = date_time_formatter.DateTimeFormatter()
+
+    timestamp = timelib.Timestamp.CopyFromString('2012-06-27 18:17:01')
+    iso_string = test_formatter.CopyToIsoFormat(timestamp)
+    self.assertEqual(iso_string, '2012-06-27T18:17:01+00:00')
+
+    # Timestamps within the same second are formatted using the cached
+    # date and time of the second.
+    iso_string = test_formatter.CopyToIsoFormat(timestamp + 12)
+    self.assertEqual(iso_string, '2012-06-27T18:17:01.000012+00:00')
+
+    iso_string = test_formatter.CopyToIsoFormat(0)
+    self.assertEqual(iso_string, '1970-01-01T00:00:00+00:00')
+
+    with self.assertRaises(ValueError):
+      test_formatter.CopyToIsoFormat(0, raise_error=True)
+
+    with self.assertRaises(OverflowError):
+      test_formatter.CopyToIsoFormat(2 ** 62, raise_error=True)
+
+  def testCopyToIsoFormatWithTimezone(self):
+    """Tests the CopyToIsoFormat function with a timezone."""
+    test_formatter = date_time_formatter.DateTimeFormatter(
+        timezone=pytz.timezone('Europe/Amsterdam'))
+
+    # The last second before and the first second after the transition to
+    # daylight saving time.
+    timestamp = timelib.Timestamp.CopyFromString('2019-03-31 00:59:59')
+    iso_string = test_formatter.CopyToIsoFormat(timestamp + 500000)
+    self.assertEqual(iso_string, '2019-03-31T01:59:59.500000+01:00')
+
+    iso_string = test_formatter.CopyToIsoFormat(timestamp + 1000000)
+    self.assertEqual(iso_string, '2019-03-31T03:00:00+02:00')
+
+  def testGetDateAndTimeOfDay(self):
+    """Tests the GetDateAndTimeOfDay function."""
+    test_formatter = date_time_formatter.DateTimeFormatter(
+        timezone=pytz.timezone('Europe/Amsterdam'))
+
+    timestamp = timelib.Timestamp.CopyFromString('2012-06-27 18:17:01')
+    date_and_time_of_day = test_formatter.GetDateAndTimeOfDay(timestamp)
+    self.assertEqual(date_and_time_of_day, (2012, 6, 27, 18, 17, 1))
+
+    date_and_time_of_day = test_formatter.GetDateAndTimeOfDay(
+        timestamp + 3600 * 1000000)
+    self.assertEqual(date_and_time_of_day, (2012, 6, 27, 19, 17, 1))
+
+    date_and_time_of_day = test_formatter.GetDateAndTimeOfDay(-1000000)
+    self.assertEqual(date_and_time_of_day, (1969, 12, 31, 23, 59, 59))
+
+
+if __name__ == '__main__':
+  unittest.main()
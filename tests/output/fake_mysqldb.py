@@ -86,6 +86,21 @@ class FakeMySQLdbCursor(object):
 
     self._result_index = 0
 
+  def executemany(self, query, args):
+    """Executes the query for every parameters in a sequence.
+
+    Args:
+      query (str): SQL query.
+      args (list[object]): sequences or mappings of the parameters to use
+          with the query.
+
+    Raises:
+      ValueError: if the query or query arguments do not match the expected
+          values.
+    """
+    for query_args in args:
+      self.execute(query, args=query_args)
+
   def fetchone(self):
     """Fetches a single row of the results returned by execute.
 
@@ -50,6 +50,28 @@ class OutputMediatorTest(unittest.TestCase):
     self._output_mediator = mediator.OutputMediator(
         knowledge_base_object, None)
 
+  def testGetDateAndTimeOfDay(self):
+    """Tests the GetDateAndTimeOfDay function."""
+    event_object = TestEvent()
+
+    date_and_time_of_day = self._output_mediator.GetDateAndTimeOfDay(
+        event_object.timestamp)
+    self.assertEqual(date_and_time_of_day, (2012, 6, 27, 18, 17, 1))
+
+  def testGetDateTimeString(self):
+    """Tests the GetDateTimeString function."""
+    event_object = TestEvent()
+
+    date_time_string = self._output_mediator.GetDateTimeString(
+        event_object.timestamp)
+    self.assertEqual(date_time_string, '2012-06-27T18:17:01+00:00')
+
+    self._output_mediator.SetTimezone('Europe/Amsterdam')
+
+    date_time_string = self._output_mediator.GetDateTimeString(
+        event_object.timestamp)
+    self.assertEqual(date_time_string, '2012-06-27T20:17:01+02:00')
+
   def testGetEventFormatter(self):
     """Tests the GetEventFormatter function."""
     event_object = TestEvent()
@@ -196,6 +196,18 @@ class MySQL4n6TimeOutputModuleTest(test_lib.OutputModuleTestCase):
     event = MySQL4n6TimeTestEvent(timestamp)
     output_module.WriteEventBody(event)
 
+    self.assertEqual(len(output_module._event_values_buffer), 1)
+
+    output_module._FlushEventValues()
+    self.assertEqual(output_module._event_values_buffer, [])
+
+    meta_field_values = output_module._GetCountedMetaFieldValues('host')
+    self.assertEqual(meta_field_values, {'ubuntu': 1})
+
+    meta_field_values = output_module._GetCountedMetaFieldValues(
+        'record_number')
+    self.assertEqual(meta_field_values, {'0': 1})
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the Apache Parquet output module."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+try:
+  from pyarrow import parquet
+except ImportError:
+  parquet = None
+
+from plaso.containers import events
+from plaso.formatters import interface as formatters_interface
+from plaso.formatters import manager as formatters_manager
+from plaso.lib import definitions
+from plaso.lib import timelib
+from plaso.output import parquet_out
+
+from tests import test_lib as shared_test_lib
+from tests.output import test_lib
+
+
+class TestEvent(events.EventObject):
+  """Event object used for testing."""
+
+  DATA_TYPE = 'test:parquet'
+
+  def __init__(self, timestamp, text):
+    """Initializes an event object used for testing.
+
+    Args:
+      timestamp (int): timestamp.
+      text (str): text.
+    """
+    super(TestEvent, self).__init__()
+    self.data_type = self.DATA_TYPE
+    self.display_name = 'OS: log/syslog.1'
+    self.hostname = 'ubuntu'
+    self.parser = 'syslog'
+    self.text = text
+    self.timestamp = timestamp
+    self.timestamp_desc = definitions.TIME_DESCRIPTION_WRITTEN
+    self.username = 'root'
+
+
+class TestEventFormatter(formatters_interface.EventFormatter):
+  """Event object formatter used for testing."""
+
+  DATA_TYPE = 'test:parquet'
+  FORMAT_STRING = '{text}'
+
+  SOURCE_SHORT = 'LOG'
+  SOURCE_LONG = 'Syslog'
+
+
+@unittest.skipIf(parquet is None, 'missing pyarrow')
+class ParquetOutputModuleTest(test_lib.OutputModuleTestCase):
+  """Tests for the Apache Parquet output module."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    formatters_manager.FormattersManager.RegisterFormatter(TestEventFormatter)
+
+  def tearDown(self):
+    """Cleans up after running an individual test."""
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        TestEventFormatter)
+
+  def testOpen(self):
+    """Tests the Open function."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = parquet_out.ParquetOutputModule(output_mediator)
+
+    with self.assertRaises(ValueError):
+      output_module.Open()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      parquet_file = os.path.join(temp_directory, 'parquet.out')
+      with open(parquet_file, 'wb') as file_object:
+        file_object.write(b'')
+
+      output_module.SetFilename(parquet_file)
+      with self.assertRaises(IOError):
+        output_module.Open()
+
+  def testWriteEventBody(self):
+    """Tests the WriteEventBody function."""
+    timestamp = timelib.Timestamp.CopyFromString('2012-06-27 18:17:01')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_mediator = self._CreateOutputMediator()
+      output_module = parquet_out.ParquetOutputModule(output_mediator)
+
+      parquet_file = os.path.join(temp_directory, 'parquet.out')
+      output_module.SetFilename(parquet_file)
+      output_module.SetRowGroupSize(2)
+
+      output_module.Open()
+      output_module.WriteHeader()
+      for index in range(5):
+        event = TestEvent(timestamp + index, 'Event: {0:d}'.format(index))
+        output_module.WriteEvent(event)
+
+      self.assertEqual(output_module._number_of_buffered_events, 1)
+
+      output_module.WriteFooter()
+      output_module.Close()
+
+      parquet_file_object = parquet.ParquetFile(parquet_file)
+      self.assertEqual(parquet_file_object.metadata.num_rows, 5)
+      self.assertEqual(parquet_file_object.metadata.num_row_groups, 3)
+
+      table = parquet_file_object.read(columns=['timestamp', 'message'])
+      self.assertEqual(table.column_names, ['timestamp', 'message'])
+      self.assertEqual(str(table.schema.field('timestamp').type), 'int64')
+
+      values = table.to_pydict()
+      self.assertEqual(values['timestamp'][0], timestamp)
+      self.assertEqual(values['message'][4], 'Event: 4')
+
+      table = parquet_file_object.read(columns=['data_type', 'source_short'])
+      self.assertEqual(
+          str(table.schema.field('data_type').type),
+          'dictionary<values=string, indices=int32, ordered=0>')
+
+      values = table.to_pydict()
+      self.assertEqual(values['data_type'], ['test:parquet'] * 5)
+      self.assertEqual(values['source_short'], ['LOG'] * 5)
+
+
+if __name__ == '__main__':
+  unittest.main()
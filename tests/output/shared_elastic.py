@@ -4,8 +4,24 @@
 
 from __future__ import unicode_literals
 
+import json
+import threading
 import unittest
 
+try:
+  from BaseHTTPServer import BaseHTTPRequestHandler
+  from BaseHTTPServer import HTTPServer
+except ImportError:
+  from http.server import BaseHTTPRequestHandler
+  from http.server import HTTPServer
+
+try:
+  from urllib2 import Request
+  from urllib2 import urlopen
+except ImportError:
+  from urllib.request import Request
+  from urllib.request import urlopen
+
 try:
   from mock import MagicMock
 except ImportError:
@@ -44,6 +60,183 @@ class TestEvent(events.EventObject):
     self.timestamp = timestamp
 
 
+class StubBulkRequestHandler(BaseHTTPRequestHandler):
+  """Request handler of a stub Elasticsearch bulk API.
+
+  The first time a document is received it is rejected, as if the bulk
+  queue of Elasticsearch is full, if its identifier is in the set of
+  identifiers to reject.
+  """
+
+  # pylint: disable=invalid-name
+
+  def do_POST(self):
+    """Handles a POST request."""
+    content_length = int(self.headers.get('Content-Length', 0))
+    body = self.rfile.read(content_length).decode('utf-8')
+
+    lines = body.split('\n')
+    self.server.bodies.append(body)
+
+    items = []
+    for document in lines[1::2]:
+      document = json.loads(document)
+      identifier = document['identifier']
+
+      if identifier in self.server.identifiers_to_reject:
+        self.server.identifiers_to_reject.remove(identifier)
+        items.append({'index': {
+            'status': 429, 'error': 'es_rejected_execution_exception'}})
+      else:
+        self.server.identifiers.append(identifier)
+        items.append({'index': {'status': 201}})
+
+    response = {
+        'errors': any(item['index']['status'] != 201 for item in items),
+        'items': items}
+    response_data = json.dumps(response).encode('utf-8')
+
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', '{0:d}'.format(len(response_data)))
+    self.end_headers()
+    self.wfile.write(response_data)
+
+  def log_message(self, *unused_arguments):  # pylint: disable=arguments-differ
+    """Ignores log messages."""
+    return
+
+
+class ElasticsearchBulkIndexerTest(unittest.TestCase):
+  """Tests for the Elasticsearch bulk indexer."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    self._server = HTTPServer(('localhost', 0), StubBulkRequestHandler)
+    self._server.bodies = []
+    self._server.identifiers = []
+    self._server.identifiers_to_reject = set()
+
+    self._server_thread = threading.Thread(target=self._server.serve_forever)
+    self._server_thread.daemon = True
+    self._server_thread.start()
+
+  def tearDown(self):
+    """Cleans up after running an individual test."""
+    self._server.shutdown()
+    self._server.server_close()
+    self._server_thread.join()
+
+  def _BulkInsert(self, body):
+    """Sends a bulk request to the stub server.
+
+    Args:
+      body (str): newline delimited JSON body of the bulk request.
+
+    Returns:
+      dict[str, object]: response of the bulk request.
+    """
+    url = 'http://localhost:{0:d}/_bulk'.format(self._server.server_port)
+    request = Request(url, data=body.encode('utf-8'), headers={
+        'Content-Type': 'application/x-ndjson'})
+
+    response = urlopen(request)
+    try:
+      return json.loads(response.read().decode('utf-8'))
+    finally:
+      response.close()
+
+  def _CreateChunk(self, first_identifier, number_of_events):
+    """Creates a chunk of serialized actions and documents.
+
+    Args:
+      first_identifier (int): identifier of the first document.
+      number_of_events (int): number of events in the chunk.
+
+    Returns:
+      list[str]: serialized actions and documents.
+    """
+    lines = []
+    for identifier in range(
+        first_identifier, first_identifier + number_of_events):
+      lines.append('{"index": {"_index": "test"}}')
+      lines.append('{{"identifier": {0:d}}}'.format(identifier))
+
+    return lines
+
+  def testQueueChunk(self):
+    """Tests the QueueChunk function."""
+    bulk_indexer = shared_elastic.ElasticsearchBulkIndexer(
+        self._BulkInsert, initial_backoff=0.01, number_of_threads=3)
+    bulk_indexer.Start()
+
+    for first_identifier in range(0, 100, 10):
+      bulk_indexer.QueueChunk(self._CreateChunk(first_identifier, 10))
+
+    bulk_indexer.Stop()
+
+    self.assertEqual(len(self._server.bodies), 10)
+    self.assertEqual(sorted(self._server.identifiers), list(range(100)))
+
+    for body in self._server.bodies:
+      self.assertTrue(body.endswith('}\n'))
+
+    self.assertEqual(bulk_indexer.number_of_chunks, 10)
+    self.assertEqual(bulk_indexer.number_of_dropped_events, 0)
+    self.assertEqual(bulk_indexer.number_of_events, 100)
+    self.assertEqual(bulk_indexer.number_of_retries, 0)
+    self.assertEqual(
+        bulk_indexer.number_of_bytes,
+        sum(len(body) for body in self._server.bodies))
+
+    events_per_second, bytes_per_second = bulk_indexer.GetThroughput()
+    self.assertGreater(events_per_second, 0.0)
+    self.assertGreater(bytes_per_second, 0.0)
+
+  def testQueueChunkWithRejectedEvents(self):
+    """Tests the QueueChunk function with events that are rejected."""
+    self._server.identifiers_to_reject.update([3, 7])
+
+    bulk_indexer = shared_elastic.ElasticsearchBulkIndexer(
+        self._BulkInsert, initial_backoff=0.01, number_of_threads=1)
+    bulk_indexer.Start()
+
+    bulk_indexer.QueueChunk(self._CreateChunk(0, 10))
+
+    bulk_indexer.Stop()
+
+    # Only the rejected events are retried.
+    self.assertEqual(len(self._server.bodies), 2)
+    self.assertEqual(self._server.bodies[1], (
+        '{"index": {"_index": "test"}}\n{"identifier": 3}\n'
+        '{"index": {"_index": "test"}}\n{"identifier": 7}\n'))
+    self.assertEqual(sorted(self._server.identifiers), list(range(10)))
+
+    self.assertEqual(bulk_indexer.number_of_dropped_events, 0)
+    self.assertEqual(bulk_indexer.number_of_events, 10)
+    self.assertEqual(bulk_indexer.number_of_retries, 1)
+
+  def testQueueChunkWithMaximumNumberOfRetries(self):
+    """Tests the QueueChunk function with the maximum number of retries."""
+    bulk_function = MagicMock(side_effect=IOError('connection refused'))
+
+    bulk_indexer = shared_elastic.ElasticsearchBulkIndexer(
+        bulk_function, initial_backoff=0.01, maximum_number_of_retries=2,
+        number_of_threads=1)
+    bulk_indexer.Start()
+
+    bulk_indexer.QueueChunk(self._CreateChunk(0, 5))
+
+    bulk_indexer.Stop()
+
+    self.assertEqual(bulk_function.call_count, 3)
+    self.assertEqual(bulk_indexer.number_of_dropped_events, 5)
+    self.assertEqual(bulk_indexer.number_of_events, 0)
+    self.assertEqual(bulk_indexer.number_of_retries, 2)
+
+
 class TestElasticsearchOutputModule(
     shared_elastic.SharedElasticsearchOutputModule):
   """Elasticsearch output module for testing."""
@@ -165,11 +358,47 @@ class SharedElasticsearchOutputModuleTest(test_lib.OutputModuleTestCase):
     self.assertEqual(len(output_module._event_documents), 4)
     self.assertEqual(output_module._number_of_buffered_events, 2)
 
+    # Every document is assigned a distinct identifier, hence events with
+    # the same values do not replace each other.
+    first_action = json.loads(output_module._event_documents[0])
+    second_action = json.loads(output_module._event_documents[2])
+    self.assertEqual(len(first_action['index']['_id']), 32)
+    self.assertNotEqual(
+        first_action['index']['_id'], second_action['index']['_id'])
+
     output_module._InsertEvent(event, force_flush=True)
 
     self.assertEqual(len(output_module._event_documents), 0)
     self.assertEqual(output_module._number_of_buffered_events, 0)
 
+  def testInsertEventWithChunkSize(self):
+    """Tests the _InsertEvent function with a maximum chunk size."""
+    event = self._CreateTestEvent()
+
+    output_mediator = self._CreateOutputMediator()
+    output_module = TestElasticsearchOutputModule(output_mediator)
+
+    output_module._Connect()
+    output_module._CreateIndexIfNotExists('test', {})
+
+    output_module._InsertEvent(event)
+
+    self.assertEqual(output_module._number_of_buffered_events, 1)
+
+    # The buffered event documents are flushed when their size exceeds
+    # the chunk size.
+    output_module._chunk_size = output_module._event_documents_size * 2
+
+    output_module._InsertEvent(event)
+
+    self.assertEqual(len(output_module._event_documents), 0)
+    self.assertEqual(output_module._event_documents_size, 0)
+    self.assertEqual(output_module._number_of_buffered_events, 0)
+
+    output_module.Close()
+
+    self.assertIsNone(output_module._client)
+
   def testClose(self):
     """Tests the Close function."""
     output_mediator = self._CreateOutputMediator()
@@ -179,9 +408,30 @@ class SharedElasticsearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     self.assertIsNotNone(output_module._client)
 
+    client = output_module._client
+
+    event = self._CreateTestEvent()
+    output_module._InsertEvent(event)
+
     output_module.Close()
 
     self.assertIsNone(output_module._client)
+    self.assertIsNone(output_module._bulk_indexer)
+
+    # The buffered event documents are inserted on close.
+    self.assertEqual(client.bulk.call_count, 1)
+
+  def testSetChunkSize(self):
+    """Tests the SetChunkSize function."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = TestElasticsearchOutputModule(output_mediator)
+
+    self.assertEqual(
+        output_module._chunk_size, output_module._DEFAULT_CHUNK_SIZE)
+
+    output_module.SetChunkSize(1024)
+
+    self.assertEqual(output_module._chunk_size, 1024)
 
   def testSetDocumentType(self):
     """Tests the SetDocumentType function."""
@@ -218,6 +468,19 @@ class SharedElasticsearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     self.assertEqual(output_module._index_name, 'test_index')
 
+  def testSetNumberOfSenderThreads(self):
+    """Tests the SetNumberOfSenderThreads function."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = TestElasticsearchOutputModule(output_mediator)
+
+    self.assertEqual(
+        output_module._number_of_sender_threads,
+        output_module._DEFAULT_NUMBER_OF_SENDER_THREADS)
+
+    output_module.SetNumberOfSenderThreads(4)
+
+    self.assertEqual(output_module._number_of_sender_threads, 4)
+
   def testSetPassword(self):
     """Tests the SetPassword function."""
     output_mediator = self._CreateOutputMediator()
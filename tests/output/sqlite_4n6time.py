@@ -43,6 +43,8 @@ class TestEventData(events.EventData):
 class SqliteOutputModuleTest(test_lib.OutputModuleTestCase):
   """Tests for the 4n6time SQLite output module."""
 
+  # pylint: disable=protected-access
+
   # TODO: remove after event data refactor.
   def _MergeEventAndEventData(self, event, event_data):
     """Merges the event data with the event.
@@ -116,6 +118,77 @@ class SqliteOutputModuleTest(test_lib.OutputModuleTestCase):
       row_dict = dict(zip(row.keys(), row))
       self.assertDictContainsSubset(expected_dict, row_dict)
 
+  def testOutputMetadata(self):
+    """Tests the metadata tables written by the output module."""
+    timestamp = timelib.Timestamp.CopyFromString(
+        '2012-06-27 18:17:01+00:00')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_mediator = self._CreateOutputMediator()
+      sqlite_output = sqlite_4n6time.SQLite4n6TimeOutputModule(
+          output_mediator)
+      sqlite_output._INSERT_BATCH_SIZE = 2
+
+      sqlite_file = os.path.join(temp_directory, '4n6time.db')
+      sqlite_output.SetFilename(sqlite_file)
+
+      sqlite_output.Open()
+      for index, username in enumerate(['root', 'user', 'root', '"quoted"']):
+        event = time_events.TimestampEvent(
+            timestamp + index, definitions.TIME_DESCRIPTION_WRITTEN)
+        self._MergeEventAndEventData(event, TestEventData())
+        event.username = username
+        sqlite_output.WriteEventBody(event)
+      sqlite_output.Close()
+
+      sqlite_connection = sqlite3.connect(sqlite_file)
+
+      cursor = sqlite_connection.execute('SELECT COUNT(*) FROM log2timeline')
+      self.assertEqual(cursor.fetchone()[0], 4)
+
+      cursor = sqlite_connection.execute(
+          'SELECT users, frequency FROM l2t_users ORDER BY users')
+      self.assertEqual(
+          cursor.fetchall(), [('"quoted"', 1), ('root', 2), ('user', 1)])
+
+      cursor = sqlite_connection.execute(
+          'SELECT record_numbers, frequency FROM l2t_record_numbers')
+      self.assertEqual(cursor.fetchall(), [('0', 4)])
+
+      cursor = sqlite_connection.execute(
+          'SELECT name FROM sqlite_master WHERE type = "index" '
+          'ORDER BY name')
+      expected_index_names = [
+          'datetime_idx', 'host_idx', 'source_idx', 'sourcetype_idx',
+          'type_idx', 'user_idx']
+      self.assertEqual(
+          [row[0] for row in cursor.fetchall()], expected_index_names)
+
+      sqlite_connection.close()
+
+      # Test appending events to the database.
+      sqlite_output = sqlite_4n6time.SQLite4n6TimeOutputModule(
+          output_mediator)
+      sqlite_output.SetAppendMode(True)
+      sqlite_output.SetFilename(sqlite_file)
+
+      sqlite_output.Open()
+      event = time_events.TimestampEvent(
+          timestamp, definitions.TIME_DESCRIPTION_WRITTEN)
+      self._MergeEventAndEventData(event, TestEventData())
+      event.username = 'user'
+      sqlite_output.WriteEventBody(event)
+      sqlite_output.Close()
+
+      sqlite_connection = sqlite3.connect(sqlite_file)
+
+      cursor = sqlite_connection.execute(
+          'SELECT users, frequency FROM l2t_users ORDER BY users')
+      self.assertEqual(
+          cursor.fetchall(), [('"quoted"', 1), ('root', 2), ('user', 2)])
+
+      sqlite_connection.close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -177,6 +177,33 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
   # TODO: add tests for ProcessEvent.
   # TODO: add tests for ProduceEventSource.
 
+  def testProduceEventData(self):
+    """Tests the ProduceEventData method."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    event_data = events.EventData()
+    event_data.text = 'test'
+
+    event_data_identifier = parsers_mediator.ProduceEventData(event_data)
+    self.assertIsNotNone(event_data_identifier)
+
+    # The event data is stored when the first event is produced.
+    stored_event_data = list(storage_writer.GetEventData())
+    self.assertEqual(len(stored_event_data), 0)
+
+    date_time = fake_time.FakeTime()
+    event_with_timestamp = time_events.DateTimeValuesEvent(
+        date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+    parsers_mediator.ProduceEventWithEventDataIdentifier(
+        event_with_timestamp, event_data_identifier)
+
+    stored_event_data = list(storage_writer.GetEventData())
+    self.assertEqual(len(stored_event_data), 1)
+    self.assertEqual(stored_event_data[0].text, 'test')
+
   def testProduceEventWithEventData(self):
     """Tests the ProduceEventWithEventData method."""
     session = sessions.Session()
@@ -198,6 +225,147 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
       parsers_mediator.ProduceEventWithEventData(
           event_without_timestamp, event_data)
 
+  def testProduceEventWithEventDataIdentifier(self):
+    """Tests the ProduceEventWithEventDataIdentifier method."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    event_data = events.EventData()
+    event_data_identifier = parsers_mediator.ProduceEventData(event_data)
+
+    for _ in range(2):
+      date_time = fake_time.FakeTime()
+      event_with_timestamp = time_events.DateTimeValuesEvent(
+          date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+      parsers_mediator.ProduceEventWithEventDataIdentifier(
+          event_with_timestamp, event_data_identifier)
+
+      self.assertEqual(
+          event_with_timestamp.GetEventDataIdentifier(),
+          event_data.GetIdentifier())
+
+    self.assertEqual(storage_writer.number_of_errors, 0)
+    self.assertEqual(storage_writer.number_of_events, 2)
+    self.assertEqual(len(list(storage_writer.GetEventData())), 1)
+
+    event_without_timestamp = events.EventObject()
+    with self.assertRaises(errors.InvalidEvent):
+      parsers_mediator.ProduceEventWithEventDataIdentifier(
+          event_without_timestamp, event_data_identifier)
+
+  def testProduceEventWithEventDataIdentifierInvalidTimestamp(self):
+    """Tests ProduceEventWithEventDataIdentifier with an invalid timestamp."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    event_data = events.EventData()
+    event_data_identifier = parsers_mediator.ProduceEventData(event_data)
+
+    event_without_timestamp = events.EventObject()
+    with self.assertRaises(errors.InvalidEvent):
+      parsers_mediator.ProduceEventWithEventDataIdentifier(
+          event_without_timestamp, event_data_identifier)
+
+    # No event data is stored without events.
+    self.assertEqual(storage_writer.number_of_events, 0)
+    self.assertEqual(len(list(storage_writer.GetEventData())), 0)
+
+    # Test that event data produced after the invalid event is stored.
+    event_data = events.EventData()
+    event_data.text = 'test'
+    event_data_identifier = parsers_mediator.ProduceEventData(event_data)
+
+    date_time = fake_time.FakeTime()
+    event_with_timestamp = time_events.DateTimeValuesEvent(
+        date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+    parsers_mediator.ProduceEventWithEventDataIdentifier(
+        event_with_timestamp, event_data_identifier)
+
+    stored_event_data = list(storage_writer.GetEventData())
+    self.assertEqual(len(stored_event_data), 1)
+    self.assertEqual(stored_event_data[0].text, 'test')
+    self.assertEqual(storage_writer.number_of_events, 1)
+
+  def testProduceEventWithEventDataIdentifierInterleaved(self):
+    """Tests ProduceEventWithEventDataIdentifier with interleaved handles."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    event_data1 = events.EventData()
+    event_data1.text = 'test1'
+    event_data_identifier1 = parsers_mediator.ProduceEventData(event_data1)
+
+    event_data2 = events.EventData()
+    event_data2.text = 'test2'
+    event_data_identifier2 = parsers_mediator.ProduceEventData(event_data2)
+
+    produced_events = []
+    for event_data_identifier in (
+        event_data_identifier1, event_data_identifier2,
+        event_data_identifier1, event_data_identifier2):
+      date_time = fake_time.FakeTime()
+      event_with_timestamp = time_events.DateTimeValuesEvent(
+          date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+      parsers_mediator.ProduceEventWithEventDataIdentifier(
+          event_with_timestamp, event_data_identifier)
+      produced_events.append(event_with_timestamp)
+
+    self.assertEqual(storage_writer.number_of_events, 4)
+    self.assertEqual(len(list(storage_writer.GetEventData())), 2)
+
+    expected_event_data_identifiers = [
+        event_data1.GetIdentifier(), event_data2.GetIdentifier()] * 2
+    event_data_identifiers = [
+        event.GetEventDataIdentifier() for event in produced_events]
+    self.assertEqual(event_data_identifiers, expected_event_data_identifiers)
+
+  def testProduceEventWithEventDataIdentifierReused(self):
+    """Tests ProduceEventWithEventDataIdentifier with a reused handle."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+    parsers_mediator = self._CreateParserMediator(storage_writer)
+
+    event_data1 = events.EventData()
+    event_data1.text = 'test1'
+    event_data_identifier1 = parsers_mediator.ProduceEventData(event_data1)
+
+    date_time = fake_time.FakeTime()
+    event_with_timestamp = time_events.DateTimeValuesEvent(
+        date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+    parsers_mediator.ProduceEventWithEventDataIdentifier(
+        event_with_timestamp, event_data_identifier1)
+
+    event_data2 = events.EventData()
+    event_data2.text = 'test2'
+    event_data_identifier2 = parsers_mediator.ProduceEventData(event_data2)
+
+    date_time = fake_time.FakeTime()
+    event_with_timestamp = time_events.DateTimeValuesEvent(
+        date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+    parsers_mediator.ProduceEventWithEventDataIdentifier(
+        event_with_timestamp, event_data_identifier2)
+
+    # Produce another event of the event data produced first.
+    date_time = fake_time.FakeTime()
+    event_with_timestamp = time_events.DateTimeValuesEvent(
+        date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+    parsers_mediator.ProduceEventWithEventDataIdentifier(
+        event_with_timestamp, event_data_identifier1)
+
+    self.assertEqual(storage_writer.number_of_events, 3)
+    self.assertEqual(len(list(storage_writer.GetEventData())), 2)
+
+    self.assertEqual(
+        event_with_timestamp.GetEventDataIdentifier(),
+        event_data1.GetIdentifier())
+
   # TODO: add tests for ProduceExtractionError.
   # TODO: add tests for RemoveEventAttribute.
 
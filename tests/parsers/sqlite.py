@@ -13,6 +13,53 @@ from tests import test_lib as shared_test_lib
 from tests.parsers import test_lib
 
 
+class SQLiteCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the SQLite cache."""
+
+  def testHasChangedTables(self):
+    """Tests the HasChangedTables function."""
+    cache = sqlite.SQLiteCache()
+
+    table_names = frozenset(['mytable'])
+    self.assertFalse(cache.HasChangedTables(table_names))
+
+    cache.SetChangedTableNames(['MyTable', 'My Other Table'])
+    self.assertTrue(cache.HasChangedTables(table_names))
+    self.assertTrue(cache.HasChangedTables(frozenset(['my other table'])))
+    self.assertFalse(cache.HasChangedTables(frozenset(['mytable2'])))
+
+
+class SQLiteDatabaseTest(test_lib.ParserTestCase):
+  """Tests for the SQLite database."""
+
+  @shared_test_lib.skipUnlessHasTestFile(['wal_database.db'])
+  @shared_test_lib.skipUnlessHasTestFile(['wal_database.db-wal'])
+  def testGetChangedTableNames(self):
+    """Tests the GetChangedTableNames function."""
+    database_file = self._GetTestFilePath(['wal_database.db'])
+    wal_file = self._GetTestFilePath(['wal_database.db-wal'])
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    with open(database_file, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+    try:
+      self.assertEqual(database.GetChangedTableNames(), set())
+    finally:
+      database.Close()
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    with open(database_file, 'rb') as database_file_object:
+      with open(wal_file, 'rb') as wal_file_object:
+        database.Open(database_file_object, wal_file_object=wal_file_object)
+
+    try:
+      self.assertEqual(
+          database.GetChangedTableNames(), set(['MyTable', 'NewTable']))
+    finally:
+      database.Close()
+
+
 class SQLiteParserTest(test_lib.ParserTestCase):
   """Tests for the SQLite database parser."""
 
@@ -38,6 +85,42 @@ class SQLiteParserTest(test_lib.ParserTestCase):
       chain = event.parser
       self.assertEqual(1, chain.count('/'))
 
+  @shared_test_lib.skipUnlessHasTestFile(['wal_database.db'])
+  @shared_test_lib.skipUnlessHasTestFile(['wal_database.db-wal'])
+  def testGetTemporaryCopyFileObject(self):
+    """Tests the GetTemporaryCopyFileObject function."""
+    database_file = self._GetTestFilePath(['wal_database.db'])
+    wal_file = self._GetTestFilePath(['wal_database.db-wal'])
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    self.assertIsNone(database.GetTemporaryCopyFileObject())
+
+    with open(database_file, 'rb') as database_file_object:
+      expected_data = database_file_object.read()
+      database.Open(database_file_object)
+
+    database_wal = sqlite.SQLiteDatabase('wal_database.db')
+    try:
+      file_object = database.GetTemporaryCopyFileObject()
+      try:
+        self.assertEqual(file_object.read(), expected_data)
+
+        with open(wal_file, 'rb') as wal_file_object:
+          database_wal.Open(file_object, wal_file_object=wal_file_object)
+
+      finally:
+        file_object.close()
+
+      rows = database.Query('SELECT Field1 FROM MyTable WHERE Field2 = 3')
+      self.assertEqual(len(rows.fetchall()), 1)
+
+      rows = database_wal.Query('SELECT Field1 FROM MyTable WHERE Field2 = 3')
+      self.assertEqual(len(rows.fetchall()), 0)
+
+    finally:
+      database_wal.Close()
+      database.Close()
+
   @shared_test_lib.skipUnlessHasTestFile(['wal_database.db'])
   @shared_test_lib.skipUnlessHasTestFile(['wal_database.db-wal'])
   def testQueryDatabaseWithWAL(self):
@@ -11,6 +11,7 @@ from plaso.containers import time_events
 from plaso.lib import definitions
 from plaso.lib import py2to3
 from plaso.lib import timelib
+from plaso.parsers import sqlite
 from plaso.parsers.sqlite_plugins import interface
 
 from tests import test_lib as shared_test_lib
@@ -99,6 +100,8 @@ class TestSQLitePlugin(interface.SQLitePlugin):
 class SQLiteInterfaceTest(test_lib.SQLitePluginTestCase):
   """Tests for the SQLite plugin interface."""
 
+  # pylint: disable=protected-access
+
   @shared_test_lib.skipUnlessHasTestFile(['wal_database.db'])
   @shared_test_lib.skipUnlessHasTestFile(['wal_database.db-wal'])
   def testProcessWithWAL(self):
@@ -123,6 +126,121 @@ class SQLiteInterfaceTest(test_lib.SQLitePluginTestCase):
 
     self.assertEqual(plugin.results, expected_results)
 
+  @shared_test_lib.skipUnlessHasTestFile(['wal_database.db'])
+  @shared_test_lib.skipUnlessHasTestFile(['wal_database.db-wal'])
+  def testProcessChangedRowsOnly(self):
+    """Tests the Process function on a database and its WAL file."""
+    plugin = TestSQLitePlugin()
+    storage_writer = self._CreateStorageWriter()
+
+    file_entry, database = self._OpenDatabaseFile(['wal_database.db'])
+
+    wal_file = self._GetTestFilePath(['wal_database.db-wal'])
+    _, database_wal = self._OpenDatabaseFile(
+        ['wal_database.db'], wal_path=wal_file)
+
+    parser_mediator = self._CreateParserMediator(
+        storage_writer, file_entry=file_entry)
+    parser_mediator.SetFileEntry(file_entry)
+
+    try:
+      cache = sqlite.SQLiteCache()
+      cache.SetChangedTableNames(database_wal.GetChangedTableNames())
+
+      plugin.Process(
+          parser_mediator, cache=cache, database=database,
+          database_wal=database_wal)
+      self.assertEqual(len(plugin.results), 10)
+
+      plugin.results = []
+      plugin.Process(
+          parser_mediator, cache=cache, database=database_wal,
+          database_wal=database_wal)
+
+    finally:
+      database_wal.Close()
+      database.Close()
+
+    expected_results = [
+        ('Modified Committed Text 3', 4, None),
+        ('Unhashable Row 2', 11, b'More Binary Text!\x01\x02\x03'),
+        ('New Text 1', 12, None),
+        ('New Text 2', 13, None)]
+
+    self.assertEqual(plugin.results, expected_results)
+
+    # The queries of a plugin of which none of the tables were changed are
+    # not run on the database with the WAL file committed.
+    plugin.results = []
+    _, database_wal = self._OpenDatabaseFile(
+        ['wal_database.db'], wal_path=wal_file)
+
+    try:
+      plugin.Process(
+          parser_mediator, cache=sqlite.SQLiteCache(), database=database_wal,
+          database_wal=database_wal)
+    finally:
+      database_wal.Close()
+
+    self.assertEqual(plugin.results, [])
+
+  def testGetTableNames(self):
+    """Tests the _GetTableNames function."""
+    plugin = interface.SQLitePlugin()
+    plugin.REQUIRED_TABLES = frozenset(['MyTable'])
+    plugin.SCHEMAS = [
+        {'MyTable': 'CREATE TABLE MyTable (Field1 TEXT)'},
+        {'MyTable': 'CREATE TABLE MyTable (Field1 TEXT)',
+         'NewTable': 'CREATE TABLE NewTable (Field1 TEXT)'}]
+
+    table_names = plugin._GetTableNames()
+    self.assertEqual(table_names, frozenset(['mytable', 'newtable']))
+
+  def testHashRow(self):
+    """Tests the _HashRow function."""
+    plugin = TestSQLitePlugin()
+
+    hash_value = plugin._HashRow(('text', 1, b'\x01\x02'))
+    self.assertLess(hash_value, 2 ** 64)
+    self.assertEqual(hash_value, plugin._HashRow(('text', 1, b'\x01\x02')))
+    self.assertNotEqual(
+        hash_value, plugin._HashRow(('text', '1', b'\x01\x02')))
+    self.assertNotEqual(
+        plugin._HashRow(('a', 'bc')), plugin._HashRow(('ab', 'c')))
+    self.assertNotEqual(plugin._HashRow((None, )), plugin._HashRow(('', )))
+
+  @shared_test_lib.skipUnlessHasTestFile(['wal_database.db'])
+  @shared_test_lib.skipUnlessHasTestFile(['wal_database.db-wal'])
+  def testHashRowWithBlob(self):
+    """Tests the _HashRow function on blob rows of a database and its WAL."""
+    plugin = TestSQLitePlugin()
+
+    _, database = self._OpenDatabaseFile(['wal_database.db'])
+
+    wal_file = self._GetTestFilePath(['wal_database.db-wal'])
+    _, database_wal = self._OpenDatabaseFile(
+        ['wal_database.db'], wal_path=wal_file)
+
+    query = 'SELECT Field1, Field2, Field3 FROM MyTable WHERE Field2 = 10'
+
+    try:
+      rows = database.Query(query).fetchall()
+      rows_wal = database_wal.Query(query).fetchall()
+
+      self.assertEqual(len(rows), 1)
+      self.assertEqual(len(rows_wal), 1)
+
+      hash_value = plugin._HashRow(rows[0])
+      self.assertEqual(hash_value, plugin._HashRow(rows_wal[0]))
+
+      # Test that the same row is hashed the same when queried again.
+      rows = database.Query(query).fetchall()
+      self.assertEqual(hash_value, plugin._HashRow(rows[0]))
+
+    finally:
+      database_wal.Close()
+      database.Close()
+
   @shared_test_lib.skipUnlessHasTestFile(['wal_database.db'])
   def testProcessWithoutWAL(self):
     """Tests the Process function on a database without WAL file."""
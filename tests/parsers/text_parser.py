@@ -4,6 +4,8 @@
 
 from __future__ import unicode_literals
 
+import io
+import re
 import unittest
 
 import pyparsing
@@ -13,6 +15,196 @@ from plaso.parsers import text_parser
 from tests.parsers import test_lib
 
 
+class TestFileObject(io.BytesIO):
+  """File-like object for testing."""
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+    """
+    return len(self.getvalue())
+
+
+class BufferedTextFileTest(unittest.TestCase):
+  """Tests for the buffered text file."""
+
+  # pylint: disable=protected-access
+
+  def testReadline(self):
+    """Tests the readline function."""
+    file_object = TestFileObject(
+        '\ufeffFirst line\r\nSecond line\n\nLast line'.encode('utf-8'))
+    text_file_object = text_parser.BufferedTextFile(file_object)
+
+    self.assertEqual(text_file_object.readline(), 'First line\r\n')
+    self.assertEqual(text_file_object.get_offset(), 15)
+    self.assertEqual(text_file_object.readline(), 'Second line\n')
+    self.assertEqual(text_file_object.readline(), '\n')
+    self.assertEqual(text_file_object.readline(), 'Last line')
+    self.assertEqual(text_file_object.get_offset(), 37)
+    self.assertEqual(text_file_object.readline(), '')
+
+  def testReadlineWithSize(self):
+    """Tests the readline function with a maximum size."""
+    file_object = TestFileObject(b'0123456789\nabc\n')
+    text_file_object = text_parser.BufferedTextFile(file_object)
+
+    self.assertEqual(text_file_object.readline(size=4), '0123')
+    self.assertEqual(text_file_object.readline(size=4), '4567')
+    self.assertEqual(text_file_object.readline(size=4), '89\n')
+    self.assertEqual(text_file_object.readline(size=4), 'abc\n')
+    self.assertEqual(text_file_object.get_offset(), 15)
+    self.assertEqual(text_file_object.readline(size=4), '')
+
+  def testReadlineWithSmallReadBuffer(self):
+    """Tests the readline function with lines spanning multiple reads."""
+    file_object = TestFileObject(b'first\r\nsecond\r\nthird')
+    text_file_object = text_parser.BufferedTextFile(
+        file_object, end_of_line='\r\n')
+    text_file_object._READ_BUFFER_SIZE = 3
+
+    self.assertEqual(text_file_object.readline(), 'first\r\n')
+    self.assertEqual(text_file_object.readline(), 'second\r\n')
+    self.assertEqual(text_file_object.readline(), 'third')
+    self.assertEqual(text_file_object.readline(), '')
+
+  def testReadlineWithInvalidEncoding(self):
+    """Tests the readline function with data that cannot be decoded."""
+    file_object = TestFileObject(b'\xff\xfe\n')
+    text_file_object = text_parser.BufferedTextFile(file_object)
+
+    with self.assertRaises(UnicodeDecodeError):
+      text_file_object.readline()
+
+
+class RegularExpressionStructureTest(unittest.TestCase):
+  """Tests for the regular expression structure."""
+
+  def testFromMatch(self):
+    """Tests the FromMatch function."""
+    regular_expression = re.compile(
+        r'^(?P<name>[a-z]+)=(?P<value>[0-9]+)(?: (?P<comment>.*))?$')
+
+    match = regular_expression.match('count=12')
+    structure = text_parser.RegularExpressionStructure.FromMatch(match)
+
+    self.assertEqual(structure.name, 'count')
+    self.assertEqual(structure.value, '12')
+    self.assertEqual(structure.comment, '')
+    self.assertEqual(structure.get('value'), '12')
+    self.assertIsNone(structure.get('comment'))
+    self.assertEqual(structure.get('comment', 'bogus'), 'bogus')
+    self.assertEqual(structure.bogus, '')
+    self.assertEqual(str(structure), str(['count', '12']))
+
+  def testStructure(self):
+    """Tests a structure with nested values."""
+    date_time = text_parser.RegularExpressionStructure([
+        ('year', 2018), ('month', 'Aug')])
+    structure = text_parser.RegularExpressionStructure([
+        ('date_time', date_time), ('text', 'message')])
+
+    self.assertTrue(structure)
+    self.assertEqual(structure.date_time.year, 2018)
+    self.assertEqual(structure.date_time.month, 'Aug')
+    self.assertEqual(str(structure.date_time), str([2018, 'Aug']))
+
+    with self.assertRaises(AttributeError):
+      _ = structure._bogus
+
+
+class TestMultiLineTextParser(text_parser.PyparsingMultiLineTextParser):
+  """Multi line text parser for testing.
+
+  Attributes:
+    records (list[tuple[str, str]]): year and text of the parsed records.
+  """
+
+  NAME = 'test_multi_line'
+
+  _ENCODING = 'utf-8'
+
+  LINE_STRUCTURES = [
+      ('record', (
+          pyparsing.Word(pyparsing.nums, exact=4).setResultsName('year') +
+          pyparsing.SkipTo(pyparsing.StringEnd()).setResultsName('text')))]
+
+  RECORD_START_REGULAR_EXPRESSION = re.compile(r'[0-9]{4} ')
+
+  def __init__(self):
+    """Initializes a multi line text parser for testing."""
+    super(TestMultiLineTextParser, self).__init__()
+    self.records = []
+
+  def ParseRecord(self, parser_mediator, key, structure):
+    """Parses a log record structure.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      key (str): name of the parsed structure.
+      structure (pyparsing.ParseResults): tokens from a parsed log line.
+    """
+    self.records.append((structure.year, structure.text))
+
+  def VerifyStructure(self, parser_mediator, lines):
+    """Verifies the structure of the file.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      lines (str): one or more lines from the text file.
+
+    Returns:
+      bool: True since any file is supported.
+    """
+    return True
+
+
+class PyparsingMultiLineTextParserTest(test_lib.ParserTestCase):
+  """Tests for the multi line PyParsing-based text parser."""
+
+  def testParseFileObjectWithRecords(self):
+    """Tests the ParseFileObject function with a record start expression."""
+    parser = TestMultiLineTextParser()
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+
+    file_object = TestFileObject((
+        'bogus line\n'
+        '2018 first\r\n'
+        '\tcontinued\r\n'
+        '2019 second\n').encode('utf-8'))
+    parser.ParseFileObject(parser_mediator, file_object)
+
+    self.assertEqual(storage_writer.number_of_errors, 1)
+
+    expected_records = [
+        ('2018', 'first\n\tcontinued\n'),
+        ('2019', 'second\n')]
+    self.assertEqual(parser.records, expected_records)
+
+  def testParseFileObjectWithLargeRecord(self):
+    """Tests the ParseFileObject function with a record larger than buffer."""
+    parser = TestMultiLineTextParser()
+    parser._buffer_size = 32  # pylint: disable=protected-access
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+
+    file_object = TestFileObject((
+        '2018 first\n'
+        'continued with a long line\n'
+        '2019 second\n').encode('utf-8'))
+    parser.ParseFileObject(parser_mediator, file_object)
+
+    self.assertEqual(storage_writer.number_of_errors, 1)
+
+    expected_records = [('2018', 'first\n'), ('2019', 'second\n')]
+    self.assertEqual(parser.records, expected_records)
+
+
 class PyparsingConstantsTest(test_lib.ParserTestCase):
   """Tests the PyparsingConstants text parser."""
 
@@ -6,6 +6,8 @@ from __future__ import unicode_literals
 
 import unittest
 
+from plaso.containers import windows_events
+from plaso.engine import configurations
 from plaso.formatters import winevtx as _  # pylint: disable=unused-import
 from plaso.lib import definitions
 from plaso.parsers import winevtx
@@ -164,5 +166,47 @@ class WinEvtxParserTest(test_lib.ParserTestCase):
     self.assertEqual(event.event_identifier, 4648)
 
 
+  @shared_test_lib.skipUnlessHasTestFile(['System.evtx'])
+  def testParseWithXMLTemplates(self):
+    """Tests the Parse function with XML templates enabled."""
+    parser = winevtx.WinEvtxParser()
+
+    storage_writer = self._CreateStorageWriter()
+    file_entry = self._GetTestFileEntry(['System.evtx'])
+    parser_mediator = self._CreateParserMediator(
+        storage_writer, file_entry=file_entry)
+
+    configuration = configurations.EventExtractionConfiguration()
+    configuration.evtx_xml_templates = True
+    parser_mediator.SetEventExtractionConfiguration(configuration)
+
+    file_object = file_entry.GetFileObject()
+    try:
+      parser.Parse(parser_mediator, file_object)
+    finally:
+      file_object.close()
+
+    self.assertEqual(storage_writer.number_of_errors, 0)
+    self.assertEqual(storage_writer.number_of_events, 1601)
+
+    templates = set()
+    for event_data in storage_writer.GetEventData():
+      self.assertIsNone(event_data.xml_string)
+      templates.add(event_data.xml_template)
+
+    self.assertLess(len(templates), 100)
+
+    event = list(storage_writer.GetEvents())[0]
+
+    self.assertEqual(event.xml_values[0], '105')
+
+    xml_template = windows_events.WindowsEventLogXMLTemplate(
+        template=event.xml_template)
+    xml_string = xml_template.Render(event.xml_values)
+
+    self.assertTrue(xml_string.startswith('<Event xmlns="http://schemas.'))
+    self.assertIn('<EventRecordID>12049</EventRecordID>', xml_string)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -16,6 +16,39 @@ from tests.parsers import test_lib
 class XChatLogUnitTest(test_lib.ParserTestCase):
   """Tests for the xchatlog parser."""
 
+  # pylint: disable=protected-access
+
+  def testGetRegularExpressionStructure(self):
+    """Tests the _GetRegularExpressionStructure function."""
+    parser = xchatlog.XChatLogParser()
+    regular_expression = parser.LINE_REGULAR_EXPRESSIONS['logline']
+
+    test_lines = [
+        'dec 31 21:11:55 --> You are now talking on #gugle',
+        'dec 31 21:11:55      Topic for #gugle set by Kristinn',
+        'dec 31 21:11:58 <fpi> ola plas-ing guys!',
+        'feb 26 19:56:01 <empty_text>']
+
+    for line in test_lines:
+      match = regular_expression.match(line)
+      self.assertIsNotNone(match)
+
+      structure = parser._GetRegularExpressionStructure('logline', match)
+      expected_structure = parser._LOG_LINE.parseString(line)
+
+      self.assertEqual(
+          list(structure.date_time), list(expected_structure.date_time))
+      self.assertEqual(structure.nickname, expected_structure.nickname)
+      self.assertEqual(
+          structure.text.split(), expected_structure.text.split())
+
+    # Lines where pyparsing would parse a nickname that the regular expression
+    # does not match are left to pyparsing.
+    self.assertIsNone(regular_expression.match(
+        'dec 31 21:11:55 <a nickname> text'))
+    self.assertIsNone(regular_expression.match(
+        ' dec 31 21:11:55 --- Topic for #gugle is plaso, a difficult word'))
+
   @shared_test_lib.skipUnlessHasTestFile(['xchat.log'])
   def testParse(self):
     """Tests the Parse function."""
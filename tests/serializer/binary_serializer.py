@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the serializer object implementation using a binary format."""
+
+from __future__ import unicode_literals
+
+import collections
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import events
+from plaso.containers import event_sources
+from plaso.containers import reports
+from plaso.containers import sessions
+from plaso.containers import tasks
+from plaso.serializer import binary_serializer
+
+from tests import test_lib as shared_test_lib
+
+
+class BinaryAttributeContainerSerializerTest(shared_test_lib.BaseTestCase):
+  """Tests for the binary attribute container serializer object."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestPathSpec(self):
+    """Creates a path specification for testing.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+    """
+    test_file = self._GetTestFilePath(['ímynd.dd'])
+
+    volume_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file)
+    return path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=15,
+        location='/passwords.txt', parent=volume_path_spec)
+
+  def testReadAndWriteSerializedAnalysisReport(self):
+    """Test ReadSerialized and WriteSerialized of AnalysisReport."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    expected_analysis_report = reports.AnalysisReport(
+        plugin_name='chrome_extension_test', text='Report text.')
+    expected_analysis_report.report_dict = {
+        'dude': [['Google Keep', 'hmjkmjkepdijhoojdojkdfohbdgmmhki']]}
+    expected_analysis_report.time_compiled = 1431978243000000
+
+    serialized_data = serializer.WriteSerialized(expected_analysis_report)
+    self.assertIsNotNone(serialized_data)
+
+    analysis_report = serializer.ReadSerialized(serialized_data)
+    self.assertIsInstance(analysis_report, reports.AnalysisReport)
+
+    self.assertEqual(
+        analysis_report.CopyToDict(), expected_analysis_report.CopyToDict())
+
+  def testReadAndWriteSerializedEventObject(self):
+    """Test ReadSerialized and WriteSerialized of EventObject."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    path_spec = self._CreateTestPathSpec()
+
+    expected_event = events.EventObject()
+    expected_event.data_type = 'test:event2'
+    expected_event.pathspec = path_spec
+    expected_event.timestamp = 1234124
+    expected_event.timestamp_desc = 'Written'
+
+    expected_event.binary_string = b'\xc0\x90\x90binary'
+    expected_event.empty_string = ''
+    expected_event.zero_integer = 0
+    expected_event.integer = 34
+    expected_event.large_integer = 0x123456789abcdef0123
+    expected_event.float = -122.082203542683
+    expected_event.string = 'Normal string'
+    expected_event.unicode_string = 'And I am a unicorn ☃ \udc80.'
+    expected_event.my_list = ['asf', 4234, 2, None, True, False]
+    expected_event.my_dict = {
+        'a': 'not b', 'c': 34, 'list': ['sf', 234], 'an': [234, 32]}
+    expected_event.a_tuple = (
+        'some item', [234, 52, 15], {'a': 'not a', 'b': 'not b'}, 35)
+    expected_event.my_counter = collections.Counter({'a': 1, 'b': 2})
+
+    serialized_data = serializer.WriteSerialized(expected_event)
+    self.assertIsNotNone(serialized_data)
+
+    event = serializer.ReadSerialized(serialized_data)
+    self.assertIsInstance(event, events.EventObject)
+
+    event_dict = event.CopyToDict()
+    self.assertEqual(event_dict, expected_event.CopyToDict())
+    self.assertEqual(event.pathspec.comparable, path_spec.comparable)
+    self.assertIsInstance(event.a_tuple, tuple)
+    self.assertIsInstance(event.my_counter, collections.Counter)
+
+  def testReadAndWriteSerializedEventSource(self):
+    """Test ReadSerialized and WriteSerialized of EventSource."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    path_spec = self._CreateTestPathSpec()
+
+    expected_event_source = event_sources.FileEntryEventSource(
+        path_spec=path_spec)
+    expected_event_source.size = 100
+
+    serialized_data = serializer.WriteSerialized(expected_event_source)
+    self.assertIsNotNone(serialized_data)
+
+    event_source = serializer.ReadSerialized(serialized_data)
+    self.assertIsInstance(event_source, event_sources.EventSource)
+
+    self.assertEqual(event_source.path_spec.comparable, path_spec.comparable)
+    self.assertEqual(event_source.size, 100)
+
+    # Identical path specifications are only deserialized once.
+    other_event_source = serializer.ReadSerialized(serialized_data)
+    self.assertIs(other_event_source.path_spec, event_source.path_spec)
+
+  def testReadAndWriteSerializedSession(self):
+    """Test ReadSerialized and WriteSerialized of Session."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    parsers_counter = collections.Counter()
+    parsers_counter['filestat'] = 3
+    parsers_counter['total'] = 3
+
+    expected_session = sessions.Session()
+    expected_session.product_name = 'plaso'
+    expected_session.product_version = '20180101'
+    expected_session.parsers_counter = parsers_counter
+
+    serialized_data = serializer.WriteSerialized(expected_session)
+    self.assertIsNotNone(serialized_data)
+
+    session = serializer.ReadSerialized(serialized_data)
+    self.assertIsInstance(session, sessions.Session)
+
+    self.assertEqual(session.CopyToDict(), expected_session.CopyToDict())
+
+  def testReadAndWriteSerializedTask(self):
+    """Test ReadSerialized and WriteSerialized of Task."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    expected_task = tasks.Task(session_identifier='1234')
+    expected_task.path_specs = [self._CreateTestPathSpec()]
+
+    serialized_data = serializer.WriteSerialized(expected_task)
+    self.assertIsNotNone(serialized_data)
+
+    task = serializer.ReadSerialized(serialized_data)
+    self.assertIsInstance(task, tasks.Task)
+
+    self.assertEqual(task.identifier, expected_task.identifier)
+    self.assertEqual(task.session_identifier, '1234')
+    self.assertEqual(len(task.path_specs), 1)
+
+  def testReadSerialized(self):
+    """Tests the ReadSerialized function with unsupported data."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    self.assertIsNone(serializer.ReadSerialized(b''))
+
+    with self.assertRaises(ValueError):
+      serializer.ReadSerialized(b'\xff')
+
+    event_data = events.EventData()
+    event_data.data_type = 'test:event'
+    serialized_data = serializer.WriteSerialized(event_data)
+
+    with self.assertRaises(ValueError):
+      serializer.ReadSerialized(serialized_data[:-2])
+
+  def testWriteSerialized(self):
+    """Tests the WriteSerialized function with unsupported values."""
+    serializer = binary_serializer.BinaryAttributeContainerSerializer()
+
+    with self.assertRaises(TypeError):
+      serializer.WriteSerialized('bogus')
+
+    event_data = events.EventData()
+    event_data.unsupported = object()
+
+    with self.assertRaises(TypeError):
+      serializer.WriteSerialized(event_data)
+
+
+if __name__ == '__main__':
+  unittest.main()
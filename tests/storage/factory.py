@@ -4,9 +4,11 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from plaso.containers import sessions
+from plaso.lib import definitions
 from plaso.storage import factory
 from plaso.storage.sqlite import sqlite_file
 from plaso.storage.sqlite import reader as sqlite_reader
@@ -19,6 +21,35 @@ from tests.storage import test_lib
 class StorageFactoryTest(test_lib.StorageTestCase):
   """Tests for the storage factory."""
 
+  # pylint: disable=protected-access
+
+  def testCreateStorageFile(self):
+    """Test the CreateStorageFile function."""
+    storage_file = factory.StorageFactory.CreateStorageFile(
+        definitions.STORAGE_FORMAT_SQLITE, cache_size=-4096,
+        journal_mode='memory', page_size=8192)
+    self.assertIsInstance(storage_file, sqlite_file.SQLiteStorageFile)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file.Open(path=temp_file, read_only=False)
+
+      try:
+        storage_file._cursor.execute('PRAGMA cache_size')
+        self.assertEqual(storage_file._cursor.fetchone()[0], -4096)
+
+        storage_file._cursor.execute('PRAGMA journal_mode')
+        self.assertEqual(storage_file._cursor.fetchone()[0], 'memory')
+
+        storage_file._cursor.execute('PRAGMA page_size')
+        self.assertEqual(storage_file._cursor.fetchone()[0], 8192)
+
+      finally:
+        storage_file.Close()
+
+    storage_file = factory.StorageFactory.CreateStorageFile('bogus')
+    self.assertIsNone(storage_file)
+
   @shared_test_lib.skipUnlessHasTestFile(['psort_test.plaso'])
   def testCreateStorageFileForFile(self):
     """Test the CreateStorageFileForFile function."""
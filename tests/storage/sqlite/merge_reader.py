@@ -7,10 +7,16 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import event_sources
+from plaso.containers import events
 from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.lib import definitions
 from plaso.storage.sqlite import merge_reader
+from plaso.storage.sqlite import sqlite_file
 from plaso.storage.sqlite import writer
 
 from tests import test_lib as shared_test_lib
@@ -41,6 +47,16 @@ class SQLiteStorageMergeReaderTest(test_lib.StorageTestCase):
     for event in test_events:
       storage_file.AddEvent(event)
 
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/test.txt')
+    event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+    storage_file.AddEventSource(event_source)
+
+    event_data = events.EventData()
+    event_data.xml_template = '<Event><EventID>\x00</EventID></Event>'
+    event_data.xml_values = ['1']
+    storage_file.AddEventData(event_data)
+
     storage_file.Close()
 
   def testReadStorageMetadata(self):
@@ -84,6 +100,26 @@ class SQLiteStorageMergeReaderTest(test_lib.StorageTestCase):
 
       storage_writer.Close()
 
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=session_storage_path)
+
+      test_event_sources = list(storage_file.GetEventSources())
+      self.assertEqual(len(test_event_sources), 1)
+      self.assertEqual(
+          test_event_sources[0].path_spec.location, '/tmp/test.txt')
+
+      test_event_data = list(storage_file.GetEventData())
+      self.assertEqual(len(test_event_data), 1)
+      self.assertEqual(test_event_data[0].xml_values, ['1'])
+
+      xml_template = storage_file.GetEVTXXMLTemplateByRowIdentifier(
+          test_event_data[0].xml_template_row_identifier)
+      self.assertEqual(
+          xml_template.Render(test_event_data[0].xml_values),
+          '<Event><EventID>1</EventID></Event>')
+
+      storage_file.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
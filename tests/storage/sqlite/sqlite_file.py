@@ -5,26 +5,102 @@
 from __future__ import unicode_literals
 
 import os
+import shutil
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
 from plaso.containers import errors
 from plaso.containers import events
 from plaso.containers import event_sources
 from plaso.containers import reports
 from plaso.containers import sessions
 from plaso.containers import tasks
+from plaso.containers import windows_events
 from plaso.lib import definitions
+from plaso.storage import identifiers
+from plaso.storage import time_range as time_range_lib
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
 from tests.storage import test_lib
 
 
+class BackgroundIteratorTest(shared_test_lib.BaseTestCase):
+  """Tests for the background iterator."""
+
+  def _RaiseAfterFirstValue(self):
+    """Yields a value and raises.
+
+    Yields:
+      int: value.
+
+    Raises:
+      RuntimeError: always after the first value.
+    """
+    yield 1
+    raise RuntimeError('Test error.')
+
+  def testIterate(self):
+    """Tests iterating the values."""
+    background_iterator = sqlite_file._BackgroundIterator(
+        iter(range(10)), maximum_number_of_queued_values=2)
+    self.assertEqual(list(background_iterator), list(range(10)))
+
+    background_iterator = sqlite_file._BackgroundIterator(
+        self._RaiseAfterFirstValue())
+    with self.assertRaises(RuntimeError):
+      list(background_iterator)
+
+    # Stopping early should not block the thread.
+    background_iterator = sqlite_file._BackgroundIterator(
+        iter(range(100)), maximum_number_of_queued_values=1)
+    for value in background_iterator:
+      if value == 3:
+        break
+
+    self.assertFalse(background_iterator._thread.is_alive())
+
+
 class SQLiteStorageFileTest(test_lib.StorageTestCase):
   """Tests for the SQLite-based storage file object."""
 
   # pylint: disable=protected-access
 
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    storage_file = sqlite_file.SQLiteStorageFile(
+        journal_mode='memory', page_size=8192)
+    self.assertEqual(storage_file._journal_mode, 'MEMORY')
+
+    with self.assertRaises(ValueError):
+      sqlite_file.SQLiteStorageFile(journal_mode='bogus')
+
+    with self.assertRaises(ValueError):
+      sqlite_file.SQLiteStorageFile(page_size=1000)
+
+    with self.assertRaises(ValueError):
+      sqlite_file.SQLiteStorageFile(page_size=131072)
+
+  def _AddTestEventsWithEventData(self, storage_file):
+    """Adds events that share event data to a storage file.
+
+    Args:
+      storage_file (SQLiteStorageFile): storage file.
+    """
+    for index in range(2):
+      event_data = events.EventData()
+      event_data.offset = index
+      storage_file.AddEventData(event_data)
+
+      for timestamp in (1334940286000000, 1334961526929596):
+        event = events.EventObject()
+        event.timestamp = timestamp + index
+        event.timestamp_desc = definitions.TIME_DESCRIPTION_WRITTEN
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        storage_file.AddEvent(event)
+
   def testAddAttributeContainer(self):
     """Tests the _AddAttributeContainer function."""
     event_data = events.EventData()
@@ -135,6 +211,80 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testReadEventDataIntoCache(self):
+    """Tests the _ReadEventDataIntoCache function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self._AddTestEventsWithEventData(storage_file)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      test_events = list(storage_file.GetEvents())
+      self.assertEqual(len(test_events), 4)
+      self.assertEqual(len(storage_file._event_data_cache), 0)
+
+      storage_file._ReadEventDataIntoCache(test_events)
+      self.assertEqual(len(storage_file._event_data_cache), 2)
+
+      storage_file.Close()
+
+  def testGetPathSpecRowIdentifier(self):
+    """Tests the _GetPathSpecRowIdentifier function."""
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/image.raw')
+    tsk_path_spec1 = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=15, location='/a',
+        parent=os_path_spec)
+    tsk_path_spec2 = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16, location='/b',
+        parent=os_path_spec)
+
+    # Equal to the first TSK path specification but with a distinct parent
+    # object.
+    other_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/image.raw')
+    tsk_path_spec3 = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=15, location='/a',
+        parent=other_os_path_spec)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      row_identifier1 = storage_file._GetPathSpecRowIdentifier(tsk_path_spec1)
+      row_identifier2 = storage_file._GetPathSpecRowIdentifier(tsk_path_spec2)
+      row_identifier3 = storage_file._GetPathSpecRowIdentifier(tsk_path_spec3)
+
+      self.assertNotEqual(row_identifier1, row_identifier2)
+      self.assertEqual(row_identifier1, row_identifier3)
+
+      # The parent chain is only interned once.
+      self.assertEqual(len(storage_file._path_spec_parent_identifiers), 1)
+
+      # The row identifiers are kept in a bounded cache.
+      self.assertEqual(
+          storage_file._path_spec_row_identifiers.maximum_number_of_values,
+          storage_file._DEFAULT_PATH_SPEC_CACHE_SIZE)
+      self.assertEqual(len(storage_file._path_spec_row_identifiers), 2)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      # Path specifications of a previous session are reused.
+      row_identifier = storage_file._GetPathSpecRowIdentifier(tsk_path_spec2)
+      self.assertEqual(row_identifier, row_identifier2)
+
+      storage_file.Close()
+
   def testHasAttributeContainers(self):
     """Tests the _HasAttributeContainers function."""
     event_data = events.EventData()
@@ -162,6 +312,26 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testHasIndex(self):
+    """Tests the _HasIndex function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      result = storage_file._HasIndex(storage_file._EVENT_TIMESTAMP_INDEX_NAME)
+      self.assertFalse(result)
+
+      storage_file.CreateEventTimestampIndex()
+
+      result = storage_file._HasIndex(storage_file._EVENT_TIMESTAMP_INDEX_NAME)
+      self.assertTrue(result)
+
+      result = storage_file._HasIndex('bogus')
+      self.assertFalse(result)
+
+      storage_file.Close()
+
   def testHasTable(self):
     """Tests the _HasTable function."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -222,8 +392,57 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testWriteSerializedAttributeContainerListInBatches(self):
+    """Tests the _WriteSerializedAttributeContainerList function in batches."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file._WRITE_BATCH_SIZE = 2
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for index in range(5):
+        event_data = events.EventData()
+        event_data.offset = index
+        storage_file._AddAttributeContainer(
+            storage_file._CONTAINER_TYPE_EVENT_DATA, event_data)
+
+      storage_file._WriteSerializedAttributeContainerList(
+          storage_file._CONTAINER_TYPE_EVENT_DATA)
+
+      number_of_containers = storage_file._CountStoredAttributeContainers(
+          storage_file._CONTAINER_TYPE_EVENT_DATA)
+      self.assertEqual(number_of_containers, 5)
+
+      test_event_data = list(storage_file._GetAttributeContainers(
+          storage_file._CONTAINER_TYPE_EVENT_DATA))
+      offsets = [event_data.offset for event_data in test_event_data]
+      self.assertEqual(offsets, [0, 1, 2, 3, 4])
+
+      storage_file.Close()
+
   # TODO: add tests for _WriteStorageMetadata
 
+  def testOpenWithPragmas(self):
+    """Tests the Open function with SQLite pragmas."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile(
+          cache_size=-4096, journal_mode='MEMORY', page_size=8192)
+      storage_file.Open(path=temp_file, read_only=False)
+
+      try:
+        storage_file._cursor.execute('PRAGMA cache_size')
+        self.assertEqual(storage_file._cursor.fetchone()[0], -4096)
+
+        storage_file._cursor.execute('PRAGMA journal_mode')
+        self.assertEqual(storage_file._cursor.fetchone()[0], 'memory')
+
+        storage_file._cursor.execute('PRAGMA page_size')
+        self.assertEqual(storage_file._cursor.fetchone()[0], 8192)
+
+      finally:
+        storage_file.Close()
+
   def testAddAnalysisReport(self):
     """Tests the AddAnalysisReport function."""
     analysis_report = reports.AnalysisReport(
@@ -312,6 +531,31 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
   # TODO: add tests for CheckSupportedFormat
 
+  def testCreateEventTimestampIndex(self):
+    """Tests the CreateEventTimestampIndex function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self.assertFalse(storage_file.HasEventTimestampIndex())
+
+      storage_file.CreateEventTimestampIndex()
+      self.assertTrue(storage_file.HasEventTimestampIndex())
+
+      # Creating the index a second time should not fail.
+      storage_file.CreateEventTimestampIndex()
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      with self.assertRaises(IOError):
+        storage_file.CreateEventTimestampIndex()
+
+      storage_file.Close()
+
   def testGetAnalysisReports(self):
     """Tests the GetAnalysisReports function."""
     analysis_report = reports.AnalysisReport(
@@ -357,7 +601,48 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       storage_file.Close()
 
   # TODO: add tests for GetEventData
-  # TODO: add tests for GetEventDataByIdentifier
+
+  def testGetEventDataByIdentifier(self):
+    """Tests the GetEventDataByIdentifier function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self._AddTestEventsWithEventData(storage_file)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      identifier = identifiers.SQLTableIdentifier('event_data', 1)
+
+      event_data = storage_file.GetEventDataByIdentifier(identifier)
+      self.assertIsNotNone(event_data)
+      self.assertEqual(event_data.offset, 0)
+      self.assertEqual(storage_file._event_data_cache.number_of_misses, 1)
+
+      cached_event_data = storage_file.GetEventDataByIdentifier(identifier)
+      self.assertIs(cached_event_data, event_data)
+      self.assertEqual(storage_file._event_data_cache.number_of_hits, 1)
+
+      identifier = identifiers.SQLTableIdentifier('event_data', 99)
+      event_data = storage_file.GetEventDataByIdentifier(identifier)
+      self.assertIsNone(event_data)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile(event_data_cache_size=0)
+      storage_file.Open(path=temp_file)
+
+      identifier = identifiers.SQLTableIdentifier('event_data', 1)
+
+      event_data = storage_file.GetEventDataByIdentifier(identifier)
+      cached_event_data = storage_file.GetEventDataByIdentifier(identifier)
+      self.assertIsNot(cached_event_data, event_data)
+
+      storage_file.Close()
 
   def testGetEvents(self):
     """Tests the GetEvents function."""
@@ -381,6 +666,162 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testGetEventsWithBinarySerializationFormat(self):
+    """Tests the GetEvents function with the binary serialization format."""
+    test_events = self._CreateTestEvents()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile(
+          serialization_format=definitions.SERIALIZER_FORMAT_BINARY)
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for event in test_events:
+        storage_file.AddEvent(event)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      self.assertEqual(
+          storage_file.serialization_format,
+          definitions.SERIALIZER_FORMAT_BINARY)
+
+      expected_timestamps = sorted(event.timestamp for event in test_events)
+
+      test_events = list(storage_file.GetSortedEvents())
+      timestamps = [event.timestamp for event in test_events]
+      self.assertEqual(timestamps, expected_timestamps)
+
+      storage_file.Close()
+
+  def testGetEventDataWithEVTXXMLTemplate(self):
+    """Tests the GetEventData function with an EVTX XML template."""
+    template, _ = windows_events.WindowsEventLogXMLTemplate.SplitXMLString(
+        '<Event><EventID>1</EventID></Event>')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for index in range(3):
+        event_data = events.EventData()
+        event_data.xml_template = template
+        event_data.xml_values = ['{0:d}'.format(index)]
+        storage_file.AddEventData(event_data)
+
+        # The XML template of the event data is not changed.
+        self.assertEqual(event_data.xml_template, template)
+        self.assertFalse(hasattr(event_data, 'xml_template_row_identifier'))
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      event_data = events.EventData()
+      event_data.xml_template = template
+      event_data.xml_values = ['3']
+      storage_file.AddEventData(event_data)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      # The XML template is only stored once.
+      number_of_xml_templates = storage_file._CountStoredAttributeContainers(
+          storage_file._CONTAINER_TYPE_EVTX_XML_TEMPLATE)
+      self.assertEqual(number_of_xml_templates, 1)
+
+      test_event_data = list(storage_file.GetEventData())
+      self.assertEqual(len(test_event_data), 4)
+
+      # The XML string is not rendered when the event data is read.
+      for index, event_data in enumerate(test_event_data):
+        self.assertEqual(event_data.xml_template_row_identifier, 1)
+        self.assertEqual(event_data.xml_values, ['{0:d}'.format(index)])
+        self.assertFalse(hasattr(event_data, 'xml_string'))
+
+      event_data = storage_file.GetEventDataByIdentifier(
+          test_event_data[2].GetIdentifier())
+      self.assertEqual(event_data.xml_values, ['2'])
+
+      xml_template = storage_file.GetEVTXXMLTemplateByRowIdentifier(
+          event_data.xml_template_row_identifier)
+      self.assertEqual(xml_template.template, template)
+      self.assertEqual(
+          xml_template.Render(event_data.xml_values),
+          '<Event><EventID>2</EventID></Event>')
+
+      # The XML template is cached by row identifier.
+      cached_xml_template = storage_file.GetEVTXXMLTemplateByRowIdentifier(1)
+      self.assertIs(cached_xml_template, xml_template)
+
+      with self.assertRaises(IOError):
+        storage_file.GetEVTXXMLTemplateByRowIdentifier(2)
+
+      storage_file.Close()
+
+  def testGetEventDataWithSharedPathSpec(self):
+    """Tests the GetEventData function with a shared path specification."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/test.txt')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for index in range(3):
+        event_data = events.EventData()
+        event_data.offset = index
+        event_data.pathspec = path_spec
+        storage_file.AddEventData(event_data)
+
+        # The path specification of the event data is not changed.
+        self.assertIs(event_data.pathspec, path_spec)
+        self.assertFalse(hasattr(event_data, 'path_spec_row_identifier'))
+
+      event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+      storage_file.AddEventSource(event_source)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      event_data = events.EventData()
+      event_data.pathspec = path_spec
+      storage_file.AddEventData(event_data)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      # The path specification is only stored once.
+      number_of_path_specs = storage_file._CountStoredAttributeContainers(
+          storage_file._CONTAINER_TYPE_PATH_SPEC)
+      self.assertEqual(number_of_path_specs, 1)
+
+      test_event_data = list(storage_file.GetEventData())
+      self.assertEqual(len(test_event_data), 4)
+
+      for event_data in test_event_data:
+        self.assertEqual(event_data.pathspec.comparable, path_spec.comparable)
+        self.assertFalse(hasattr(event_data, 'path_spec_row_identifier'))
+
+      # The path specification is only deserialized once.
+      self.assertIs(test_event_data[0].pathspec, test_event_data[3].pathspec)
+
+      event_source = storage_file.GetEventSourceByIndex(0)
+      self.assertEqual(event_source.path_spec.comparable, path_spec.comparable)
+
+      storage_file.Close()
+
   # TODO: add tests for GetEventSourceByIndex
 
   def testGetEventSources(self):
@@ -430,6 +871,73 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testGetEventTimeRanges(self):
+    """Tests the GetEventTimeRanges function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self._AddTestEventsWithEventData(storage_file)
+
+      time_ranges = storage_file.GetEventTimeRanges(2)
+      self.assertIsNone(time_ranges)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      time_ranges = storage_file.GetEventTimeRanges(1)
+      self.assertEqual(len(time_ranges), 1)
+      self.assertEqual(time_ranges[0].start_timestamp, 1334940286000000)
+      self.assertEqual(time_ranges[0].end_timestamp, 1334961526929597)
+
+      time_ranges = storage_file.GetEventTimeRanges(2)
+      self.assertEqual(len(time_ranges), 2)
+      self.assertEqual(time_ranges[0].start_timestamp, 1334940286000000)
+      self.assertEqual(time_ranges[0].end_timestamp, 1334961526929595)
+      self.assertEqual(time_ranges[1].start_timestamp, 1334961526929596)
+      self.assertEqual(time_ranges[1].end_timestamp, 1334961526929597)
+
+      # Every event is in exactly one time range.
+      number_of_events = 0
+      for time_range in storage_file.GetEventTimeRanges(8):
+        number_of_events += len(list(storage_file.GetSortedEvents(
+            time_range=time_range)))
+
+      self.assertEqual(number_of_events, 4)
+
+      with self.assertRaises(ValueError):
+        storage_file.GetEventTimeRanges(0)
+
+      storage_file.Close()
+
+      # Events with duplicate timestamps that are not stored in chronological
+      # order.
+      temp_file = os.path.join(temp_directory, 'duplicates.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for index in range(100):
+        event = events.EventObject()
+        event.timestamp = (99 - index) // 4
+        event.timestamp_desc = definitions.TIME_DESCRIPTION_WRITTEN
+        storage_file.AddEvent(event)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      time_ranges = storage_file.GetEventTimeRanges(4)
+      start_timestamps = [
+          time_range.start_timestamp for time_range in time_ranges]
+      self.assertEqual(start_timestamps, [0, 6, 12, 18])
+      self.assertEqual(time_ranges[-1].end_timestamp, 24)
+
+      storage_file.Close()
+
   # TODO: add tests for GetNumberOfAnalysisReports
   # TODO: add tests for GetNumberOfEventSources
 
@@ -455,14 +963,103 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       test_events = list(storage_file.GetSortedEvents())
       self.assertEqual(len(test_events), 4)
 
+      timestamps = [event.timestamp for event in test_events]
+      self.assertEqual(timestamps, sorted(timestamps))
+
+      time_range = time_range_lib.TimeRange(
+          1334940286000000, 1334961526929596)
+      test_events = list(storage_file.GetSortedEvents(time_range=time_range))
+      self.assertEqual(len(test_events), 2)
+
+      timestamps = [event.timestamp for event in test_events]
+      self.assertEqual(timestamps, [1334940286000000, 1334961526929596])
+
+      storage_file.Close()
+
+      temp_file = os.path.join(temp_directory, 'event_data.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self._AddTestEventsWithEventData(storage_file)
+
       storage_file.Close()
 
-    # TODO: add test with time range.
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      test_events = list(storage_file.GetSortedEvents())
+      self.assertEqual(len(test_events), 4)
+
+      # The event data referenced by the sorted events is read into the cache.
+      self.assertEqual(len(storage_file._event_data_cache), 2)
+
+      for event in test_events:
+        event_data_identifier = event.GetEventDataIdentifier()
+        storage_file.GetEventDataByIdentifier(event_data_identifier)
+
+      self.assertEqual(storage_file._event_data_cache.number_of_hits, 4)
+      self.assertEqual(storage_file._event_data_cache.number_of_misses, 0)
+
+      storage_file.Close()
 
   # TODO: add tests for HasAnalysisReports
   # TODO: add tests for HasErrors
   # TODO: add tests for HasEventTags
 
+  def testHasEventTimestampIndex(self):
+    """Tests the HasEventTimestampIndex function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      self.assertFalse(storage_file.HasEventTimestampIndex())
+
+      storage_file.Close()
+
+      # The index is created when a session store is closed.
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      self.assertTrue(storage_file.HasEventTimestampIndex())
+
+      storage_file.Close()
+
+      temp_file = os.path.join(temp_directory, 'task.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile(
+          storage_type=definitions.STORAGE_TYPE_TASK)
+      storage_file.Open(path=temp_file, read_only=False)
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile(
+          storage_type=definitions.STORAGE_TYPE_TASK)
+      storage_file.Open(path=temp_file)
+
+      self.assertFalse(storage_file.HasEventTimestampIndex())
+
+      storage_file.Close()
+
+  @shared_test_lib.skipUnlessHasTestFile(['psort_test.plaso'])
+  def testHasEventTimestampIndexExistingStorageFile(self):
+    """Tests the HasEventTimestampIndex function on an existing store."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'psort_test.plaso')
+      shutil.copyfile(test_file_path, temp_file)
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+      storage_file.Close()
+
+      # The index is not created when an existing session store is closed.
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      self.assertFalse(storage_file.HasEventTimestampIndex())
+
+      storage_file.Close()
+
   # TODO: add tests for Open and Close
 
   # TODO: add tests for ReadPreprocessingInformation
@@ -25,6 +25,8 @@ def Main():
   try:
     if tool.compare_storage_information:
       result = tool.CompareStores()
+    elif tool.create_event_timestamp_index:
+      result = tool.CreateEventTimestampIndex()
     else:
       tool.PrintStorageInformation()
 
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the event formatters."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import sys
+import time
+
+from plaso.containers import events
+from plaso.formatters import manager as formatters_manager
+from plaso.formatters import mediator as formatters_mediator
+from plaso.lib import errors
+
+# Make sure all formatters are registered.
+from plaso import formatters  # pylint: disable=unused-import
+
+
+class FormatterBenchmark(object):
+  """Benchmark of event formatters.
+
+  Attributes:
+    number_of_iterations (int): number of times every event is formatted.
+  """
+
+  # Attributes that events typically have in addition to the attributes
+  # used by the format strings.
+  _COMMON_ATTRIBUTE_VALUES = {
+      'display_name': 'OS:/tmp/test.log',
+      'filename': '/tmp/test.log',
+      'hostname': 'myhost',
+      'inode': 12345,
+      'offset': 0,
+      'parser': 'test_parser',
+      'sha256_hash': 'e3b0c44298fc1c149afbf4c8996fb924',
+      'timestamp': 1542826800000000,
+      'timestamp_desc': 'Creation Time',
+      'username': 'user'}
+
+  def __init__(self, number_of_iterations=10000):
+    """Initializes an event formatter benchmark.
+
+    Args:
+      number_of_iterations (Optional[int]): number of times every event
+          is formatted.
+    """
+    super(FormatterBenchmark, self).__init__()
+    self._formatter_mediator = formatters_mediator.FormatterMediator()
+    self.number_of_iterations = number_of_iterations
+
+  def _CreateTestEvent(self, formatter_object):
+    """Creates an event that can be formatted by a formatter.
+
+    Args:
+      formatter_object (EventFormatter): formatter.
+
+    Returns:
+      EventObject: event.
+    """
+    event = events.EventObject()
+    event.data_type = formatter_object.DATA_TYPE
+
+    for attribute_name, attribute_value in iter(
+        self._COMMON_ATTRIBUTE_VALUES.items()):
+      setattr(event, attribute_name, attribute_value)
+
+    for attribute_name in formatter_object.GetFormatStringAttributeNames():
+      setattr(event, attribute_name, 'value')
+
+    return event
+
+  def GetDataTypes(self):
+    """Retrieves the data types of the formatters that can be benchmarked.
+
+    Returns:
+      list[str]: data types of the formatters that can format an event with
+          string attribute values.
+    """
+    data_types = []
+    # pylint: disable=protected-access
+    for data_type in sorted(formatters_manager.FormattersManager.
+                            _formatter_classes.keys()):
+      formatter_object = (
+          formatters_manager.FormattersManager.GetFormatterObject(data_type))
+      event = self._CreateTestEvent(formatter_object)
+
+      try:
+        formatter_object.GetMessages(self._formatter_mediator, event)
+      except (AttributeError, KeyError, TypeError, ValueError,
+              errors.WrongFormatter):
+        continue
+
+      data_types.append(data_type)
+
+    return data_types
+
+  def Run(self, data_type):
+    """Benchmarks a formatter.
+
+    Args:
+      data_type (str): data type of the formatter.
+
+    Returns:
+      float: number of seconds it took to format the event for all iterations.
+    """
+    formatter_object = (
+        formatters_manager.FormattersManager.GetFormatterObject(data_type))
+    event = self._CreateTestEvent(formatter_object)
+
+    start_time = time.time()
+    for _ in range(self.number_of_iterations):
+      formatter_object = (
+          formatters_manager.FormattersManager.GetFormatterObject(
+              event.data_type))
+      formatter_object.GetMessages(self._formatter_mediator, event)
+
+    return time.time() - start_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the event formatters.'))
+
+  argument_parser.add_argument(
+      '--iterations', dest='number_of_iterations', type=int, default=10000,
+      help='number of times every event is formatted.')
+
+  argument_parser.add_argument(
+      '--data_types', '--data-types', dest='data_types', type=str, default='',
+      help=(
+          'comma separated list of the data types of the formatters to '
+          'benchmark, where all formatters are benchmarked by default.'))
+
+  options = argument_parser.parse_args()
+
+  benchmark = FormatterBenchmark(
+      number_of_iterations=options.number_of_iterations)
+
+  data_types = benchmark.GetDataTypes()
+  if options.data_types:
+    data_types = [
+        data_type for data_type in options.data_types.split(',')
+        if data_type in data_types]
+
+  print('{0:<48s} {1:>10s} {2:>12s}'.format(
+      'Data type', 'Seconds', 'Events/sec'))
+
+  total_duration = 0.0
+  for data_type in data_types:
+    duration = benchmark.Run(data_type)
+    total_duration += duration
+
+    events_per_second = 0.0
+    if duration > 0.0:
+      events_per_second = benchmark.number_of_iterations / duration
+
+    print('{0:<48s} {1:>10.3f} {2:>12.1f}'.format(
+        data_type, duration, events_per_second))
+
+  events_per_second = 0.0
+  if total_duration > 0.0:
+    events_per_second = (
+        len(data_types) * benchmark.number_of_iterations) / total_duration
+
+  print('{0:<48s} {1:>10.3f} {2:>12.1f}'.format(
+      'Total', total_duration, events_per_second))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
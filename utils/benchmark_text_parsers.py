@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the text parsers against the test data log files."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+import sys
+import time
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.containers import sessions
+from plaso.engine import knowledge_base
+from plaso.lib import errors
+from plaso.parsers import manager as parsers_manager
+from plaso.parsers import mediator as parsers_mediator
+from plaso.storage.fake import writer as fake_writer
+
+# Make sure all parsers are registered.
+from plaso import parsers  # pylint: disable=unused-import
+
+
+class TextParserBenchmark(object):
+  """Benchmark of text parsers.
+
+  Attributes:
+    number_of_iterations (int): number of times every test file is parsed.
+  """
+
+  # Test data log files per text parser.
+  TEST_FILES = {
+      'apache_access': ['access.log'],
+      'bash': ['bash_history_desync'],
+      'dpkg': ['dpkg.log'],
+      'gdrive_synclog': ['sync_log.log'],
+      'mac_appfirewall_log': ['appfirewall.log'],
+      'mac_securityd': ['security.log'],
+      'macwifi': ['wifi.log', 'wifi_turned_over.log'],
+      'popularity_contest': ['popcontest1.log'],
+      'santa': ['santa.log'],
+      'sccm': ['sccm_various.log'],
+      'selinux': ['selinux.log'],
+      'skydrive_log': ['skydriveerr.log', 'skydrive.log'],
+      'skydrive_log_old': ['skydrive_old.log'],
+      'sophos_av': ['sav.txt'],
+      'syslog': ['syslog', 'syslog_cron.log', 'syslog_rsyslog'],
+      'winfirewall': ['firewall.log'],
+      'winiis': ['iis.log', 'iis_without_date.log'],
+      'xchatlog': ['xchat.log'],
+      'xchatscrollback': ['xchatscrollback.log'],
+      'zsh_extended_history': ['zsh_extended_history.txt']}
+
+  def __init__(self, test_data_path, number_of_iterations=10):
+    """Initializes a text parser benchmark.
+
+    Args:
+      test_data_path (str): path of the test data directory.
+      number_of_iterations (Optional[int]): number of times every test file
+          is parsed.
+    """
+    super(TextParserBenchmark, self).__init__()
+    self._test_data_path = test_data_path
+    self.number_of_iterations = number_of_iterations
+
+  def _CountLines(self, path):
+    """Counts the number of lines in a file.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      int: number of lines.
+    """
+    with open(path, 'rb') as file_object:
+      return sum(1 for _ in file_object)
+
+  def _ParseFile(self, parser, path):
+    """Parses a file with a parser.
+
+    Args:
+      parser (BaseParser): parser.
+      path (str): path of the file.
+
+    Returns:
+      int: number of events produced by the parser.
+    """
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    knowledge_base_object.SetValue('year', 2016)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base_object)
+    mediator.SetFileEntry(file_entry)
+
+    file_object = file_entry.GetFileObject()
+    try:
+      parser.Parse(mediator, file_object)
+    except errors.UnableToParseFile:
+      pass
+    finally:
+      file_object.close()
+
+    return storage_writer.number_of_events
+
+  def GetParserNames(self):
+    """Retrieves the names of the text parsers that can be benchmarked.
+
+    Returns:
+      list[str]: names of the text parsers with test data log files.
+    """
+    parser_names = []
+    for parser_name, filenames in sorted(self.TEST_FILES.items()):
+      paths = [
+          os.path.join(self._test_data_path, filename)
+          for filename in filenames]
+      if all(os.path.isfile(path) for path in paths):
+        parser_names.append(parser_name)
+
+    return parser_names
+
+  def Run(self, parser_name):
+    """Benchmarks a text parser.
+
+    Args:
+      parser_name (str): name of the text parser.
+
+    Returns:
+      tuple: contains:
+
+        int: number of lines parsed per iteration.
+        int: number of events produced per iteration.
+        float: number of seconds it took to parse all iterations.
+    """
+    parser = parsers_manager.ParsersManager.GetParserObjectByName(parser_name)
+    paths = [
+        os.path.join(self._test_data_path, filename)
+        for filename in self.TEST_FILES[parser_name]]
+
+    number_of_lines = sum(self._CountLines(path) for path in paths)
+    number_of_events = 0
+
+    start_time = time.time()
+    for _ in range(self.number_of_iterations):
+      number_of_events = sum(self._ParseFile(parser, path) for path in paths)
+
+    return number_of_lines, number_of_events, time.time() - start_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the text parsers against the test data log files.'))
+
+  argument_parser.add_argument(
+      '--iterations', dest='number_of_iterations', type=int, default=10,
+      help='number of times every test file is parsed.')
+
+  argument_parser.add_argument(
+      '--parsers', dest='parser_names', type=str, default='', help=(
+          'comma separated list of the names of the text parsers to '
+          'benchmark, where all text parsers with test data are benchmarked '
+          'by default.'))
+
+  argument_parser.add_argument(
+      'test_data_path', type=str, nargs='?', default='test_data', help=(
+          'path of the test data directory.'))
+
+  options = argument_parser.parse_args()
+
+  if not os.path.isdir(options.test_data_path):
+    print('No such directory: {0:s}'.format(options.test_data_path))
+    return False
+
+  benchmark = TextParserBenchmark(
+      options.test_data_path,
+      number_of_iterations=options.number_of_iterations)
+
+  parser_names = benchmark.GetParserNames()
+  if options.parser_names:
+    parser_names = [
+        parser_name for parser_name in options.parser_names.split(',')
+        if parser_name in parser_names]
+
+  print('{0:<24s} {1:>8s} {2:>8s} {3:>10s} {4:>12s}'.format(
+      'Parser', 'Lines', 'Events', 'Seconds', 'Lines/sec'))
+
+  for parser_name in parser_names:
+    number_of_lines, number_of_events, duration = benchmark.Run(parser_name)
+
+    lines_per_second = 0.0
+    if duration > 0.0:
+      lines_per_second = (
+          number_of_lines * benchmark.number_of_iterations) / duration
+
+    print('{0:<24s} {1:>8d} {2:>8d} {3:>10.3f} {4:>12.1f}'.format(
+        parser_name, number_of_lines, number_of_events, duration,
+        lines_per_second))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)